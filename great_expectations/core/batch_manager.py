@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional
 
 from great_expectations.core.batch import (
     Batch,
@@ -38,6 +38,7 @@ class BatchManager:
 
         self._batch_cache: Dict[str, Batch] = OrderedDict()
         self._batch_data_cache: Dict[str, BatchDataType] = {}
+        self._derived_batch_data_cache: Dict[str, Dict[Hashable, Any]] = {}
 
         if batch_list:
             self.load_batch_list(batch_list=batch_list)
@@ -47,6 +48,14 @@ class BatchManager:
         """Dictionary of loaded BatchData objects."""
         return self._batch_data_cache
 
+    def get_derived_batch_data_cache(self, batch_id: str) -> Dict[Hashable, Any]:
+        """
+        Dictionary of objects derived from loaded BatchData (e.g., persisted Spark DataFrames) for specified Batch ID.
+
+        Contents are discarded whenever BatchData for this Batch ID is (re)loaded, so that they never outlive the data.
+        """
+        return self._derived_batch_data_cache.setdefault(batch_id, {})
+
     @property
     def loaded_batch_ids(self) -> List[str]:
         """IDs of loaded BatchData objects."""
@@ -165,5 +174,27 @@ class BatchManager:
         """
         Updates the data for the specified Batch in the cache
         """
+        self._release_batch_data(batch_id=batch_id)
         self._batch_data_cache[batch_id] = batch_data
         self._active_batch_data_id = batch_id
+
+    def remove_batch_data(self, batch_id: str) -> None:
+        """
+        Evicts loaded BatchData (and objects derived from it) for specified Batch ID from the cache
+        """
+        self._release_batch_data(batch_id=batch_id)
+        if self._active_batch_data_id == batch_id:
+            self._active_batch_data_id = None
+
+    def _release_batch_data(self, batch_id: str) -> None:
+        batch_data: Optional[BatchDataType] = self._batch_data_cache.pop(batch_id, None)
+        derived_batch_data: Dict[Hashable, Any] = self._derived_batch_data_cache.pop(
+            batch_id, {}
+        )
+        if batch_data is not None:
+            # ExecutionEngine frees backend resources (e.g., cached storage), held by evicted objects.
+            self._execution_engine.release_batch_data(
+                batch_id=batch_id,
+                batch_data=batch_data,
+                derived_batch_data=derived_batch_data,
+            )
@@ -1,10 +1,15 @@
+from __future__ import annotations
+
 import base64
 import json
 import logging
+import os
 import re
+import threading
+import time
 from collections import OrderedDict
-from functools import lru_cache
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 from typing_extensions import Final
 
@@ -36,6 +41,127 @@ TEMPLATE_STR_REGEX: Final[re.Pattern] = re.compile(
     r"(?<!\\)\$\{(.*?)\}|(?<!\\)\$([_a-zA-Z][_a-zA-Z0-9]*)"
 )
 
+# Secrets fetched from secret stores are reused for this many seconds (configurations are substituted repeatedly).
+DEFAULT_SECRET_CACHE_TTL_SECONDS: Final[float] = 300.0
+
+# Environment variable, overriding number of seconds, for which fetched secrets are reused ("0" disables caching).
+SECRET_CACHE_TTL_SECONDS_ENV_VAR: Final[str] = "GX_SECRET_CACHE_TTL_SECONDS"
+
+# Upper bound on number of threads, concurrently fetching distinct secrets referenced in one configuration.
+MAX_CONCURRENT_SECRET_FETCHES: Final[int] = 8
+
+
+class _SecretStoreCache:
+    """Thread-safe cache of secrets (expiring after "ttl_seconds") and of secret store clients (kept for reuse).
+
+    Secrets are keyed by secret store, secret name, and version (not by key within JSON secret), so that references to
+    different keys of one secret share single fetch.  Concurrent lookups of the same uncached secret fetch it only once.
+    Unless "ttl_seconds" is given, it is read from "GX_SECRET_CACHE_TTL_SECONDS" environment variable upon every
+    lookup (defaulting to "DEFAULT_SECRET_CACHE_TTL_SECONDS").  Non-positive "ttl_seconds" disables caching of secrets
+    (clients are still reused).  Expired secrets (and their locks) are pruned upon subsequent lookups.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._secrets: Dict[Hashable, Tuple[float, str]] = {}
+        self._secret_locks: Dict[Hashable, threading.Lock] = {}
+        self._num_secret_lock_users: Dict[Hashable, int] = {}
+        self._clients: Dict[Hashable, Any] = {}
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is not None:
+            return self._ttl_seconds
+
+        ttl_seconds: Optional[str] = os.getenv(SECRET_CACHE_TTL_SECONDS_ENV_VAR)
+        if not ttl_seconds:
+            return DEFAULT_SECRET_CACHE_TTL_SECONDS
+
+        try:
+            return float(ttl_seconds)
+        except ValueError:
+            raise gx_exceptions.InvalidConfigError(
+                f'Environment variable "{SECRET_CACHE_TTL_SECONDS_ENV_VAR}" must be a number of seconds (got "{ttl_seconds}").'
+            )
+
+    def get_secret(self, secret_id: Hashable, fetch_secret: Callable[[], str]) -> str:
+        """Returns unexpired cached secret, or calls "fetch_secret" (at most once at a time per "secret_id")."""
+        ttl_seconds: float = self.ttl_seconds
+        if ttl_seconds <= 0:
+            return fetch_secret()
+
+        with self._lock:
+            self._prune_expired_secrets()
+            secret_lock: threading.Lock = self._secret_locks.setdefault(
+                secret_id, threading.Lock()
+            )
+            self._num_secret_lock_users[secret_id] = (
+                self._num_secret_lock_users.get(secret_id, 0) + 1
+            )
+
+        try:
+            with secret_lock:
+                with self._lock:
+                    cached_secret: Optional[Tuple[float, str]] = self._secrets.get(
+                        secret_id
+                    )
+
+                if cached_secret is not None and cached_secret[0] > time.monotonic():
+                    return cached_secret[1]
+
+                secret: str = fetch_secret()
+                with self._lock:
+                    self._secrets[secret_id] = (
+                        time.monotonic() + ttl_seconds,
+                        secret,
+                    )
+
+                return secret
+        finally:
+            with self._lock:
+                num_secret_lock_users: int = (
+                    self._num_secret_lock_users.pop(secret_id, 1) - 1
+                )
+                if num_secret_lock_users > 0:
+                    self._num_secret_lock_users[secret_id] = num_secret_lock_users
+
+    def _prune_expired_secrets(self) -> None:
+        # Caller must hold "self._lock".  Locks of secrets, being looked up by other threads, are kept.
+        now: float = time.monotonic()
+        secret_id: Hashable
+        for secret_id in list(self._secret_locks.keys()):
+            if secret_id in self._num_secret_lock_users:
+                continue
+
+            cached_secret: Optional[Tuple[float, str]] = self._secrets.get(secret_id)
+            if cached_secret is None or cached_secret[0] <= now:
+                self._secrets.pop(secret_id, None)
+                del self._secret_locks[secret_id]
+
+    def get_client(self, client_id: Hashable, create_client: Callable[[], Any]) -> Any:
+        """Returns client, previously created for "client_id", or creates (and keeps) one with "create_client"."""
+        with self._lock:
+            if client_id not in self._clients:
+                self._clients[client_id] = create_client()
+
+            return self._clients[client_id]
+
+    def __deepcopy__(self, memo: dict) -> _SecretStoreCache:
+        # Copies of substitutors (e.g., within deep-copied configuration providers) share the same cache.
+        return self
+
+    def clear(self) -> None:
+        with self._lock:
+            self._secrets.clear()
+            self._secret_locks.clear()
+            self._num_secret_lock_users.clear()
+            self._clients.clear()
+
+
+# Shared by all substitutors in process (DataContext, Checkpoints, and Datasources substitute the same configurations).
+_secret_store_cache = _SecretStoreCache()
+
 
 class _ConfigurationSubstitutor:
     """
@@ -52,11 +178,12 @@ class _ConfigurationSubstitutor:
     )
     AZURE_PATTERN = r"^secret\|(https:\/\/[a-zA-Z0-9\-]{3,24}\.vault\.azure\.net)\/secrets\/([0-9a-zA-Z-]+)"
 
-    def __init__(self) -> None:
-        # Using the @lru_cache decorator on method calls can create memory leaks - an attr is preferred here.
-        # Ref: https://stackoverflow.com/a/68550238
-        self._secret_store_cache = lru_cache(maxsize=None)(
-            self._substitute_value_from_secret_store
+    def __init__(self, secret_store_cache: Optional[_SecretStoreCache] = None) -> None:
+        # Secrets (and secret store clients) are cached process-wide, unless a dedicated cache is provided.
+        self._secret_store_cache: _SecretStoreCache = (
+            secret_store_cache
+            if secret_store_cache is not None
+            else _secret_store_cache
         )
 
     def substitute_all_config_variables(
@@ -69,30 +196,101 @@ class _ConfigurationSubstitutor:
         Substitute all config variables of the form ${SOME_VARIABLE} in a dictionary-like
         config object for their values.
 
-        The method traverses the dictionary recursively.
+        The method traverses the dictionary recursively.  All "secret|" references found in the config are collected
+        first, and then resolved together (distinct secrets concurrently, cached secrets without calling secret store).
 
         :param data:
         :param replace_variables_dict:
         :param dollar_sign_escape_string: a reserved character for specifying parameters
         :return: a dictionary with all the variables replaced with their values
         """
+        data = self._substitute_all_config_variables_without_secrets(
+            data, replace_variables_dict, dollar_sign_escape_string
+        )
+
+        secret_references: Dict[str, None] = {}
+        self._collect_secret_references(data, secret_references)
+        if not secret_references:
+            return data
+
+        secrets: Dict[str, str] = self._resolve_secret_references(
+            list(secret_references.keys())
+        )
+        return self._replace_secret_references(data, secrets)
+
+    def _substitute_all_config_variables_without_secrets(
+        self,
+        data: Any,
+        replace_variables_dict: Dict[str, str],
+        dollar_sign_escape_string: str = r"\$",
+    ) -> Any:
         if isinstance(data, BaseYamlConfig):
             data = (data.__class__.get_schema_class())().dump(data)
 
         if isinstance(data, dict) or isinstance(data, OrderedDict):
             return {
-                k: self.substitute_all_config_variables(v, replace_variables_dict)
+                k: self._substitute_all_config_variables_without_secrets(
+                    v, replace_variables_dict
+                )
                 for k, v in data.items()
             }
         elif isinstance(data, list):
             return [
-                self.substitute_all_config_variables(v, replace_variables_dict)
+                self._substitute_all_config_variables_without_secrets(
+                    v, replace_variables_dict
+                )
                 for v in data
             ]
-        return self.substitute_config_variable(
+        return self._substitute_config_variable_without_secrets(
             data, replace_variables_dict, dollar_sign_escape_string
         )
 
+    def _collect_secret_references(
+        self, data: Any, secret_references: Dict[str, None]
+    ) -> None:
+        if isinstance(data, dict):
+            for value in data.values():
+                self._collect_secret_references(value, secret_references)
+        elif isinstance(data, list):
+            for value in data:
+                self._collect_secret_references(value, secret_references)
+        elif self._is_secret_reference(data):
+            secret_references[data] = None
+
+    def _resolve_secret_references(
+        self, secret_references: List[str]
+    ) -> Dict[str, str]:
+        max_workers: int = min(len(secret_references), MAX_CONCURRENT_SECRET_FETCHES)
+        if max_workers <= 1:
+            return {
+                secret_reference: self._substitute_value_from_secret_store(
+                    secret_reference
+                )
+                for secret_reference in secret_references
+            }
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Secrets are returned in order of references; the first failing reference (in that order) raises.
+            return dict(
+                zip(
+                    secret_references,
+                    executor.map(
+                        self._substitute_value_from_secret_store, secret_references
+                    ),
+                )
+            )
+
+    def _replace_secret_references(self, data: Any, secrets: Dict[str, str]) -> Any:
+        if isinstance(data, dict):
+            return {
+                k: self._replace_secret_references(v, secrets) for k, v in data.items()
+            }
+        elif isinstance(data, list):
+            return [self._replace_secret_references(v, secrets) for v in data]
+        elif isinstance(data, str):
+            return secrets.get(data, data)
+        return data
+
     def substitute_config_variable(
         self,
         template_str: str,
@@ -125,7 +323,22 @@ class _ConfigurationSubstitutor:
 
         :return: a string with values substituted, or the same object if template_str is not a string.
         """
+        substituted_value: Optional[
+            str
+        ] = self._substitute_config_variable_without_secrets(
+            template_str, config_variables_dict, dollar_sign_escape_string
+        )
+        if substituted_value is None:
+            return substituted_value
 
+        return self._substitute_value_from_secret_store(substituted_value)
+
+    def _substitute_config_variable_without_secrets(
+        self,
+        template_str: str,
+        config_variables_dict: Dict[str, str],
+        dollar_sign_escape_string: str = r"\$",
+    ) -> Optional[str]:
         if template_str is None:
             return template_str
 
@@ -155,9 +368,14 @@ class _ConfigurationSubstitutor:
 
         # 2. Replace the "$"'s that had been escaped
         template_str = template_str.replace(dollar_sign_escape_string, "$")
-        template_str = self._substitute_value_from_secret_store(template_str)
         return template_str
 
+    def _is_secret_reference(self, value: Any) -> bool:
+        return isinstance(value, str) and any(
+            re.match(pattern, value)
+            for pattern in (self.AWS_PATTERN, self.GCP_PATTERN, self.AZURE_PATTERN)
+        )
+
     def _substitute_value_from_secret_store(self, value: str) -> str:
         """
         This method takes a value, tries to parse the value to fetch a secret from a secret manager
@@ -236,22 +454,32 @@ class _ConfigurationSubstitutor:
         secret_version = matches.group(4)
         secret_key = matches.group(5)
 
-        # Create a Secrets Manager client
-        session = boto3.session.Session()
-        client = session.client(service_name="secretsmanager", region_name=region_name)
-
-        if secret_version:
-            secret_response = client.get_secret_value(
-                SecretId=secret_name, VersionId=secret_version
+        def _fetch_secret() -> str:
+            # Create a Secrets Manager client (once per region; clients are thread-safe)
+            client = self._secret_store_cache.get_client(
+                client_id=("aws", region_name),
+                create_client=lambda: boto3.session.Session().client(
+                    service_name="secretsmanager", region_name=region_name
+                ),
             )
-        else:
-            secret_response = client.get_secret_value(SecretId=secret_name)
-        # Decrypts secret using the associated KMS CMK.
-        # Depending on whether the secret is a string or binary, one of these fields will be populated.
-        if "SecretString" in secret_response:
-            secret = secret_response["SecretString"]
-        else:
-            secret = base64.b64decode(secret_response["SecretBinary"]).decode("utf-8")
+
+            if secret_version:
+                secret_response = client.get_secret_value(
+                    SecretId=secret_name, VersionId=secret_version
+                )
+            else:
+                secret_response = client.get_secret_value(SecretId=secret_name)
+            # Decrypts secret using the associated KMS CMK.
+            # Depending on whether the secret is a string or binary, one of these fields will be populated.
+            if "SecretString" in secret_response:
+                return secret_response["SecretString"]
+
+            return base64.b64decode(secret_response["SecretBinary"]).decode("utf-8")
+
+        secret = self._secret_store_cache.get_secret(
+            secret_id=("aws", region_name, secret_name, secret_version),
+            fetch_secret=_fetch_secret,
+        )
         if secret_key:
             secret = json.loads(secret)[secret_key]
         return secret
@@ -287,7 +515,6 @@ class _ConfigurationSubstitutor:
             )
             raise ImportError("Could not import secretmanager from google.cloud")
 
-        client = secretmanager.SecretManagerServiceClient()
         matches = regex.match(value)
 
         if not matches:
@@ -300,14 +527,24 @@ class _ConfigurationSubstitutor:
         if not secret_version:
             secret_version = "latest"
         name = f"projects/{project_id}/secrets/{secret_id}/versions/{secret_version}"
-        try:
-            secret = client.access_secret_version(name=name)._pb.payload.data.decode(
-                "utf-8"
+
+        def _fetch_secret() -> str:
+            client = self._secret_store_cache.get_client(
+                client_id=("gcp",),
+                create_client=secretmanager.SecretManagerServiceClient,
             )
-        except AttributeError:
-            secret = client.access_secret_version(name=name).payload.data.decode(
-                "utf-8"
-            )  # for google-cloud-secret-manager < 2.0.0
+            try:
+                return client.access_secret_version(name=name)._pb.payload.data.decode(
+                    "utf-8"
+                )
+            except AttributeError:
+                return client.access_secret_version(name=name).payload.data.decode(
+                    "utf-8"
+                )  # for google-cloud-secret-manager < 2.0.0
+
+        secret = self._secret_store_cache.get_secret(
+            secret_id=("gcp", name), fetch_secret=_fetch_secret
+        )
         if secret_key:
             secret = json.loads(secret)[secret_key]
         return secret
@@ -354,9 +591,20 @@ class _ConfigurationSubstitutor:
         secret_name = matches.group(2)
         secret_version = matches.group(3)
         secret_key = matches.group(4)
-        credential = DefaultAzureCredential()
-        client = SecretClient(vault_url=keyvault_uri, credential=credential)
-        secret = client.get_secret(name=secret_name, version=secret_version).value
+
+        def _fetch_secret() -> str:
+            client = self._secret_store_cache.get_client(
+                client_id=("azure", keyvault_uri),
+                create_client=lambda: SecretClient(
+                    vault_url=keyvault_uri, credential=DefaultAzureCredential()
+                ),
+            )
+            return client.get_secret(name=secret_name, version=secret_version).value
+
+        secret = self._secret_store_cache.get_secret(
+            secret_id=("azure", keyvault_uri, secret_name, secret_version),
+            fetch_secret=_fetch_secret,
+        )
         if secret_key:
             secret = json.loads(secret)[secret_key]
         return secret
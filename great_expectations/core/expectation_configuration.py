@@ -77,6 +77,9 @@ def parse_result_format(result_format: Union[str, dict]) -> dict:
                 "When using `include_unexpected_rows`, `result_format` must be explicitly specified"
             )
 
+        # Defaults are filled in on copy, since "result_format" may belong to (shared) configuration "kwargs".
+        result_format = dict(result_format)
+
         if "partial_unexpected_count" not in result_format:
             result_format["partial_unexpected_count"] = 20
 
@@ -1058,6 +1061,26 @@ class ExpectationConfiguration(SerializableDictDot):
                 "evaluation_parameters have already been built on this expectation"
             )
 
+    def copy_with_updated_kwargs(self, kwargs: dict) -> ExpectationConfiguration:
+        """Returns copy of this configuration, whose "kwargs" are updated with given "kwargs" (copy-on-write).
+
+        Only "kwargs" and "meta" dictionaries themselves are copied; their values (e.g., large "value_set" lists) are
+        shared with this configuration (rather than deep-copied) and must therefore not be modified in place.
+
+        Args:
+            kwargs: Keyword arguments to add to (or to replace in) "kwargs" of the copy.
+
+        Returns:
+            Updated copy of this configuration.
+        """
+        updated_config: ExpectationConfiguration = copy.copy(self)
+        updated_config._kwargs = {**self._kwargs, **kwargs}
+        if self._raw_kwargs is not None:
+            updated_config._raw_kwargs = dict(self._raw_kwargs)
+
+        updated_config.meta = dict(self.meta)
+        return updated_config
+
     def get_raw_configuration(self) -> ExpectationConfiguration:
         # return configuration without substituted evaluation parameters
         raw_config = deepcopy(self)
@@ -5,15 +5,21 @@ import json
 import logging
 import pprint
 import uuid
+from bisect import insort
+from collections import defaultdict
 from copy import deepcopy
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Hashable,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -63,6 +69,271 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _to_hashable(value: Any) -> Hashable:
+    """Converts (possibly nested) kwargs value into hashable one, which is equal for equal values.
+
+    Raises:
+        TypeError: If value (or any of its elements) cannot be hashed.
+    """
+    if isinstance(value, dict):
+        return frozenset((key, _to_hashable(element)) for key, element in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_to_hashable(element) for element in value)
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_to_hashable(element) for element in value)
+
+    hash(value)
+    return value
+
+
+class _ExpectationConfigurationIndex:
+    """Positions of "ExpectationConfiguration" objects in list, keyed by expectation type and domain kwargs, and by
+    ge_cloud_id.
+
+    Equal domain is necessary for match of every match type, so index only narrows down candidates, which callers must
+    still verify using "ExpectationConfiguration.isEquivalentTo()".  Objects, whose domain kwargs cannot be hashed, are
+    candidates for every lookup.  Objects modified in place (e.g., "expectation.kwargs["column"] = ...") are re-keyed by
+    "refresh()".
+    """
+
+    def __init__(self, expectations: List[ExpectationConfiguration]) -> None:
+        self._domain_keys: List[Optional[Hashable]] = []
+        self._ge_cloud_ids: List[Optional[Hashable]] = []
+        self._positions_by_domain_key: Dict[Hashable, List[int]] = defaultdict(list)
+        self._positions_by_ge_cloud_id: Dict[Hashable, List[int]] = defaultdict(list)
+        self._unkeyed_positions: List[int] = []
+
+        expectation_configuration: ExpectationConfiguration
+        for expectation_configuration in expectations:
+            self.append(expectation_configuration=expectation_configuration)
+
+    def __len__(self) -> int:
+        return len(self._domain_keys)
+
+    @staticmethod
+    def get_domain_key(
+        expectation_configuration: ExpectationConfiguration,
+    ) -> Optional[Hashable]:
+        try:
+            return (
+                expectation_configuration.expectation_type,
+                _to_hashable(expectation_configuration.get_domain_kwargs()),
+            )
+        except (TypeError, gx_exceptions.GreatExpectationsError):
+            return None
+
+    def append(self, expectation_configuration: ExpectationConfiguration) -> None:
+        self._domain_keys.append(None)
+        self._ge_cloud_ids.append(None)
+        self._add_position(
+            position=len(self._domain_keys) - 1,
+            expectation_configuration=expectation_configuration,
+        )
+
+    def replace(
+        self, position: int, expectation_configuration: ExpectationConfiguration
+    ) -> None:
+        domain_key: Optional[Hashable] = self._domain_keys[position]
+        if domain_key is None:
+            self._unkeyed_positions.remove(position)
+        else:
+            self._positions_by_domain_key[domain_key].remove(position)
+
+        ge_cloud_id: Optional[Hashable] = self._ge_cloud_ids[position]
+        if ge_cloud_id is not None:
+            self._positions_by_ge_cloud_id[ge_cloud_id].remove(position)
+
+        self._add_position(
+            position=position, expectation_configuration=expectation_configuration
+        )
+
+    def refresh(
+        self, position: int, expectation_configuration: ExpectationConfiguration
+    ) -> None:
+        """Re-keys position, if domain or ge_cloud_id of its "ExpectationConfiguration" object has changed."""
+        if self._domain_keys[position] != self.get_domain_key(
+            expectation_configuration=expectation_configuration
+        ) or self._ge_cloud_ids[position] != self._get_ge_cloud_id(
+            expectation_configuration=expectation_configuration
+        ):
+            self.replace(
+                position=position,
+                expectation_configuration=expectation_configuration,
+            )
+
+    def get_candidate_positions(
+        self,
+        expectation_configuration: Optional[ExpectationConfiguration] = None,
+        ge_cloud_id: Optional[str] = None,
+    ) -> Iterable[int]:
+        if ge_cloud_id is not None:
+            try:
+                return list(self._positions_by_ge_cloud_id.get(ge_cloud_id, []))
+            except TypeError:
+                return range(len(self._domain_keys))
+
+        domain_key: Optional[Hashable] = self.get_domain_key(
+            expectation_configuration=expectation_configuration  # type: ignore[arg-type]
+        )
+        if domain_key is None:
+            return range(len(self._domain_keys))
+
+        return sorted(
+            self._positions_by_domain_key.get(domain_key, []) + self._unkeyed_positions
+        )
+
+    def _add_position(
+        self, position: int, expectation_configuration: ExpectationConfiguration
+    ) -> None:
+        domain_key: Optional[Hashable] = self.get_domain_key(
+            expectation_configuration=expectation_configuration
+        )
+        self._domain_keys[position] = domain_key
+        if domain_key is None:
+            insort(self._unkeyed_positions, position)
+        else:
+            insort(self._positions_by_domain_key[domain_key], position)
+
+        ge_cloud_id: Optional[Hashable] = self._get_ge_cloud_id(
+            expectation_configuration=expectation_configuration
+        )
+        self._ge_cloud_ids[position] = ge_cloud_id
+        if ge_cloud_id is not None:
+            insort(self._positions_by_ge_cloud_id[ge_cloud_id], position)
+
+    @staticmethod
+    def _get_ge_cloud_id(
+        expectation_configuration: ExpectationConfiguration,
+    ) -> Optional[Hashable]:
+        ge_cloud_id: Optional[Hashable] = expectation_configuration.ge_cloud_id
+        try:
+            hash(ge_cloud_id)
+        except TypeError:
+            return None
+
+        return ge_cloud_id
+
+
+class _ExpectationConfigurationList(List[ExpectationConfiguration]):
+    """List of "ExpectationConfiguration" objects, which keeps its "_ExpectationConfigurationIndex" up to date.
+
+    Appending and assigning individual items update index in place; all other modifications discard it (index is
+    rebuilt upon next lookup).  Since items themselves can be modified in place, items handed out since last lookup (by
+    appending, assigning, indexing, or iterating) are re-keyed upon next lookup, so that cost of lookups does not grow
+    with size of list.  Items, which are modified after a lookup through references obtained before it, are not seen.
+    Copies (including deep copies and pickled objects) do not carry index over.
+    """
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self._expectation_index: Optional[_ExpectationConfigurationIndex] = None
+        self._exposed_positions: Set[int] = set()
+        self._all_positions_exposed: bool = False
+
+    def get_expectation_index(self) -> _ExpectationConfigurationIndex:
+        # In-place concatenation and repetition ("+=", "*=") are not overridden, but are detected by change of length.
+        if self._expectation_index is None or len(self._expectation_index) != len(self):
+            self._expectation_index = _ExpectationConfigurationIndex(
+                expectations=list(self)
+            )
+        else:
+            positions: Iterable[int] = (
+                range(len(self))
+                if self._all_positions_exposed
+                else self._exposed_positions
+            )
+            position: int
+            for position in positions:
+                self._expectation_index.refresh(
+                    position=position,
+                    expectation_configuration=super().__getitem__(position),
+                )
+
+        self._exposed_positions.clear()
+        self._all_positions_exposed = False
+        return self._expectation_index
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(key, int):
+            self._exposed_positions.add(key if key >= 0 else len(self) + key)
+        else:
+            self._all_positions_exposed = True
+
+        return value
+
+    def __iter__(self) -> Iterator[ExpectationConfiguration]:
+        self._all_positions_exposed = True
+        return super().__iter__()
+
+    def __reversed__(self) -> Iterator[ExpectationConfiguration]:
+        self._all_positions_exposed = True
+        return super().__reversed__()
+
+    def copy(self) -> List[ExpectationConfiguration]:
+        self._all_positions_exposed = True
+        return super().copy()
+
+    def append(self, expectation_configuration: ExpectationConfiguration) -> None:
+        super().append(expectation_configuration)
+        if self._expectation_index is not None:
+            self._expectation_index.append(
+                expectation_configuration=expectation_configuration
+            )
+            self._exposed_positions.add(len(self) - 1)
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        if self._expectation_index is None:
+            return
+
+        if isinstance(key, int):
+            position: int = key if key >= 0 else len(self) + key
+            self._expectation_index.replace(
+                position=position, expectation_configuration=value
+            )
+            self._exposed_positions.add(position)
+        else:
+            self._expectation_index = None
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._expectation_index = None
+
+    def extend(self, other) -> None:
+        super().extend(other)
+        self._expectation_index = None
+
+    def insert(self, index, value) -> None:
+        super().insert(index, value)
+        self._expectation_index = None
+
+    def pop(self, index=-1):
+        self._expectation_index = None
+        return super().pop(index)
+
+    def remove(self, value) -> None:
+        super().remove(value)
+        self._expectation_index = None
+
+    def clear(self) -> None:
+        super().clear()
+        self._expectation_index = None
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._expectation_index = None
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._expectation_index = None
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+
 @public_api
 @deprecated_argument(argument_name="data_asset_type", version="0.14.0")
 @new_argument(
@@ -106,12 +377,12 @@ class ExpectationSuite(SerializableDictDot):
 
         if expectations is None:
             expectations = []
-        self.expectations = [
+        self.expectations = _ExpectationConfigurationList(
             ExpectationConfiguration(**expectation)
             if isinstance(expectation, dict)
             else expectation
             for expectation in expectations
-        ]
+        )
         if evaluation_parameters is None:
             evaluation_parameters = {}
         self.evaluation_parameters = evaluation_parameters
@@ -404,11 +675,11 @@ class ExpectationSuite(SerializableDictDot):
             for expectation in self.expectations
             if expectation.expectation_type in expectation_types
         ]
-        self.expectations = [
+        self.expectations = _ExpectationConfigurationList(
             expectation
             for expectation in self.expectations
             if expectation.expectation_type not in expectation_types
-        ]
+        )
 
         return removed_expectations
 
@@ -450,8 +721,45 @@ class ExpectationSuite(SerializableDictDot):
                 "Ensure that expectation configuration is valid."
             )
 
+        all_indexes: Iterable[int] = range(len(self.expectations))
+
+        # Only candidates, narrowed down by index, are checked (rather than all Expectations in this Suite).
+        candidate_indexes: Iterable[int] = all_indexes
+        if isinstance(self.expectations, _ExpectationConfigurationList):
+            candidate_indexes = (
+                self.expectations.get_expectation_index().get_candidate_positions(
+                    expectation_configuration=expectation_configuration,
+                    ge_cloud_id=ge_cloud_id,
+                )
+            )
+
+        match_indexes = self._get_matching_expectation_indexes(
+            candidate_indexes=candidate_indexes,
+            expectation_configuration=expectation_configuration,
+            match_type=match_type,
+            ge_cloud_id=ge_cloud_id,
+        )
+        if not match_indexes and ge_cloud_id is not None:
+            # Value of "ge_cloud_id" can be assigned to "ExpectationConfiguration" after it has been added to Suite.
+            match_indexes = self._get_matching_expectation_indexes(
+                candidate_indexes=all_indexes,
+                expectation_configuration=expectation_configuration,
+                match_type=match_type,
+                ge_cloud_id=ge_cloud_id,
+            )
+
+        return match_indexes
+
+    def _get_matching_expectation_indexes(
+        self,
+        candidate_indexes: Iterable[int],
+        expectation_configuration: Optional[ExpectationConfiguration] = None,
+        match_type: str = "domain",
+        ge_cloud_id: Optional[str] = None,
+    ) -> List[int]:
         match_indexes = []
-        for idx, expectation in enumerate(self.expectations):
+        for idx in candidate_indexes:
+            expectation = self.expectations[idx]
             if ge_cloud_id is not None:
                 if expectation.ge_cloud_id == ge_cloud_id:
                     match_indexes.append(idx)
@@ -583,8 +891,12 @@ class ExpectationSuite(SerializableDictDot):
                 "criteria"
             )
 
-        self.expectations[found_expectation_indexes[0]].patch(op, path, value)
-        return self.expectations[found_expectation_indexes[0]]
+        patched_expectation: ExpectationConfiguration = self.expectations[
+            found_expectation_indexes[0]
+        ].patch(op, path, value)
+        # Assigning patched "ExpectationConfiguration" back keeps index of this Suite up to date.
+        self.expectations[found_expectation_indexes[0]] = patched_expectation
+        return patched_expectation
 
     def _add_expectation(
         self,
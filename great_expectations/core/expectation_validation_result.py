@@ -4,7 +4,7 @@ import datetime
 import json
 import logging
 from copy import deepcopy
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from marshmallow import Schema, fields, post_dump, post_load, pre_dump
 from typing_extensions import TypedDict
@@ -67,6 +67,19 @@ def get_metric_kwargs_id(metric_kwargs: dict) -> str | None:
     return None
 
 
+class SpilledUnexpectedList(list):
+    """Leading part of unexpected index list (or of unexpected rows), whose complete contents were spilled to file.
+
+    The file at "path" is gzip-compressed JSON Lines, holding one unexpected index (or row) dictionary per line.  Spill
+    files are kept, unless "unexpected_spill_retention_seconds" of "result_format" is set: then subsequent spills into
+    the same directory delete spill files older than that.
+    """
+
+    def __init__(self, unexpected_list: List[Dict[str, Any]], path: str) -> None:
+        super().__init__(unexpected_list)
+        self.path = path
+
+
 @public_api
 class ExpectationValidationResult(SerializableDictDot):
     """An Expectation validation result.
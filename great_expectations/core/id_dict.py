@@ -33,6 +33,77 @@ class IDDict(dict):
         return _result_hash
 
 
+class FrozenIDDict(IDDict):
+    """IDDict, whose ID (and hash) is computed only once and is then reused by every subsequent "to_id()" call.
+
+    Entries can be added and changed freely until the ID is first computed; from then on, the dictionary is frozen, and
+    any attempt to modify it raises "TypeError" (so as to detect mutations that would otherwise leave the cached ID
+    stale).  Values are not frozen; mutating nested containers in place after the ID is computed must be avoided.
+
+    Copies (shallow or deep) of FrozenIDDict are not frozen, since their IDs have not yet been computed.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._id: Union[str, tuple, None] = None
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether or not the ID has been computed (and further modifications are therefore disallowed)."""
+        return self._id is not None
+
+    def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is not None or id_ignore_keys is not None:
+            return super().to_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+
+        if self._id is None:
+            self._id = super().to_id()
+
+        return self._id
+
+    def _raise_if_frozen(self) -> None:
+        if self._id is not None:
+            raise TypeError(
+                f"""{type(self).__name__} cannot be modified after its ID has been computed (ID: "{self._id}")."""
+            )
+
+    def __setitem__(self, key, value) -> None:
+        self._raise_if_frozen()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key) -> None:
+        self._raise_if_frozen()
+        super().__delitem__(key)
+
+    def __ior__(self, other):  # type: ignore[misc] # in-place "|=" returns self (unlike "|"), as for dict itself
+        # "dict.__ior__" does not call "update()" (and is absent before Python 3.9).
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        self._raise_if_frozen()
+        super().clear()
+
+    def pop(self, *args):
+        self._raise_if_frozen()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._raise_if_frozen()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._raise_if_frozen()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        self._raise_if_frozen()
+        super().update(*args, **kwargs)
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
 def deep_convert_properties_iterable_to_id_dict(
     source: Union[T, dict]
 ) -> Union[T, IDDict]:
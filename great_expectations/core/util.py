@@ -198,6 +198,13 @@ JSONConvertable: TypeAlias = Union[
 ]
 
 
+# Types, whose (exact) instances are JSON-serializable as they are.
+_JSON_NATIVE_SCALAR_TYPES = (str, int, bool)
+
+# Datetime units, for which "numpy.ndarray.tolist()" returns "datetime.datetime" objects.
+_DATETIME64_UNITS_CONVERTED_TO_DATETIME = ("h", "m", "s", "ms", "us")
+
+
 @overload
 def convert_to_json_serializable(  # type: ignore[misc] # overlap with `ToList`?
     data: ToDict,
@@ -273,6 +280,10 @@ def convert_to_json_serializable(  # noqa: C901 - complexity 32
     Raises:
         TypeError: A non-JSON-serializable field was found.
     """
+    # Fast path for most common (scalar) values, which are JSON-serializable as they are.
+    if type(data) in _JSON_NATIVE_SCALAR_TYPES:
+        return data  # type: ignore[return-value] # checked type
+
     # If it's one of our types, we use our own conversion; this can move to full schema
     # once nesting goes all the way down
     from great_expectations.datasource.fluent.interfaces import (
@@ -309,17 +320,16 @@ def convert_to_json_serializable(  # noqa: C901 - complexity 32
         return new_dict
 
     if isinstance(data, (list, tuple, set)):
-        new_list: List[JSONValues] = []
-        for val in data:
-            new_list.append(convert_to_json_serializable(val))
+        return _convert_list_to_json_serializable(data=data)
 
-        return new_list
+    if isinstance(data, np.ndarray):
+        return _convert_ndarray_to_json_serializable(data=data)
 
-    if isinstance(data, (np.ndarray, pd.Index)):
-        # test_obj[key] = test_obj[key].tolist()
-        # If we have an array or index, convert it first to a list--causing coercion to float--and then round
-        # to the number of digits for which the string representation will equal the float representation
-        return [convert_to_json_serializable(x) for x in data.tolist()]
+    if isinstance(data, pd.Index):
+        if _is_numpy_numeric_dtype(dtype=data.dtype):
+            return _convert_ndarray_to_json_serializable(data=data.to_numpy())
+
+        return _convert_list_to_json_serializable(data=data.tolist())
 
     if isinstance(data, np.int64):
         return int(data)
@@ -381,14 +391,26 @@ def convert_to_json_serializable(  # noqa: C901 - complexity 32
         value_name = data.name or "value"
         return [
             {
-                index_name: convert_to_json_serializable(idx),
-                value_name: convert_to_json_serializable(val),
+                index_name: idx,
+                value_name: val,
             }
-            for idx, val in data.items()
+            for idx, val in zip(
+                convert_to_json_serializable(data.index),
+                _convert_series_values_to_json_serializable(data=data),
+            )
         ]
 
     if isinstance(data, pd.DataFrame):
-        return convert_to_json_serializable(data.to_dict(orient="records"))
+        if data.columns.empty or not data.columns.is_unique:
+            return convert_to_json_serializable(data.to_dict(orient="records"))
+
+        # Columns are converted one at a time (each with converter for its dtype) and then assembled into records.
+        column_names: List[str] = [str(column) for column in data.columns]
+        column_values: List[list] = [
+            _convert_series_values_to_json_serializable(data=data.iloc[:, idx])
+            for idx in range(len(column_names))
+        ]
+        return [dict(zip(column_names, row)) for row in zip(*column_values)]
 
     if pyspark_sql_DataFrame and isinstance(data, pyspark_sql_DataFrame):  # type: ignore[truthy-function]
         # using StackOverflow suggestion for converting pyspark df into dictionary
@@ -424,6 +446,78 @@ def convert_to_json_serializable(  # noqa: C901 - complexity 32
     )
 
 
+def _convert_list_to_json_serializable(data: Union[list, tuple, set]) -> list:
+    """Converts elements of collection, leaving (most common) JSON-native scalars as they are without function call."""
+    return [
+        val
+        if type(val) in _JSON_NATIVE_SCALAR_TYPES
+        or (type(val) is float and val == val)  # "val != val" only for "NaN"
+        else convert_to_json_serializable(val)
+        for val in data
+    ]
+
+
+def _is_numpy_numeric_dtype(dtype: Any) -> bool:
+    return isinstance(dtype, np.dtype) and dtype.kind in "biuf"
+
+
+def _convert_series_values_to_json_serializable(data: pd.Series) -> list:
+    if _is_numpy_numeric_dtype(dtype=data.dtype):
+        return _convert_ndarray_to_json_serializable(data=data.to_numpy())
+
+    return _convert_list_to_json_serializable(data=list(data))
+
+
+def _convert_ndarray_to_json_serializable(data: np.ndarray) -> list:
+    """Converts whole array at once (according to its dtype), rather than element by element, where possible.
+
+    Results are same as those of converting elements of "data.tolist()" one by one (e.g., "NaN" values become "None").
+    """
+    if data.dtype.kind in "biuU":
+        # Python "bool", "int", and "str" values of "tolist()" need no further conversion.
+        return data.tolist()
+
+    if data.dtype.kind == "f" and data.dtype.itemsize <= 8:
+        # Python "float" values of "tolist()" need no further conversion ("numpy.longdouble" values are not "float").
+        nan_mask: np.ndarray = np.isnan(data)
+        if not nan_mask.any():
+            return data.tolist()
+
+        converted: np.ndarray = data.astype(object)
+        converted[nan_mask] = None
+        return converted.tolist()
+
+    if (
+        data.dtype.kind == "M"
+        and np.datetime_data(data.dtype)[0] in _DATETIME64_UNITS_CONVERTED_TO_DATETIME
+    ):
+        return _convert_datetime64_ndarray_to_json_serializable(data=data)
+
+    # If we have an array, convert it first to a list--causing coercion to Python types--and then convert elements.
+    return _convert_list_to_json_serializable(data=data.tolist())
+
+
+def _convert_datetime64_ndarray_to_json_serializable(data: np.ndarray) -> list:
+    """Formats "datetime64" values as "datetime.datetime.isoformat()" would (omitting zero microseconds); "NaT" is None."""
+    nat_mask: np.ndarray = np.isnat(data)
+    values: np.ndarray = data[~nat_mask]
+    if values.size and (
+        values.min() < np.datetime64("0001-01-01")
+        or values.max() >= np.datetime64("10000-01-01")
+    ):
+        # Outside of "datetime.datetime" range, "tolist()" returns integers, which are left to elementwise conversion.
+        return [convert_to_json_serializable(val) for val in data.tolist()]
+
+    data = data.astype("datetime64[us]")
+    converted: np.ndarray = np.where(
+        data == data.astype("datetime64[s]"),
+        np.datetime_as_string(data, unit="s"),
+        np.datetime_as_string(data, unit="us"),
+    ).astype(object)
+    converted[nat_mask] = None
+    return converted.tolist()
+
+
 def ensure_json_serializable(data):  # noqa: C901 - complexity 21
     """
     Helper function to convert an object to one that is json serializable
@@ -19,6 +19,7 @@ from typing import (
     Dict,
     List,
     Mapping,
+    MutableMapping,
     Optional,
     Sequence,
     Tuple,
@@ -113,6 +114,7 @@ from great_expectations.datasource.fluent.interfaces import (
     Datasource as FluentDatasource,
 )
 from great_expectations.datasource.fluent.sources import _SourceFactories
+from great_expectations.datasource.lazy_datasource_dict import LazyDatasourceDict
 from great_expectations.datasource.new_datasource import BaseDatasource, Datasource
 from great_expectations.profile.basic_dataset_profiler import BasicDatasetProfiler
 from great_expectations.rule_based_profiler.data_assistant.data_assistant_dispatcher import (
@@ -296,8 +298,10 @@ class AbstractDataContext(ConfigPeer, ABC):
             self.project_config_with_variables_substituted.anonymous_usage_statistics
         )
 
-        # Store cached datasources but don't init them
-        self._cached_datasources: dict = {}
+        # Store cached datasources but don't init them (they are instantiated upon first access)
+        self._cached_datasources: LazyDatasourceDict = LazyDatasourceDict(
+            datasource_factory=self._instantiate_datasource_from_datasource_config
+        )
 
         # Build the datasources we know about and have access to
         self._init_datasources()
@@ -1121,7 +1125,8 @@ class AbstractDataContext(ConfigPeer, ABC):
         }.intersection(set(kwargs.keys())):
             return "v3"
 
-        if not self.datasources:
+        # Truth testing of datasource cache does not instantiate datasources (unlike "len()").
+        if not self._cached_datasources:
             return None
 
         api_version: Optional[str] = None
@@ -4437,15 +4442,17 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
     @property
     def datasources(
         self,
-    ) -> Dict[str, Union[LegacyDatasource, BaseDatasource, FluentDatasource]]:
-        """A single holder for all Datasources in this context"""
+    ) -> MutableMapping[str, Union[LegacyDatasource, BaseDatasource, FluentDatasource]]:
+        """A single holder for all Datasources in this context (each is instantiated upon its first access)"""
         return self._cached_datasources
 
     @property
     def fluent_datasources(self) -> Dict[str, FluentDatasource]:
+        # Datasources, which have not been instantiated yet, are block-config (not fluent) datasources; skipping them
+        # avoids instantiating all datasources.
         return {
             name: ds
-            for (name, ds) in self.datasources.items()
+            for (name, ds) in self._cached_datasources.instantiated_items()
             if isinstance(ds, FluentDatasource)
         }
 
@@ -4499,38 +4506,49 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
         )
 
     def _init_datasources(self) -> None:
-        """Initialize the datasources in store"""
+        """Initialize the datasources in store
+
+        Datasources are not instantiated here; their configurations are registered with datasource cache, which
+        instantiates each datasource upon first access (e.g., "get_datasource()" or batch request) of that datasource.
+        """
         config: DataContextConfig = self.config
         datasources: Dict[str, DatasourceConfig] = cast(
             Dict[str, DatasourceConfig], config.datasources
         )
 
         for datasource_name, datasource_config in datasources.items():
-            try:
-                config = copy.deepcopy(datasource_config)  # type: ignore[assignment]
+            self._cached_datasources.add_datasource_config(
+                datasource_name=datasource_name, datasource_config=datasource_config
+            )
 
-                raw_config_dict = dict(datasourceConfigSchema.dump(config))
-                substituted_config_dict: dict = self.config_provider.substitute_config(
-                    raw_config_dict
-                )
+    def _instantiate_datasource_from_datasource_config(
+        self, datasource_name: str, datasource_config: DatasourceConfig
+    ) -> Optional[Datasource]:
+        """Substitute variables in configuration of datasource and instantiate it (None if it cannot be initialized)."""
+        try:
+            config = copy.deepcopy(datasource_config)
 
-                raw_datasource_config = datasourceConfigSchema.load(raw_config_dict)
-                substituted_datasource_config = datasourceConfigSchema.load(
-                    substituted_config_dict
-                )
-                substituted_datasource_config.name = datasource_name
+            raw_config_dict = dict(datasourceConfigSchema.dump(config))
+            substituted_config_dict: dict = self.config_provider.substitute_config(
+                raw_config_dict
+            )
 
-                datasource = self._instantiate_datasource_from_config(
-                    raw_config=raw_datasource_config,
-                    substituted_config=substituted_datasource_config,
-                )
-                self._cached_datasources[datasource_name] = datasource
-            except gx_exceptions.DatasourceInitializationError as e:
-                logger.warning(f"Cannot initialize datasource {datasource_name}: {e}")
-                # this error will happen if our configuration contains datasources that GX can no longer connect to.
-                # this is ok, as long as we don't use it to retrieve a batch. If we try to do that, the error will be
-                # caught at the context.get_batch() step. So we just pass here.
-                pass
+            raw_datasource_config = datasourceConfigSchema.load(raw_config_dict)
+            substituted_datasource_config = datasourceConfigSchema.load(
+                substituted_config_dict
+            )
+            substituted_datasource_config.name = datasource_name
+
+            return self._instantiate_datasource_from_config(
+                raw_config=raw_datasource_config,
+                substituted_config=substituted_datasource_config,
+            )
+        except gx_exceptions.DatasourceInitializationError as e:
+            logger.warning(f"Cannot initialize datasource {datasource_name}: {e}")
+            # this error will happen if our configuration contains datasources that GX can no longer connect to.
+            # this is ok, as long as we don't use it to retrieve a batch. If we try to do that, the error will be
+            # caught at the context.get_batch() step. So we just pass here.
+            return None
 
     def _instantiate_datasource_from_config(
         self,
@@ -4650,8 +4668,9 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
             DatasourceInitializationError
         """
         # If attempting to override an existing value, ensure that the id persists
+        # Name is optional in DatasourceConfig; datasources without name cannot be looked up (and are not cached).
         name = config.name
-        if not config.id and name in self._cached_datasources:
+        if not config.id and name is not None and name in self._cached_datasources:
             existing_datasource = self._cached_datasources[name]
             if isinstance(existing_datasource, BaseDatasource):
                 config.id = existing_datasource.id
@@ -4671,7 +4690,8 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
                 datasource = self._instantiate_datasource_from_config(
                     raw_config=config, substituted_config=substituted_config
                 )
-                self._cached_datasources[name] = datasource
+                if name is not None:
+                    self._cached_datasources[name] = datasource
             except gx_exceptions.DatasourceInitializationError as e:
                 if save_changes:
                     self._datasource_store.delete(config)
@@ -4826,6 +4846,8 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
             "active_batch_definition", {}
         ).get("data_asset_name")
 
+        # Metrics are collected first, and then stored with one bulk operation of target store.
+        metrics_to_store: List[Tuple[ValidationMetricIdentifier, Any]] = []
         for expectation_suite_dependency, metrics_list in requested_metrics.items():
             if (expectation_suite_dependency != "*") and (
                 expectation_suite_dependency != expectation_suite_name
@@ -4849,19 +4871,21 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
                         metric_value = validation_results.get_metric(
                             metric_name, **metric_kwargs
                         )
-                        self.stores[target_store_name].set(
-                            ValidationMetricIdentifier(
-                                run_id=run_id,
-                                data_asset_name=data_asset_name,
-                                expectation_suite_identifier=ExpectationSuiteIdentifier(
-                                    expectation_suite_name
-                                ),
-                                metric_name=metric_name,
-                                metric_kwargs_id=get_metric_kwargs_id(
-                                    metric_kwargs=metric_kwargs
+                        metrics_to_store.append(
+                            (
+                                ValidationMetricIdentifier(
+                                    run_id=run_id,
+                                    data_asset_name=data_asset_name,
+                                    expectation_suite_identifier=ExpectationSuiteIdentifier(
+                                        expectation_suite_name
+                                    ),
+                                    metric_name=metric_name,
+                                    metric_kwargs_id=get_metric_kwargs_id(
+                                        metric_kwargs=metric_kwargs
+                                    ),
                                 ),
-                            ),
-                            metric_value,
+                                metric_value,
+                            )
                         )
                     except gx_exceptions.UnavailableMetricError:
                         # This will happen frequently in larger pipelines
@@ -4870,6 +4894,9 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
                             "this validation result.".format(metric_name)
                         )
 
+        if metrics_to_store:
+            self.stores[target_store_name].set_many(metrics_to_store)
+
     def send_usage_message(
         self, event: str, event_payload: Optional[dict], success: Optional[bool] = None
     ) -> None:
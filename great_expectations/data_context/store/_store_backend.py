@@ -2,7 +2,7 @@ import logging
 import urllib
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import pyparsing as pp
 
@@ -131,6 +131,35 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")
 
+    def get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        """Retrieves values of all given keys (in the same order) at once.
+
+        Like "get", this fails if any of the keys does not exist.  Backends, for which retrieving many values together
+        is cheaper than retrieving them one by one (e.g. in one database query), override "_get_many".
+        """
+        for key in keys:
+            self._validate_key(key)
+
+        return self._get_many(keys, **kwargs)
+
+    def set_many(self, key_value_pairs: List[Tuple[tuple, Any]], **kwargs) -> None:
+        """Stores all given (key, value) pairs at once.
+
+        Unlike "set", this does not return anything.  Backends, for which storing many values together is cheaper than
+        storing them one by one (e.g. in one database transaction), override "_set_many".
+        """
+        for key, value in key_value_pairs:
+            self._validate_key(key)
+            self._validate_value(value)
+
+        try:
+            self._set_many(key_value_pairs, **kwargs)
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError(
+                "ValueError while calling _set_many on store backend."
+            )
+
     def add(self, key, value, **kwargs):
         """
         Essentially `set` but validates that a given key-value pair does not already exist.
@@ -211,6 +240,13 @@ class StoreBackend(metaclass=ABCMeta):
     def _set(self, key, value, **kwargs) -> None:
         raise NotImplementedError
 
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        return [self._get(key, **kwargs) for key in keys]
+
+    def _set_many(self, key_value_pairs: List[Tuple[tuple, Any]], **kwargs) -> None:
+        for key, value in key_value_pairs:
+            self._set(key, value, **kwargs)
+
     @abstractmethod
     def _move(self, source_key, dest_key, **kwargs) -> None:
         raise NotImplementedError
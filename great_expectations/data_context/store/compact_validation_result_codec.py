@@ -0,0 +1,142 @@
+"""Compact, text-safe envelope for serialized Validation Results.
+
+A Validation Result (serialized by "ExpectationSuiteValidationResultSchema") is split into two blocks, each encoded
+(as compact JSON or as msgpack), optionally compressed (with gzip or zstd), and base64-encoded:
+
+    GXVR/1 encoding=<encoding> compression=<compression>
+    <summary block: every field, except for "results">
+    <results block: "results" (Expectation Validation Results, including any unexpected values)>
+
+Keeping the two blocks apart allows summary of Validation Result (success, statistics, meta, etc.) to be read without
+decompressing (and decoding) its individual Expectation Validation Results.  Base64 keeps the envelope a string, which
+every store backend can persist.
+"""
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+from typing import Any, Optional
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.optional_imports import msgpack, zstandard
+
+
+class CompactValidationResultCodec:
+    """Encodes serialized Validation Results (dictionaries) into compact envelope and decodes them back.
+
+    Args:
+        encoding: "json" (compact JSON) or "msgpack" (requires "msgpack" package).
+        compression: "gzip", "zstd" (requires "zstandard" package), or None.
+    """
+
+    HEADER_PREFIX = "GXVR/1"
+    FILEPATH_SUFFIX = ".gxvr"
+    ENCODINGS = ("json", "msgpack")
+    COMPRESSIONS = ("gzip", "zstd", None)
+
+    def __init__(
+        self, encoding: str = "json", compression: Optional[str] = "gzip"
+    ) -> None:
+        if encoding not in self.ENCODINGS:
+            raise gx_exceptions.InvalidConfigError(
+                f'Unsupported encoding "{encoding}" of compact Validation Results (supported: {self.ENCODINGS}).'
+            )
+
+        if compression not in self.COMPRESSIONS:
+            raise gx_exceptions.InvalidConfigError(
+                f'Unsupported compression "{compression}" of compact Validation Results (supported: {self.COMPRESSIONS}).'
+            )
+
+        if encoding == "msgpack" and not msgpack:
+            raise gx_exceptions.InvalidConfigError(str(msgpack))
+
+        if compression == "zstd" and not zstandard:
+            raise gx_exceptions.InvalidConfigError(str(zstandard))
+
+        self._encoding = encoding
+        self._compression = compression
+
+    @property
+    def encoding(self) -> str:
+        return self._encoding
+
+    @property
+    def compression(self) -> Optional[str]:
+        return self._compression
+
+    @classmethod
+    def is_encoded(cls, value: Any) -> bool:
+        return isinstance(value, str) and value.startswith(cls.HEADER_PREFIX)
+
+    def encode(self, validation_result_dict: dict) -> str:
+        summary: dict = {
+            key: value
+            for key, value in validation_result_dict.items()
+            if key != "results"
+        }
+        results: list = validation_result_dict.get("results") or []
+        header: str = f"{self.HEADER_PREFIX} encoding={self._encoding} compression={self._compression or 'none'}"
+        return "\n".join(
+            (
+                header,
+                self._encode_block(value=summary),
+                self._encode_block(value=results),
+            )
+        )
+
+    @classmethod
+    def decode(cls, value: str, summary_only: bool = False) -> dict:
+        """Returns serialized Validation Result; with "summary_only", its "results" are left empty (and not decoded)."""
+        header: str
+        summary_block: str
+        results_block: str
+        try:
+            header, summary_block, results_block = value.split("\n", 2)
+            options: dict = dict(
+                option.split("=", 1) for option in header.split(" ")[1:]
+            )
+            codec = cls(
+                encoding=options["encoding"],
+                compression=None
+                if options["compression"] == "none"
+                else options["compression"],
+            )
+        except (KeyError, ValueError, gx_exceptions.InvalidConfigError) as e:
+            # Missing optional dependency (e.g., "msgpack") of stored Validation Result is reported as "InvalidConfigError".
+            raise gx_exceptions.StoreError(
+                f"Unable to decode compact Validation Result: {str(e)}"
+            ) from e
+
+        validation_result_dict: dict = codec._decode_block(block=summary_block)
+        validation_result_dict["results"] = (
+            [] if summary_only else codec._decode_block(block=results_block)
+        )
+        return validation_result_dict
+
+    def _encode_block(self, value: Any) -> str:
+        data: bytes
+        if self._encoding == "msgpack":
+            data = msgpack.packb(value, use_bin_type=True)
+        else:
+            data = json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+        if self._compression == "gzip":
+            data = gzip.compress(data)
+        elif self._compression == "zstd":
+            data = zstandard.ZstdCompressor().compress(data)
+
+        return base64.b64encode(data).decode("ascii")
+
+    def _decode_block(self, block: str) -> Any:
+        data: bytes = base64.b64decode(block)
+
+        if self._compression == "gzip":
+            data = gzip.decompress(data)
+        elif self._compression == "zstd":
+            data = zstandard.ZstdDecompressor().decompress(data)
+
+        if self._encoding == "msgpack":
+            return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+        return json.loads(data.decode("utf-8"))
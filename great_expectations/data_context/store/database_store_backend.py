@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import uuid
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.data_context.store.store_backend import StoreBackend
@@ -11,7 +11,10 @@ from great_expectations.optional_imports import (
     SQLAlchemyError,
     sqlalchemy_engine_Row,
     sqlalchemy_IntegrityError,
+    sqlalchemy_mysql_insert,
     sqlalchemy_NoSuchTableError,
+    sqlalchemy_postgresql_insert,
+    sqlalchemy_sqlite_insert,
 )
 from great_expectations.optional_imports import (
     sqlalchemy as sa,
@@ -30,6 +33,10 @@ logger = logging.getLogger(__name__)
 
 
 class DatabaseStoreBackend(StoreBackend):
+    # Bulk operations are split into statements with at most this many bound parameters (SQLite, prior to version
+    # 3.32, allows at most 999 of them per statement).
+    BULK_OPERATION_MAX_PARAMETERS = 900
+
     def __init__(  # noqa: C901 - 16
         self,
         table_name,
@@ -284,6 +291,206 @@ class DatabaseStoreBackend(StoreBackend):
                     f"Integrity error {str(e)} while trying to store key"
                 )
 
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        """Retrieves values of all keys in one transaction (with one query per chunk of keys).
+
+        Rows are matched to keys by key column values exactly as returned by the database.  The database may match keys
+        differently (e.g., under case-insensitive collation, or with padding of CHAR columns); keys, which are not
+        matched exactly by any returned row, are therefore looked up one by one (as "_get" does).
+        """
+        values_by_key: Dict[tuple, Any] = {}
+        key_columns = [getattr(self._table.columns, col) for col in self.key_columns]
+        unmatched_keys: List[tuple]
+        try:
+            with self.engine.begin() as connection:
+                for keys_chunk in self._get_chunks(keys):
+                    sel = sa.select(*key_columns, self._table.columns.value).where(
+                        self._get_keys_clause(keys=keys_chunk)
+                    )
+                    for row in connection.execute(sel).fetchall():
+                        values_by_key[tuple(row[:-1])] = row[-1]
+
+                unmatched_keys = [
+                    key for key in keys if tuple(key) not in values_by_key
+                ]
+                for key in unmatched_keys:
+                    sel = sa.select(self._table.columns.value).where(
+                        self._get_keys_clause(keys=[key])
+                    )
+                    row = connection.execute(sel).fetchone()
+                    if row is None:
+                        raise gx_exceptions.StoreError(
+                            f"Unable to fetch value for key: {str(key)}"
+                        )
+
+                    values_by_key[tuple(key)] = row[0]
+        except SQLAlchemyError as e:
+            logger.debug(f"Error fetching values: {str(e)}")
+            raise gx_exceptions.StoreError(
+                f"Unable to fetch values for {len(keys)} keys."
+            )
+
+        return [values_by_key[tuple(key)] for key in keys]
+
+    def _set_many(
+        self, key_value_pairs: List[Tuple[tuple, Any]], allow_update=True, **kwargs
+    ) -> None:
+        """Stores all (key, value) pairs in one transaction, using multi-row INSERT statements.
+
+        With "allow_update", existing keys are updated by native upsert of dialect (ON CONFLICT for PostgreSQL and
+        SQLite, ON DUPLICATE KEY for MySQL) or, for other dialects, by UPDATE of keys found to exist in the same
+        transaction.  If the transaction fails on integrity error (e.g. a key exists, and "allow_update" is False), the
+        pairs are stored one by one, so that "_set" reports the offending key.
+        """
+        # The last value of a repeated key wins (as it would, were the pairs stored one by one).
+        rows_by_key: Dict[tuple, dict] = {
+            tuple(key): self._get_row(key=key, value=value)
+            for key, value in key_value_pairs
+        }
+        if not rows_by_key:
+            return
+
+        rows_chunk: List[dict]
+        try:
+            with self.engine.begin() as connection:
+                for rows_chunk in self._get_chunks(
+                    list(rows_by_key.values()), parameters_per_item=len(self._table.c)
+                ):
+                    self._insert_rows(
+                        connection=connection,
+                        rows=rows_chunk,
+                        allow_update=allow_update,
+                    )
+        except sqlalchemy_IntegrityError as e:
+            logger.debug(f"Integrity error {str(e)} while storing many keys.")
+            for key, row in rows_by_key.items():
+                self._set(key, row["value"], allow_update=allow_update, **kwargs)
+        except SQLAlchemyError as e:
+            raise gx_exceptions.StoreBackendError(
+                f"Unable to store {len(rows_by_key)} keys: got sqlalchemy error {str(e)}"
+            )
+
+    def _insert_rows(
+        self,
+        connection: "sa.engine.Connection",  # noqa: UP037
+        rows: List[dict],
+        allow_update: bool,
+    ) -> None:
+        if not allow_update:
+            connection.execute(self._table.insert().values(rows))
+            return
+
+        upsert = self._get_upsert_statement(rows=rows)
+        if upsert is not None:
+            connection.execute(upsert)
+            return
+
+        key_columns = [getattr(self._table.columns, col) for col in self.key_columns]
+        existing_keys = {
+            tuple(row)
+            for row in connection.execute(
+                sa.select(*key_columns).where(
+                    self._get_keys_clause(
+                        keys=[
+                            tuple(row[col] for col in self.key_columns) for row in rows
+                        ]
+                    )
+                )
+            ).fetchall()
+        }
+        rows_to_update: List[dict] = []
+        rows_to_insert: List[dict] = []
+        for row in rows:
+            if tuple(row[col] for col in self.key_columns) in existing_keys:
+                rows_to_update.append(row)
+            else:
+                rows_to_insert.append(row)
+
+        if rows_to_update:
+            update = (
+                self._table.update()
+                .where(
+                    sa.and_(
+                        *(
+                            getattr(self._table.columns, col)
+                            == sa.bindparam(f"key_{col}")
+                            for col in self.key_columns
+                        )
+                    )
+                )
+                .values(value=sa.bindparam("value"))
+            )
+            connection.execute(
+                update,
+                [
+                    {
+                        "value": row["value"],
+                        **{f"key_{col}": row[col] for col in self.key_columns},
+                    }
+                    for row in rows_to_update
+                ],
+            )
+
+        if rows_to_insert:
+            connection.execute(self._table.insert().values(rows_to_insert))
+
+    def _get_upsert_statement(self, rows: List[dict]) -> Optional[Any]:
+        """Returns multi-row INSERT, which updates values of existing keys, if dialect supports one (None otherwise)."""
+        # Native upsert relies on primary key constraint over key columns, which a pre-existing table may not have.
+        if {col.name for col in self._table.primary_key.columns} != set(
+            self.key_columns
+        ):
+            return None
+
+        dialect_name: str = self.engine.dialect.name
+        if dialect_name in ("postgresql", "sqlite"):
+            insert = (
+                sqlalchemy_postgresql_insert
+                if dialect_name == "postgresql"
+                else sqlalchemy_sqlite_insert
+            )
+            ins = insert(self._table).values(rows)
+            return ins.on_conflict_do_update(
+                index_elements=self.key_columns, set_={"value": ins.excluded.value}
+            )
+
+        if dialect_name == "mysql":
+            ins = sqlalchemy_mysql_insert(self._table).values(rows)
+            return ins.on_duplicate_key_update(value=ins.inserted.value)
+
+        return None
+
+    def _get_row(self, key: tuple, value: Any) -> dict:
+        row = {k: v for (k, v) in zip(self.key_columns, key)}
+        row["value"] = value
+        return row
+
+    def _get_keys_clause(self, keys: List[tuple]):
+        return sa.or_(
+            *(
+                sa.and_(
+                    *(
+                        getattr(self._table.columns, key_col) == val
+                        for key_col, val in zip(self.key_columns, key)
+                    )
+                )
+                for key in keys
+            )
+        )
+
+    def _get_chunks(
+        self, items: list, parameters_per_item: Optional[int] = None
+    ) -> List[list]:
+        if parameters_per_item is None:
+            parameters_per_item = len(self.key_columns)
+
+        chunk_size: int = max(
+            1, self.BULK_OPERATION_MAX_PARAMETERS // max(1, parameters_per_item)
+        )
+        return [
+            items[idx : idx + chunk_size] for idx in range(0, len(items), chunk_size)
+        ]
+
     def _move(self) -> None:  # type: ignore[override]
         raise NotImplementedError
 
@@ -23,7 +23,11 @@ from great_expectations.data_context.util import (
     instantiate_class_from_config,
     load_class,
 )
-from great_expectations.exceptions import ClassInstantiationError, DataContextError
+from great_expectations.exceptions import (
+    ClassInstantiationError,
+    DataContextError,
+    InvalidKeyError,
+)
 from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
@@ -228,11 +232,36 @@ class HtmlSiteStore:
                 class_name=store_backend["class_name"],
             )
 
+        filepath_template = "data_docs_manifest.json"
+        manifest_config_defaults = {
+            "module_name": module_name,
+            "filepath_template": filepath_template,
+            "suppress_store_backend_id": True,
+        }
+        if is_gx_cloud_store:
+            manifest_config_defaults = {
+                "module_name": module_name,
+                "suppress_store_backend_id": True,
+            }
+
+        manifest_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults=manifest_config_defaults,
+        )
+        if not manifest_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
         self.store_backends = {
             ExpectationSuiteIdentifier: expectation_suite_identifier_obj,
             ValidationResultIdentifier: validation_result_idendifier_obj,
             "index_page": index_page_obj,
             "static_assets": static_assets_obj,
+            "manifest": manifest_obj,
         }
 
         # NOTE: Instead of using the filesystem as the source of record for keys,
@@ -372,6 +401,22 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    def read_manifest(self):
+        """Like "write_index_page()", this uses a zero-length tuple as a key; returns None if there is no manifest."""
+        try:
+            return self.store_backends["manifest"].get(())
+        except InvalidKeyError:
+            return None
+
+    def write_manifest(self, manifest):
+        """Writes serialized manifest of rendered resources (used by incremental builds of Data Docs site)."""
+        return self.store_backends["manifest"].set(
+            (),
+            manifest,
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+
     def clean_site(self) -> None:
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
@@ -97,11 +97,14 @@ class EvaluationParameterStore(MetricStore):
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
     def get_bind_params(self, run_id: RunIdentifier) -> dict:
-        params = {}
-        for k in self._store_backend.list_keys(run_id.to_tuple()):
-            key = self.tuple_to_key(k)
-            params[key.to_evaluation_parameter_urn()] = self.get(key)  # type: ignore[attr-defined]
-        return params
+        keys = [
+            self.tuple_to_key(k)
+            for k in self._store_backend.list_keys(run_id.to_tuple())
+        ]
+        return {
+            key.to_evaluation_parameter_urn(): value  # type: ignore[attr-defined]
+            for key, value in zip(keys, self.get_many(keys))
+        }
 
     @property
     def config(self) -> dict:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Type
 
 from typing_extensions import TypedDict
 
@@ -199,6 +199,41 @@ class Store:
             self.key_to_tuple(key), self.serialize(value), **kwargs
         )
 
+    def get_many(self, keys: Sequence[DataContextKey]) -> List[Optional[Any]]:
+        """Retrieves values of all given keys (in the same order) with one bulk operation of store backend."""
+        key: DataContextKey
+        for key in keys:
+            self._validate_key(key)
+
+        values: List[Any] = self._store_backend.get_many(
+            [self.key_to_tuple(key) for key in keys]
+        )
+        if self.cloud_mode:
+            values = [
+                self.ge_cloud_response_json_to_object_dict(response_json=value)
+                if value
+                else value
+                for value in values
+            ]
+
+        return [self.deserialize(value) if value else None for value in values]
+
+    def set_many(
+        self, key_value_pairs: Sequence[Tuple[DataContextKey, Any]], **kwargs
+    ) -> None:
+        """Stores all given (key, value) pairs with one bulk operation of store backend."""
+        key: DataContextKey
+        for key, _ in key_value_pairs:
+            self._validate_key(key)
+
+        self._store_backend.set_many(
+            [
+                (self.key_to_tuple(key), self.serialize(value))
+                for key, value in key_value_pairs
+            ],
+            **kwargs,
+        )
+
     def add(self, key: DataContextKey, value: Any, **kwargs) -> None:
         """
         Essentially `set` but validates that a given key-value pair does not already exist.
@@ -5,8 +5,11 @@ import os
 import random
 import re
 import shutil
+import threading
 from abc import ABCMeta
-from typing import Any, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
 
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
@@ -15,6 +18,59 @@ from great_expectations.util import filter_properties_dict
 logger = logging.getLogger(__name__)
 
 
+class _ObjectReadCache:
+    """Size-bounded (least recently used entries are evicted first), thread-safe cache of contents of store objects.
+
+    Every entry is tagged with version of object (e.g. ETag or generation), from which it was read, so that object can
+    be read again only if it has changed since.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._size = 0
+        self._entries: OrderedDict[str, Tuple[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, object_key: str) -> Optional[Tuple[str, Any]]:
+        """Returns (version, value) of object, if cached (None otherwise)."""
+        with self._lock:
+            entry: Optional[Tuple[str, Any]] = self._entries.get(object_key)
+            if entry is not None:
+                self._entries.move_to_end(object_key)
+
+            return entry
+
+    def set(self, object_key: str, version: str, value: Any) -> None:
+        value_size: int = self._get_value_size(value=value)
+        with self._lock:
+            self._remove(object_key=object_key)
+            if value_size > self._max_size:
+                return
+
+            self._entries[object_key] = (version, value)
+            self._size += value_size
+            while self._size > self._max_size:
+                self._remove(object_key=next(iter(self._entries)))
+
+    def invalidate(self, object_key: Optional[str] = None) -> None:
+        """Removes object (or, if no object key is given, all objects) from cache."""
+        with self._lock:
+            if object_key is None:
+                self._entries.clear()
+                self._size = 0
+            else:
+                self._remove(object_key=object_key)
+
+    def _remove(self, object_key: str) -> None:
+        entry: Optional[Tuple[str, Any]] = self._entries.pop(object_key, None)
+        if entry is not None:
+            self._size -= self._get_value_size(value=entry[1])
+
+    @staticmethod
+    def _get_value_size(value: Any) -> int:
+        return len(value) if isinstance(value, (str, bytes)) else 1
+
+
 class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     r"""
     If filepath_template is provided, the key to this StoreBackend abstract class must be a tuple with
@@ -22,8 +78,15 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
 
     For example, in the following template path: expectations/{0}/{1}/{2}/prefix-{2}.json, keys must have
     three components.
+
+    Backends of remote object stores may read objects of "get_many" concurrently (on up to "max_concurrent_reads"
+    threads) and may cache contents of objects they read ("cache_reads"), so that unchanged objects are not downloaded
+    again.
     """
 
+    # Max total size (in characters, or bytes) of object contents, kept by read cache of a store backend.
+    READ_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
     def __init__(
         self,
         filepath_template=None,
@@ -36,6 +99,8 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
         manually_initialize_store_backend_id: str = "",
         base_public_path=None,
         store_name=None,
+        max_concurrent_reads: int = 1,
+        cache_reads: bool = False,
     ) -> None:
         super().__init__(
             fixed_length_key=fixed_length_key,
@@ -65,6 +130,10 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
         self.filepath_prefix = filepath_prefix
         self.filepath_suffix = filepath_suffix
         self.base_public_path = base_public_path
+        self._max_concurrent_reads = max_concurrent_reads
+        self._read_cache: Optional[_ObjectReadCache] = (
+            _ObjectReadCache(max_size=self.READ_CACHE_MAX_SIZE) if cache_reads else None
+        )
 
         if filepath_template is not None:
             # key length is the number of unique values to be substituted in the filepath_template
@@ -73,6 +142,29 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             self.verify_that_key_to_filepath_operation_is_reversible()
             self._fixed_length_key = True
 
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        max_workers: int = min(len(keys), self._max_concurrent_reads)
+        if max_workers <= 1:
+            return super()._get_many(keys, **kwargs)
+
+        # Clients of object stores are thread-safe (and expensive to create), so all reads share one client.
+        client: Any = self._create_read_client()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Values are returned in order of keys; the first failing key (in that same order) raises its exception.
+            return list(
+                executor.map(
+                    functools.partial(self._get, client=client, **kwargs), keys
+                )
+            )
+
+    def _create_read_client(self) -> Any:
+        """Returns client, which "_get" of backend accepts (as "client" argument) for reading objects concurrently."""
+        raise NotImplementedError
+
+    def _invalidate_cached_object(self, object_key: Optional[str] = None) -> None:
+        if self._read_cache is not None:
+            self._read_cache.invalidate(object_key=object_key)
+
     def _validate_key(self, key) -> None:
         super()._validate_key(key)
 
@@ -470,6 +562,8 @@ class TupleS3StoreBackend(TupleStoreBackend):
         base_public_path=None,
         endpoint_url=None,
         store_name=None,
+        max_concurrent_reads: int = 16,
+        cache_reads: bool = False,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -482,6 +576,8 @@ class TupleS3StoreBackend(TupleStoreBackend):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             base_public_path=base_public_path,
             store_name=store_name,
+            max_concurrent_reads=max_concurrent_reads,
+            cache_reads=cache_reads,
         )
         self.bucket = bucket
         if prefix:
@@ -521,6 +617,8 @@ class TupleS3StoreBackend(TupleStoreBackend):
             "base_public_path = None": base_public_path,
             "endpoint_url": endpoint_url,
             "store_name": store_name,
+            "max_concurrent_reads": max_concurrent_reads,
+            "cache_reads": cache_reads,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -543,23 +641,43 @@ class TupleS3StoreBackend(TupleStoreBackend):
                 s3_object_key = self._convert_key_to_filepath(key)
         return s3_object_key
 
-    def _get(self, key):
+    def _get(self, key, client=None):
         s3_object_key = self._build_s3_object_key(key)
 
-        s3 = self._create_client()
+        s3 = client or self._create_client()
+
+        get_object_kwargs = {"Bucket": self.bucket, "Key": s3_object_key}
+        cached_object: Optional[Tuple[str, Any]] = (
+            self._read_cache.get(s3_object_key) if self._read_cache else None
+        )
+        if cached_object is not None:
+            # S3 responds with "304 Not Modified" (and without content) if object still has the cached ETag.
+            get_object_kwargs["IfNoneMatch"] = cached_object[0]
 
         try:
-            s3_response_object = s3.get_object(Bucket=self.bucket, Key=s3_object_key)
+            s3_response_object = s3.get_object(**get_object_kwargs)
         except (s3.exceptions.NoSuchKey, s3.exceptions.NoSuchBucket):
             raise InvalidKeyError(
                 f"Unable to retrieve object from TupleS3StoreBackend with the following Key: {str(s3_object_key)}"
             )
+        except s3.exceptions.ClientError as e:
+            if cached_object is not None and e.response["Error"]["Code"] == "304":
+                return cached_object[1]
+            raise
 
-        return (
+        value = (
             s3_response_object["Body"]
             .read()
             .decode(s3_response_object.get("ContentEncoding", "utf-8"))
         )
+        if self._read_cache is not None:
+            self._read_cache.set(
+                object_key=s3_object_key,
+                version=s3_response_object["ETag"],
+                value=value,
+            )
+
+        return value
 
     def _set(
         self,
@@ -570,6 +688,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         **kwargs,
     ):
         s3_object_key = self._build_s3_object_key(key)
+        self._invalidate_cached_object(object_key=s3_object_key)
 
         s3 = self._create_resource()
 
@@ -602,6 +721,9 @@ class TupleS3StoreBackend(TupleStoreBackend):
         if not dest_filepath.startswith(self.prefix):
             dest_filepath = os.path.join(self.prefix, dest_filepath)  # noqa: PTH118
 
+        self._invalidate_cached_object(object_key=source_filepath)
+        self._invalidate_cached_object(object_key=dest_filepath)
+
         s3.Bucket(self.bucket).copy(
             {"Bucket": self.bucket, "Key": source_filepath}, dest_filepath
         )
@@ -686,6 +808,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
 
         s3 = self._create_resource()
         s3_object_key = self._build_s3_object_key(key)
+        self._invalidate_cached_object(object_key=s3_object_key)
 
         # Check if the object exists
         if self.has_key(key):  # noqa: W601
@@ -740,6 +863,9 @@ class TupleS3StoreBackend(TupleStoreBackend):
 
         return boto3.client("s3", **self.boto3_options)
 
+    def _create_read_client(self) -> Any:
+        return self._create_client()
+
     def _create_resource(self):
         import boto3
 
@@ -776,6 +902,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         public_urls=True,
         base_public_path=None,
         store_name=None,
+        max_concurrent_reads: int = 16,
+        cache_reads: bool = False,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -788,6 +916,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             base_public_path=base_public_path,
             store_name=store_name,
+            max_concurrent_reads=max_concurrent_reads,
+            cache_reads=cache_reads,
         )
         self.bucket = bucket
         self.prefix = prefix
@@ -814,6 +944,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             "public_urls": public_urls,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "max_concurrent_reads": max_concurrent_reads,
+            "cache_reads": cache_reads,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -836,21 +968,32 @@ class TupleGCSStoreBackend(TupleStoreBackend):
                 gcs_object_key = self._convert_key_to_filepath(key)
         return gcs_object_key
 
-    def _get(self, key):
+    def _get(self, key, client=None):
         gcs_object_key = self._build_gcs_object_key(key)
 
         from google.cloud import storage
 
-        gcs = storage.Client(project=self.project)
+        gcs = client or storage.Client(project=self.project)
         bucket = gcs.bucket(self.bucket)
         gcs_response_object = bucket.get_blob(gcs_object_key)
         if not gcs_response_object:
             raise InvalidKeyError(
                 f"Unable to retrieve object from TupleGCSStoreBackend with the following Key: {str(key)}"
             )
-        else:
+
+        if self._read_cache is None:
             return gcs_response_object.download_as_string().decode("utf-8")
 
+        # Metadata of blob (retrieved above) carries its generation, so unchanged blob is not downloaded again.
+        generation = str(gcs_response_object.generation)
+        cached_object: Optional[Tuple[str, Any]] = self._read_cache.get(gcs_object_key)
+        if cached_object is not None and cached_object[0] == generation:
+            return cached_object[1]
+
+        value = gcs_response_object.download_as_string().decode("utf-8")
+        self._read_cache.set(object_key=gcs_object_key, version=generation, value=value)
+        return value
+
     def _set(
         self,
         key,
@@ -860,6 +1003,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         **kwargs,
     ):
         gcs_object_key = self._build_gcs_object_key(key)
+        self._invalidate_cached_object(object_key=gcs_object_key)
 
         from google.cloud import storage
 
@@ -889,6 +1033,9 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         if not dest_filepath.startswith(self.prefix):
             dest_filepath = os.path.join(self.prefix, dest_filepath)  # noqa: PTH118
 
+        self._invalidate_cached_object(object_key=source_filepath)
+        self._invalidate_cached_object(object_key=dest_filepath)
+
         blob = bucket.blob(source_filepath)
         _ = bucket.rename_blob(blob, dest_filepath)
 
@@ -943,6 +1090,11 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         public_url = self.base_public_path + path_url
         return public_url
 
+    def _create_read_client(self) -> Any:
+        from google.cloud import storage
+
+        return storage.Client(project=self.project)
+
     def _get_path_url(self, path):
         if self.prefix:
             path_url = "/".join((self.bucket, self.prefix, path))
@@ -962,6 +1114,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
 
         gcs = storage.Client(project=self.project)
         bucket = gcs.bucket(self.bucket)
+        # All blobs under prefix are deleted, so nothing cached remains valid.
+        self._invalidate_cached_object()
         try:
             bucket.delete_blobs(blobs=list(bucket.list_blobs(prefix=self.prefix)))
         except NotFound:
@@ -1001,6 +1155,8 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         suppress_store_backend_id=False,
         manually_initialize_store_backend_id: str = "",
         store_name=None,
+        max_concurrent_reads: int = 16,
+        cache_reads: bool = False,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -1012,6 +1168,8 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             suppress_store_backend_id=suppress_store_backend_id,
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             store_name=store_name,
+            max_concurrent_reads=max_concurrent_reads,
+            cache_reads=cache_reads,
         )
         self.connection_string = connection_string or os.environ.get(
             "AZURE_STORAGE_CONNECTION_STRING"
@@ -1042,13 +1200,36 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
 
         return blob_service_client.get_container_client(self.container)
 
-    def _get(self, key):
+    def _get(self, key, client=None):
         az_blob_key = os.path.join(  # noqa: PTH118
             self.prefix, self._convert_key_to_filepath(key)
         )
-        return (
-            self._container_client.download_blob(az_blob_key).readall().decode("utf-8")
+        container_client = client or self._container_client
+        if self._read_cache is None:
+            return container_client.download_blob(az_blob_key).readall().decode("utf-8")
+
+        from azure.core import MatchConditions
+        from azure.core.exceptions import ResourceNotModifiedError
+
+        cached_object: Optional[Tuple[str, Any]] = self._read_cache.get(az_blob_key)
+        try:
+            if cached_object is None:
+                downloader = container_client.download_blob(az_blob_key)
+            else:
+                # Blob is downloaded only if its ETag differs from the cached one.
+                downloader = container_client.download_blob(
+                    az_blob_key,
+                    etag=cached_object[0],
+                    match_condition=MatchConditions.IfModified,
+                )
+        except ResourceNotModifiedError:
+            return cached_object[1]  # type: ignore[index]
+
+        value = downloader.readall().decode("utf-8")
+        self._read_cache.set(
+            object_key=az_blob_key, version=downloader.properties.etag, value=value
         )
+        return value
 
     def _set(self, key, value, content_encoding="utf-8", **kwargs):
 
@@ -1057,6 +1238,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         az_blob_key = os.path.join(  # noqa: PTH118
             self.prefix, self._convert_key_to_filepath(key)
         )
+        self._invalidate_cached_object(object_key=az_blob_key)
 
         if isinstance(value, str):
             if az_blob_key.endswith(".html"):
@@ -1127,6 +1309,9 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         if not dest_blob_path.startswith(self.prefix):
             dest_blob_path = os.path.join(self.prefix, dest_blob_path)  # noqa: PTH118
 
+        self._invalidate_cached_object(object_key=source_blob_path)
+        self._invalidate_cached_object(object_key=dest_blob_path)
+
         # azure storage sdk does not have _move method
         source_blob = self._container_client.get_blob_client(source_blob_path)  # type: ignore[attr-defined]
         dest_blob = self._container_client.get_blob_client(dest_blob_path)  # type: ignore[attr-defined]
@@ -1149,10 +1334,15 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         if not az_blob_path.startswith(self.prefix):
             az_blob_path = os.path.join(self.prefix, az_blob_path)  # noqa: PTH118
 
+        self._invalidate_cached_object(object_key=az_blob_path)
+
         blob = self._container_client.get_blob_client(az_blob_path)
         blob.delete_blob()
         return True
 
+    def _create_read_client(self) -> Any:
+        return self._container_client
+
     @property
     def config(self) -> dict:
         return self._config  # type: ignore[attr-defined]
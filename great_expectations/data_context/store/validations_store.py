@@ -1,12 +1,15 @@
 import random
 import uuid
-from typing import Dict
+from typing import Dict, List, Optional
 
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
     ExpectationSuiteValidationResultSchema,
 )
 from great_expectations.data_context.cloud_constants import GXCloudRESTResource
+from great_expectations.data_context.store.compact_validation_result_codec import (
+    CompactValidationResultCodec,
+)
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
@@ -91,16 +94,33 @@ class ValidationsStore(Store):
             bug_risk: Moderate
 
     --ge-feature-maturity-info--
+
+    By default, Validation Results are stored as (pretty-printed) JSON.  With "compact_serialization" (e.g.
+    "{encoding: msgpack, compression: zstd}"; see "CompactValidationResultCodec" for options), they are stored in a
+    compact envelope instead, which also allows their summaries to be read (see "get_summaries") without decoding their
+    individual Expectation Validation Results.  Compact Validation Results are kept under ".gxvr" (rather than ".json")
+    file path suffix by default.  Either format is read regardless of how the store is configured (e.g., set
+    "filepath_suffix" of "store_backend" to ".json" to keep reading existing Validation Results after enabling
+    "compact_serialization").
     """
 
     _key_class: type = ValidationResultIdentifier
 
     def __init__(
-        self, store_backend=None, runtime_environment=None, store_name=None
+        self,
+        store_backend=None,
+        runtime_environment=None,
+        store_name=None,
+        compact_serialization: Optional[dict] = None,
     ) -> None:
         self._expectationSuiteValidationResultSchema = (
             ExpectationSuiteValidationResultSchema()
         )
+        self._compact_codec: Optional[CompactValidationResultCodec] = (
+            None
+            if compact_serialization is None
+            else CompactValidationResultCodec(**compact_serialization)
+        )
 
         if store_backend is not None:
             store_backend_module_name = store_backend.get(
@@ -118,7 +138,10 @@ class ValidationsStore(Store):
             if issubclass(store_backend_class, TupleStoreBackend):
                 # Provide defaults for this common case
                 store_backend["filepath_suffix"] = store_backend.get(
-                    "filepath_suffix", ".json"
+                    "filepath_suffix",
+                    ".json"
+                    if self._compact_codec is None
+                    else CompactValidationResultCodec.FILEPATH_SUFFIX,
                 )
             elif issubclass(store_backend_class, DatabaseStoreBackend):
                 # Provide defaults for this common case
@@ -146,6 +169,7 @@ class ValidationsStore(Store):
             "store_backend": store_backend,
             "runtime_environment": runtime_environment,
             "store_name": store_name,
+            "compact_serialization": compact_serialization,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -167,6 +191,10 @@ class ValidationsStore(Store):
     def serialize(self, value):
         if self.cloud_mode:
             return value.to_json_dict()
+        if self._compact_codec is not None:
+            return self._compact_codec.encode(
+                self._expectationSuiteValidationResultSchema.dump(value.to_json_dict())
+            )
         return self._expectationSuiteValidationResultSchema.dumps(
             value.to_json_dict(), indent=2, sort_keys=True
         )
@@ -174,9 +202,49 @@ class ValidationsStore(Store):
     def deserialize(self, value):
         if isinstance(value, dict):
             return self._expectationSuiteValidationResultSchema.load(value)
+        elif CompactValidationResultCodec.is_encoded(value):
+            return self._expectationSuiteValidationResultSchema.load(
+                CompactValidationResultCodec.decode(value)
+            )
         else:
             return self._expectationSuiteValidationResultSchema.loads(value)
 
+    def get_summaries(
+        self, keys: List[ValidationResultIdentifier]
+    ) -> List[Optional[ExpectationSuiteValidationResult]]:
+        """Retrieves Validation Results of all given keys without their individual Expectation Validation Results.
+
+        Returned Validation Results carry "success", "statistics", "meta", and "evaluation_parameters", but empty
+        "results".  Summaries of Validation Results, stored in compact format, are read without decoding "results".
+        """
+        if self.cloud_mode:
+            validation_results: List[
+                Optional[ExpectationSuiteValidationResult]
+            ] = self.get_many(keys)
+        else:
+            for key in keys:
+                self._validate_key(key)
+
+            validation_results = [
+                self._deserialize_summary(value) if value else None
+                for value in self._store_backend.get_many(
+                    [self.key_to_tuple(key) for key in keys]
+                )
+            ]
+
+        for validation_result in validation_results:
+            if validation_result is not None:
+                validation_result.results = []
+
+        return validation_results
+
+    def _deserialize_summary(self, value) -> ExpectationSuiteValidationResult:
+        if CompactValidationResultCodec.is_encoded(value):
+            return self._expectationSuiteValidationResultSchema.load(
+                CompactValidationResultCodec.decode(value, summary_only=True)
+            )
+        return self.deserialize(value)
+
     def self_check(self, pretty_print):
         return_obj = {}
 
@@ -1032,8 +1032,13 @@ class ExecutionEngineConfigSchema(Schema):
         keys=fields.Str(), values=fields.Str(), required=False, allow_none=True
     )
     caching = fields.Boolean(required=False, allow_none=True)
+    metric_cache = fields.Dict(required=False, allow_none=True)
+    metric_cache_limits = fields.Dict(required=False, allow_none=True)
+    fingerprint_updated_at_column = fields.String(required=False, allow_none=True)
     batch_spec_defaults = fields.Dict(required=False, allow_none=True)
     force_reuse_spark_context = fields.Boolean(required=False, allow_none=True)
+    cache_policy = fields.Dict(required=False, allow_none=True)
+    bundle_domains_in_single_job = fields.Boolean(required=False, allow_none=True)
     # BigQuery Service Account Credentials
     # https://googleapis.dev/python/sqlalchemy-bigquery/latest/README.html#connection-string-parameters
     credentials_info = fields.Dict(required=False, allow_none=True)
@@ -1061,6 +1066,15 @@ configuration to continue.
             raise gx_exceptions.InvalidConfigError(
                 f"""Your current configuration uses the "spark_config" key in an execution engine, but only
 SparkDFExecutionEngine requires this attribute (your execution engine is "{data['class_name']}").  Please update your
+configuration to continue.
+                """
+            )
+        if "fingerprint_updated_at_column" in data and not (
+            data["class_name"] == "SqlAlchemyExecutionEngine"
+        ):
+            raise gx_exceptions.InvalidConfigError(
+                f"""Your current configuration uses the "fingerprint_updated_at_column" key in an execution engine, but only
+SqlAlchemyExecutionEngine requires this attribute (your execution engine is "{data['class_name']}").  Please update your
 configuration to continue.
                 """
             )
@@ -1558,6 +1572,13 @@ class ConcurrencyConfig(DictDot):
         # databases and/or be manually user configurable.
         return 100
 
+    @property
+    def max_data_docs_page_concurrency(self) -> int:
+        """Max number of Data Docs pages to build (retrieve, render, and store) concurrently with multithreading."""
+        # Page builds alternate between store I/O (which releases the GIL) and rendering (which does not), so a small
+        # pool hides the latency of remote (e.g. S3, GCS) stores without much contention over the GIL.
+        return 16
+
     def add_sqlalchemy_create_engine_parameters(
         self, parameters: MutableMapping[str, Any]
     ):
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import logging
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.data_context.types.base import DatasourceConfig
+
+logger = logging.getLogger(__name__)
+
+
+class _UninstantiatedDatasource:
+    """Placeholder for datasource, whose configuration has been added, but which has not been instantiated yet."""
+
+    def __init__(self, datasource_config: DatasourceConfig) -> None:
+        self.datasource_config = datasource_config
+
+
+class LazyDatasourceDict(MutableMapping[str, Any]):
+    """Dictionary of datasources (by name), which instantiates datasources, added as configurations, on first access.
+
+    Instantiating datasource can be expensive (e.g., building SQLAlchemy engine and connecting to database), so datasource
+    configurations of DataContext are added to this dictionary without instantiating them; "datasource_factory" is called
+    for datasource only once it is looked up (e.g., by "get_datasource()" or by batch request).  Datasources, which fail
+    to instantiate ("datasource_factory" returns None), are removed, as if they had never been added.
+
+    Enumerating contents of this dictionary (iteration, "len()", "keys()", "values()", "items()") instantiates all
+    datasources; "instantiated_items()" and truth testing do not.  Removing datasources ("del", "pop()", "clear()")
+    does not instantiate them.  Insertion order is retained.
+    """
+
+    def __init__(
+        self, datasource_factory: Callable[[str, DatasourceConfig], Optional[Any]]
+    ) -> None:
+        self._datasource_factory = datasource_factory
+        self._datasources: Dict[str, Any] = {}
+
+    def add_datasource_config(
+        self, datasource_name: str, datasource_config: DatasourceConfig
+    ) -> None:
+        """Adds datasource configuration to be instantiated upon first access of datasource with given name."""
+        self._datasources[datasource_name] = _UninstantiatedDatasource(
+            datasource_config=datasource_config
+        )
+
+    def is_instantiated(self, datasource_name: str) -> bool:
+        """Returns True if datasource with given name is present and has been instantiated (without instantiating it)."""
+        return datasource_name in self._datasources and not isinstance(
+            self._datasources[datasource_name], _UninstantiatedDatasource
+        )
+
+    def instantiated_items(self) -> Iterator[Tuple[str, Any]]:
+        """Yields (name, datasource) pairs of datasources, which have been instantiated (without instantiating others)."""
+        datasource_name: str
+        datasource: Any
+        for datasource_name, datasource in list(self._datasources.items()):
+            if not isinstance(datasource, _UninstantiatedDatasource):
+                yield datasource_name, datasource
+
+    def _instantiate(self, datasource_name: str) -> None:
+        uninstantiated_datasource = self._datasources[datasource_name]
+        if not isinstance(uninstantiated_datasource, _UninstantiatedDatasource):
+            return
+
+        datasource: Optional[Any] = self._datasource_factory(
+            datasource_name, uninstantiated_datasource.datasource_config
+        )
+        if datasource is None:
+            del self._datasources[datasource_name]
+        else:
+            self._datasources[datasource_name] = datasource
+
+    def _instantiate_all(self) -> None:
+        datasource_name: str
+        for datasource_name in list(self._datasources.keys()):
+            self._instantiate(datasource_name=datasource_name)
+
+    def __getitem__(self, datasource_name: str) -> Any:
+        if datasource_name in self._datasources:
+            self._instantiate(datasource_name=datasource_name)
+
+        return self._datasources[datasource_name]
+
+    def __setitem__(self, datasource_name: str, datasource: Any) -> None:
+        self._datasources[datasource_name] = datasource
+
+    def __delitem__(self, datasource_name: str) -> None:
+        del self._datasources[datasource_name]
+
+    def pop(self, datasource_name: str, *args: Any) -> Any:
+        """Removes datasource with given name and returns it (None, if datasource has not been instantiated yet).
+
+        If datasource is not present, returns default (if provided) or raises KeyError (as "dict.pop()" does).
+        """
+        datasource: Any = self._datasources.pop(datasource_name, *args)
+        if isinstance(datasource, _UninstantiatedDatasource):
+            return None
+
+        return datasource
+
+    def clear(self) -> None:
+        self._datasources.clear()
+
+    def __contains__(self, datasource_name: object) -> bool:
+        if datasource_name not in self._datasources:
+            return False
+
+        self._instantiate(datasource_name=datasource_name)  # type: ignore[arg-type] # checked membership
+        return datasource_name in self._datasources
+
+    def __iter__(self) -> Iterator[str]:
+        self._instantiate_all()
+        return iter(self._datasources)
+
+    def __bool__(self) -> bool:
+        # Datasources, which would fail to instantiate, still count here (they are only removed upon access).
+        return bool(self._datasources)
+
+    def __len__(self) -> int:
+        self._instantiate_all()
+        return len(self._datasources)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._datasources.keys())})"
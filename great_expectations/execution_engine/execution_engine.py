@@ -3,12 +3,14 @@ from __future__ import annotations
 import copy
 import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import asdict, dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     List,
     Optional,
@@ -22,6 +24,13 @@ from great_expectations.core._docs_decorators import public_api
 from great_expectations.core.batch_manager import BatchManager
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.execution_engine.metric_cache import (
+    _MISSING,
+    BatchFingerprintFn,
+    BoundedMetricCache,
+    MetricCacheStatistics,
+    PersistentMetricCache,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -62,6 +71,10 @@ class NoOpDict:
     def update(self, value):
         return None
 
+    # noinspection PyMethodMayBeStatic,PyUnusedLocal
+    def get(self, key, default=None):
+        return default
+
 
 @dataclass(frozen=True)
 class MetricComputationConfiguration(DictDot):
@@ -132,9 +145,18 @@ class ExecutionEngine(ABC):
     Args:
         name: (str) name of this ExecutionEngine
         caching: (Boolean) if True (default), then resolved (computed) metrics are added to local in-memory cache.
+        metric_cache_limits: dictionary of budgets of local in-memory cache (optional) -- "scalar", "partial", and \
+            "records" keys hold MetricCacheLimits arguments ("max_entries" and "max_size_bytes") for final metric values, \
+            partial metric values, and records derived from Batch data (e.g., filtered Domain records), respectively \
+            (least recently used values are evicted once either budget is exceeded)
         batch_spec_defaults: dictionary of BatchSpec overrides (useful for amending configuration at runtime).
         batch_data_dict: dictionary of Batch objects with corresponding IDs as keys supplied at initialization time
         validator: Validator object (optional) -- not utilized in V3 and later versions
+        metric_cache: PersistentMetricCache object, or dictionary of its constructor arguments (optional) -- if \
+            provided, then resolved metrics are also persisted on disk (keyed by Batch fingerprint), so that they can be \
+            reused by subsequent runs against unchanged data (values are pickled, so cache file is trusted input only)
+        batch_fingerprint_fn: function computing fingerprint of Batch contents (optional) -- overrides fingerprint \
+            computed by ExecutionEngine subclass for purposes of persistent metric caching
     """
 
     recognized_batch_spec_defaults: Set[str] = set()
@@ -146,6 +168,9 @@ class ExecutionEngine(ABC):
         batch_spec_defaults: Optional[dict] = None,
         batch_data_dict: Optional[dict] = None,
         validator: Optional[Validator] = None,
+        metric_cache: Optional[Union[dict, PersistentMetricCache]] = None,
+        batch_fingerprint_fn: Optional[BatchFingerprintFn] = None,
+        metric_cache_limits: Optional[dict] = None,
     ) -> None:
         self.name = name
         self._validator = validator
@@ -153,12 +178,24 @@ class ExecutionEngine(ABC):
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
         if self._caching:
-            self._metric_cache: Union[Dict, NoOpDict] = {}
+            self._metric_cache: Union[
+                BoundedMetricCache, NoOpDict
+            ] = BoundedMetricCache.from_limits_config(config=metric_cache_limits)
         else:
             self._metric_cache = NoOpDict()
 
+        if isinstance(metric_cache, dict):
+            self._persistent_metric_cache: Optional[
+                PersistentMetricCache
+            ] = PersistentMetricCache(**metric_cache)
+        else:
+            self._persistent_metric_cache = metric_cache
+
+        self._batch_fingerprint_fn = batch_fingerprint_fn
+        # Batch fingerprints are computed at most once per loaded BatchData object.
+        self._batch_fingerprints: Dict[str, Optional[str]] = {}
+
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
 
@@ -188,9 +225,13 @@ class ExecutionEngine(ABC):
         self._config = {
             "name": name,
             "caching": caching,
+            "metric_cache_limits": metric_cache_limits,
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "metric_cache": self._persistent_metric_cache.config
+            if self._persistent_metric_cache is not None
+            else None,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -213,6 +254,19 @@ class ExecutionEngine(ABC):
         """Getter for batch_manager"""
         return self._batch_manager
 
+    @property
+    def metric_cache_statistics(self) -> MetricCacheStatistics:
+        """Getter for hit, miss, and eviction counters (and occupancy) of local in-memory metric cache"""
+        if isinstance(self._metric_cache, BoundedMetricCache):
+            return self._metric_cache.statistics
+
+        return MetricCacheStatistics()
+
+    @property
+    def persistent_metric_cache(self) -> Optional[PersistentMetricCache]:
+        """Getter for on-disk metric cache (None, unless configured)"""
+        return self._persistent_metric_cache
+
     def _load_batch_data_from_dict(
         self, batch_data_dict: Dict[str, BatchDataType]
     ) -> None:
@@ -226,6 +280,24 @@ class ExecutionEngine(ABC):
 
     def load_batch_data(self, batch_id: str, batch_data: BatchDataType) -> None:
         self._batch_manager.save_batch_data(batch_id=batch_id, batch_data=batch_data)
+        self._batch_fingerprints.pop(batch_id, None)
+
+    def release_batch_data(
+        self,
+        batch_id: str,
+        batch_data: BatchDataType,
+        derived_batch_data: Dict[Hashable, Any],
+    ) -> None:
+        """Frees resources held by BatchData (and by objects derived from it), once evicted from BatchManager.
+
+        Args:
+            batch_id: ID of evicted Batch
+            batch_data: evicted BatchData object
+            derived_batch_data: objects derived from evicted BatchData (e.g., persisted Spark DataFrames)
+        """
+        self._batch_fingerprints.pop(batch_id, None)
+        if isinstance(self._metric_cache, BoundedMetricCache):
+            self._metric_cache.discard_records(batch_id=batch_id)
 
     def get_batch_data(
         self,
@@ -247,6 +319,131 @@ class ExecutionEngine(ABC):
     def get_batch_data_and_markers(self, batch_spec) -> Tuple[BatchData, BatchMarkers]:
         raise NotImplementedError
 
+    def get_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """Returns fingerprint of contents of loaded Batch, which changes whenever underlying data changes.
+
+        Fingerprints key persisted metrics; "batch_fingerprint_fn" (if configured) takes precedence over fingerprint,
+        computed by ExecutionEngine subclass.  Fingerprint is computed at most once for every loaded BatchData object.
+
+        Args:
+            batch_id: ID of loaded Batch
+
+        Returns:
+            Fingerprint string or None (if reliable fingerprint of this Batch is unavailable)
+        """
+        if batch_id not in self._batch_fingerprints:
+            if self._batch_fingerprint_fn is None:
+                self._batch_fingerprints[batch_id] = self._compute_batch_fingerprint(
+                    batch_id=batch_id
+                )
+            else:
+                self._batch_fingerprints[batch_id] = self._batch_fingerprint_fn(
+                    self, batch_id
+                )
+
+        return self._batch_fingerprints[batch_id]
+
+    def _compute_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """Computes backend-specific fingerprint of loaded Batch (to be implemented by ExecutionEngine subclasses).
+
+        Returns None (i.e., fingerprint is unavailable and metrics of this Batch are never persisted) by default.
+        """
+        return None
+
+    def get_persisted_metrics(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Looks up metrics, previously resolved against Batch data with same fingerprint, in on-disk metric cache.
+
+        Args:
+            metric_configurations: metrics to look up
+
+        Returns:
+            Dictionary of persisted metric values, keyed by metric ID (empty, unless on-disk metric cache is configured)
+        """
+        persisted_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        if self._persistent_metric_cache is None:
+            return persisted_metrics
+
+        batch_fingerprint: str
+        metric_ids: List[Tuple[str, str, str]]
+        for (
+            batch_fingerprint,
+            metric_ids,
+        ) in self._get_persistable_metric_ids_by_batch_fingerprint(
+            metric_configurations=metric_configurations
+        ).items():
+            persisted_metrics.update(
+                self._persistent_metric_cache.get_many(
+                    batch_fingerprint=batch_fingerprint, metric_ids=metric_ids
+                )
+            )
+
+        return persisted_metrics
+
+    def _persist_metrics(
+        self,
+        metric_configurations: Iterable[MetricConfiguration],
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> None:
+        """Stores resolved values of given metrics in on-disk metric cache (if configured)."""
+        if self._persistent_metric_cache is None:
+            return
+
+        batch_fingerprint: str
+        metric_ids: List[Tuple[str, str, str]]
+        for (
+            batch_fingerprint,
+            metric_ids,
+        ) in self._get_persistable_metric_ids_by_batch_fingerprint(
+            metric_configurations=metric_configurations
+        ).items():
+            self._persistent_metric_cache.set_many(
+                batch_fingerprint=batch_fingerprint,
+                metrics={
+                    metric_id: resolved_metrics[metric_id]
+                    for metric_id in metric_ids
+                    if metric_id in resolved_metrics
+                },
+            )
+
+    def _get_persistable_metric_ids_by_batch_fingerprint(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> Dict[str, List[Tuple[str, str, str]]]:
+        """Groups IDs of metrics, whose values can be persisted, by fingerprint of Batch, against which they resolve.
+
+        Partial metrics (e.g., map conditions and aggregate functions) evaluate to deferred computational components and
+        intermediate results; they are never persisted.  Metrics of Batch without fingerprint are not persisted either.
+        """
+        metric_ids_by_batch_fingerprint: Dict[
+            str, List[Tuple[str, str, str]]
+        ] = defaultdict(list)
+
+        metric_configuration: MetricConfiguration
+        batch_id: Optional[str]
+        batch_fingerprint: Optional[str]
+        for metric_configuration in metric_configurations:
+            if metric_configuration.is_partial:
+                continue
+
+            batch_id = (
+                metric_configuration.metric_domain_kwargs.get("batch_id")
+                or self._batch_manager.active_batch_data_id
+            )
+            if batch_id is None:
+                continue
+
+            batch_fingerprint = self.get_batch_fingerprint(batch_id=batch_id)
+            if batch_fingerprint is None:
+                continue
+
+            metric_ids_by_batch_fingerprint[batch_fingerprint].append(
+                metric_configuration.id
+            )
+
+        return metric_ids_by_batch_fingerprint
+
     def resolve_metrics(
         self,
         metrics_to_resolve: Iterable[MetricConfiguration],
@@ -508,14 +705,21 @@ class ExecutionEngine(ABC):
                 metric_dependencies_by_metric_name[metric_name] = metrics[
                     metric_configuration.id
                 ]
-            elif self._caching and metric_configuration.id in self._metric_cache:  # type: ignore[operator] # TODO: update NoOpDict
-                metric_dependencies_by_metric_name[metric_name] = self._metric_cache[
-                    metric_configuration.id
-                ]
-            else:
-                raise gx_exceptions.MetricError(
-                    message=f'Missing metric dependency: "{metric_name}" for metric "{metric_to_resolve.metric_name}".'
+                continue
+
+            if self._caching:
+                cached_metric_value = self._metric_cache.get(
+                    metric_configuration.id, _MISSING
                 )
+                if cached_metric_value is not _MISSING:
+                    metric_dependencies_by_metric_name[
+                        metric_name
+                    ] = cached_metric_value
+                    continue
+
+            raise gx_exceptions.MetricError(
+                message=f'Missing metric dependency: "{metric_name}" for metric "{metric_to_resolve.metric_name}".'
+            )
 
         return metric_dependencies_by_metric_name
 
@@ -573,6 +777,15 @@ class ExecutionEngine(ABC):
         if self._caching:
             self._metric_cache.update(resolved_metrics)
 
+        self._persist_metrics(
+            metric_configurations=[
+                metric_computation_configuration.metric_configuration
+                for metric_computation_configuration in metric_fn_direct_configurations
+                + metric_fn_bundle_configurations
+            ],
+            resolved_metrics=resolved_metrics,
+        )
+
         return resolved_metrics
 
     def _split_domain_kwargs(
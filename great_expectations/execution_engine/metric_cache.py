@@ -0,0 +1,650 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pathlib
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+from great_expectations import __version__ as ge_version
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypeSuffixes,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.validator.computed_metric import MetricValue
+
+logger = logging.getLogger(__name__)
+
+# Signature of pluggable function, computing fingerprint of contents of Batch (given by its ID) for ExecutionEngine;
+# "None" means that no reliable fingerprint is available, in which case metrics of this Batch are not persisted.
+BatchFingerprintFn = Callable[["ExecutionEngine", str], Optional[str]]
+
+# Sentinel, distinguishing absent entries from cached "None" metric values.
+_MISSING = object()
+
+# Metrics, whose names end with these suffixes, evaluate to partial functions (or intermediate results).
+_PARTIAL_METRIC_NAME_SUFFIXES = frozenset(
+    suffix.value for suffix in MetricPartialFunctionTypeSuffixes
+)
+
+# SQLite limits number of host parameters in single statement (999 in older versions); lookups are chunked accordingly.
+_MAX_SQLITE_HOST_PARAMETERS: int = 500
+
+
+@dataclass(frozen=True)
+class MetricCacheLimits:
+    """Budget of one segment of BoundedMetricCache ("None" means unbounded).
+
+    Args:
+        max_entries: maximum number of cached metric values
+        max_size_bytes: maximum total (estimated) size of cached metric values
+    """
+
+    max_entries: Optional[int] = None
+    max_size_bytes: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class MetricCacheStatistics:
+    """Counters and current occupancy of BoundedMetricCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    num_entries: int = 0
+    size_bytes: int = 0
+
+
+class _LRUSegment:
+    """Least-recently-used ordered dictionary of metric values with entry count and byte budget."""
+
+    def __init__(self, limits: MetricCacheLimits) -> None:
+        self._limits = limits
+        self._entries: OrderedDict[Hashable, Tuple[Any, int]] = OrderedDict()
+        self._size_bytes = 0
+        self.evictions = 0
+
+    @property
+    def limits(self) -> MetricCacheLimits:
+        return self._limits
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, metric_id: Hashable) -> bool:
+        return metric_id in self._entries
+
+    def get(self, metric_id: Hashable) -> Any:
+        entry: Optional[Tuple[Any, int]] = self._entries.get(metric_id)
+        if entry is None:
+            return _MISSING
+
+        self._entries.move_to_end(metric_id)
+        return entry[0]
+
+    def put(self, metric_id: Hashable, value: Any) -> None:
+        self.discard(metric_id=metric_id)
+
+        size_bytes: int = _estimate_size_bytes(value=value)
+        if (
+            self._limits.max_size_bytes is not None
+            and size_bytes > self._limits.max_size_bytes
+        ) or self._limits.max_entries == 0:
+            # Value would not fit even into empty segment; caching it would merely flush all other entries.
+            self.evictions += 1
+            return
+
+        self._entries[metric_id] = (value, size_bytes)
+        self._size_bytes += size_bytes
+
+        while (
+            self._limits.max_entries is not None
+            and len(self._entries) > self._limits.max_entries
+        ) or (
+            self._limits.max_size_bytes is not None
+            and self._size_bytes > self._limits.max_size_bytes
+        ):
+            _, (_, size_bytes) = self._entries.popitem(last=False)
+            self._size_bytes -= size_bytes
+            self.evictions += 1
+
+    def discard(self, metric_id: Hashable) -> None:
+        entry: Optional[Tuple[Any, int]] = self._entries.pop(metric_id, None)
+        if entry is not None:
+            self._size_bytes -= entry[1]
+
+    def discard_if(self, predicate: Callable[[Hashable], bool]) -> None:
+        for metric_id in [
+            metric_id for metric_id in self._entries if predicate(metric_id)
+        ]:
+            self.discard(metric_id=metric_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size_bytes = 0
+
+
+class BoundedMetricCache:
+    """In-memory cache of resolved metric values with least-recently-used eviction under entry count and byte budgets.
+
+    Final (e.g., scalar) metric values and partial metric values are kept in separate segments with separate budgets.
+    Partial metrics (maps, conditions, and aggregate functions) may hold large intermediate objects (e.g., Pandas
+    boolean condition Series, Spark column expressions); their smaller budget keeps them from crowding out (or keeping
+    alive along with them) cheap-to-keep final values.  Sizes are estimates (Pandas and NumPy objects are measured by
+    their memory usage; containers are measured recursively; other objects are measured shallowly).
+
+    Third segment holds records derived from loaded Batch data (e.g., Domain records, filtered by row condition), which
+    ExecutionEngine shares among metrics; its entries are keyed by tuples, starting with Batch ID.
+
+    Args:
+        scalar_limits: budget of segment, holding final metric values
+        partial_limits: budget of segment, holding partial metric values
+        records_limits: budget of segment, holding records derived from Batch data
+    """
+
+    DEFAULT_SCALAR_LIMITS = MetricCacheLimits(
+        max_entries=100_000, max_size_bytes=256 * 1024 * 1024
+    )
+    DEFAULT_PARTIAL_LIMITS = MetricCacheLimits(
+        max_entries=1_000, max_size_bytes=256 * 1024 * 1024
+    )
+    DEFAULT_RECORDS_LIMITS = MetricCacheLimits(
+        max_entries=32, max_size_bytes=512 * 1024 * 1024
+    )
+
+    def __init__(
+        self,
+        scalar_limits: Optional[MetricCacheLimits] = None,
+        partial_limits: Optional[MetricCacheLimits] = None,
+        records_limits: Optional[MetricCacheLimits] = None,
+    ) -> None:
+        self._scalar_segment = _LRUSegment(
+            limits=scalar_limits or self.DEFAULT_SCALAR_LIMITS
+        )
+        self._partial_segment = _LRUSegment(
+            limits=partial_limits or self.DEFAULT_PARTIAL_LIMITS
+        )
+        self._records_segment = _LRUSegment(
+            limits=records_limits or self.DEFAULT_RECORDS_LIMITS
+        )
+
+        self._hits = 0
+        self._misses = 0
+
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_limits_config(cls, config: Optional[dict] = None) -> BoundedMetricCache:
+        """Builds BoundedMetricCache from dictionary with optional "scalar", "partial", and "records" MetricCacheLimits.
+
+        For example, "{"partial": {"max_entries": 100, "max_size_bytes": 64 * 1024 * 1024}}" restricts partial metric
+        values to 100 entries and 64 MiB, while final metric values retain default budget.
+        """
+        if config is None:
+            config = {}
+
+        return cls(
+            scalar_limits=MetricCacheLimits(**config["scalar"])
+            if "scalar" in config
+            else None,
+            partial_limits=MetricCacheLimits(**config["partial"])
+            if "partial" in config
+            else None,
+            records_limits=MetricCacheLimits(**config["records"])
+            if "records" in config
+            else None,
+        )
+
+    @property
+    def scalar_limits(self) -> MetricCacheLimits:
+        return self._scalar_segment.limits
+
+    @property
+    def partial_limits(self) -> MetricCacheLimits:
+        return self._partial_segment.limits
+
+    @property
+    def records_limits(self) -> MetricCacheLimits:
+        return self._records_segment.limits
+
+    @property
+    def statistics(self) -> MetricCacheStatistics:
+        segments: Tuple[_LRUSegment, ...] = (
+            self._scalar_segment,
+            self._partial_segment,
+            self._records_segment,
+        )
+        with self._lock:
+            return MetricCacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=sum(segment.evictions for segment in segments),
+                num_entries=sum(len(segment) for segment in segments),
+                size_bytes=sum(segment.size_bytes for segment in segments),
+            )
+
+    def __len__(self) -> int:
+        return len(self._scalar_segment) + len(self._partial_segment)
+
+    def __contains__(self, metric_id: Tuple[str, str, str]) -> bool:
+        return metric_id in self._get_segment(metric_id=metric_id)
+
+    def __getitem__(self, metric_id: Tuple[str, str, str]) -> MetricValue:
+        value: Any = self.get(metric_id, _MISSING)
+        if value is _MISSING:
+            raise KeyError(metric_id)
+
+        return value
+
+    def __setitem__(self, metric_id: Tuple[str, str, str], value: MetricValue) -> None:
+        with self._lock:
+            self._get_segment(metric_id=metric_id).put(metric_id=metric_id, value=value)
+
+    def get(self, metric_id: Tuple[str, str, str], default: Any = None) -> Any:
+        """Returns cached metric value (marking it as most recently used), or "default", if absent (counted as miss)."""
+        with self._lock:
+            value: Any = self._get_segment(metric_id=metric_id).get(metric_id=metric_id)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+
+            self._hits += 1
+            return value
+
+    def update(self, metrics: Dict[Tuple[str, str, str], MetricValue]) -> None:
+        metric_id: Tuple[str, str, str]
+        value: MetricValue
+        with self._lock:
+            for metric_id, value in metrics.items():
+                self._get_segment(metric_id=metric_id).put(
+                    metric_id=metric_id, value=value
+                )
+
+    def get_records(self, key: Tuple[Hashable, ...], default: Any = None) -> Any:
+        """Returns cached records, derived from Batch data (marking them as most recently used), or "default", if absent.
+
+        Records are shared by all callers; they must be treated as read-only (copied before being modified).
+        """
+        with self._lock:
+            records: Any = self._records_segment.get(metric_id=key)
+            if records is _MISSING:
+                self._misses += 1
+                return default
+
+            self._hits += 1
+            return records
+
+    def set_records(self, key: Tuple[Hashable, ...], records: Any) -> None:
+        """Caches records, derived from Batch data (key starts with Batch ID), within budget of records segment."""
+        with self._lock:
+            self._records_segment.put(metric_id=key, value=records)
+
+    def discard_records(self, batch_id: str) -> None:
+        """Removes records, derived from data of specified Batch (e.g., when this Batch is reloaded or removed)."""
+        with self._lock:
+            self._records_segment.discard_if(
+                predicate=lambda key: isinstance(key, tuple) and key[0] == batch_id
+            )
+
+    def clear(self) -> None:
+        """Removes all entries (counters are retained)."""
+        with self._lock:
+            self._scalar_segment.clear()
+            self._partial_segment.clear()
+            self._records_segment.clear()
+
+    def _get_segment(self, metric_id: Tuple[str, str, str]) -> _LRUSegment:
+        if metric_id[0].split(".")[-1] in _PARTIAL_METRIC_NAME_SUFFIXES:
+            return self._partial_segment
+
+        return self._scalar_segment
+
+
+def _estimate_size_bytes(value: Any) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True).sum())
+
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True))
+
+    if isinstance(value, pd.Index):
+        return int(value.memory_usage())
+
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(
+            _estimate_size_bytes(value=element) for element in value
+        )
+
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            _estimate_size_bytes(value=key) + _estimate_size_bytes(value=element)
+            for key, element in value.items()
+        )
+
+    return sys.getsizeof(value)
+
+
+class PersistentMetricCache:
+    """On-disk (SQLite-backed) cache of resolved metric values, which outlives ExecutionEngine (and process) using it.
+
+    Entries are keyed by fingerprint of Batch contents together with "MetricConfiguration.id" (and Great Expectations
+    version), so that repeated validation of unchanged data reuses metrics resolved in prior runs, while any change to
+    data (reflected in Batch fingerprint) simply results in cache misses.
+
+    Metric values are stored pickled, and loading them can execute arbitrary code: cache file is trusted input only,
+    and must reside in location writable only by users trusted to run validations.
+
+    Args:
+        path: filesystem path of SQLite database file, holding cache entries (created, if absent)
+        max_size_bytes: upper bound on total size of stored (pickled) metric values; least recently used entries are
+            evicted when this budget is exceeded (no bound, if None)
+        ttl_seconds: time-to-live of entries; entries stored longer than this ago are treated as absent and purged
+            (no expiration, if None)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        max_size_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        self._path = os.fspath(path)
+        self._max_size_bytes = max_size_bytes
+        self._ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+
+        pathlib.Path(self._path).resolve().parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS metric_cache (
+                    batch_fingerprint TEXT NOT NULL,
+                    metric_key TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (batch_fingerprint, metric_key)
+                )
+                """
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS metric_cache_accessed_at ON metric_cache (accessed_at)"
+            )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def max_size_bytes(self) -> Optional[int]:
+        return self._max_size_bytes
+
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        return self._ttl_seconds
+
+    @property
+    def config(self) -> dict:
+        """Returns constructor arguments (plain values), from which equivalent PersistentMetricCache can be built."""
+        return {
+            "path": self._path,
+            "max_size_bytes": self._max_size_bytes,
+            "ttl_seconds": self._ttl_seconds,
+        }
+
+    def __len__(self) -> int:
+        with self._connect() as connection:
+            return connection.execute("SELECT COUNT(*) FROM metric_cache").fetchone()[0]
+
+    @property
+    def size_bytes(self) -> int:
+        """Returns total size of stored (pickled) metric values."""
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT COALESCE(SUM(size_bytes), 0) FROM metric_cache"
+            ).fetchone()[0]
+
+    def get_many(
+        self,
+        batch_fingerprint: str,
+        metric_ids: Iterable[Tuple[str, str, str]],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Looks up metric values, stored for Batch with given fingerprint.
+
+        Args:
+            batch_fingerprint: fingerprint of contents of Batch, to which metrics pertain
+            metric_ids: IDs of metrics to look up
+
+        Returns:
+            Dictionary of metric values, found in cache (and not expired), keyed by metric ID (misses are omitted)
+        """
+        metric_ids_by_key: Dict[str, Tuple[str, str, str]] = {
+            self._build_metric_key(metric_id=metric_id): metric_id
+            for metric_id in metric_ids
+        }
+        if not metric_ids_by_key:
+            return {}
+
+        now: float = time.time()
+        min_created_at: float = self._get_min_created_at(now=now)
+
+        metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        unreadable_metric_keys: List[str] = []
+
+        with self._lock, self._connect() as connection:
+            metric_keys: List[str]
+            rows: List[Tuple[str, bytes]]
+            metric_key: str
+            value: bytes
+            for metric_keys in _chunk(
+                list(metric_ids_by_key.keys()), _MAX_SQLITE_HOST_PARAMETERS
+            ):
+                rows = connection.execute(
+                    f"""
+                    SELECT metric_key, value FROM metric_cache
+                    WHERE batch_fingerprint = ? AND created_at >= ?
+                    AND metric_key IN ({", ".join("?" * len(metric_keys))})
+                    """,
+                    (batch_fingerprint, min_created_at, *metric_keys),
+                ).fetchall()
+                for metric_key, value in rows:
+                    try:
+                        metrics[metric_ids_by_key[metric_key]] = pickle.loads(value)
+                    except Exception as e:
+                        logger.debug(
+                            f'Discarding unreadable metric cache entry "{metric_key}": {str(e)}.'
+                        )
+                        unreadable_metric_keys.append(metric_key)
+
+            hit_metric_keys: List[str] = [
+                self._build_metric_key(metric_id=metric_id) for metric_id in metrics
+            ]
+            connection.executemany(
+                "UPDATE metric_cache SET accessed_at = ? WHERE batch_fingerprint = ? AND metric_key = ?",
+                [
+                    (now, batch_fingerprint, metric_key)
+                    for metric_key in hit_metric_keys
+                ],
+            )
+            connection.executemany(
+                "DELETE FROM metric_cache WHERE batch_fingerprint = ? AND metric_key = ?",
+                [
+                    (batch_fingerprint, metric_key)
+                    for metric_key in unreadable_metric_keys
+                ],
+            )
+
+        return metrics
+
+    def set_many(
+        self,
+        batch_fingerprint: str,
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> None:
+        """Stores metric values for Batch with given fingerprint and then evicts entries to honor TTL and size budget.
+
+        Metric values that cannot be pickled (or that alone exceed size budget) are not stored.
+
+        Args:
+            batch_fingerprint: fingerprint of contents of Batch, to which metrics pertain
+            metrics: metric values, keyed by metric ID
+        """
+        now: float = time.time()
+
+        rows: List[Tuple[str, str, bytes, int, float, float]] = []
+
+        metric_id: Tuple[str, str, str]
+        metric_value: MetricValue
+        value: bytes
+        for metric_id, metric_value in metrics.items():
+            try:
+                value = pickle.dumps(metric_value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                logger.debug(
+                    f"Metric {str(metric_id)} is not stored in metric cache, because its value cannot be pickled: {str(e)}."
+                )
+                continue
+
+            if self._max_size_bytes is not None and len(value) > self._max_size_bytes:
+                continue
+
+            rows.append(
+                (
+                    batch_fingerprint,
+                    self._build_metric_key(metric_id=metric_id),
+                    value,
+                    len(value),
+                    now,
+                    now,
+                )
+            )
+
+        if not rows:
+            return
+
+        with self._lock, self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO metric_cache VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            self._evict(connection=connection, now=now)
+
+    def clear(self) -> None:
+        """Removes all entries from cache."""
+        with self._lock, self._connect() as connection:
+            connection.execute("DELETE FROM metric_cache")
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        connection.execute(
+            "DELETE FROM metric_cache WHERE created_at < ?",
+            (self._get_min_created_at(now=now),),
+        )
+
+        if self._max_size_bytes is None:
+            return
+
+        size_bytes: int = connection.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM metric_cache"
+        ).fetchone()[0]
+        if size_bytes <= self._max_size_bytes:
+            return
+
+        evicted_keys: List[Tuple[str, str]] = []
+
+        batch_fingerprint: str
+        metric_key: str
+        entry_size_bytes: int
+        for batch_fingerprint, metric_key, entry_size_bytes in connection.execute(
+            "SELECT batch_fingerprint, metric_key, size_bytes FROM metric_cache ORDER BY accessed_at"
+        ).fetchall():
+            if size_bytes <= self._max_size_bytes:
+                break
+
+            evicted_keys.append((batch_fingerprint, metric_key))
+            size_bytes -= entry_size_bytes
+
+        connection.executemany(
+            "DELETE FROM metric_cache WHERE batch_fingerprint = ? AND metric_key = ?",
+            evicted_keys,
+        )
+
+    def _get_min_created_at(self, now: float) -> float:
+        if self._ttl_seconds is None:
+            return float("-inf")
+
+        return now - self._ttl_seconds
+
+    def _connect(self) -> _SQLiteTransaction:
+        return _SQLiteTransaction(path=self._path)
+
+    @staticmethod
+    def _build_metric_key(metric_id: Tuple[str, str, str]) -> str:
+        # Metric implementations may change between releases; hence, entries are scoped by Great Expectations version.
+        return json.dumps([ge_version, *metric_id])
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(path="{self._path}", max_size_bytes={self._max_size_bytes}, ttl_seconds={self._ttl_seconds})'
+
+
+class _SQLiteTransaction:
+    """Opens SQLite connection, which commits (or rolls back, upon exception) and closes on exit from "with" block."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._connection = sqlite3.connect(self._path, timeout=30)
+        return self._connection
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        connection: Optional[sqlite3.Connection] = self._connection
+        if connection is None:
+            return
+
+        self._connection = None
+        with closing(connection):
+            if exc_type is None:
+                connection.commit()
+            else:
+                connection.rollback()
+
+
+def _chunk(elements: List[str], chunk_size: int) -> Iterator[List[str]]:
+    idx: int
+    for idx in range(0, len(elements), chunk_size):
+        yield elements[idx : idx + chunk_size]
@@ -6,8 +6,20 @@ import logging
 import pickle
 from functools import partial
 from io import BytesIO
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union, cast, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
 
+import numpy as np
 import pandas as pd
 from typing_extensions import TypeAlias
 
@@ -26,6 +38,7 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric_domain_types import (
     MetricDomainTypes,  # noqa: TCH001
 )
@@ -34,6 +47,7 @@ from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.execution_engine import (
     SplitDomainKwargs,  # noqa: TCH001
 )
+from great_expectations.execution_engine.metric_cache import BoundedMetricCache
 from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
 from great_expectations.execution_engine.split_and_sample.pandas_data_sampler import (
     PandasDataSampler,
@@ -69,6 +83,55 @@ HASH_THRESHOLD = 1e9
 DataFrameFactoryFn: TypeAlias = Callable[..., pd.DataFrame]
 
 
+class PandasColumnSummary:
+    """Column of Domain records with its missing-value mask and counts, computed in one pass and shared by metrics.
+
+    Column aggregates and column map conditions over the same Domain and column reuse this summary instead of each
+    extracting the column and filtering out its missing values (which used to copy entire Domain records per metric).
+    Columns (like Domain records) are shared; metrics must treat them as read-only.
+
+    Args:
+        column: column of Domain records
+    """
+
+    def __init__(self, column: pd.Series) -> None:
+        self._column = column
+        self._is_null: pd.Series = column.isnull()
+        self._null_count = int(np.count_nonzero(self._is_null.to_numpy()))
+        self._nonnull_column: pd.Series = (
+            column[~self._is_null] if self._null_count else column
+        )
+
+    @property
+    def column(self) -> pd.Series:
+        return self._column
+
+    @property
+    def is_null(self) -> pd.Series:
+        return self._is_null
+
+    @property
+    def nonnull_column(self) -> pd.Series:
+        """Column without missing values (same object as "column", if it has no missing values)."""
+        return self._nonnull_column
+
+    @property
+    def null_count(self) -> int:
+        return self._null_count
+
+    @property
+    def nonnull_count(self) -> int:
+        return len(self._column) - self._null_count
+
+    def __sizeof__(self) -> int:
+        # Shared column is not counted (it is part of Domain records); mask and filtered column are owned by summary.
+        size_bytes: int = int(self._is_null.memory_usage(index=False))
+        if self._nonnull_column is not self._column:
+            size_bytes += int(self._nonnull_column.memory_usage(index=True))
+
+        return size_bytes
+
+
 @public_api
 class PandasExecutionEngine(ExecutionEngine):
     """PandasExecutionEngine instantiates the ExecutionEngine API to support computations using Pandas.
@@ -500,6 +563,33 @@ not {batch_spec.__class__.__name__}"""
             {}
         )  # This is NO-OP for "PandasExecutionEngine" (no bundling for direct execution computational backend).
 
+    def _compute_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """Fingerprints loaded DataFrame by its column names and types together with hash of its contents.
+
+        Hash of contents is taken from "pandas_data_fingerprint" Batch marker, if available (otherwise, it is computed).
+        """
+        batch_data: Optional[PandasBatchData] = cast(
+            Optional[PandasBatchData],
+            self.batch_manager.batch_data_cache.get(batch_id),
+        )
+        if batch_data is None:
+            return None
+
+        df: pd.DataFrame = batch_data.dataframe
+
+        batch = self.batch_manager.batch_cache.get(batch_id)
+        batch_markers: Optional[BatchMarkers] = getattr(batch, "batch_markers", None)
+        data_fingerprint: Optional[str] = (
+            batch_markers.get("pandas_data_fingerprint") if batch_markers else None
+        )
+        if data_fingerprint is None:
+            data_fingerprint = hash_pandas_dataframe(df)
+
+        schema: str = str(
+            [(str(column), str(dtype)) for column, dtype in zip(df.columns, df.dtypes)]
+        )
+        return hashlib.md5(f"{data_fingerprint}:{schema}".encode()).hexdigest()
+
     @public_api
     def get_domain_records(  # noqa: C901 - 17
         self,
@@ -512,6 +602,9 @@ not {batch_spec.__class__.__name__}"""
 
         Returns:
             A DataFrame (the data on which to compute returned in the format of a Pandas DataFrame)
+
+        Returned DataFrame is shared (not copied) by all metrics of the same Batch and Domain (and, without row filtering,
+        it is the loaded Batch data itself); it must be treated as read-only, and copied by callers, which modify it.
         """
         table = domain_kwargs.get("table", None)
         if table:
@@ -523,6 +616,7 @@ not {batch_spec.__class__.__name__}"""
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.batch_manager.active_batch_data_id is not None:
+                batch_id = self.batch_manager.active_batch_data_id
                 data = cast(
                     PandasBatchData, self.batch_manager.active_batch_data
                 ).dataframe
@@ -542,6 +636,7 @@ not {batch_spec.__class__.__name__}"""
 
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
+        condition_parser: Optional[str] = None
         if row_condition:
             condition_parser = domain_kwargs.get("condition_parser", None)
 
@@ -551,68 +646,151 @@ not {batch_spec.__class__.__name__}"""
                     "condition_parser is required when setting a row_condition,"
                     " and must be 'python' or 'pandas'"
                 )
-            else:
-                # Querying row condition
-                data = data.query(row_condition, parser=condition_parser)
+        else:
+            row_condition = None
 
+        ignore_row_if: Optional[str] = None
+        subset: Tuple[str, ...] = ()
+        how: Optional[str] = None
         if "column" in domain_kwargs:
-            return data
-
-        if (
+            pass
+        elif (
             "column_A" in domain_kwargs
             and "column_B" in domain_kwargs
             and "ignore_row_if" in domain_kwargs
         ):
-            # noinspection PyPep8Naming
-            column_A_name = domain_kwargs["column_A"]
-            # noinspection PyPep8Naming
-            column_B_name = domain_kwargs["column_B"]
-
             ignore_row_if = domain_kwargs["ignore_row_if"]
+            subset = (domain_kwargs["column_A"], domain_kwargs["column_B"])
             if ignore_row_if == "both_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=[column_A_name, column_B_name],
-                )
+                how = "all"
             elif ignore_row_if == "either_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=[column_A_name, column_B_name],
+                how = "any"
+            elif ignore_row_if != "neither":
+                raise ValueError(
+                    f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
+                )
+        elif "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
+            ignore_row_if = domain_kwargs["ignore_row_if"]
+            subset = tuple(domain_kwargs["column_list"])
+            if ignore_row_if == "all_values_are_missing":
+                how = "all"
+            elif ignore_row_if == "any_value_is_missing":
+                how = "any"
+            elif ignore_row_if != "never":
+                raise ValueError(
+                    f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
                 )
-            else:
-                if ignore_row_if != "neither":
-                    raise ValueError(
-                        f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
-                    )
 
+        if row_condition is None and how is None:
             return data
 
-        if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
-            column_list = domain_kwargs["column_list"]
+        if not self._caching:
+            return self._filter_domain_records(
+                data=data,
+                row_condition=row_condition,
+                condition_parser=condition_parser,
+                how=how,
+                subset=subset,
+            )
 
-            ignore_row_if = domain_kwargs["ignore_row_if"]
-            if ignore_row_if == "all_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=column_list,
-                )
-            elif ignore_row_if == "any_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=column_list,
+        # Filtered records are shared (without copying) by all metrics with the same Domain in the same Batch, within
+        # budget of "records" segment of metric cache (entries are discarded when Batch data is reloaded or removed).
+        metric_cache = cast(BoundedMetricCache, self._metric_cache)
+
+        row_condition_key: Tuple[Hashable, ...] = (
+            batch_id,
+            "domain_records",
+            row_condition,
+            condition_parser,
+        )
+        if row_condition is not None:
+            filtered_data: Optional[pd.DataFrame] = metric_cache.get_records(
+                key=row_condition_key
+            )
+            if filtered_data is None:
+                filtered_data = self._filter_domain_records(
+                    data=data,
+                    row_condition=row_condition,
+                    condition_parser=condition_parser,
                 )
-            else:
-                if ignore_row_if != "never":
-                    raise ValueError(
-                        f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
-                    )
+                metric_cache.set_records(key=row_condition_key, records=filtered_data)
+
+            data = filtered_data
 
+        if how is None:
             return data
 
+        ignore_row_if_key: Tuple[Hashable, ...] = (
+            *row_condition_key,
+            ignore_row_if,
+            subset,
+        )
+        domain_records: Optional[pd.DataFrame] = metric_cache.get_records(
+            key=ignore_row_if_key
+        )
+        if domain_records is None:
+            domain_records = self._filter_domain_records(
+                data=data, how=how, subset=subset
+            )
+            metric_cache.set_records(key=ignore_row_if_key, records=domain_records)
+
+        return domain_records
+
+    def get_column_summary(
+        self, domain_kwargs: dict, column_name: str
+    ) -> PandasColumnSummary:
+        """Returns column of Domain records with its missing-value mask and counts, shared by all metrics of the Domain.
+
+        Args:
+            domain_kwargs: compute Domain kwargs (e.g., "batch_id" and "row_condition"), whose records hold the column
+            column_name: name of column
+
+        Returns:
+            PandasColumnSummary, which is computed once per Batch, compute Domain, and column (if caching is enabled)
+        """
+        df: pd.DataFrame = self.get_domain_records(domain_kwargs=domain_kwargs)
+        if not self._caching:
+            return PandasColumnSummary(column=df[column_name])
+
+        metric_cache = cast(BoundedMetricCache, self._metric_cache)
+        key: Tuple[Hashable, ...] = (
+            domain_kwargs.get("batch_id") or self.batch_manager.active_batch_data_id,
+            "column_summary",
+            IDDict(domain_kwargs).to_id(),
+            column_name,
+        )
+        column_summary: Optional[PandasColumnSummary] = metric_cache.get_records(
+            key=key
+        )
+        if column_summary is None:
+            column_summary = PandasColumnSummary(column=df[column_name])
+            metric_cache.set_records(key=key, records=column_summary)
+
+        return column_summary
+
+    @staticmethod
+    def _filter_domain_records(
+        data: pd.DataFrame,
+        row_condition: Optional[str] = None,
+        condition_parser: Optional[str] = None,
+        how: Optional[str] = None,
+        subset: Tuple[str, ...] = (),
+    ) -> pd.DataFrame:
+        """Applies row condition and then drops rows with missing values in "subset" columns ("how" is "any" or "all").
+
+        When no rows are dropped, original DataFrame is returned as is (rather than as its copy).
+        """
+        if row_condition is not None:
+            data = data.query(row_condition, parser=condition_parser)
+
+        if how is not None:
+            is_present: pd.DataFrame = data[list(subset)].notna()
+            keep: pd.Series = (
+                is_present.all(axis=1) if how == "any" else is_present.any(axis=1)
+            )
+            if not keep.all():
+                data = data[keep]
+
         return data
 
     @public_api
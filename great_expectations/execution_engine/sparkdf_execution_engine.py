@@ -3,11 +3,13 @@ from __future__ import annotations
 import copy
 import datetime
 import logging
+from dataclasses import dataclass, field
 from functools import reduce
 from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     List,
     Optional,
@@ -18,9 +20,10 @@ from typing import (
 )
 
 from dateutil.parser import parse
+from packaging import version
 
 from great_expectations.core._docs_decorators import public_api
-from great_expectations.core.batch import BatchMarkers
+from great_expectations.core.batch import BatchDataType, BatchMarkers
 from great_expectations.core.batch_spec import (
     AzureBatchSpec,
     BatchSpec,
@@ -63,7 +66,10 @@ from great_expectations.expectations.row_conditions import (
 )
 from great_expectations.optional_imports import (
     F,
+    pyarrow,
+    pyspark,
     pyspark_DataFrameReader,
+    pyspark_sql_Column,
     pyspark_sql_DataFrame,
     pyspark_sql_Row,
     pyspark_sql_SparkSession,
@@ -78,6 +84,70 @@ from great_expectations.validator.metric_configuration import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class SparkCachePolicy:
+    """Caching policy of SparkDFExecutionEngine.
+
+    Args:
+        storage_level: name of "pyspark.StorageLevel" at which Batch DataFrames (and cached filtered Domains) persist
+        batch_dataframes: how to cache DataFrames of loaded Batches -- None (do not cache), or "persist" (persist at \
+            "storage_level" once loaded, and unpersist once evicted)
+        filtered_domains: how to cache Domains filtered by row conditions and "ignore_row_if" directives -- None (do not \
+            cache), "persist" (persist at "storage_level"), or "checkpoint" (local checkpoint, truncating lineage)
+        filtered_domain_min_reuse: number of requests for the same filtered Domain, after which it is cached
+    """
+
+    storage_level: str = "MEMORY_AND_DISK"
+    batch_dataframes: Optional[str] = None
+    filtered_domains: Optional[str] = None
+    filtered_domain_min_reuse: int = 2
+
+
+@dataclass(frozen=True)
+class SparkCacheFootprint:
+    """Footprint of DataFrames cached by SparkDFExecutionEngine.
+
+    Memory and disk sizes are reported by Spark for all cached data of Spark application (None, if unavailable).
+    """
+
+    num_persisted_batches: int = 0
+    num_cached_filtered_domains: int = 0
+    memory_size_bytes: Optional[int] = None
+    disk_size_bytes: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class SparkColumnAggregate:
+    """Deferred aggregation of one column, returned by "column_aggregate_partial" metric functions for Spark.
+
+    Aggregate over all values of column is built upon construction, so that errors raised by "aggregate_fn" (e.g.,
+    unsupported column type) fail only metric, whose function returned this object, rather than its whole bundle.  When
+    Domains of Batch are computed in single job, column is restricted to records of its own Domain (using "F.when()"
+    with condition of Domain) before it is aggregated.  Hence, "aggregate_fn" must depend on records only through its
+    column argument and must ignore missing values (as Spark aggregate functions do).
+
+    Args:
+        column: column (or column expression) to aggregate
+        aggregate_fn: callable, building aggregate Spark column (e.g., "F.max") from column
+    """
+
+    column: pyspark_sql_Column
+    aggregate_fn: Callable[[pyspark_sql_Column], pyspark_sql_Column]
+    aggregate: pyspark_sql_Column = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "aggregate", self.aggregate_fn(self.column))
+
+    def to_column(
+        self, condition: Optional[pyspark_sql_Column] = None
+    ) -> pyspark_sql_Column:
+        """Builds aggregate over values of records satisfying condition (over all values, if condition is None)."""
+        if condition is None:
+            return self.aggregate
+
+        return self.aggregate_fn(F.when(condition, self.column))
+
+
 # noinspection SpellCheckingInspection
 def apply_dateutil_parse(column):
     assert len(column.columns) == 1, "Expected DataFrame with 1 column"
@@ -98,6 +168,8 @@ class SparkDFExecutionEngine(ExecutionEngine):
         *args: Positional arguments for configuring SparkDFExecutionEngine
         persist: If True (default), then creation of the Spark DataFrame is done outside this class
         spark_config: Dictionary of Spark configuration options
+        cache_policy: Dictionary of SparkCachePolicy arguments (storage level, and caching of filtered Domains)
+        bundle_domains_in_single_job: If True, then bundled metrics of all Domains of a Batch are computed in one job
         force_reuse_spark_context: If True then utilize existing SparkSession if it exists and is active
         **kwargs: Keyword arguments for configuring SparkDFExecutionEngine
 
@@ -113,6 +185,10 @@ class SparkDFExecutionEngine(ExecutionEngine):
         spark_session: SparkSession = execution_engine.spark
     ```
 
+    DataFrames cached by this ExecutionEngine (per "cache_policy") are unpersisted when their Batch is evicted (e.g.,
+    reloaded).  Calling "close()" evicts all loaded Batches (so they can no longer be used for computing metrics);
+    DataFrames, which were cached by their creators, are never unpersisted by this ExecutionEngine.
+
     --ge-feature-maturity-info--
 
         id: validation_engine_pyspark_self_managed
@@ -195,9 +271,25 @@ class SparkDFExecutionEngine(ExecutionEngine):
         persist=True,
         spark_config=None,
         force_reuse_spark_context=True,
+        cache_policy: Optional[dict] = None,
+        bundle_domains_in_single_job: bool = False,
         **kwargs,
     ) -> None:
         self._persist = persist
+        self._bundle_domains_in_single_job = bundle_domains_in_single_job
+
+        self._cache_policy = SparkCachePolicy(**(cache_policy or {}))
+        if self._cache_policy.batch_dataframes not in (None, "persist"):
+            raise ExecutionEngineError(
+                f'Unrecognized caching of Batch DataFrames ("{self._cache_policy.batch_dataframes}"); must be "persist".'
+            )
+        if self._cache_policy.filtered_domains not in (None, "persist", "checkpoint"):
+            raise ExecutionEngineError(
+                f'Unrecognized caching of filtered Domains ("{self._cache_policy.filtered_domains}"); must be "persist" or "checkpoint".'
+            )
+
+        # DataFrames of loaded Batches, which were persisted by this ExecutionEngine (and are to be unpersisted by it).
+        self._persisted_batch_dataframes: Dict[str, pyspark_sql_DataFrame] = {}
 
         if spark_config is None:
             spark_config = {}
@@ -213,6 +305,15 @@ class SparkDFExecutionEngine(ExecutionEngine):
         self._spark_config = spark_config
         self.spark = spark
 
+        try:
+            self._storage_level = getattr(
+                pyspark.StorageLevel, self._cache_policy.storage_level
+            )
+        except AttributeError:
+            raise ExecutionEngineError(
+                f'Unrecognized Spark storage level "{self._cache_policy.storage_level}".'
+            )
+
         azure_options: dict = kwargs.pop("azure_options", {})
         self._azure_options = azure_options
 
@@ -222,6 +323,8 @@ class SparkDFExecutionEngine(ExecutionEngine):
             {
                 "persist": self._persist,
                 "spark_config": spark_config,
+                "cache_policy": cache_policy,
+                "bundle_domains_in_single_job": bundle_domains_in_single_job,
                 "azure_options": azure_options,
             }
         )
@@ -239,6 +342,55 @@ class SparkDFExecutionEngine(ExecutionEngine):
 
         return cast(SparkDFBatchData, self.batch_manager.active_batch_data).dataframe
 
+    @property
+    def cache_policy(self) -> SparkCachePolicy:
+        """Getter for caching policy"""
+        return self._cache_policy
+
+    @property
+    def arrow_enabled(self) -> bool:
+        """Whether vectorized (Arrow-backed "pandas_udf") UDFs are to be used by map metrics
+
+        Arrow must be enabled in Spark configuration ("spark.sql.execution.arrow.pyspark.enabled"), "pyarrow" must be
+        installed, and Spark must be 3.0 or later (iterator-of-Series pandas UDFs).
+        """
+        if not pyarrow or version.parse(pyspark.__version__) < version.parse("3.0.0"):
+            return False
+
+        return (
+            str(self.spark.conf.get("spark.sql.execution.arrow.pyspark.enabled"))
+            .strip()
+            .lower()
+            == "true"
+        )
+
+    @property
+    def cache_footprint(self) -> SparkCacheFootprint:
+        """Getter for numbers of DataFrames cached by this ExecutionEngine, and for Spark storage they occupy"""
+        num_cached_filtered_domains: int = sum(
+            isinstance(key, tuple) and key[0] == "spark_filtered_domain"
+            for batch_id in self.batch_manager.loaded_batch_ids
+            for key in self.batch_manager.get_derived_batch_data_cache(
+                batch_id=batch_id
+            )
+        )
+
+        memory_size_bytes: Optional[int] = None
+        disk_size_bytes: Optional[int] = None
+        try:
+            rdd_storage_info = self.spark.sparkContext._jsc.sc().getRDDStorageInfo()
+            memory_size_bytes = sum(rdd_info.memSize() for rdd_info in rdd_storage_info)
+            disk_size_bytes = sum(rdd_info.diskSize() for rdd_info in rdd_storage_info)
+        except Exception as e:
+            logger.debug(f"Unable to obtain Spark storage information: {str(e)}.")
+
+        return SparkCacheFootprint(
+            num_persisted_batches=len(self._persisted_batch_dataframes),
+            num_cached_filtered_domains=num_cached_filtered_domains,
+            memory_size_bytes=memory_size_bytes,
+            disk_size_bytes=disk_size_bytes,
+        )
+
     def load_batch_data(  # type: ignore[override]
         self, batch_id: str, batch_data: Union[SparkDFBatchData, pyspark_sql_DataFrame]
     ) -> None:
@@ -251,6 +403,47 @@ class SparkDFExecutionEngine(ExecutionEngine):
 
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+        dataframe: pyspark_sql_DataFrame = batch_data.dataframe
+        # DataFrames, cached by their creators, are left under their control.
+        if self._cache_policy.batch_dataframes == "persist" and not dataframe.is_cached:
+            dataframe.persist(self._storage_level)
+            self._persisted_batch_dataframes[batch_id] = dataframe
+
+    def release_batch_data(
+        self,
+        batch_id: str,
+        batch_data: BatchDataType,
+        derived_batch_data: Dict[Hashable, Any],
+    ) -> None:
+        """Unpersists Batch DataFrame (if persisted by this ExecutionEngine) and filtered Domains cached for it."""
+        super().release_batch_data(
+            batch_id=batch_id,
+            batch_data=batch_data,
+            derived_batch_data=derived_batch_data,
+        )
+
+        dataframe: Optional[
+            pyspark_sql_DataFrame
+        ] = self._persisted_batch_dataframes.pop(batch_id, None)
+        if dataframe is not None:
+            dataframe.unpersist()
+
+        key: Hashable
+        value: Any
+        for key, value in derived_batch_data.items():
+            if isinstance(key, tuple) and key[0] == "spark_filtered_domain":
+                value.unpersist()
+
+    def close(self) -> None:
+        """Evicts all loaded Batches, thereby unpersisting all DataFrames cached by this ExecutionEngine.
+
+        Afterwards, no Batch is active; Batches must be loaded again before metrics can be computed.  SparkSession is
+        left running, since it may be shared with other ExecutionEngine objects (and with the caller).
+        """
+        batch_id: str
+        for batch_id in self.batch_manager.loaded_batch_ids:
+            self.batch_manager.remove_batch_data(batch_id=batch_id)
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:  # batch_data
@@ -499,6 +692,8 @@ illegal.  Please check your config."""
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.batch_manager.active_batch_data:
+                # Active BatchData is available only if its Batch ID is determined.
+                batch_id = cast(str, self.batch_manager.active_batch_data_id)
                 data = cast(
                     SparkDFBatchData, self.batch_manager.active_batch_data
                 ).dataframe
@@ -514,15 +709,122 @@ illegal.  Please check your config."""
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
 
+        if self._cache_policy.filtered_domains is None:
+            return self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+
+        filtered_domain_key: Optional[
+            Tuple[Hashable, ...]
+        ] = self._get_filtered_domain_key(domain_kwargs=domain_kwargs)
+        if filtered_domain_key is None:
+            return data
+
+        # Filtered Domains, reused by many metrics, are cached for as long as their Batch remains loaded.
+        derived_batch_data: Dict[
+            Hashable, Any
+        ] = self.batch_manager.get_derived_batch_data_cache(batch_id=batch_id)
+        cache_key: Tuple[Hashable, ...] = ("spark_filtered_domain", filtered_domain_key)
+        if cache_key in derived_batch_data:
+            return derived_batch_data[cache_key]
+
+        data = self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+
+        request_count_key: Tuple[Hashable, ...] = (
+            "spark_filtered_domain_request_count",
+            filtered_domain_key,
+        )
+        derived_batch_data[request_count_key] = (
+            derived_batch_data.get(request_count_key, 0) + 1
+        )
+        if (
+            derived_batch_data[request_count_key]
+            < self._cache_policy.filtered_domain_min_reuse
+        ):
+            return data
+
+        if self._cache_policy.filtered_domains == "checkpoint":
+            data = data.localCheckpoint(eager=True)
+        else:
+            data = data.persist(self._storage_level)
+
+        derived_batch_data[cache_key] = data
+        return data
+
+    @staticmethod
+    def _get_filtered_domain_key(
+        domain_kwargs: dict,
+    ) -> Optional[Tuple[Hashable, ...]]:
+        """Identifies records filtering, specified by Domain kwargs (None if records are not filtered at all)."""
+        row_condition: Optional[str] = domain_kwargs.get("row_condition") or None
+        filter_conditions: Tuple[Tuple[str, str], ...] = tuple(
+            (filter_condition.condition, filter_condition.condition_type.value)
+            for filter_condition in domain_kwargs.get("filter_conditions", [])
+        )
+
+        ignore_row_if_directive: Tuple[Hashable, ...] = ()
+        if "column" not in domain_kwargs:
+            ignore_row_if: Optional[str] = domain_kwargs.get("ignore_row_if")
+            if (
+                "column_A" in domain_kwargs
+                and "column_B" in domain_kwargs
+                and ignore_row_if not in (None, "neither")
+            ):
+                ignore_row_if_directive = (
+                    ignore_row_if,
+                    domain_kwargs["column_A"],
+                    domain_kwargs["column_B"],
+                )
+            elif "column_list" in domain_kwargs and ignore_row_if not in (
+                None,
+                "never",
+            ):
+                ignore_row_if_directive = (
+                    ignore_row_if,
+                    tuple(domain_kwargs["column_list"]),
+                )
+
+        if not (row_condition or filter_conditions or ignore_row_if_directive):
+            return None
+
+        return (
+            row_condition,
+            domain_kwargs.get("condition_parser") if row_condition else None,
+            filter_conditions,
+            ignore_row_if_directive,
+        )
+
+    def _filter_domain_records(
+        self, data: pyspark_sql_DataFrame, domain_kwargs: dict
+    ) -> pyspark_sql_DataFrame:
+        """Applies row condition, filter conditions, and "ignore_row_if" directive of Domain kwargs to Batch DataFrame."""
+        condition: Optional[pyspark_sql_Column] = self._get_domain_records_condition(
+            domain_kwargs=domain_kwargs
+        )
+        if condition is None:
+            return data
+
+        return data.filter(condition)
+
+    def _get_domain_records_condition(  # noqa: C901 - 13
+        self, domain_kwargs: dict
+    ) -> Optional[pyspark_sql_Column]:
+        """Combines row condition, filter conditions, and "ignore_row_if" directive of Domain kwargs into one condition.
+
+        Args:
+            domain_kwargs: Domain kwargs, specifying records of Domain
+
+        Returns:
+            Condition, satisfied by records of Domain (None, if all records of Batch belong to Domain)
+        """
+        conditions: List[pyspark_sql_Column] = []
+
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
             condition_parser = domain_kwargs.get("condition_parser", None)
             if condition_parser == "spark":
-                data = data.filter(row_condition)
+                conditions.append(F.expr(row_condition))
             elif condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_spark(row_condition)
-                data = data.filter(parsed_condition)
+                conditions.append(parse_condition_to_spark(row_condition))
             else:
                 raise GreatExpectationsError(
                     f"unrecognized condition_parser {str(condition_parser)} for Spark execution engine"
@@ -534,13 +836,12 @@ illegal.  Please check your config."""
         )
         if len(filter_conditions) > 0:
             filter_condition = self._combine_row_conditions(filter_conditions)
-            data = data.filter(filter_condition.condition)
-
-        if "column" in domain_kwargs:
-            return data
+            conditions.append(F.expr(filter_condition.condition))
 
         # Filtering by ignore_row_if directive
-        if (
+        if "column" in domain_kwargs:
+            pass
+        elif (
             "column_A" in domain_kwargs
             and "column_B" in domain_kwargs
             and "ignore_row_if" in domain_kwargs
@@ -555,44 +856,42 @@ illegal.  Please check your config."""
                 ignore_condition = (
                     F.col(column_A_name).isNull() & F.col(column_B_name).isNull()
                 )
-                data = data.filter(~ignore_condition)
+                conditions.append(~ignore_condition)
             elif ignore_row_if == "either_value_is_missing":
                 ignore_condition = (
                     F.col(column_A_name).isNull() | F.col(column_B_name).isNull()
                 )
-                data = data.filter(~ignore_condition)
+                conditions.append(~ignore_condition)
             else:
                 if ignore_row_if != "neither":
                     raise ValueError(
                         f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
                     )
-
-            return data
-
-        if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
+        elif "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
             column_list = domain_kwargs["column_list"]
             ignore_row_if = domain_kwargs["ignore_row_if"]
             if ignore_row_if == "all_values_are_missing":
-                conditions = [
+                column_conditions = [
                     F.col(column_name).isNull() for column_name in column_list
                 ]
-                ignore_condition = reduce(lambda a, b: a & b, conditions)
-                data = data.filter(~ignore_condition)
+                ignore_condition = reduce(lambda a, b: a & b, column_conditions)
+                conditions.append(~ignore_condition)
             elif ignore_row_if == "any_value_is_missing":
-                conditions = [
+                column_conditions = [
                     F.col(column_name).isNull() for column_name in column_list
                 ]
-                ignore_condition = reduce(lambda a, b: a | b, conditions)
-                data = data.filter(~ignore_condition)
+                ignore_condition = reduce(lambda a, b: a | b, column_conditions)
+                conditions.append(~ignore_condition)
             else:
                 if ignore_row_if != "never":
                     raise ValueError(
                         f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
                     )
 
-            return data
+        if not conditions:
+            return None
 
-        return data
+        return reduce(lambda a, b: a & b, conditions)
 
     @staticmethod
     def _combine_row_conditions(row_conditions: List[RowCondition]) -> RowCondition:
@@ -756,7 +1055,31 @@ illegal.  Please check your config."""
             aggregates[domain_id]["column_aggregates"].append(metric_fn)
             aggregates[domain_id]["metric_ids"].append(metric_to_resolve.id)
 
-        for aggregate in aggregates.values():
+        if self._bundle_domains_in_single_job:
+            batch_id: str
+            batch_aggregates: Dict[Tuple[str, str, str], dict]
+            for (
+                batch_id,
+                batch_aggregates,
+            ) in self._get_single_job_aggregates_by_batch_id(
+                aggregates=aggregates
+            ).items():
+                try:
+                    resolved_metrics.update(
+                        self._resolve_domain_aggregates_in_single_job(
+                            batch_id=batch_id, aggregates=batch_aggregates
+                        )
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"SparkDFExecutionEngine could not compute metrics of {len(batch_aggregates)} domains of batch_id {batch_id} in single job ({str(e)}); computing them per domain."
+                    )
+                    continue
+
+                for domain_id in batch_aggregates:
+                    del aggregates[domain_id]
+
+        for domain_id, aggregate in aggregates.items():
             domain_kwargs: dict = aggregate["domain_kwargs"]
             df: pyspark_sql_DataFrame = self.get_domain_records(
                 domain_kwargs=domain_kwargs
@@ -764,10 +1087,17 @@ illegal.  Please check your config."""
 
             assert len(aggregate["column_aggregates"]) == len(aggregate["metric_ids"])
 
-            res = df.agg(*aggregate["column_aggregates"]).collect()
+            res = df.agg(
+                *[
+                    column_aggregate.to_column()
+                    if isinstance(column_aggregate, SparkColumnAggregate)
+                    else column_aggregate
+                    for column_aggregate in aggregate["column_aggregates"]
+                ]
+            ).collect()
 
             logger.debug(
-                f"SparkDFExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(domain_kwargs).to_id()}"
+                f"SparkDFExecutionEngine computed {len(res[0])} metrics on domain_id {domain_id}"
             )
 
             assert (
@@ -788,6 +1118,98 @@ illegal.  Please check your config."""
 
         return resolved_metrics
 
+    def _get_single_job_aggregates_by_batch_id(
+        self, aggregates: Dict[Tuple[str, str, str], dict]
+    ) -> Dict[str, Dict[Tuple[str, str, str], dict]]:
+        """Groups aggregates of Domains by Batch, keeping only Batches with more than one Domain to compute.
+
+        Domains of other Batches (or whose Batch cannot be determined), as well as Domains having aggregates other than
+        "SparkColumnAggregate", are computed by separate jobs, one per Domain.
+        """
+        aggregates_by_batch_id: Dict[str, Dict[Tuple[str, str, str], dict]] = {}
+
+        domain_id: Tuple[str, str, str]
+        aggregate: dict
+        for domain_id, aggregate in aggregates.items():
+            batch_id: Optional[str] = (
+                aggregate["domain_kwargs"].get("batch_id")
+                or self.batch_manager.active_batch_data_id
+            )
+            if batch_id is None or batch_id not in self.batch_manager.batch_data_cache:
+                continue
+
+            # Aggregates, whose column is unknown, cannot be restricted to records of their Domain.
+            if not all(
+                isinstance(column_aggregate, SparkColumnAggregate)
+                for column_aggregate in aggregate["column_aggregates"]
+            ):
+                continue
+
+            aggregates_by_batch_id.setdefault(batch_id, {})[domain_id] = aggregate
+
+        return {
+            batch_id: batch_aggregates
+            for batch_id, batch_aggregates in aggregates_by_batch_id.items()
+            if len(batch_aggregates) > 1
+        }
+
+    def _resolve_domain_aggregates_in_single_job(
+        self, batch_id: str, aggregates: Dict[Tuple[str, str, str], dict]
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes aggregates of all Domains of Batch over single scan of Batch DataFrame.
+
+        Column of every aggregate is restricted (using "F.when()" with condition of its Domain) to records of its own
+        Domain, so that each aggregate only processes values of its Domain, and all aggregates are computed by one
+        "DataFrame.agg()" over Batch DataFrame.
+
+        Args:
+            batch_id: ID of Batch, to which all Domains belong
+            aggregates: aggregates and metric IDs of each Domain, keyed by Domain ID
+
+        Returns:
+            A dictionary of "MetricConfiguration" IDs and their corresponding fully resolved values for domains.
+        """
+        data: pyspark_sql_DataFrame = cast(
+            SparkDFBatchData, self.batch_manager.batch_data_cache[batch_id]
+        ).dataframe
+
+        column_aggregates: List[pyspark_sql_Column] = []
+        metric_ids: List[Tuple[str, str, str]] = []
+        aggregate: dict
+        for aggregate in aggregates.values():
+            condition: Optional[
+                pyspark_sql_Column
+            ] = self._get_domain_records_condition(
+                domain_kwargs=aggregate["domain_kwargs"]
+            )
+            column_aggregate: SparkColumnAggregate
+            for column_aggregate in aggregate["column_aggregates"]:
+                column_aggregates.append(
+                    column_aggregate.to_column(condition=condition)
+                )
+
+            metric_ids.extend(aggregate["metric_ids"])
+
+        res: List[pyspark_sql_Row] = data.agg(*column_aggregates).collect()
+
+        logger.debug(
+            f"SparkDFExecutionEngine computed {len(column_aggregates)} aggregates of {len(aggregates)} domains of batch_id {batch_id} in single job"
+        )
+
+        assert (
+            len(res) == 1
+        ), "all bundle-computed metrics must be single-value statistics"
+        assert len(metric_ids) == len(res[0]), "unexpected number of metrics returned"
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        idx: int
+        metric_id: Tuple[str, str, str]
+        for idx, metric_id in enumerate(metric_ids):
+            resolved_metrics[metric_id] = convert_to_json_serializable(data=res[0][idx])
+
+        return resolved_metrics
+
     def head(self, n=5):
         """Returns dataframe head. Default is 5"""
         return self.dataframe.limit(n).toPandas()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Union
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.core.id_dict import BatchSpec  # noqa: TCH001
@@ -20,10 +21,49 @@ from great_expectations.optional_imports import (
 if TYPE_CHECKING:
     from great_expectations.execution_engine import SqlAlchemyExecutionEngine
 
+logger = logging.getLogger(__name__)
+
 
 class SqlAlchemyDataSampler(DataSampler):
     """Sampling methods for data stores with SQL interfaces."""
 
+    # Dialects with native TABLESAMPLE: supported sampling methods, whether seed ("REPEATABLE") is supported,
+    # and whether sampling percentage is followed by "PERCENT" keyword.
+    TABLESAMPLE_DIALECTS: Dict[GXSqlDialect, Tuple[Tuple[str, ...], bool, bool]] = {
+        GXSqlDialect.POSTGRESQL: (("bernoulli", "system"), True, False),
+        GXSqlDialect.TRINO: (("bernoulli", "system"), False, False),
+        GXSqlDialect.MSSQL: (("system",), True, True),
+        GXSqlDialect.SNOWFLAKE: (("bernoulli", "system"), True, False),
+        GXSqlDialect.BIGQUERY: (("system",), False, True),
+    }
+
+    # Dialects without "md5" function of strings; hash-based fallback is replaced with random filtering for them.
+    DIALECTS_WITHOUT_MD5: Tuple[GXSqlDialect, ...] = (
+        GXSqlDialect.SQLITE,
+        GXSqlDialect.ORACLE,
+        GXSqlDialect.MSSQL,
+        GXSqlDialect.AWSATHENA,
+        GXSqlDialect.TERADATASQL,
+    )
+
+    # Number of trailing hexadecimal digits of md5 hash, compared against threshold in hash-based fallback.
+    HASH_DIGITS: int = 8
+
+    # Expressions of random number between 0 and 1 (random filtering is used by dialects without native sampling, unless
+    # hash-based filtering is possible); sampling fails for dialects not listed here.
+    RANDOM_FRACTION_EXPRESSIONS: Dict[GXSqlDialect, Callable[[], Any]] = {
+        # SQLite random() returns 64-bit signed integer (rather than number between 0 and 1).
+        GXSqlDialect.SQLITE: lambda: (sa.func.abs(sa.func.random()) % 1000000)
+        / 1000000.0,
+        GXSqlDialect.ORACLE: lambda: sa.literal_column("dbms_random.value"),
+        GXSqlDialect.MYSQL: lambda: sa.func.rand(),
+        GXSqlDialect.HIVE: lambda: sa.func.rand(),
+        GXSqlDialect.AWSATHENA: lambda: sa.func.random(),
+        GXSqlDialect.DREMIO: lambda: sa.func.random(),
+        GXSqlDialect.REDSHIFT: lambda: sa.func.random(),
+        GXSqlDialect.VERTICA: lambda: sa.func.random(),
+    }
+
     def sample_using_limit(
         self,
         execution_engine: SqlAlchemyExecutionEngine,
@@ -175,6 +215,145 @@ class SqlAlchemyDataSampler(DataSampler):
             .limit(sample_size)
         )
 
+    def sample_using_tablesample(  # noqa: C901 - 11
+        self,
+        execution_engine: SqlAlchemyExecutionEngine,
+        batch_spec: BatchSpec,
+        where_clause: Optional[sa_sql_expression_Selectable] = None,
+    ) -> sa_sql_expression_Selectable:
+        """Sample fraction of rows using native block/row sampling of the database, without counting or sorting rows.
+
+        Dialects with native sampling use TABLESAMPLE (PostgreSQL, Trino, MSSQL, Snowflake, BigQuery); "method" is
+        "bernoulli" (rows, default) or "system" (blocks/pages), and dialects supporting only the latter use it.  Other
+        dialects filter rows by md5 hash of "column_name" (if provided, and if dialect has md5 function), or else by
+        random number (dialects without known random number function are not supported).
+
+        Sampling is reproducible for the same "seed" where the dialect allows it (TABLESAMPLE with REPEATABLE on
+        PostgreSQL, MSSQL, and Snowflake; hash-based filtering, which is always reproducible, seeded by prefixing values).
+
+        Args:
+            execution_engine: Engine used to connect to the database.
+            batch_spec: should contain key `p` (fraction of rows, between 0 and 1) in `sampling_kwargs`, and optionally
+                `method` ("bernoulli" or "system"), `seed` (integer), and `column_name` (used for hash-based filtering)
+            where_clause: Optional clause used in WHERE clause. Typically generated by a splitter.
+
+        Returns:
+            Sqlalchemy selectable.
+
+        Raises:
+            SamplerError
+        """
+        self.verify_batch_spec_sampling_kwargs_exists(batch_spec)
+        self.verify_batch_spec_sampling_kwargs_key_exists("p", batch_spec)
+        p: float = float(self.get_sampling_kwargs_value_or_default(batch_spec, "p"))
+        if not 0.0 <= p <= 1.0:
+            raise gx_exceptions.SamplerError(
+                f'Sampling fraction "p" must be between 0 and 1, but got {p}.'
+            )
+
+        method: str = str(
+            self.get_sampling_kwargs_value_or_default(
+                batch_spec=batch_spec,
+                sampling_kwargs_key="method",
+                default_value="bernoulli",
+            )
+        ).lower()
+        if method not in ("bernoulli", "system"):
+            raise gx_exceptions.SamplerError(
+                f'Sampling "method" must be "bernoulli" or "system", but got "{method}".'
+            )
+
+        seed: Optional[int] = self.get_sampling_kwargs_value_or_default(
+            batch_spec, "seed"
+        )
+        if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int)):
+            raise gx_exceptions.SamplerError(
+                f'Sampling "seed" must be an integer, but got {seed}.'
+            )
+
+        column_name: Optional[str] = self.get_sampling_kwargs_value_or_default(
+            batch_spec, "column_name"
+        )
+
+        # Split clause should be permissive of all values if not supplied.
+        if where_clause is None:
+            if execution_engine.dialect_name == GXSqlDialect.SQLITE:
+                where_clause = sa.text("1 = 1")
+            else:
+                where_clause = sa.true()
+
+        table: sa_sql_expression_Selectable = sa.table(
+            batch_spec["table_name"], schema=batch_spec.get("schema_name", None)
+        )
+
+        # GXSqlDialect members compare (and hash) equal to their lowercase names, so dialect name is used for lookups.
+        dialect_name: str = execution_engine.dialect_name.lower()
+        if dialect_name in self.TABLESAMPLE_DIALECTS:
+            supported_methods: Tuple[str, ...]
+            supports_seed: bool
+            percent_keyword: bool
+            (
+                supported_methods,
+                supports_seed,
+                percent_keyword,
+            ) = self.TABLESAMPLE_DIALECTS[
+                dialect_name  # type: ignore[index]
+            ]
+            if method not in supported_methods:
+                method = supported_methods[0]
+
+            if seed is not None and not supports_seed:
+                logger.warning(
+                    f'Sampling "seed" is not supported by TABLESAMPLE of {dialect_name} dialect and will be ignored.'
+                )
+
+            # Percentage and seed are validated numbers, rendered literally (some dialects do not accept parameters).
+            percent: str = f"{p * 100:.10g}"
+            sampled_table: sa_sql_expression_Selectable = sa.tablesample(
+                table,
+                getattr(sa.func, method)(
+                    sa.literal_column(
+                        f"{percent} PERCENT" if percent_keyword else percent
+                    )
+                ),
+                seed=sa.literal_column(str(seed))
+                if seed is not None and supports_seed
+                else None,
+                name=batch_spec["table_name"],
+            )
+            return sa.select("*").select_from(sampled_table).where(where_clause)
+
+        sample_clause: sa_sql_expression_Selectable
+        if p >= 1.0:
+            sample_clause = where_clause
+        elif column_name is not None and dialect_name not in self.DIALECTS_WITHOUT_MD5:
+            # Rows are kept if trailing (fixed-width, lowercase) hexadecimal digits of hash are below threshold.
+            hashed_value = sa.func.md5(
+                sa.literal(str(seed or 0)) + sa.cast(sa.column(column_name), sa.Text)
+            )
+            threshold: str = f"{int(p * 16 ** self.HASH_DIGITS):0{self.HASH_DIGITS}x}"
+            sample_clause = sa.and_(
+                where_clause,
+                sa.func.right(hashed_value, self.HASH_DIGITS) < threshold,
+            )
+        else:
+            if seed is not None:
+                logger.warning(
+                    f'Sampling "seed" requires "column_name" (for hash-based sampling) with {dialect_name} dialect and will be ignored.'
+                )
+
+            if dialect_name not in self.RANDOM_FRACTION_EXPRESSIONS:
+                raise gx_exceptions.SamplerError(
+                    f'Sampling with "sample_using_tablesample" is not supported for {dialect_name} dialect without "column_name" (for hash-based sampling).'
+                )
+
+            random_fraction = self.RANDOM_FRACTION_EXPRESSIONS[
+                dialect_name  # type: ignore[index]
+            ]()
+            sample_clause = sa.and_(where_clause, random_fraction < p)
+
+        return sa.select("*").select_from(table).where(sample_clause)
+
     def sample_using_mod(
         self,
         batch_spec: BatchSpec,
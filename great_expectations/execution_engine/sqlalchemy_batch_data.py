@@ -97,6 +97,7 @@ class SqlAlchemyBatchData(BatchData):
         self._use_quoted_name = use_quoted_name
         self._source_table_name = source_table_name
         self._source_schema_name = source_schema_name
+        self._temp_table_name: Optional[str] = None
 
         if sum(bool(x) for x in [table_name, query, selectable is not None]) != 1:
             raise ValueError(
@@ -161,6 +162,7 @@ class SqlAlchemyBatchData(BatchData):
                 query=query,
                 temp_table_schema_name=temp_table_schema_name,
             )
+            self._temp_table_name = generated_table_name
             self._selectable = sa.Table(
                 generated_table_name,
                 sa.MetaData(),
@@ -193,6 +195,11 @@ class SqlAlchemyBatchData(BatchData):
     def source_schema_name(self):
         return self._source_schema_name
 
+    @property
+    def temp_table_name(self) -> Optional[str]:
+        """Name of the temporary table created for this batch (None if the batch is not backed by a temporary table)"""
+        return self._temp_table_name
+
     @property
     def selectable(self):
         return self._selectable
@@ -49,6 +49,8 @@ from great_expectations.optional_imports import (
     sa_sql_expression_Select,
     sa_sql_expression_Selectable,
     sa_sql_expression_TextualSelect,
+    sqlalchemy_DatabaseError,
+    sqlalchemy_engine_Connection,
     sqlalchemy_engine_Dialect,
     sqlalchemy_engine_Engine,
     sqlalchemy_engine_Row,
@@ -65,6 +67,7 @@ del get_versions  # isort:skip
 
 
 from great_expectations.core import IDDict
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import BatchMarkers, BatchSpec
 from great_expectations.core.batch_spec import (
     RuntimeQueryBatchSpec,
@@ -102,6 +105,15 @@ from great_expectations.validator.metric_configuration import (
 
 logger = logging.getLogger(__name__)
 
+# Dialects for which "temporary" tables, created by "SqlAlchemyBatchData", are regular (or expiring) database objects,
+# visible from every connection (rather than being private to the session that created them).
+_DIALECTS_WITH_CONNECTION_INDEPENDENT_TEMP_TABLES = (
+    GXSqlDialect.AWSATHENA,
+    GXSqlDialect.BIGQUERY,
+    GXSqlDialect.DREMIO,
+    GXSqlDialect.TRINO,
+)
+
 
 if sa:
     sqlalchemy_version_check(sa.__version__)
@@ -200,6 +212,11 @@ except ImportError:
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine as SaEngine  # noqa: TID251
 
+    from great_expectations.execution_engine.metric_cache import (
+        BatchFingerprintFn,
+        PersistentMetricCache,
+    )
+
 
 def _get_dialect_type_module(dialect):
     """Given a dialect, returns the dialect type, which is defines the engine/system that is used to communicates
@@ -283,7 +300,18 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url (string): If neither the engines, the credentials, nor the connection_string have been provided, a \
             URL can be used to access the data. This will be overridden by all other configuration options if \
             any are provided.
-        concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine.
+        concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine and to decide \
+            whether per-Domain bundle queries are dispatched concurrently over pooled connections.  If not provided, \
+            the concurrency config of the data_context is used.
+        metric_cache (PersistentMetricCache or dict): On-disk metric cache (or its constructor arguments), which \
+            persists resolved metrics across runs, keyed by fingerprint of Batch contents (see "batch_fingerprint_fn").
+        batch_fingerprint_fn (Callable): Function computing fingerprint of Batch (given ExecutionEngine and Batch ID) \
+            for purposes of persistent metric caching.  By default, Batches backed by tables are fingerprinted by \
+            table name, row count, and maximum value of "fingerprint_updated_at_column" (other Batches are not).
+        fingerprint_updated_at_column (str): Name of column, holding modification timestamps of rows (default is \
+            "updated_at"), which is used by default fingerprint; tables lacking this column are not fingerprinted.
+        metric_cache_limits (dict): Budgets of in-memory metric cache for final ("scalar") and partial ("partial") \
+            metric values (see "ExecutionEngine").
 
     For example:
     ```python
@@ -303,10 +331,21 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
         concurrency: Optional[ConcurrencyConfig] = None,
+        metric_cache: Optional[Union[dict, PersistentMetricCache]] = None,
+        batch_fingerprint_fn: Optional[BatchFingerprintFn] = None,
+        fingerprint_updated_at_column: str = "updated_at",
+        metric_cache_limits: Optional[dict] = None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ) -> None:
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(
+            name=name,
+            batch_data_dict=batch_data_dict,
+            metric_cache=metric_cache,
+            batch_fingerprint_fn=batch_fingerprint_fn,
+            metric_cache_limits=metric_cache_limits,
+        )
         self._name = name
+        self._fingerprint_updated_at_column = fingerprint_updated_at_column
 
         self._credentials = credentials
         self._connection_string = connection_string
@@ -314,6 +353,14 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         self._create_temp_table = create_temp_table
         os.environ["SF_PARTNER"] = "great_expectations_oss"
 
+        if concurrency is None:
+            if data_context is None or data_context.concurrency is None:
+                concurrency = ConcurrencyConfig()
+            else:
+                concurrency = data_context.concurrency
+
+        self._concurrency = concurrency
+
         if engine is not None:
             if credentials is not None:
                 logger.warning(
@@ -322,12 +369,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 )
             self.engine = engine
         else:
-            if data_context is None or data_context.concurrency is None:
-                concurrency = ConcurrencyConfig()
-            else:
-                concurrency = data_context.concurrency
-
-            concurrency.add_sqlalchemy_create_engine_parameters(kwargs)  # type: ignore[union-attr]
+            concurrency.add_sqlalchemy_create_engine_parameters(kwargs)
 
             if credentials is not None:
                 self.engine = self._build_engine(credentials=credentials, **kwargs)
@@ -461,6 +503,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "metric_cache": self._persistent_metric_cache.config
+            if self._persistent_metric_cache is not None
+            else None,
+            "metric_cache_limits": metric_cache_limits,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -495,6 +541,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         """
         return self.engine.dialect.name.lower()
 
+    @property
+    def concurrency(self) -> ConcurrencyConfig:
+        """Concurrency config governing multithreaded query execution by this SqlAlchemyExecutionEngine."""
+        return self._concurrency
+
     def _build_engine(self, credentials: dict, **kwargs) -> sa.engine.Engine:
         """
         Using a set of given credentials, constructs an Execution Engine , connecting to a database using a URL or a
@@ -577,6 +628,32 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             create_engine_kwargs,
         )
 
+    def _get_batch_data_for_domain(self, domain_kwargs: dict) -> SqlAlchemyBatchData:
+        """Looks up the SqlAlchemyBatchData referenced by "batch_id" of given Domain kwargs (or the active batch).
+
+        Args:
+            domain_kwargs (dict) - A dictionary consisting of the Domain kwargs specifying which data to obtain
+
+        Returns:
+            SqlAlchemyBatchData object, against which the Domain is to be computed
+        """
+        batch_id: Optional[str] = domain_kwargs.get("batch_id")
+        if batch_id is None:
+            # We allow no batch id specified if there is only one batch
+            if self.batch_manager.active_batch_data:
+                return cast(SqlAlchemyBatchData, self.batch_manager.active_batch_data)
+
+            raise GreatExpectationsError(
+                "No batch is specified, but could not identify a loaded batch."
+            )
+
+        if batch_id in self.batch_manager.batch_data_cache:
+            return cast(
+                SqlAlchemyBatchData, self.batch_manager.batch_data_cache[batch_id]
+            )
+
+        raise GreatExpectationsError(f"Unable to find batch with batch_id {batch_id}")
+
     @public_api
     def get_domain_records(  # noqa: C901 - 24
         self,
@@ -590,28 +667,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         Returns:
             An SqlAlchemy table/column(s) (the selectable object for obtaining data on which to compute returned in the format of an SqlAlchemy table/column(s) object)
         """
-        data_object: SqlAlchemyBatchData
-
-        batch_id: Optional[str] = domain_kwargs.get("batch_id")
-        if batch_id is None:
-            # We allow no batch id specified if there is only one batch
-            if self.batch_manager.active_batch_data:
-                data_object = cast(
-                    SqlAlchemyBatchData, self.batch_manager.active_batch_data
-                )
-            else:
-                raise GreatExpectationsError(
-                    "No batch is specified, but could not identify a loaded batch."
-                )
-        else:
-            if batch_id in self.batch_manager.batch_data_cache:
-                data_object = cast(
-                    SqlAlchemyBatchData, self.batch_manager.batch_data_cache[batch_id]
-                )
-            else:
-                raise GreatExpectationsError(
-                    f"Unable to find batch with batch_id {batch_id}"
-                )
+        data_object: SqlAlchemyBatchData = self._get_batch_data_for_domain(
+            domain_kwargs=domain_kwargs
+        )
 
         selectable: sa_sql_expression_Selectable
         if "table" in domain_kwargs and domain_kwargs["table"] is not None:
@@ -1016,60 +1074,48 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             queries[domain_id]["metric_ids"].append(metric_to_resolve.id)
 
+        sa_query_objects: List[sa_sql_expression_Select] = []
         for query in queries.values():
-            domain_kwargs: dict = query["domain_kwargs"]
-            selectable: sa_sql_expression_Selectable = self.get_domain_records(
-                domain_kwargs=domain_kwargs
-            )
-
             assert len(query["select"]) == len(query["metric_ids"])
+            sa_query_objects.append(self._build_bundle_query(query=query))
 
-            try:
-                """
-                If a custom query is passed, selectable will be TextClause and not formatted
-                as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-                to TextualSelect using sa.columns() before it can be converted to type Subquery
-                """
-                if sqlalchemy_TextClause and isinstance(
-                    selectable, sqlalchemy_TextClause
-                ):
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable.columns().subquery()
-                    )
-                elif (
-                    sa_sql_expression_Select
-                    and isinstance(selectable, sa_sql_expression_Select)
-                ) or (
-                    sa_sql_expression_TextualSelect
-                    and isinstance(selectable, sa_sql_expression_TextualSelect)
-                ):
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable.subquery()
-                    )
-                else:
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable
-                    )
-
-                logger.debug(f"Attempting query {str(sa_query_object)}")
+        connectable: Union[sqlalchemy_engine_Engine, sqlalchemy_engine_Connection]
+        if self._can_execute_bundle_queries_concurrently(queries=queries):
+            connectable = self._get_pooled_engine()
+            max_workers = len(sa_query_objects)
+        else:
+            if sqlalchemy_engine_Engine and isinstance(
+                self.engine, sqlalchemy_engine_Engine
+            ):
+                self.engine = self.engine.connect()
 
-                if sqlalchemy_engine_Engine and isinstance(
-                    self.engine, sqlalchemy_engine_Engine
-                ):
-                    self.engine = self.engine.connect()
+            connectable = self.engine
+            max_workers = 1
+
+        # When running concurrently, every query obtains its own connection from the pool of the engine; otherwise,
+        # AsyncExecutor executes the queries one after another, in submission order, on the single shared connection.
+        with AsyncExecutor(
+            concurrency_config=self._concurrency, max_workers=max_workers
+        ) as async_executor:
+            async_results: List[AsyncResult] = [
+                async_executor.submit(
+                    self._execute_bundle_query,
+                    connectable=connectable,
+                    sa_query_object=sa_query_object,
+                )
+                for sa_query_object in sa_query_objects
+            ]
 
-                res = self.engine.execute(sa_query_object).fetchall()
+        # Results are merged in the order in which Domains were first encountered (not in order of query completion),
+        # and the first failing Domain (in that same order) determines the exception that is raised.
+        async_result: AsyncResult
+        for (domain_id, query), async_result in zip(queries.items(), async_results):
+            res = async_result.result()
 
-                logger.debug(
-                    f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
-{IDDict(domain_kwargs).to_id()}"""
-                )
-            except sqlalchemy_OperationalError as oe:
-                exception_message: str = "An SQL execution Exception occurred.  "
-                exception_traceback: str = traceback.format_exc()
-                exception_message += f'{type(oe).__name__}: "{str(oe)}".  Traceback: "{exception_traceback}".'
-                logger.error(exception_message)
-                raise ExecutionEngineError(message=exception_message)
+            logger.debug(
+                f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
+{domain_id}"""
+            )
 
             assert (
                 len(res) == 1
@@ -1089,6 +1135,166 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return resolved_metrics
 
+    def _build_bundle_query(self, query: dict) -> sa_sql_expression_Select:
+        """Builds single SELECT statement, computing all bundled metrics of one Domain.
+
+        Args:
+            query: dictionary with "select" (labeled metric functions) and "domain_kwargs" (compute Domain) entries
+
+        Returns:
+            SqlAlchemy Select object, selecting all bundled metrics from records of the compute Domain
+        """
+        selectable: sa_sql_expression_Selectable = self.get_domain_records(
+            domain_kwargs=query["domain_kwargs"]
+        )
+
+        """
+        If a custom query is passed, selectable will be TextClause and not formatted
+        as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+        to TextualSelect using sa.columns() before it can be converted to type Subquery
+        """
+        if sqlalchemy_TextClause and isinstance(selectable, sqlalchemy_TextClause):
+            return sa.select(*query["select"]).select_from(
+                selectable.columns().subquery()
+            )
+
+        if (
+            sa_sql_expression_Select
+            and isinstance(selectable, sa_sql_expression_Select)
+        ) or (
+            sa_sql_expression_TextualSelect
+            and isinstance(selectable, sa_sql_expression_TextualSelect)
+        ):
+            return sa.select(*query["select"]).select_from(selectable.subquery())
+
+        return sa.select(*query["select"]).select_from(selectable)
+
+    @staticmethod
+    def _execute_bundle_query(
+        connectable: Union[sqlalchemy_engine_Engine, sqlalchemy_engine_Connection],
+        sa_query_object: sa_sql_expression_Select,
+    ) -> List[sqlalchemy_engine_Row]:
+        """Executes bundled metrics query, using its own pooled connection if given an Engine (e.g., from a thread).
+
+        Args:
+            connectable: SqlAlchemy Engine (a connection is checked out of its pool) or Connection (used as is)
+            sa_query_object: SqlAlchemy Select object, computing bundled metrics of one Domain
+
+        Returns:
+            Rows fetched by the query (all bundled metrics are single-value statistics, so exactly one row expected)
+        """
+        logger.debug(f"Attempting query {str(sa_query_object)}")
+
+        try:
+            if sqlalchemy_engine_Engine and isinstance(
+                connectable, sqlalchemy_engine_Engine
+            ):
+                with connectable.connect() as connection:
+                    return connection.execute(sa_query_object).fetchall()
+
+            return connectable.execute(sa_query_object).fetchall()
+        except sqlalchemy_OperationalError as oe:
+            exception_message: str = "An SQL execution Exception occurred.  "
+            exception_traceback: str = traceback.format_exc()
+            exception_message += f'{type(oe).__name__}: "{str(oe)}".  Traceback: "{exception_traceback}".'
+            logger.error(exception_message)
+            raise ExecutionEngineError(message=exception_message)
+
+    def _can_execute_bundle_queries_concurrently(
+        self, queries: Dict[Tuple[str, str, str], dict]
+    ) -> bool:
+        """Determines whether or not per-Domain bundle queries can be dispatched over multiple pooled connections.
+
+        This requires concurrency to be enabled and more than one Domain to be queried.  In addition, none of the
+        batches involved may be backed by a temporary table that is only visible to the connection that created it,
+        and in-memory SQLite databases (which are private to their connection) cannot be shared among connections.
+
+        Args:
+            queries: per-Domain bundle query directives, keyed by ID of the compute Domain
+
+        Returns:
+            Boolean value indicating whether or not concurrent bundle query execution is possible
+        """
+        if not (self._concurrency.enabled and len(queries) > 1):
+            return False
+
+        if self.dialect_name == GXSqlDialect.SQLITE:
+            database: Optional[str] = self._get_pooled_engine().url.database
+            if not database or database == ":memory:":
+                return False
+
+        query: dict
+        batch_data: SqlAlchemyBatchData
+        for query in queries.values():
+            batch_data = self._get_batch_data_for_domain(
+                domain_kwargs=query["domain_kwargs"]
+            )
+            if (
+                batch_data.temp_table_name is not None
+                and batch_data.dialect
+                not in _DIALECTS_WITH_CONNECTION_INDEPENDENT_TEMP_TABLES
+            ):
+                return False
+
+        return True
+
+    def _get_pooled_engine(self) -> sqlalchemy_engine_Engine:
+        """Returns the SqlAlchemy Engine (whose pool supplies connections), even if "self.engine" holds a Connection."""
+        if self._engine_backup:
+            return self._engine_backup
+
+        if sqlalchemy_engine_Engine and isinstance(
+            self.engine, sqlalchemy_engine_Engine
+        ):
+            return self.engine
+
+        return self.engine.engine
+
+    def _compute_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """Fingerprints Batch backed by database table by table name, row count, and latest modification timestamp.
+
+        Batches defined by queries (or backed by temporary tables) and tables lacking "fingerprint_updated_at_column"
+        are not fingerprinted (rows could change in place without affecting row count).
+        """
+        batch_data = self.batch_manager.batch_data_cache.get(batch_id)
+        if not (
+            isinstance(batch_data, SqlAlchemyBatchData)
+            and batch_data.temp_table_name is None
+            and isinstance(batch_data.selectable, sa.Table)
+        ):
+            return None
+
+        table: sa.Table = batch_data.selectable
+        sa_query_object: sa_sql_expression_Select = sa.select(
+            sa.func.count(),
+            sa.func.max(sa.column(self._fingerprint_updated_at_column)),
+        ).select_from(table)
+
+        try:
+            if sqlalchemy_engine_Engine and isinstance(
+                self.engine, sqlalchemy_engine_Engine
+            ):
+                with self.engine.connect() as connection:
+                    row_count, max_updated_at = connection.execute(
+                        sa_query_object
+                    ).fetchone()
+            else:
+                row_count, max_updated_at = self.engine.execute(
+                    sa_query_object
+                ).fetchone()
+        except sqlalchemy_DatabaseError as e:
+            logger.debug(
+                f'Unable to fingerprint table "{table.fullname}" for persistent metric caching: {str(e)}.'
+            )
+            return None
+
+        if row_count and max_updated_at is None:
+            return None
+
+        return hashlib.md5(
+            f"{repr(self._get_pooled_engine().url)}:{table.fullname}:{row_count}:{max_updated_at}".encode()
+        ).hexdigest()
+
     def close(self) -> None:
         """
         Note: Will 20210729
@@ -1218,6 +1424,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 "sample_using_limit",
                 "_sample_using_random",
                 "sample_using_random",
+                "_sample_using_tablesample",
+                "sample_using_tablesample",
             ]:
                 sampler_fn = self._data_sampler.get_sampler_method(sampling_method)
                 return sampler_fn(
@@ -63,6 +63,7 @@ from great_expectations.core.expectation_diagnostics.supporting_types import (
 )
 from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
+    SpilledUnexpectedList,
 )
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.metric_function_types import (
@@ -1159,10 +1160,9 @@ class Expectation(metaclass=MetaExpectation):
         if not configuration:
             configuration = self.configuration
 
-        configuration = deepcopy(configuration)
-
-        if runtime_configuration:
-            configuration.kwargs.update(runtime_configuration)
+        configuration = configuration.copy_with_updated_kwargs(
+            kwargs=runtime_configuration or {}
+        )
 
         success_kwargs = self.get_success_kwargs(configuration=configuration)
         runtime_kwargs = {
@@ -3482,6 +3482,19 @@ def _format_map_output(  # noqa: C901 - 22
     In each case, the object returned has a different set of populated fields.
     See :ref:`result_format` for more information.
 
+    Besides "result_format", "partial_unexpected_count", and "include_unexpected_rows", dictionary result_format may
+    bound unexpected results, retrieved by SQL map metrics:
+
+    - "unexpected_rows_limit": maximum number of unexpected rows returned (None for no limit); without spill directory,
+      COMPLETE result_format returns at most 100,000 unexpected rows by default (no limit, when spilling).
+    - "unexpected_rows_sampling": "first" (default) returns leading unexpected rows; "reservoir" returns uniform random
+      sample of "unexpected_rows_limit" unexpected rows (seeded by "unexpected_rows_sampling_seed", if any).
+    - "unexpected_spill_directory": in COMPLETE result_format, unexpected index list and unexpected rows are streamed
+      to gzip-compressed JSON Lines files in this directory, and only leading "partial_unexpected_count" of them are
+      kept in result, along with "unexpected_index_list_path" and "unexpected_rows_path" of their files.
+    - "unexpected_spill_retention_seconds": if set, spill files older than this are deleted by subsequent spills into
+      the same directory (by default, spill files are kept, and their deletion is left to caller).
+
     This function handles the logic for mapping those fields for column_map_expectations.
     """
     if element_count is None:
@@ -3546,6 +3559,9 @@ def _format_map_output(  # noqa: C901 - 22
                 "unexpected_rows": unexpected_rows,
             }
         )
+        if isinstance(unexpected_rows, SpilledUnexpectedList):
+            # Only leading unexpected rows are included; all unexpected rows are referenced by their file path.
+            return_obj["result"].update({"unexpected_rows_path": unexpected_rows.path})
 
     if result_format["result_format"] == "BASIC":
         return return_obj
@@ -3601,6 +3617,11 @@ def _format_map_output(  # noqa: C901 - 22
         return_obj["result"].update({"unexpected_list": unexpected_list})
     if unexpected_index_list is not None:
         return_obj["result"].update({"unexpected_index_list": unexpected_index_list})
+        if isinstance(unexpected_index_list, SpilledUnexpectedList):
+            # Only leading part of unexpected index list is included; complete list is referenced by its file path.
+            return_obj["result"].update(
+                {"unexpected_index_list_path": unexpected_index_list.path}
+            )
     if unexpected_index_query is not None:
         return_obj["result"].update({"unexpected_index_query": unexpected_index_query})
     if result_format["result_format"] == "COMPLETE":
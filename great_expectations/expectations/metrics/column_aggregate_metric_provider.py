@@ -7,7 +7,11 @@ from great_expectations.core._docs_decorators import public_api
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.metric_function_types import MetricPartialFunctionTypes
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasColumnSummary,  # noqa: TCH001
+)
 from great_expectations.execution_engine.sparkdf_execution_engine import (
+    SparkColumnAggregate,
     SparkDFExecutionEngine,
 )
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
@@ -24,7 +28,7 @@ from great_expectations.expectations.metrics.table_metric_provider import (
 from great_expectations.expectations.metrics.util import (
     get_dbms_compatible_column_names,
 )
-from great_expectations.optional_imports import quoted_name
+from great_expectations.optional_imports import pyspark_sql_Column, quoted_name
 from great_expectations.optional_imports import sqlalchemy as sa
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
@@ -69,7 +73,11 @@ def column_aggregate_value(
                     "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
                 )
 
-                df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+                (
+                    _,
+                    compute_domain_kwargs,
+                    accessor_domain_kwargs,
+                ) = execution_engine.get_compute_domain(
                     domain_kwargs=metric_domain_kwargs, domain_type=domain_type
                 )
 
@@ -80,12 +88,18 @@ def column_aggregate_value(
                     batch_columns_list=metrics["table.columns"],
                 )
 
-                if filter_column_isnull:
-                    df = df[df[column_name].notnull()]
+                # Column (and its missing-value filtering) is shared by all aggregate and map metrics of this Domain.
+                column_summary: PandasColumnSummary = (
+                    execution_engine.get_column_summary(
+                        domain_kwargs=compute_domain_kwargs, column_name=column_name
+                    )
+                )
 
                 return metric_fn(
                     cls,
-                    column=df[column_name],
+                    column=column_summary.nonnull_column
+                    if filter_column_isnull
+                    else column_summary.column,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
@@ -227,14 +241,18 @@ def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):
                     batch_columns_list=metrics["table.columns"],
                 )
 
-                column = data[column_name]
-                metric_aggregate = metric_fn(
-                    cls,
-                    column=column,
-                    **metric_value_kwargs,
-                    _table=data,
-                    _column_name=column_name,
-                    _metrics=metrics,
+                def aggregate_fn(column: pyspark_sql_Column) -> pyspark_sql_Column:
+                    return metric_fn(
+                        cls,
+                        column=column,
+                        **metric_value_kwargs,
+                        _table=data,
+                        _column_name=column_name,
+                        _metrics=metrics,
+                    )
+
+                metric_aggregate = SparkColumnAggregate(
+                    column=data[column_name], aggregate_fn=aggregate_fn
                 )
                 return metric_aggregate, compute_domain_kwargs, accessor_domain_kwargs
 
@@ -15,7 +15,9 @@ class ColumnValuesInTypeList(ColumnMapMetricProvider):
     condition_metric_name = "column_values.in_type_list"
     condition_value_keys = ("type_list",)
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(
+        engine=PandasExecutionEngine, evaluate_on_unique_values=True
+    )
     def _pandas(cls, column, type_list, **kwargs):
         comp_types = []
         for type_ in type_list:
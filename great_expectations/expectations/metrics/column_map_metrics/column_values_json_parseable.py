@@ -8,13 +8,17 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.optional_imports import F, sparktypes
+from great_expectations.expectations.metrics.map_metric_provider.spark_map_condition_udf import (
+    get_spark_map_condition_udf,
+)
 
 
 class ColumnValuesJsonParseable(ColumnMapMetricProvider):
     condition_metric_name = "column_values.json_parseable"
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(
+        engine=PandasExecutionEngine, evaluate_on_unique_values=True
+    )
     def _pandas(cls, column, **kwargs):
         def is_json(val):
             try:
@@ -26,7 +30,7 @@ class ColumnValuesJsonParseable(ColumnMapMetricProvider):
         return column.map(is_json)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
-    def _spark(cls, column, **kwargs):
+    def _spark(cls, column, _execution_engine=None, **kwargs):
         def is_json(val):
             try:
                 json.loads(val)
@@ -34,6 +38,8 @@ class ColumnValuesJsonParseable(ColumnMapMetricProvider):
             except Exception:
                 return False
 
-        is_json_udf = F.udf(is_json, sparktypes.BooleanType())
+        is_json_udf = get_spark_map_condition_udf(
+            execution_engine=_execution_engine, make_condition_fn=lambda: is_json
+        )
 
         return is_json_udf(column)
@@ -1,7 +1,3 @@
-import json
-
-import jsonschema
-
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
@@ -11,54 +7,33 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.optional_imports import F, sparktypes
+from great_expectations.expectations.metrics.map_metric_provider.condition_functions import (
+    make_json_schema_matcher,
+)
+from great_expectations.expectations.metrics.map_metric_provider.spark_map_condition_udf import (
+    get_spark_map_condition_udf,
+)
 
 
 class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
     condition_metric_name = "column_values.match_json_schema"
     condition_value_keys = ("json_schema",)
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(
+        engine=PandasExecutionEngine, evaluate_on_unique_values=True
+    )
     def _pandas(cls, column, json_schema, **kwargs):
-        def matches_json_schema(val):
-            try:
-                val_json = json.loads(val)
-                jsonschema.validate(val_json, json_schema)
-                # jsonschema.validate raises an error if validation fails.
-                # So if we make it this far, we know that the validation succeeded.
-                return True
-            except jsonschema.ValidationError:
-                return False
-            except jsonschema.SchemaError:
-                raise
-            except:
-                raise
-
-        return column.map(matches_json_schema)
+        return column.map(make_json_schema_matcher(json_schema=json_schema))
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
-    def _spark(cls, column, json_schema, **kwargs):
+    def _spark(cls, column, json_schema, _execution_engine=None, **kwargs):
         # This step insures that Spark UDF defined can be pickled; otherwise, pickle serialization exceptions may occur.
         json_schema = convert_to_json_serializable(data=json_schema)
 
-        def matches_json_schema(val):
-            if val is None:
-                return False
-            try:
-                val_json = json.loads(val)
-                jsonschema.validate(instance=val_json, schema=json_schema)
-                # jsonschema.validate raises an error if validation fails.
-                # So if we make it this far, we know that the validation succeeded.
-                return True
-            except jsonschema.ValidationError:
-                return False
-            except jsonschema.SchemaError:
-                raise
-            except:
-                raise
-
-        matches_json_schema_udf = F.udf(
-            lambda val: matches_json_schema(val=val), sparktypes.BooleanType()
+        matches_json_schema_udf = get_spark_map_condition_udf(
+            execution_engine=_execution_engine,
+            # Validator is compiled once per executor task (not once per row, as "jsonschema.validate" would do).
+            make_condition_fn=lambda: make_json_schema_matcher(json_schema=json_schema),
         )
 
         return matches_json_schema_udf(column)
@@ -8,14 +8,18 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.optional_imports import F, sparktypes
+from great_expectations.expectations.metrics.map_metric_provider.spark_map_condition_udf import (
+    get_spark_map_condition_udf,
+)
 
 
 class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
     condition_metric_name = "column_values.match_strftime_format"
     condition_value_keys = ("strftime_format",)
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(
+        engine=PandasExecutionEngine, evaluate_on_unique_values=True
+    )
     def _pandas(cls, column, strftime_format, **kwargs):
         def is_parseable_by_format(val):
             try:
@@ -31,7 +35,7 @@ class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
         return column.map(is_parseable_by_format)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
-    def _spark(cls, column, strftime_format, **kwargs):
+    def _spark(cls, column, strftime_format, _execution_engine=None, **kwargs):
         # Below is a simple validation that the provided format can both format and parse a datetime object.
         # %D is an example of a format that can format but not parse, e.g.
         try:
@@ -54,5 +58,8 @@ class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
             except ValueError:
                 return False
 
-        success_udf = F.udf(is_parseable_by_format, sparktypes.BooleanType())
+        success_udf = get_spark_map_condition_udf(
+            execution_engine=_execution_engine,
+            make_condition_fn=lambda: is_parseable_by_format,
+        )
         return success_udf(column)
@@ -11,6 +11,8 @@ from typing import (
     Union,
 )
 
+import pandas as pd
+
 from great_expectations.core._docs_decorators import public_api
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.metric_function_types import (
@@ -22,6 +24,12 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasColumnSummary,  # noqa: TCH001
+)
+from great_expectations.expectations.metrics.map_metric_provider.condition_functions import (
+    evaluate_on_unique_values,
+)
 from great_expectations.expectations.metrics.metric_provider import (
     metric_partial,
 )
@@ -53,6 +61,11 @@ def column_condition_partial(  # noqa: C901 - 23
     A metric function that is decorated as a column_condition_partial will be called with the engine-specific column
     type and any value_kwargs associated with the Metric for which the provider function is being declared.
 
+    For PandasExecutionEngine, a metric_fn that maps every value independently (e.g., by calling a Python function per
+    row) can opt in to be evaluated only once per distinct value, by passing `evaluate_on_unique_values=True` (or by
+    setting the same class attribute).  The metric_fn is then called with a column of distinct values, and its results
+    are broadcast back to all rows; this is much faster for columns in which the same values repeat.
+
     Args:
         engine: The `ExecutionEngine` used to to evaluate the condition
         partial_fn_type: The metric function
@@ -90,7 +103,7 @@ def column_condition_partial(  # noqa: C901 - 23
                 runtime_configuration: dict,
             ):
                 (
-                    df,
+                    _,
                     compute_domain_kwargs,
                     accessor_domain_kwargs,
                 ) = execution_engine.get_compute_domain(
@@ -107,15 +120,39 @@ def column_condition_partial(  # noqa: C901 - 23
                 filter_column_isnull = kwargs.get(
                     "filter_column_isnull", getattr(cls, "filter_column_isnull", True)
                 )
-                if filter_column_isnull:
-                    df = df[df[column_name].notnull()]
+                # Column (and its missing-value filtering) is shared by all aggregate and map metrics of this Domain.
+                column_summary: PandasColumnSummary = (
+                    execution_engine.get_column_summary(
+                        domain_kwargs=compute_domain_kwargs, column_name=column_name
+                    )
+                )
+                column: pd.Series = (
+                    column_summary.nonnull_column
+                    if filter_column_isnull
+                    else column_summary.column
+                )
 
-                meets_expectation_series = metric_fn(
-                    cls,
-                    df[column_name],
-                    **metric_value_kwargs,
-                    _metrics=metrics,
+                should_evaluate_on_unique_values = kwargs.get(
+                    "evaluate_on_unique_values",
+                    getattr(cls, "evaluate_on_unique_values", False),
                 )
+                if should_evaluate_on_unique_values:
+                    meets_expectation_series = evaluate_on_unique_values(
+                        column=column,
+                        metric_fn=lambda column: metric_fn(
+                            cls,
+                            column,
+                            **metric_value_kwargs,
+                            _metrics=metrics,
+                        ),
+                    )
+                else:
+                    meets_expectation_series = metric_fn(
+                        cls,
+                        column,
+                        **metric_value_kwargs,
+                        _metrics=metrics,
+                    )
                 return (
                     ~meets_expectation_series,
                     compute_domain_kwargs,
@@ -264,6 +301,7 @@ def column_condition_partial(  # noqa: C901 - 23
                     _metrics=metrics,
                     _compute_domain_kwargs=compute_domain_kwargs,
                     _accessor_domain_kwargs=accessor_domain_kwargs,
+                    _execution_engine=execution_engine,
                 )
                 filter_column_isnull = kwargs.get(
                     "filter_column_isnull", getattr(cls, "filter_column_isnull", True)
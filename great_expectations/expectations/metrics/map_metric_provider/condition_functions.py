@@ -0,0 +1,62 @@
+"""Helpers for row-wise map conditions, shared by Pandas metric functions and Spark UDFs.
+
+This module imports only third-party packages (never "great_expectations"), so that Spark UDFs can ship its functions to
+executors by value (see "get_spark_map_condition_udf"), without requiring "great_expectations" to be installed there.
+"""
+import json
+from typing import Any, Callable, Dict, Optional
+
+import jsonschema
+import numpy as np
+import pandas as pd
+
+
+def evaluate_on_unique_values(
+    column: pd.Series, metric_fn: Callable[[pd.Series], pd.Series]
+) -> pd.Series:
+    """Calls "metric_fn" on first occurrences of distinct values of "column" and broadcasts results to all rows.
+
+    Values of object columns are distinguished by type as well (e.g., 1, 1.0, and True are distinct), and missing values
+    are evaluated as well.  Columns with unhashable values are evaluated entirely.
+    """
+    try:
+        # Arrays (not Series) are factorized, so that distinct values are not wrapped in Index; missing values are -1.
+        codes: np.ndarray = pd.factorize(column.to_numpy())[0] + 1
+        if pd.api.types.is_object_dtype(column.dtype):
+            type_codes: np.ndarray
+            type_uniques: np.ndarray
+            type_codes, type_uniques = pd.factorize(column.map(type).to_numpy())
+            codes = codes * len(type_uniques) + type_codes
+    except TypeError:
+        return metric_fn(column)
+
+    first_positions: np.ndarray
+    inverse: np.ndarray
+    _, first_positions, inverse = np.unique(
+        codes, return_index=True, return_inverse=True
+    )
+    unique_results: np.ndarray = np.asarray(metric_fn(column.iloc[first_positions]))
+    return pd.Series(
+        unique_results[inverse.reshape(-1)], index=column.index, name=column.name
+    )
+
+
+def make_json_schema_matcher(
+    json_schema: Dict[str, Any]
+) -> Callable[[Optional[str]], bool]:
+    """Returns function, which tells whether JSON string matches "json_schema" (missing values do not match).
+
+    Validator is compiled (and schema is checked) once, rather than by "jsonschema.validate" for every value.
+    """
+    validator_class = jsonschema.validators.validator_for(json_schema)
+    validator_class.check_schema(json_schema)
+    validator = validator_class(json_schema)
+
+    def matches_json_schema(val: Optional[str]) -> bool:
+        if val is None:
+            return False
+
+        # "is_valid" returns False where "jsonschema.validate" would raise ValidationError.
+        return validator.is_valid(json.loads(val))
+
+    return matches_json_schema
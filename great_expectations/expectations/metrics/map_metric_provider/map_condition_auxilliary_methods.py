@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import gzip
+import json
 import logging
+import pathlib
+import random
+import time
+import uuid
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Union,
@@ -14,10 +22,16 @@ import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.expectation_validation_result import (
+    SpilledUnexpectedList,
+)
 from great_expectations.core.metric_function_types import (
     SummarizationMetricNameSuffixes,
 )
 from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.execution_engine.sparkdf_execution_engine import (
+    SparkColumnAggregate,
+)
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_metric_selectable import (
     _is_sqlalchemy_metric_selectable,
@@ -57,6 +71,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Number of unexpected rows, fetched from server-side cursor at a time, when streaming SQL query results.
+_SQL_UNEXPECTED_ROWS_FETCH_SIZE = 10000
+
+# Number of unexpected rows, held in memory by COMPLETE result_format without spill directory (unless configured).
+_DEFAULT_UNEXPECTED_ROWS_LIMIT = 100000
+
+# Spill files of unexpected index lists and unexpected rows.
+_SPILL_FILE_SUFFIX = ".jsonl.gz"
+
 
 def _pandas_map_condition_unexpected_count(
     cls,
@@ -423,10 +446,49 @@ def _sqlalchemy_map_condition_rows(
         query = query.select_from(selectable)
 
     result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] != "COMPLETE":
-        query = query.limit(result_format["partial_unexpected_count"])
     try:
-        return execution_engine.engine.execute(query).fetchall()
+        if result_format["result_format"] != "COMPLETE":
+            query = query.limit(result_format["partial_unexpected_count"])
+            return execution_engine.engine.execute(query).fetchall()
+
+        spill_directory: Optional[str] = result_format.get("unexpected_spill_directory")
+        if spill_directory:
+            # All unexpected rows are streamed to file, and only leading ones are kept in memory.
+            return _spill_unexpected_list(
+                unexpected_list=(
+                    _sqlalchemy_row_to_dict(row=row)
+                    for row in _stream_sqlalchemy_unexpected_rows(
+                        execution_engine=execution_engine,
+                        query=query,
+                        result_format=result_format,
+                    )
+                ),
+                name="unexpected_rows",
+                directory=spill_directory,
+                num_rows_to_keep=result_format["partial_unexpected_count"],
+                retention_seconds=result_format.get(
+                    "unexpected_spill_retention_seconds"
+                ),
+            )
+
+        # Without spill directory, unexpected rows are held in memory; hence, their number is bounded by default.
+        unexpected_rows: List[Any] = list(
+            _stream_sqlalchemy_unexpected_rows(
+                execution_engine=execution_engine,
+                query=query,
+                result_format=result_format,
+                default_unexpected_rows_limit=_DEFAULT_UNEXPECTED_ROWS_LIMIT,
+            )
+        )
+        if (
+            "unexpected_rows_limit" not in result_format
+            and len(unexpected_rows) == _DEFAULT_UNEXPECTED_ROWS_LIMIT
+        ):
+            logger.warning(
+                f'Only first {_DEFAULT_UNEXPECTED_ROWS_LIMIT} unexpected rows were retrieved; set "unexpected_rows_limit" (None for no limit) or "unexpected_spill_directory" in result_format to retrieve more.'
+            )
+
+        return unexpected_rows
     except sqlalchemy_OperationalError as oe:
         exception_message: str = f"An SQL execution Exception occurred: {str(oe)}."
         raise gx_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
@@ -597,20 +659,41 @@ def _sqlalchemy_map_condition_index(
             sa.Table, sa.Select
         ] = get_sqlalchemy_selectable(domain_records_as_selectable)
 
-    # since SQL tables can be **very** large, truncate query_result values at 20, or at `partial_unexpected_count`
     final_query: sa.select = (
         unexpected_condition_query_with_selected_columns.select_from(
             domain_records_as_selectable
-        ).limit(result_format["partial_unexpected_count"])
+        )
     )
+
+    # add the actual unexpected value
+    all_columns = unexpected_index_column_names + domain_column_name_list
+
+    spill_directory: Optional[str] = result_format.get("unexpected_spill_directory")
+    if result_format["result_format"] == "COMPLETE" and spill_directory:
+        # Complete unexpected index list is streamed to file, and only its leading part is kept in memory.
+        return _spill_unexpected_list(
+            unexpected_list=(
+                dict(zip(all_columns, row))
+                for row in _stream_sqlalchemy_unexpected_rows(
+                    execution_engine=execution_engine,
+                    query=final_query,
+                    result_format=result_format,
+                )
+            ),
+            name="unexpected_index_list",
+            directory=spill_directory,
+            num_rows_to_keep=result_format["partial_unexpected_count"],
+            retention_seconds=result_format.get("unexpected_spill_retention_seconds"),
+        )
+
+    # since SQL tables can be **very** large, truncate query_result values at 20, or at `partial_unexpected_count`
+    final_query = final_query.limit(result_format["partial_unexpected_count"])
     query_result: List[tuple] = execution_engine.engine.execute(final_query).fetchall()
 
     unexpected_index_list: Optional[List[Dict[str, Any]]] = []
 
     for row in query_result:
         primary_key_dict: Dict[str, Any] = {}
-        # add the actual unexpected value
-        all_columns = unexpected_index_column_names + domain_column_name_list
         for index in range(len(all_columns)):
             name: str = all_columns[index]
             primary_key_dict[name] = row[index]
@@ -619,6 +702,150 @@ def _sqlalchemy_map_condition_index(
     return unexpected_index_list
 
 
+def _stream_sqlalchemy_unexpected_rows(
+    execution_engine: SqlAlchemyExecutionEngine,
+    query: sa.select,
+    result_format: dict,
+    default_unexpected_rows_limit: Optional[int] = None,
+) -> Iterable[Any]:
+    """
+    Streams rows of unexpected rows query, bounded by "unexpected_rows_limit" directive of "result_format" (if absent,
+    by "default_unexpected_rows_limit"; None means no limit).
+
+    By default, leading rows are returned; "unexpected_rows_sampling": "reservoir" directive draws uniform random
+    sample (seeded by "unexpected_rows_sampling_seed" directive, if any) from all unexpected rows instead.  Either way,
+    no more than limit (plus one fetch) rows are held in memory.
+    """
+    unexpected_rows_limit: Optional[int] = result_format.get(
+        "unexpected_rows_limit", default_unexpected_rows_limit
+    )
+    sampling: str = result_format.get("unexpected_rows_sampling", "first")
+    if sampling == "first":
+        if unexpected_rows_limit is not None:
+            query = query.limit(unexpected_rows_limit)
+
+        return _iterate_sqlalchemy_query_rows(
+            execution_engine=execution_engine, query=query
+        )
+
+    if sampling == "reservoir":
+        if unexpected_rows_limit is None:
+            raise ValueError(
+                'Reservoir sampling of unexpected rows requires "unexpected_rows_limit" in result_format.'
+            )
+
+        return _reservoir_sample(
+            rows=_iterate_sqlalchemy_query_rows(
+                execution_engine=execution_engine, query=query
+            ),
+            sample_size=unexpected_rows_limit,
+            seed=result_format.get("unexpected_rows_sampling_seed"),
+        )
+
+    raise ValueError(
+        f'Unrecognized unexpected_rows_sampling "{sampling}"; must be "first" or "reservoir".'
+    )
+
+
+def _iterate_sqlalchemy_query_rows(
+    execution_engine: SqlAlchemyExecutionEngine, query: sa.select
+) -> Iterator[Any]:
+    """Iterates over query results, fetched in chunks from server-side cursor (where supported by dialect)."""
+    result = execution_engine.engine.execute(
+        query.execution_options(stream_results=True)
+    )
+    try:
+        while True:
+            rows: List[Any] = result.fetchmany(_SQL_UNEXPECTED_ROWS_FETCH_SIZE)
+            if not rows:
+                break
+
+            yield from rows
+    finally:
+        result.close()
+
+
+def _sqlalchemy_row_to_dict(row: Any) -> Dict[str, Any]:
+    # "Row._mapping" was added in SQLAlchemy 1.4; "RowProxy" of earlier versions is mapping itself.
+    return dict(getattr(row, "_mapping", row))
+
+
+def _reservoir_sample(
+    rows: Iterable[Any], sample_size: int, seed: Optional[int] = None
+) -> List[Any]:
+    """Draws uniform random sample of given size from rows of unknown number in one pass (Algorithm R)."""
+    rng = random.Random(seed)
+
+    sample: List[Any] = []
+
+    idx: int
+    row: Any
+    for idx, row in enumerate(rows):
+        if idx < sample_size:
+            sample.append(row)
+        else:
+            sample_idx: int = rng.randint(0, idx)
+            if sample_idx < sample_size:
+                sample[sample_idx] = row
+
+    return sample
+
+
+def _spill_unexpected_list(
+    unexpected_list: Iterable[Dict[str, Any]],
+    name: str,
+    directory: str,
+    num_rows_to_keep: int,
+    retention_seconds: Optional[float] = None,
+) -> SpilledUnexpectedList:
+    """Writes unexpected index (or row) dictionaries to gzip-compressed JSON Lines file, keeping leading ones in memory.
+
+    Spill files are kept (validation results refer to them), unless "retention_seconds" is given: then spill files,
+    which earlier spills left in directory and which are older than "retention_seconds", are deleted first.
+    """
+    directory_path = pathlib.Path(directory)
+    directory_path.mkdir(parents=True, exist_ok=True)
+    if retention_seconds is not None:
+        _delete_expired_spill_files(
+            directory=directory_path, retention_seconds=retention_seconds
+        )
+
+    path: pathlib.Path = (
+        directory_path / f"{name}_{uuid.uuid4().hex}{_SPILL_FILE_SUFFIX}"
+    )
+
+    leading_unexpected_list: List[Dict[str, Any]] = []
+
+    unexpected: Dict[str, Any]
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for unexpected in unexpected_list:
+            if len(leading_unexpected_list) < num_rows_to_keep:
+                leading_unexpected_list.append(unexpected)
+
+            f.write(json.dumps(convert_to_json_serializable(data=unexpected)))
+            f.write("\n")
+
+    return SpilledUnexpectedList(
+        unexpected_list=leading_unexpected_list, path=str(path)
+    )
+
+
+def _delete_expired_spill_files(
+    directory: pathlib.Path, retention_seconds: float
+) -> None:
+    """Deletes spill files (and only them) in directory, whose last modification is older than retention period."""
+    expiration_timestamp: float = time.time() - retention_seconds
+
+    path: pathlib.Path
+    for path in directory.glob(f"unexpected_*{_SPILL_FILE_SUFFIX}"):
+        try:
+            if path.stat().st_mtime < expiration_timestamp:
+                path.unlink()
+        except FileNotFoundError:
+            # Spill file was concurrently deleted by another validation.
+            continue
+
+
 def _spark_map_condition_unexpected_count_aggregate_fn(
     cls,
     execution_engine: SparkDFExecutionEngine,
@@ -631,7 +858,9 @@ def _spark_map_condition_unexpected_count_aggregate_fn(
         "unexpected_condition"
     )
     return (
-        F.sum(F.when(unexpected_condition, 1).otherwise(0)),
+        SparkColumnAggregate(
+            column=F.when(unexpected_condition, 1).otherwise(0), aggregate_fn=F.sum
+        ),
         compute_domain_kwargs,
         accessor_domain_kwargs,
     )
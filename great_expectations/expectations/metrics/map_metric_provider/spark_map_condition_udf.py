@@ -0,0 +1,80 @@
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional
+
+import pandas as pd
+
+from great_expectations.expectations.metrics.map_metric_provider import (
+    condition_functions,
+)
+from great_expectations.expectations.metrics.map_metric_provider.condition_functions import (
+    evaluate_on_unique_values,
+)
+from great_expectations.optional_imports import F, sparktypes
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import SparkDFExecutionEngine
+    from great_expectations.optional_imports import pyspark_sql_Column
+
+logger = logging.getLogger(__name__)
+
+# Builds row-wise condition function (e.g., around compiled JSON Schema validator); called on executors, not on driver.
+ConditionFnFactory = Callable[[], Callable[[Any], bool]]
+
+
+def get_spark_map_condition_udf(
+    execution_engine: Optional["SparkDFExecutionEngine"],
+    make_condition_fn: ConditionFnFactory,
+) -> Callable[["pyspark_sql_Column"], "pyspark_sql_Column"]:
+    """Returns Spark UDF, evaluating row-wise boolean condition (built by "make_condition_fn") on every column value.
+
+    If Arrow is enabled for SparkDFExecutionEngine, the UDF is vectorized ("pandas_udf" over iterator of Arrow batches):
+    condition function is built once per task and evaluated only once per distinct value within every Arrow batch.
+    Otherwise, plain Python UDF is returned, which builds condition function once per Python worker process.
+
+    UDFs are closures (pickled by value), which only call functions of self-contained "condition_functions" module
+    (also pickled by value, where supported by PySpark), so that executors do not need "great_expectations" installed.
+
+    Args:
+        execution_engine: SparkDFExecutionEngine, whose Spark configuration determines whether Arrow is enabled
+        make_condition_fn: picklable factory of condition function (mapping single value to bool)
+
+    Returns:
+        Spark UDF, which is to be applied to column to obtain boolean column
+    """
+    _register_condition_functions_pickle_by_value()
+
+    if execution_engine is not None and execution_engine.arrow_enabled:
+        # Type hints (which must not be postponed) declare "Iterator of Series to Iterator of Series" UDF to Spark.
+        def evaluate_condition(batches: Iterator[pd.Series]) -> Iterator[pd.Series]:
+            condition_fn: Callable[[Any], bool] = make_condition_fn()
+            for values in batches:
+                yield evaluate_on_unique_values(
+                    column=values,
+                    metric_fn=lambda unique_values: unique_values.map(condition_fn),
+                ).astype(bool)
+
+        # PySpark stubs type only deprecated "functionType" form; UDF kind is inferred from type hints (Spark 3.0+).
+        return F.pandas_udf(evaluate_condition, sparktypes.BooleanType())  # type: ignore[call-overload]
+
+    condition_fns: Dict[str, Callable[[Any], bool]] = {}
+
+    def evaluate_condition_lazily(value: Any) -> bool:
+        # Condition function (e.g., compiled validator) is built on executor, upon first call; only factory is shipped.
+        if "condition_fn" not in condition_fns:
+            condition_fns["condition_fn"] = make_condition_fn()
+
+        return condition_fns["condition_fn"](value)
+
+    return F.udf(evaluate_condition_lazily, sparktypes.BooleanType())
+
+
+def _register_condition_functions_pickle_by_value() -> None:
+    try:
+        from pyspark import cloudpickle
+
+        cloudpickle.register_pickle_by_value(condition_functions)
+    except (ImportError, AttributeError):
+        # Older PySpark pickles module-level functions by reference (executors then need "great_expectations").
+        logger.debug(
+            'PySpark does not support pickling modules by value; "great_expectations" must be installed on executors.'
+        )
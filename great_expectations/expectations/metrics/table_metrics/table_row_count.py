@@ -7,6 +7,9 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.sparkdf_execution_engine import (
+    SparkColumnAggregate,
+)
 from great_expectations.expectations.metrics.metric_provider import (
     metric_partial,
     metric_value,
@@ -63,4 +66,8 @@ class TableRowCount(TableMetricProvider):
         metrics: Dict[str, Any],
         runtime_configuration: dict,
     ):
-        return F.count(F.lit(1)), metric_domain_kwargs, {}
+        return (
+            SparkColumnAggregate(column=F.lit(1), aggregate_fn=F.count),
+            metric_domain_kwargs,
+            {},
+        )
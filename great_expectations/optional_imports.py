@@ -108,6 +108,21 @@ try:
 except (ImportError, AttributeError):
     sqlalchemy_dialects_registry = SQLALCHEMY_NOT_IMPORTED
 
+try:
+    from sqlalchemy.dialects.mysql import insert as sqlalchemy_mysql_insert
+except (ImportError, AttributeError):
+    sqlalchemy_mysql_insert = SQLALCHEMY_NOT_IMPORTED
+
+try:
+    from sqlalchemy.dialects.postgresql import insert as sqlalchemy_postgresql_insert
+except (ImportError, AttributeError):
+    sqlalchemy_postgresql_insert = SQLALCHEMY_NOT_IMPORTED
+
+try:
+    from sqlalchemy.dialects.sqlite import insert as sqlalchemy_sqlite_insert
+except (ImportError, AttributeError):
+    sqlalchemy_sqlite_insert = SQLALCHEMY_NOT_IMPORTED
+
 try:
     from sqlalchemy.engine import (
         Dialect as sqlalchemy_engine_Dialect,
@@ -461,3 +476,21 @@ try:
     import pyarrow as pyarrow
 except (ImportError, AttributeError):
     pyarrow = PYARROW_NOT_IMPORTED
+
+MSGPACK_NOT_IMPORTED = NotImported(
+    "msgpack is not installed, please 'pip install msgpack'"
+)
+
+try:
+    import msgpack
+except (ImportError, AttributeError):
+    msgpack = MSGPACK_NOT_IMPORTED
+
+ZSTANDARD_NOT_IMPORTED = NotImported(
+    "zstandard is not installed, please 'pip install zstandard'"
+)
+
+try:
+    import zstandard
+except (ImportError, AttributeError):
+    zstandard = ZSTANDARD_NOT_IMPORTED
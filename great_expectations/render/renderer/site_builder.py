@@ -1,18 +1,26 @@
+import hashlib
+import json
 import logging
 import os
+import threading
 import traceback
 from collections import OrderedDict
-from typing import Any, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, List, Optional, Tuple, Union
 
 import great_expectations.exceptions as exceptions
 from great_expectations.core import ExpectationSuite
-from great_expectations.core.util import nested_update
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
+from great_expectations.core.util import convert_to_json_serializable, nested_update
 from great_expectations.data_context.cloud_constants import GXCloudRESTResource
 from great_expectations.data_context.store.html_site_store import (
     HtmlSiteStore,
     SiteSectionIdentifier,
 )
 from great_expectations.data_context.store.json_site_store import JsonSiteStore
+from great_expectations.data_context.store.validations_store import ValidationsStore
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     GXCloudIdentifier,
@@ -34,6 +42,129 @@ FALSEY_YAML_STRINGS = [
 ]
 
 
+class DataDocsManifest:
+    """Record of resources, rendered into Data Docs site, and of summary fields shown for them on index page.
+
+    The manifest is kept in target site store (next to index page).  Incremental builds use it to render only new (or
+    changed) resources and to build index page without retrieving every resource from its source store.
+
+    Validation Results are treated as immutable (once rendered, they are rendered again only if requested explicitly
+    through "resource_identifiers" or if their page is missing from site); Expectation Suites are rendered again
+    whenever their content changes.
+    """
+
+    VERSION = 1
+
+    def __init__(self, target_store: HtmlSiteStore) -> None:
+        self._target_store = target_store
+        self._resources: Dict[str, Dict[Tuple[str, ...], dict]] = {}
+        self._is_modified = False
+        # Pages of site section may be built concurrently (see "ConcurrencyConfig"), and each records itself here.
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        self._resources = {}
+        self._is_modified = False
+
+        serialized_manifest: Optional[str] = self._target_store.read_manifest()
+        if not serialized_manifest:
+            return
+
+        try:
+            manifest: dict = json.loads(serialized_manifest)
+        except ValueError:
+            logger.warning("Data Docs manifest could not be parsed; rebuilding site.")
+            return
+
+        if manifest.get("version") != self.VERSION:
+            return
+
+        section_name: str
+        entries: List[dict]
+        for section_name, entries in manifest.get("resources", {}).items():
+            self._resources[section_name] = {
+                tuple(entry["key"]): entry for entry in entries
+            }
+
+    def save(self) -> None:
+        if not self._is_modified:
+            return
+
+        manifest: dict = {
+            "version": self.VERSION,
+            "resources": {
+                section_name: list(entries.values())
+                for section_name, entries in self._resources.items()
+            },
+        }
+        self._target_store.write_manifest(json.dumps(manifest, indent=2))
+        self._is_modified = False
+
+    def get(
+        self,
+        section_name: str,
+        resource_key: Union[ExpectationSuiteIdentifier, ValidationResultIdentifier],
+    ) -> Optional[dict]:
+        return self._resources.get(section_name, {}).get(resource_key.to_tuple())
+
+    def set(
+        self,
+        section_name: str,
+        resource_key: Union[ExpectationSuiteIdentifier, ValidationResultIdentifier],
+        fingerprint: Optional[str] = None,
+        summary: Optional[dict] = None,
+    ) -> None:
+        key: Tuple[str, ...] = resource_key.to_tuple()
+        try:
+            summary = convert_to_json_serializable(summary or {})
+        except TypeError:
+            # Resource, whose summary cannot be recorded, is rendered (and retrieved for index page) upon every build.
+            logger.debug(
+                f"Summary of {str(resource_key)} cannot be recorded in Data Docs manifest."
+            )
+            return
+
+        with self._lock:
+            self._resources.setdefault(section_name, {})[key] = {
+                "key": list(key),
+                "fingerprint": fingerprint,
+                "summary": summary,
+            }
+            self._is_modified = True
+
+    def remove(
+        self,
+        resource_key: Union[ExpectationSuiteIdentifier, ValidationResultIdentifier],
+    ) -> None:
+        key: Tuple[str, ...] = resource_key.to_tuple()
+        entries: Dict[Tuple[str, ...], dict]
+        with self._lock:
+            for entries in self._resources.values():
+                if entries.pop(key, None) is not None:
+                    self._is_modified = True
+
+    @staticmethod
+    def get_fingerprint(resource: Any) -> str:
+        return hashlib.sha256(
+            json.dumps(convert_to_json_serializable(resource), sort_keys=True).encode(
+                "utf-8"
+            )
+        ).hexdigest()
+
+    @staticmethod
+    def get_validation_result_summary(validation_result: Any) -> dict:
+        """Returns fields of Validation Result (or Profiling Result), which index page shows."""
+        batch_kwargs = validation_result.meta.get("batch_kwargs", {})
+        batch_spec = validation_result.meta.get("batch_spec", {})
+        return {
+            "validation_success": validation_result.success,
+            "asset_name": batch_kwargs.get("data_asset_name")
+            or batch_spec.get("data_asset_name"),
+            "batch_kwargs": batch_kwargs,
+            "batch_spec": batch_spec,
+        }
+
+
 class SiteBuilder:
     """SiteBuilder builds data documentation for the project defined by a
     DataContext.
@@ -64,6 +195,14 @@ class SiteBuilder:
                 bucket: data_docs.my_company.com
                 prefix: /data_docs/
 
+    With "incremental_build: true", the site keeps a manifest of rendered resources (see "DataDocsManifest"), so that
+    each build renders only new (or changed) resources and builds index page from the manifest.  Then, build time
+    grows with the number of new Validation Results, rather than with the size of the history.
+
+    When concurrency is enabled in the project config (see "ConcurrencyConfig"), pages of each section are built
+    (retrieved, rendered, and stored) concurrently on a pool of threads.  In addition, "rendering_processes: <n>" moves
+    Jinja templating of pages to a pool of <n> processes, which helps when rendering (rather than store I/O) dominates.
+
 
     A more verbose configuration can also control individual sections and
     override renderers, views, and stores::
@@ -122,6 +261,8 @@ class SiteBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        incremental_build=False,
+        rendering_processes=None,
         **kwargs,
     ) -> None:
         self.site_name = site_name
@@ -132,6 +273,8 @@ class SiteBuilder:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
         self.ge_cloud_mode = cloud_mode
+        self.incremental_build = incremental_build
+        self.rendering_processes = rendering_processes
 
         usage_statistics_config = data_context.anonymous_usage_statistics
         data_context_id = None
@@ -181,6 +324,11 @@ class SiteBuilder:
                 store_backend=store_backend, runtime_environment=runtime_environment
             )
 
+        # GX Cloud renders Data Docs on its own (no index page), so there is nothing to build incrementally.
+        self.manifest: Optional[DataDocsManifest] = None
+        if incremental_build and not cloud_mode:
+            self.manifest = DataDocsManifest(target_store=self.target_store)
+
         default_site_section_builders_config = {
             "expectations": {
                 "class_name": "DefaultSiteSectionBuilder",
@@ -241,6 +389,8 @@ class SiteBuilder:
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
                     "cloud_mode": self.cloud_mode,
+                    "manifest": self.manifest,
+                    "rendering_processes": self.rendering_processes,
                 },
                 config_defaults={"name": site_section_name, "module_name": module_name},
             )
@@ -273,6 +423,7 @@ class SiteBuilder:
                 },
                 "site_section_builders_config": site_section_builders,
                 "cloud_mode": self.cloud_mode,
+                "manifest": self.manifest,
             },
             config_defaults={
                 "name": "site_index_builder",
@@ -306,6 +457,8 @@ class SiteBuilder:
 
         :return:
         """
+        if self.manifest is not None:
+            self.manifest.load()
 
         # copy static assets
         for site_section_builder in self.site_section_builders.values():
@@ -319,6 +472,10 @@ class SiteBuilder:
         self.target_store.copy_static_assets()
 
         _, index_links_dict = self.site_index_builder.build(build_index=build_index)
+
+        if self.manifest is not None:
+            self.manifest.save()
+
         return (
             self.get_resource_url(only_if_exists=False),
             index_links_dict,
@@ -341,6 +498,38 @@ class SiteBuilder:
         )
 
 
+def _instantiate_view(
+    view: dict,
+    module_name: str,
+    custom_styles_directory: Optional[str] = None,
+    custom_views_directory: Optional[str] = None,
+):
+    return instantiate_class_from_config(
+        config=view,
+        runtime_environment={
+            "custom_styles_directory": custom_styles_directory,
+            "custom_views_directory": custom_views_directory,
+        },
+        config_defaults={"module_name": module_name},
+    )
+
+
+# Views, instantiated (once per configuration) in worker process of rendering process pool.
+_worker_process_views: Dict[str, Any] = {}
+
+
+def _render_view_in_worker_process(
+    view_config: dict, rendered_content: Any, **kwargs
+) -> str:
+    view_config_key: str = json.dumps(view_config, sort_keys=True, default=str)
+    view_class = _worker_process_views.get(view_config_key)
+    if view_class is None:
+        view_class = _instantiate_view(**view_config)
+        _worker_process_views[view_config_key] = view_class
+
+    return view_class.render(rendered_content, **kwargs)
+
+
 class DefaultSiteSectionBuilder:
     def __init__(
         self,
@@ -359,6 +548,8 @@ class DefaultSiteSectionBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        manifest=None,
+        rendering_processes=None,
         **kwargs,
     ) -> None:
         self.name = name
@@ -373,6 +564,8 @@ class DefaultSiteSectionBuilder:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
         self.ge_cloud_mode = cloud_mode
+        self.manifest = manifest
+        self.rendering_processes = rendering_processes
         if renderer is None:
             raise exceptions.InvalidConfigError(
                 "SiteSectionBuilder requires a renderer configuration "
@@ -400,14 +593,13 @@ class DefaultSiteSectionBuilder:
                 "class_name": "DefaultJinjaPageView",
             }
         module_name = view.get("module_name") or module_name
-        self.view_class = instantiate_class_from_config(
-            config=view,
-            runtime_environment={
-                "custom_styles_directory": custom_styles_directory,
-                "custom_views_directory": custom_views_directory,
-            },
-            config_defaults={"module_name": module_name},
-        )
+        self.view_config = {
+            "view": view,
+            "module_name": module_name,
+            "custom_styles_directory": custom_styles_directory,
+            "custom_views_directory": custom_views_directory,
+        }
+        self.view_class = _instantiate_view(**self.view_config)
         if not self.view_class:
             raise exceptions.ClassInstantiationError(
                 module_name=view["module_name"],
@@ -422,6 +614,15 @@ class DefaultSiteSectionBuilder:
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
 
+        # Keys of pages, present in site (listed once per build, and only if there is manifest to check against).
+        rendered_site_keys: Dict[type, set] = {}
+
+        resource_keys_to_build: List[
+            Tuple[
+                Union[ExpectationSuiteIdentifier, ValidationResultIdentifier],
+                Optional[dict],
+            ]
+        ] = []
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
             # builder will build
@@ -436,81 +637,232 @@ class DefaultSiteSectionBuilder:
                     resource_key, self.run_name_filter
                 ):
                     continue
-            try:
-                resource = self.source_store.get(resource_key)
-                if isinstance(resource_key, ExpectationSuiteIdentifier):
-                    resource = ExpectationSuite(
-                        **resource, data_context=self.data_context
-                    )
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
+
+            # In incremental mode, Validation Results are immutable, so they are rendered only once (unless requested).
+            manifest_entry: Optional[dict] = (
+                None
+                if resource_identifiers
+                else self._get_manifest_entry_of_rendered_resource(
+                    resource_key=resource_key, rendered_site_keys=rendered_site_keys
                 )
+            )
+            if manifest_entry is not None and isinstance(
+                resource_key, ValidationResultIdentifier
+            ):
                 continue
 
+            resource_keys_to_build.append((resource_key, manifest_entry))
+
+        if not resource_keys_to_build:
+            return
+
+        concurrency: ConcurrencyConfig = (
+            self.data_context.concurrency or ConcurrencyConfig()
+        )
+        max_workers: int = min(
+            len(resource_keys_to_build), concurrency.max_data_docs_page_concurrency
+        )
+        with self._get_rendering_process_pool_executor(
+            concurrency=concurrency, max_workers=max_workers
+        ) as process_pool_executor, AsyncExecutor(
+            concurrency_config=concurrency, max_workers=max_workers
+        ) as async_executor:
+            # Pages are built independently of one another; failure to build one page is logged by "_build_page" and
+            # does not prevent other pages from being built.
+            async_results: List[AsyncResult] = [
+                async_executor.submit(
+                    self._build_page,
+                    resource_key=resource_key,
+                    manifest_entry=manifest_entry,
+                    process_pool_executor=process_pool_executor,
+                )
+                for resource_key, manifest_entry in resource_keys_to_build
+            ]
+
+        async_result: AsyncResult
+        for async_result in async_results:
+            async_result.result()
+
+    def _get_rendering_process_pool_executor(
+        self, concurrency: ConcurrencyConfig, max_workers: int
+    ) -> Union[ProcessPoolExecutor, ContextManager[None]]:
+        """Returns pool of processes for Jinja templating of pages, if configured (and needed), or no-op otherwise."""
+        if (
+            self.rendering_processes
+            and concurrency.enabled
+            and max_workers > 1
+            and not self.cloud_mode
+        ):
+            return ProcessPoolExecutor(
+                max_workers=min(self.rendering_processes, max_workers)
+            )
+
+        return nullcontext()
+
+    def _build_page(
+        self,
+        resource_key: Union[ExpectationSuiteIdentifier, ValidationResultIdentifier],
+        manifest_entry: Optional[dict] = None,
+        process_pool_executor: Optional[ProcessPoolExecutor] = None,
+    ) -> None:
+        fingerprint: Optional[str] = None
+        try:
+            resource = self.source_store.get(resource_key)
             if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.expectation_suite_name
+                if self.manifest is not None:
+                    fingerprint = self.manifest.get_fingerprint(resource)
+                    if (
+                        manifest_entry is not None
+                        and manifest_entry["fingerprint"] == fingerprint
+                    ):
+                        return
+
+                resource = ExpectationSuite(**resource, data_context=self.data_context)
+        except exceptions.InvalidKeyError:
+            logger.warning(
+                f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
+            )
+            return
+
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.expectation_suite_name
+            logger.debug(
+                f"        Rendering expectation suite {expectation_suite_name}"
+            )
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = (
+                resource_key.expectation_suite_identifier.expectation_suite_name
+            )
+            if self.name == "profiling":
                 logger.debug(
-                    f"        Rendering expectation suite {expectation_suite_name}"
+                    f"        Rendering profiling for batch {resource_key.batch_identifier}"
                 )
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = (
-                    resource_key.expectation_suite_identifier.expectation_suite_name
-                )
-                if self.name == "profiling":
-                    logger.debug(
-                        f"        Rendering profiling for batch {resource_key.batch_identifier}"
-                    )
-                else:
+            else:
 
-                    logger.debug(
-                        f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"
-                    )
+                logger.debug(
+                    f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"
+                )
 
-            try:
-                rendered_content = self.renderer_class.render(resource)
-
-                if self.cloud_mode:
-                    self.target_store.set(
-                        GXCloudIdentifier(
-                            resource_type=GXCloudRESTResource.RENDERED_DATA_DOC
-                        ),
-                        rendered_content,
-                        source_type=resource_key.resource_type,
-                        source_id=resource_key.id,
-                    )
-                else:
-                    viewable_content = self.view_class.render(
-                        rendered_content,
-                        data_context_id=self.data_context_id,
-                        show_how_to_buttons=self.show_how_to_buttons,
-                    )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
-                        ),
-                        viewable_content,
-                    )
-            except Exception as e:
-                exception_message = """\
+        try:
+            rendered_content = self.renderer_class.render(resource)
+
+            if self.cloud_mode:
+                self.target_store.set(
+                    GXCloudIdentifier(
+                        resource_type=GXCloudRESTResource.RENDERED_DATA_DOC
+                    ),
+                    rendered_content,
+                    source_type=resource_key.resource_type,
+                    source_id=resource_key.id,
+                )
+            else:
+                viewable_content = self._render_view(
+                    rendered_content=rendered_content,
+                    process_pool_executor=process_pool_executor,
+                )
+                # Verify type
+                self.target_store.set(
+                    SiteSectionIdentifier(
+                        site_section_name=self.name,
+                        resource_identifier=resource_key,
+                    ),
+                    viewable_content,
+                )
+                self._record_rendered_resource(
+                    resource_key=resource_key,
+                    resource=resource,
+                    fingerprint=fingerprint,
+                )
+        except Exception as e:
+            exception_message = """\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
-                """
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{str(e)}".  '
-                    f'Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)
+            """
+            exception_traceback = traceback.format_exc()
+            exception_message += (
+                f'{type(e).__name__}: "{str(e)}".  '
+                f'Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message)
+
+    def _render_view(
+        self,
+        rendered_content: Any,
+        process_pool_executor: Optional[ProcessPoolExecutor] = None,
+    ) -> str:
+        if process_pool_executor is None:
+            return self.view_class.render(
+                rendered_content,
+                data_context_id=self.data_context_id,
+                show_how_to_buttons=self.show_how_to_buttons,
+            )
+
+        # Jinja Environment of view is not picklable; hence, worker process instantiates view from its configuration.
+        return process_pool_executor.submit(
+            _render_view_in_worker_process,
+            self.view_config,
+            rendered_content,
+            data_context_id=self.data_context_id,
+            show_how_to_buttons=self.show_how_to_buttons,
+        ).result()
+
+    def _record_rendered_resource(
+        self,
+        resource_key: Union[ExpectationSuiteIdentifier, ValidationResultIdentifier],
+        resource: Any,
+        fingerprint: Optional[str] = None,
+    ) -> None:
+        if self.manifest is None:
+            return
+
+        summary: Optional[dict] = None
+        if isinstance(resource_key, ValidationResultIdentifier):
+            summary = DataDocsManifest.get_validation_result_summary(
+                validation_result=resource
+            )
+
+        self.manifest.set(
+            section_name=self.name,
+            resource_key=resource_key,
+            fingerprint=fingerprint,
+            summary=summary,
+        )
+
+    def _get_manifest_entry_of_rendered_resource(
+        self,
+        resource_key: Union[ExpectationSuiteIdentifier, ValidationResultIdentifier],
+        rendered_site_keys: Dict[type, set],
+    ) -> Optional[dict]:
+        """Returns manifest entry of resource, provided that its page is present in site (None otherwise)."""
+        if self.manifest is None:
+            return None
+
+        manifest_entry: Optional[dict] = self.manifest.get(
+            section_name=self.name, resource_key=resource_key
+        )
+        if manifest_entry is None:
+            return None
+
+        key_type: type = type(resource_key)
+        if key_type not in rendered_site_keys:
+            rendered_site_keys[key_type] = set(
+                self.target_store.store_backends[key_type].list_keys()
+            )
+
+        if resource_key.to_tuple() not in rendered_site_keys[key_type]:
+            return None
+
+        return manifest_entry
 
 
 class DefaultSiteIndexBuilder:
+    # Validation Results, shown on index page, are retrieved (with bulk reads of their store) this many at a time.
+    VALIDATION_RESULTS_PREFETCH_CHUNK_SIZE = 100
+
     def __init__(
         self,
         name,
@@ -526,6 +878,7 @@ class DefaultSiteIndexBuilder:
         view=None,
         data_context_id=None,
         source_stores=None,
+        manifest=None,
         **kwargs,
     ) -> None:
         # NOTE: This method is almost identical to DefaultSiteSectionBuilder
@@ -538,6 +891,7 @@ class DefaultSiteIndexBuilder:
         self.show_how_to_buttons = show_how_to_buttons
         self.source_stores = source_stores or {}
         self.site_section_builders_config = site_section_builders_config or {}
+        self.manifest = manifest
 
         if renderer is None:
             renderer = {
@@ -806,6 +1160,10 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         self.target_store.store_backends[
                             ExpectationSuiteIdentifier
                         ].remove_key(expectation_suite_site_key)
+                        if self.manifest is not None:
+                            self.manifest.remove(
+                                resource_key=expectation_suite_site_key
+                            )
                     else:
                         cleaned_keys.append(expectation_suite_site_key)
                 expectation_suite_site_keys = cleaned_keys
@@ -856,6 +1214,10 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         self.target_store.store_backends[
                             ValidationResultIdentifier
                         ].remove_key(validation_result_site_key)
+                        if self.manifest is not None:
+                            self.manifest.remove(
+                                resource_key=validation_result_site_key
+                            )
                     else:
                         cleaned_keys.append(validation_result_site_key)
                 validation_and_profiling_result_site_keys = cleaned_keys
@@ -879,18 +1241,20 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     validation_result_key, profiling_run_name_filter
                 )
             ]
+            prefetched_summaries: Dict[
+                ValidationResultIdentifier, dict
+            ] = self._prefetch_validation_result_summaries(
+                section_name="profiling",
+                validation_result_keys=profiling_result_site_keys,
+            )
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=profiling_result_key.run_id,
-                        validations_store_name=self.source_stores.get("profiling"),
+                    summary: dict = self._get_validation_result_summary(
+                        section_name="profiling",
+                        validation_result_key=profiling_result_key,
+                        prefetched_summaries=prefetched_summaries,
                     )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
@@ -899,10 +1263,9 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         run_id=profiling_result_key.run_id,
                         run_time=profiling_result_key.run_id.run_time,
                         run_name=profiling_result_key.run_id.run_name,
-                        asset_name=batch_kwargs.get("data_asset_name")
-                        or batch_spec.get("data_asset_name"),
-                        batch_kwargs=batch_kwargs,
-                        batch_spec=batch_spec,
+                        asset_name=summary["asset_name"],
+                        batch_kwargs=summary["batch_kwargs"],
+                        batch_spec=summary["batch_spec"],
                     )
                 except Exception:
                     error_msg = f"Profiling result not found: {str(profiling_result_key.to_tuple()):s} - skipping"
@@ -934,37 +1297,136 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 validation_result_site_keys = validation_result_site_keys[
                     : self.validation_results_limit
                 ]
+            prefetched_summaries = self._prefetch_validation_result_summaries(
+                section_name="validations",
+                validation_result_keys=validation_result_site_keys,
+            )
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=validation_result_key.run_id,
-                        validations_store_name=self.source_stores.get("validations"),
+                    summary: dict = self._get_validation_result_summary(
+                        section_name="validations",
+                        validation_result_key=validation_result_key,
+                        prefetched_summaries=prefetched_summaries,
                     )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
                         section_name="validations",
                         batch_identifier=validation_result_key.batch_identifier,
                         run_id=validation_result_key.run_id,
-                        validation_success=validation_success,
+                        validation_success=summary["validation_success"],
                         run_time=validation_result_key.run_id.run_time,
                         run_name=validation_result_key.run_id.run_name,
-                        asset_name=batch_kwargs.get("data_asset_name")
-                        or batch_spec.get("data_asset_name"),
-                        batch_kwargs=batch_kwargs,
-                        batch_spec=batch_spec,
+                        asset_name=summary["asset_name"],
+                        batch_kwargs=summary["batch_kwargs"],
+                        batch_spec=summary["batch_spec"],
                     )
                 except Exception:
                     error_msg = f"Validation result not found: {str(validation_result_key.to_tuple()):s} - skipping"
                     logger.warning(error_msg)
 
+    def _prefetch_validation_result_summaries(
+        self,
+        section_name: str,
+        validation_result_keys: List[ValidationResultIdentifier],
+    ) -> Dict[ValidationResultIdentifier, dict]:
+        """Retrieves Validation Results, whose summaries are not in manifest, with bulk reads of validations store.
+
+        Validation Results of a chunk, which cannot be retrieved together (e.g. one of them is missing), are left to be
+        retrieved one by one (with per-result error handling) by "_get_validation_result_summary".
+        """
+        validation_result_keys = [
+            validation_result_key
+            for validation_result_key in validation_result_keys
+            if self.manifest is None
+            or self.manifest.get(
+                section_name=section_name, resource_key=validation_result_key
+            )
+            is None
+        ]
+        if not validation_result_keys:
+            return {}
+
+        validations_store = self.data_context.stores[
+            self.source_stores.get(section_name)
+            or self.data_context.validations_store_name
+        ]
+        summaries: Dict[ValidationResultIdentifier, dict] = {}
+        chunk_size: int = self.VALIDATION_RESULTS_PREFETCH_CHUNK_SIZE
+        for idx in range(0, len(validation_result_keys), chunk_size):
+            keys_chunk = validation_result_keys[idx : idx + chunk_size]
+            try:
+                # Index page shows only summaries, which (compact) Validation Results can provide without "results".
+                validation_results = (
+                    validations_store.get_summaries(keys_chunk)
+                    if isinstance(validations_store, ValidationsStore)
+                    else validations_store.get_many(keys_chunk)
+                )
+            except Exception as e:
+                logger.debug(
+                    f"Validation Results could not be retrieved together: {str(e)}"
+                )
+                continue
+
+            for validation_result_key, validation_result in zip(
+                keys_chunk, validation_results
+            ):
+                if validation_result is not None:
+                    summaries[
+                        validation_result_key
+                    ] = DataDocsManifest.get_validation_result_summary(
+                        validation_result=validation_result
+                    )
+
+        return summaries
+
+    def _get_validation_result_summary(
+        self,
+        section_name: str,
+        validation_result_key: ValidationResultIdentifier,
+        prefetched_summaries: Optional[Dict[ValidationResultIdentifier, dict]] = None,
+    ) -> dict:
+        """Returns index page fields of Validation Result from manifest (if any), retrieving Validation Result otherwise."""
+        if self.manifest is not None:
+            manifest_entry: Optional[dict] = self.manifest.get(
+                section_name=section_name, resource_key=validation_result_key
+            )
+            if manifest_entry is not None:
+                return manifest_entry["summary"]
+
+        summary: Optional[dict] = (prefetched_summaries or {}).get(
+            validation_result_key
+        )
+        if summary is not None:
+            if self.manifest is not None:
+                self.manifest.set(
+                    section_name=section_name,
+                    resource_key=validation_result_key,
+                    summary=summary,
+                )
+
+            return summary
+
+        validation = self.data_context.get_validation_result(
+            batch_identifier=validation_result_key.batch_identifier,
+            expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
+            run_id=validation_result_key.run_id,
+            validations_store_name=self.source_stores.get(section_name),
+        )
+        summary = DataDocsManifest.get_validation_result_summary(
+            validation_result=validation
+        )
+
+        if self.manifest is not None:
+            self.manifest.set(
+                section_name=section_name,
+                resource_key=validation_result_key,
+                summary=summary,
+            )
+
+        return summary
+
 
 class CallToActionButton:
     def __init__(self, title, link) -> None:
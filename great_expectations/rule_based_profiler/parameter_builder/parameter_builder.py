@@ -95,6 +95,7 @@ class ParameterBuilder(ABC, Builder):
 
     exclude_field_names: ClassVar[Set[str]] = Builder.exclude_field_names | {
         "evaluation_parameter_builders",
+        "prefetched_metrics",
     }
 
     def __init__(
@@ -130,6 +131,9 @@ class ParameterBuilder(ABC, Builder):
             data_context=self._data_context,
         )
 
+        # Metrics, resolved beforehand and supplied to "build_parameters()" (available only while it executes).
+        self._prefetched_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
     def build_parameters(
         self,
         domain: Domain,
@@ -139,6 +143,7 @@ class ParameterBuilder(ABC, Builder):
         batch_list: Optional[List[Batch]] = None,
         batch_request: Optional[Union[BatchRequestBase, dict]] = None,
         runtime_configuration: Optional[dict] = None,
+        prefetched_metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
     ) -> None:
         """
         Args:
@@ -149,6 +154,8 @@ class ParameterBuilder(ABC, Builder):
             batch_list: Explicit list of "Batch" objects to supply data at runtime.
             batch_request: Explicit batch_request used to supply data at runtime.
             runtime_configuration: Additional run-time settings (see "Validator.DEFAULT_RUNTIME_CONFIGURATION").
+            prefetched_metrics: Metrics resolved beforehand (e.g., for all "Domain" objects of "Rule" together), keyed
+            by "MetricConfiguration" ID; "get_metrics()" computes only metrics missing from them.
         """
         runtime_configuration = runtime_configuration or {}
 
@@ -183,17 +190,22 @@ class ParameterBuilder(ABC, Builder):
                 parameters=parameters,
                 fully_qualified_parameter_names=fully_qualified_parameter_names,
                 runtime_configuration=runtime_configuration,
+                prefetched_metrics=prefetched_metrics,
             )
 
             if parameter_computation_impl is None:
                 parameter_computation_impl = self._build_parameters
 
-            parameter_computation_result: Attributes = parameter_computation_impl(
-                domain=domain,
-                variables=variables,
-                parameters=parameters,
-                runtime_configuration=runtime_configuration,
-            )
+            self._prefetched_metrics = prefetched_metrics or {}
+            try:
+                parameter_computation_result: Attributes = parameter_computation_impl(
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                    runtime_configuration=runtime_configuration,
+                )
+            finally:
+                self._prefetched_metrics = {}
 
             parameter_values: Dict[str, Any] = {
                 self.raw_fully_qualified_parameter_name: parameter_computation_result,
@@ -214,6 +226,7 @@ class ParameterBuilder(ABC, Builder):
         parameters: Optional[Dict[str, ParameterContainer]] = None,
         fully_qualified_parameter_names: Optional[List[str]] = None,
         runtime_configuration: Optional[dict] = None,
+        prefetched_metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
     ) -> None:
         """
         This method computes ("resolves") pre-requisite ("evaluation") dependencies (i.e., results of executing other
@@ -258,7 +271,85 @@ class ParameterBuilder(ABC, Builder):
                     variables=variables,
                     parameters=parameters,
                     runtime_configuration=runtime_configuration,
+                    prefetched_metrics=prefetched_metrics,
+                )
+
+    def get_metric_configurations(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+    ) -> List[Tuple[ParameterBuilder, List[MetricConfiguration]]]:
+        """
+        Returns "MetricConfiguration" objects, which "build_parameters()" of this "ParameterBuilder" object (and of its
+        evaluation dependencies) is going to resolve for specified "Domain", so that metrics of many "Domain" objects
+        can be resolved together beforehand.  Metrics, whose arguments depend on parameters that are not yet computed,
+        are omitted (they are resolved by "build_parameters()" as usual).
+
+        Metrics are paired with "ParameterBuilder" object resolving them, since evaluation dependencies may obtain
+        their "Batch" objects (hence, their "Validator") from "batch_request" of their own.
+
+        Args:
+            domain: "Domain" object that is context for execution of this "ParameterBuilder" object.
+            variables: attribute name/value pairs
+            parameters: Dictionary of "ParameterContainer" objects corresponding to all "Domain" objects in memory.
+            batch_list: Explicit list of "Batch" objects to supply data at runtime.
+            batch_request: Explicit batch_request used to supply data at runtime.
+
+        Returns:
+            List of "ParameterBuilder" objects and "MetricConfiguration" objects they resolve
+        """
+        self.set_batch_list_if_null_batch_request(
+            batch_list=batch_list,
+            batch_request=batch_request,
+        )
+
+        metric_configurations: List[
+            Tuple[ParameterBuilder, List[MetricConfiguration]]
+        ] = []
+
+        evaluation_parameter_builder: ParameterBuilder
+        for evaluation_parameter_builder in self.evaluation_parameter_builders or []:
+            metric_configurations.extend(
+                evaluation_parameter_builder.get_metric_configurations(
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                    batch_list=self.batch_list,
+                    batch_request=self.batch_request,
+                )
+            )
+
+        try:
+            metric_configurations.append(
+                (
+                    self,
+                    self._get_metric_configurations(
+                        domain=domain,
+                        variables=variables,
+                        parameters=parameters,
+                    ),
                 )
+            )
+        except (KeyError, gx_exceptions.ProfilerExecutionError) as e:
+            logger.debug(
+                f"""{self.__class__.__name__} "{self.name}" metrics cannot be determined beforehand ({str(e)})."""
+            )
+
+        return metric_configurations
+
+    def _get_metric_configurations(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Returns "MetricConfiguration" objects, which "_build_parameters()" resolves (none are known, unless overridden).
+        """
+        return []
 
     @abstractmethod
     def _build_parameters(
@@ -381,121 +472,49 @@ class ParameterBuilder(ABC, Builder):
 specified (empty "metric_name" value detected)."""
             )
 
-        batch_ids: Optional[List[str]] = self.get_batch_ids(
-            limit=limit,
-            domain=domain,
-            variables=variables,
-            parameters=parameters,
-        )
-        if not batch_ids:
-            raise gx_exceptions.ProfilerExecutionError(
-                message=f"Utilizing a {self.__class__.__name__} requires a non-empty list of Batch identifiers."
-            )
-
-        """
-        Compute metrics, corresponding to multiple "MetricConfiguration" directives, together, rather than individually.
-
-        As a strategy, since "metric_domain_kwargs" changes depending on "batch_id", "metric_value_kwargs" serves as
-        identifying entity (through "AttributedResolvedMetrics") for accessing resolved metrics (computation results).
-
-        All "MetricConfiguration" directives are generated by combining each metric_value_kwargs" with
-        "metric_domain_kwargs" for all "batch_ids" (where every "metric_domain_kwargs" represents separate "batch_id").
-        Then, all "MetricConfiguration" objects, collected into list as container, are resolved simultaneously.
-        """
-
-        # Step-1: Gather "metric_domain_kwargs" (corresponding to "batch_ids").
+        # Step-1 through Step-3: Generate "MetricConfiguration" directives for all "Batch"/"metric_value_kwargs" pairs.
 
-        domain_kwargs: dict = build_metric_domain_kwargs(
-            batch_id=None,
+        batch_ids: List[str]
+        domain_kwargs: dict
+        metrics_to_resolve: List[MetricConfiguration]
+        (
+            batch_ids,
+            domain_kwargs,
+            metric_value_kwargs,
+            metrics_to_resolve,
+        ) = self._build_metric_configurations(
+            metric_name=metric_name,
             metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
+            limit=limit,
             domain=domain,
             variables=variables,
             parameters=parameters,
         )
 
-        batch_id: str
+        # Step-4: Resolve all metrics in one operation simultaneously (except for metrics resolved beforehand).
 
-        metric_domain_kwargs = [
-            copy.deepcopy(
-                build_metric_domain_kwargs(
-                    batch_id=batch_id,
-                    metric_domain_kwargs=copy.deepcopy(domain_kwargs),
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {
+            metric_configuration.id: self._prefetched_metrics[metric_configuration.id]
+            for metric_configuration in metrics_to_resolve
+            if metric_configuration.id in self._prefetched_metrics
+        }
+
+        metrics_to_compute: List[MetricConfiguration] = [
+            metric_configuration
+            for metric_configuration in metrics_to_resolve
+            if metric_configuration.id not in resolved_metrics
+        ]
+        if metrics_to_compute:
+            resolved_metrics.update(
+                self.resolve_metrics(
+                    metric_configurations=metrics_to_compute,
+                    runtime_configuration=runtime_configuration,
                     domain=domain,
                     variables=variables,
                     parameters=parameters,
                 )
             )
-            for batch_id in batch_ids
-        ]
-
-        # Step-2: Gather "metric_value_kwargs" (caller may require same metric computed for multiple arguments).
-
-        if not isinstance(metric_value_kwargs, list):
-            metric_value_kwargs = [metric_value_kwargs]
-
-        value_kwargs_cursor: dict
-        metric_value_kwargs = [
-            # Obtain value kwargs from "rule state" (i.e., variables and parameters); from instance variable otherwise.
-            get_parameter_value_and_validate_return_type(
-                domain=domain,
-                parameter_reference=value_kwargs_cursor,
-                expected_return_type=None,
-                variables=variables,
-                parameters=parameters,
-            )
-            for value_kwargs_cursor in metric_value_kwargs
-        ]
-
-        # Step-3: Generate "MetricConfiguration" directives for all "metric_domain_kwargs"/"metric_value_kwargs" pairs.
-
-        domain_kwargs_cursor: dict
-        kwargs_combinations: List[List[dict]] = [
-            [domain_kwargs_cursor, value_kwargs_cursor]
-            for value_kwargs_cursor in metric_value_kwargs
-            for domain_kwargs_cursor in metric_domain_kwargs
-        ]
-
-        metrics_to_resolve: List[MetricConfiguration]
-
-        kwargs_pair_cursor: List[dict, dict]
-        metrics_to_resolve = [
-            MetricConfiguration(
-                metric_name=metric_name,
-                metric_domain_kwargs=kwargs_pair_cursor[0],
-                metric_value_kwargs=kwargs_pair_cursor[1],
-            )
-            for kwargs_pair_cursor in kwargs_combinations
-        ]
-
-        # Step-4: Resolve all metrics in one operation simultaneously.
-
-        # The Validator object used for metric calculation purposes.
-        validator: Validator = self.get_validator(
-            domain=domain,
-            variables=variables,
-            parameters=parameters,
-        )
-
-        graph: ValidationGraph = (
-            validator.metrics_calculator.build_metric_dependency_graph(
-                metric_configurations=metrics_to_resolve,
-                runtime_configuration=runtime_configuration,
-            )
-        )
-
-        resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
-        aborted_metrics_info: Dict[
-            Tuple[str, str, str],
-            Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
-        ]
-        (
-            resolved_metrics,
-            aborted_metrics_info,
-        ) = validator.metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(
-            graph=graph,
-            runtime_configuration=runtime_configuration,
-            min_graph_edges_pbar_enable=0,
-        )
 
         # Step-5: Map resolved metrics to their attributes for identification and recovery by receiver.
 
@@ -588,6 +607,166 @@ specified (empty "metric_name" value detected)."""
             details=details,
         )
 
+    def resolve_metrics(
+        self,
+        metric_configurations: List[MetricConfiguration],
+        runtime_configuration: Optional[dict] = None,
+        domain: Optional[Domain] = None,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """
+        Resolves specified metrics together, using one "ValidationGraph" (metrics, whose resolution was aborted, are
+        omitted from result).
+
+        Args:
+            metric_configurations: "MetricConfiguration" objects to resolve
+            runtime_configuration: Additional run-time settings (see "Validator.DEFAULT_RUNTIME_CONFIGURATION").
+            domain: "Domain" object scoping "$variable"/"$parameter"-style references in configuration and runtime.
+            variables: Part of the "rule state" available for "$variable"-style references.
+            parameters: Part of the "rule state" available for "$parameter"-style references.
+
+        Returns:
+            Dictionary of "MetricConfiguration" IDs and their corresponding resolved values
+        """
+        # The Validator object used for metric calculation purposes.
+        validator: Validator = self.get_validator(
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        graph: ValidationGraph = (
+            validator.metrics_calculator.build_metric_dependency_graph(
+                metric_configurations=metric_configurations,
+                runtime_configuration=runtime_configuration,
+            )
+        )
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
+        aborted_metrics_info: Dict[
+            Tuple[str, str, str],
+            Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+        ]
+        (
+            resolved_metrics,
+            aborted_metrics_info,
+        ) = validator.metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(
+            graph=graph,
+            runtime_configuration=runtime_configuration,
+            min_graph_edges_pbar_enable=0,
+        )
+
+        return resolved_metrics
+
+    def _build_metric_configurations(
+        self,
+        metric_name: str,
+        metric_domain_kwargs: Optional[
+            Union[Union[str, dict], List[Union[str, dict]]]
+        ] = None,
+        metric_value_kwargs: Optional[
+            Union[Union[str, dict], List[Union[str, dict]]]
+        ] = None,
+        limit: Optional[int] = None,
+        domain: Optional[Domain] = None,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Tuple[List[str], dict, List[dict], List[MetricConfiguration]]:
+        """
+        Generates "MetricConfiguration" directives for all "Batch" objects and "metric_value_kwargs" of metric.
+
+        Returns:
+            "batch_ids", common "metric_domain_kwargs", all "metric_value_kwargs", and "MetricConfiguration" directives
+        """
+        batch_ids: Optional[List[str]] = self.get_batch_ids(
+            limit=limit,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+        if not batch_ids:
+            raise gx_exceptions.ProfilerExecutionError(
+                message=f"Utilizing a {self.__class__.__name__} requires a non-empty list of Batch identifiers."
+            )
+
+        """
+        Compute metrics, corresponding to multiple "MetricConfiguration" directives, together, rather than individually.
+
+        As a strategy, since "metric_domain_kwargs" changes depending on "batch_id", "metric_value_kwargs" serves as
+        identifying entity (through "AttributedResolvedMetrics") for accessing resolved metrics (computation results).
+
+        All "MetricConfiguration" directives are generated by combining each metric_value_kwargs" with
+        "metric_domain_kwargs" for all "batch_ids" (where every "metric_domain_kwargs" represents separate "batch_id").
+        Then, all "MetricConfiguration" objects, collected into list as container, are resolved simultaneously.
+        """
+
+        # Step-1: Gather "metric_domain_kwargs" (corresponding to "batch_ids").
+
+        domain_kwargs: dict = build_metric_domain_kwargs(
+            batch_id=None,
+            metric_domain_kwargs=metric_domain_kwargs,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        batch_id: str
+
+        metric_domain_kwargs = [
+            copy.deepcopy(
+                build_metric_domain_kwargs(
+                    batch_id=batch_id,
+                    metric_domain_kwargs=copy.deepcopy(domain_kwargs),
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                )
+            )
+            for batch_id in batch_ids
+        ]
+
+        # Step-2: Gather "metric_value_kwargs" (caller may require same metric computed for multiple arguments).
+
+        if not isinstance(metric_value_kwargs, list):
+            metric_value_kwargs = [metric_value_kwargs]
+
+        value_kwargs_cursor: dict
+        metric_value_kwargs = [
+            # Obtain value kwargs from "rule state" (i.e., variables and parameters); from instance variable otherwise.
+            get_parameter_value_and_validate_return_type(
+                domain=domain,
+                parameter_reference=value_kwargs_cursor,
+                expected_return_type=None,
+                variables=variables,
+                parameters=parameters,
+            )
+            for value_kwargs_cursor in metric_value_kwargs
+        ]
+
+        # Step-3: Generate "MetricConfiguration" directives for all "metric_domain_kwargs"/"metric_value_kwargs" pairs.
+
+        domain_kwargs_cursor: dict
+        kwargs_combinations: List[List[dict]] = [
+            [domain_kwargs_cursor, value_kwargs_cursor]
+            for value_kwargs_cursor in metric_value_kwargs
+            for domain_kwargs_cursor in metric_domain_kwargs
+        ]
+
+        metrics_to_resolve: List[MetricConfiguration]
+
+        kwargs_pair_cursor: List[dict, dict]
+        metrics_to_resolve = [
+            MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs=kwargs_pair_cursor[0],
+                metric_value_kwargs=kwargs_pair_cursor[1],
+            )
+            for kwargs_pair_cursor in kwargs_combinations
+        ]
+
+        return batch_ids, domain_kwargs, metric_value_kwargs, metrics_to_resolve
+
     @staticmethod
     def _sanitize_metric_computation(
         parameter_builder: ParameterBuilder,
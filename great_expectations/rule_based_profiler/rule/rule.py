@@ -1,6 +1,6 @@
 import copy
 import json
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from great_expectations.core.batch import Batch, BatchRequestBase  # noqa: TCH001
 from great_expectations.core.domain import Domain  # noqa: TCH001
@@ -40,6 +40,10 @@ from great_expectations.util import (
     deep_filter_properties_iterable,
     measure_execution_time,
 )
+from great_expectations.validator.computed_metric import MetricValue  # noqa: TCH001
+from great_expectations.validator.metric_configuration import (
+    MetricConfiguration,  # noqa: TCH001
+)
 
 
 class Rule(SerializableDictDot):
@@ -109,6 +113,11 @@ class Rule(SerializableDictDot):
             reconciliation_directives: directives for how each rule component should be overwritten
             rule_state: holds "Rule" execution state and responds to "execution_time_property_name" ("execution_time")
 
+        If "prefetch_metrics" run-time setting is True, then metrics, needed by "ParameterBuilder" objects for all
+        "Domain" objects, are first resolved together (in one "ValidationGraph" per set of "Batch" objects), and then
+        supplied to each "ParameterBuilder" object (metrics that cannot be determined beforehand are resolved by
+        "ParameterBuilder").
+
         Returns:
             RuleState representing effect of executing Rule
         """
@@ -140,6 +149,19 @@ class Rule(SerializableDictDot):
 
         rule_state.reset_parameter_containers()
 
+        prefetched_metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None
+        if runtime_configuration and runtime_configuration.get(
+            "prefetch_metrics", False
+        ):
+            prefetched_metrics = self._prefetch_metrics(
+                domains=domains,
+                variables=variables,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                rule_state=rule_state,
+                runtime_configuration=runtime_configuration,
+            )
+
         pbar_method: Callable = determine_progress_bar_method_by_environment()
 
         domain: Domain
@@ -163,6 +185,7 @@ class Rule(SerializableDictDot):
                     batch_list=batch_list,
                     batch_request=batch_request,
                     runtime_configuration=runtime_configuration,
+                    prefetched_metrics=prefetched_metrics,
                 )
 
             expectation_configuration_builders: List[
@@ -183,6 +206,98 @@ class Rule(SerializableDictDot):
 
         return rule_state
 
+    def _prefetch_metrics(
+        self,
+        domains: List[Domain],
+        rule_state: RuleState,
+        variables: Optional[ParameterContainer] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """
+        Collects metrics, which "ParameterBuilder" objects need for all "Domain" objects, and resolves them together.
+
+        Metrics are grouped by "Batch" objects of "ParameterBuilder" objects needing them (builders may be configured
+        with "batch_request" of their own), and metrics of each group are resolved together, using "Validator" of
+        (any) "ParameterBuilder" object in that group.
+
+        Returns:
+            Dictionary of "MetricConfiguration" IDs and their corresponding resolved values
+        """
+        parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
+
+        # Metrics to resolve, along with "ParameterBuilder" object and "Domain" object, whose "Validator" resolves them.
+        metric_configurations_by_batch_ids: Dict[
+            Tuple[str, ...],
+            Tuple[
+                ParameterBuilder,
+                Domain,
+                Dict[Tuple[str, str, str], MetricConfiguration],
+            ],
+        ] = {}
+
+        domain: Domain
+        parameter_builder: ParameterBuilder
+        resolving_parameter_builder: ParameterBuilder
+        metric_configurations: List[MetricConfiguration]
+        metric_configuration: MetricConfiguration
+        group_metric_configurations: Dict[Tuple[str, str, str], MetricConfiguration]
+        for domain in domains:
+            rule_state.initialize_parameter_container_for_domain(domain=domain)
+            for parameter_builder in parameter_builders:
+                for (
+                    resolving_parameter_builder,
+                    metric_configurations,
+                ) in parameter_builder.get_metric_configurations(
+                    domain=domain,
+                    variables=variables,
+                    parameters=rule_state.parameters,
+                    batch_list=batch_list,
+                    batch_request=batch_request,
+                ):
+                    if not metric_configurations:
+                        continue
+
+                    batch_ids: Tuple[str, ...] = tuple(
+                        resolving_parameter_builder.get_batch_ids(
+                            domain=domain,
+                            variables=variables,
+                            parameters=rule_state.parameters,
+                        )
+                        or []
+                    )
+                    (
+                        _,
+                        _,
+                        group_metric_configurations,
+                    ) = metric_configurations_by_batch_ids.setdefault(
+                        batch_ids, (resolving_parameter_builder, domain, {})
+                    )
+                    for metric_configuration in metric_configurations:
+                        group_metric_configurations.setdefault(
+                            metric_configuration.id, metric_configuration
+                        )
+
+        prefetched_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        for (
+            resolving_parameter_builder,
+            domain,
+            group_metric_configurations,
+        ) in metric_configurations_by_batch_ids.values():
+            prefetched_metrics.update(
+                resolving_parameter_builder.resolve_metrics(
+                    metric_configurations=list(group_metric_configurations.values()),
+                    runtime_configuration=runtime_configuration,
+                    domain=domain,
+                    variables=variables,
+                    parameters=rule_state.parameters,
+                )
+            )
+
+        return prefetched_metrics
+
     @property
     def name(self) -> str:
         return self._name
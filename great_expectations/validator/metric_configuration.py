@@ -3,8 +3,11 @@ from typing import Optional, Tuple
 
 from great_expectations.core._docs_decorators import public_api
 from great_expectations.core.domain import Domain
-from great_expectations.core.id_dict import IDDict
+from great_expectations.core.id_dict import FrozenIDDict, IDDict
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypeSuffixes,
+)
 from great_expectations.core.util import convert_to_json_serializable
 
 
@@ -33,20 +36,23 @@ class MetricConfiguration:
     ) -> None:
         self._metric_name = metric_name
 
-        if not isinstance(metric_domain_kwargs, IDDict):
-            metric_domain_kwargs = IDDict(metric_domain_kwargs)
+        # Metric kwargs become immutable once their IDs are computed, which allows "id" to be computed only once.
+        if not isinstance(metric_domain_kwargs, FrozenIDDict):
+            metric_domain_kwargs = FrozenIDDict(metric_domain_kwargs)
 
-        self._metric_domain_kwargs: IDDict = metric_domain_kwargs
+        self._metric_domain_kwargs: FrozenIDDict = metric_domain_kwargs
 
-        if not isinstance(metric_value_kwargs, IDDict):
+        if not isinstance(metric_value_kwargs, FrozenIDDict):
             if metric_value_kwargs is None:
                 metric_value_kwargs = {}
-            metric_value_kwargs = IDDict(metric_value_kwargs)
+            metric_value_kwargs = FrozenIDDict(metric_value_kwargs)
 
-        self._metric_value_kwargs: IDDict = metric_value_kwargs
+        self._metric_value_kwargs: FrozenIDDict = metric_value_kwargs
 
         self._metric_dependencies: IDDict = IDDict({})
 
+        self._id: Optional[Tuple[str, str, str]] = None
+
     def __repr__(self):
         return json.dumps(self.to_json_dict(), indent=2)
 
@@ -58,11 +64,11 @@ class MetricConfiguration:
         return self._metric_name
 
     @property
-    def metric_domain_kwargs(self) -> IDDict:
+    def metric_domain_kwargs(self) -> FrozenIDDict:
         return self._metric_domain_kwargs
 
     @property
-    def metric_value_kwargs(self) -> IDDict:
+    def metric_value_kwargs(self) -> FrozenIDDict:
         return self._metric_value_kwargs
 
     @property
@@ -87,6 +93,16 @@ class MetricConfiguration:
 
         self._metric_dependencies = metric_dependencies
 
+    @property
+    def is_partial(self) -> bool:
+        """Whether or not this metric evaluates to partial function (e.g., map, condition, or aggregate function).
+
+        Such metrics are deferred computational components (or intermediate results), consumed by other metrics.
+        """
+        return self._metric_name.split(".")[-1] in {
+            suffix.value for suffix in MetricPartialFunctionTypeSuffixes
+        }
+
     def get_domain(self) -> Domain:
         """Return "Domain" object, constructed from this "MetricConfiguration" object."""
         domain_type: MetricDomainTypes = self.get_domain_type()
@@ -151,11 +167,14 @@ class MetricConfiguration:
 
     @property
     def id(self) -> Tuple[str, str, str]:
-        return (
-            self.metric_name,
-            self.metric_domain_kwargs_id,
-            self.metric_value_kwargs_id,
-        )
+        if self._id is None:
+            self._id = (
+                self.metric_name,
+                self.metric_domain_kwargs_id,
+                self.metric_value_kwargs_id,
+            )
+
+        return self._id
 
     @public_api
     def to_json_dict(self) -> dict:
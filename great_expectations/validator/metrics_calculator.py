@@ -8,7 +8,10 @@ import pandas as pd
 from great_expectations.validator.computed_metric import MetricValue  # noqa: TCH001
 from great_expectations.validator.exception_info import ExceptionInfo  # noqa: TCH001
 from great_expectations.validator.metric_configuration import MetricConfiguration
-from great_expectations.validator.validation_graph import ValidationGraph
+from great_expectations.validator.validation_graph import (
+    MetricDependencyGraphBuilder,
+    ValidationGraph,
+)
 
 if TYPE_CHECKING:
     from great_expectations.execution_engine import ExecutionEngine
@@ -172,18 +175,10 @@ class MetricsCalculator:
         Returns:
             Resulting "ValidationGraph" object.
         """
-        graph: ValidationGraph = ValidationGraph(
-            execution_engine=self._execution_engine
-        )
-
-        metric_configuration: MetricConfiguration
-        for metric_configuration in metric_configurations:
-            graph.build_metric_dependency_graph(
-                metric_configuration=metric_configuration,
-                runtime_configuration=runtime_configuration,
-            )
-
-        return graph
+        return MetricDependencyGraphBuilder(
+            execution_engine=self._execution_engine,
+            runtime_configuration=runtime_configuration,
+        ).build_metric_dependency_graph(metric_configurations=metric_configurations)
 
     def resolve_validation_graph_and_handle_aborted_metrics_info(
         self,
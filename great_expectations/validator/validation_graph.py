@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import logging
 import traceback
+from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -44,6 +46,9 @@ class MetricEdge:
     ) -> None:
         self._left = left
         self._right = right
+        self._id: Optional[
+            Tuple[Tuple[str, str, str], Optional[Tuple[str, str, str]]]
+        ] = None
 
     @property
     def left(self):
@@ -55,15 +60,154 @@ class MetricEdge:
 
     @property
     def id(self):
-        if self.right:
-            return self.left.id, self.right.id
+        if self._id is None:
+            if self.right:
+                self._id = self.left.id, self.right.id
+            else:
+                self._id = self.left.id, None
 
-        return self.left.id, None
+        return self._id
 
     def __repr__(self):
         return f"<{self._left.__repr__()}|{self._right.__repr__()}>"
 
 
+class MetricResolutionScheduler:
+    """Incremental topological scheduler of "MetricConfiguration" objects, contained in "MetricEdge" list.
+
+    In-degree counts (numbers of unresolved dependencies) and adjacency lists (dependents of every metric) are built in
+    a single pass over edges.  Afterwards, reporting every batch of newly resolved metrics releases their dependents,
+    whose dependencies have all been met, into the set of ready metrics -- without rescanning the edges of the graph.
+
+    Metrics already present among resolved metrics, supplied at construction time, are neither scheduled nor waited on.
+    Metrics that never become ready (e.g., due to circular dependencies or failed dependencies) remain "needed".
+    """
+
+    def __init__(
+        self,
+        edges: Iterable[MetricEdge],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+    ) -> None:
+        if metrics is None:
+            metrics = {}
+
+        # All unresolved metrics (first "MetricConfiguration" object encountered for every metric ID is retained).
+        self._pending_metrics: Dict[Tuple[str, str, str], MetricConfiguration] = {}
+        # Number of distinct unresolved dependencies of every pending metric.
+        self._num_unmet_dependencies: Dict[Tuple[str, str, str], int] = {}
+        # Adjacency lists: IDs of pending metrics that depend on given metric ID.
+        self._dependents: Dict[
+            Tuple[str, str, str], List[Tuple[str, str, str]]
+        ] = defaultdict(list)
+
+        dependency_edge_ids: Set[
+            Tuple[Tuple[str, str, str], Tuple[str, str, str]]
+        ] = set()
+
+        edge: MetricEdge
+        left_id: Tuple[str, str, str]
+        right_id: Tuple[str, str, str]
+        for edge in edges:
+            left_id = edge.left.id
+            if left_id in metrics:
+                continue
+
+            if left_id not in self._pending_metrics:
+                self._pending_metrics[left_id] = edge.left
+                self._num_unmet_dependencies[left_id] = 0
+
+            if edge.right is None:
+                continue
+
+            right_id = edge.right.id
+            if right_id in metrics or (left_id, right_id) in dependency_edge_ids:
+                continue
+
+            dependency_edge_ids.add((left_id, right_id))
+            self._num_unmet_dependencies[left_id] += 1
+            self._dependents[right_id].append(left_id)
+
+        self._ready_metric_ids: Dict[Tuple[str, str, str], None] = {
+            metric_id: None
+            for metric_id, num_unmet_dependencies in self._num_unmet_dependencies.items()
+            if num_unmet_dependencies == 0
+        }
+
+    @property
+    def ready_metrics(self) -> List[MetricConfiguration]:
+        """Returns unresolved metrics, all of whose dependencies have been resolved (in order of becoming ready)."""
+        return [
+            self._pending_metrics[metric_id] for metric_id in self._ready_metric_ids
+        ]
+
+    @property
+    def needed_metrics(self) -> List[MetricConfiguration]:
+        """Returns unresolved metrics, which are still waiting on at least one of their dependencies to be resolved."""
+        return [
+            metric_configuration
+            for metric_id, metric_configuration in self._pending_metrics.items()
+            if metric_id not in self._ready_metric_ids
+        ]
+
+    @property
+    def num_pending_metrics(self) -> int:
+        """Returns number of unresolved metrics (both ready and still waiting on their dependencies)."""
+        return len(self._pending_metrics)
+
+    def mark_resolved(self, metric_ids: Iterable[Tuple[str, str, str]]) -> None:
+        """Records given metrics as resolved and releases dependents, whose dependencies have thereby all been met.
+
+        Args:
+            metric_ids: IDs of newly resolved metrics (IDs of metrics unknown to this scheduler are ignored)
+        """
+        metric_id: Tuple[str, str, str]
+        dependent_id: Tuple[str, str, str]
+        for metric_id in metric_ids:
+            if self._pending_metrics.pop(metric_id, None) is None:
+                continue
+
+            self._ready_metric_ids.pop(metric_id, None)
+            del self._num_unmet_dependencies[metric_id]
+
+            for dependent_id in self._dependents.pop(metric_id, []):
+                if dependent_id not in self._num_unmet_dependencies:
+                    continue
+
+                self._num_unmet_dependencies[dependent_id] -= 1
+                if self._num_unmet_dependencies[dependent_id] == 0:
+                    self._ready_metric_ids[dependent_id] = None
+
+    def get_levels(self) -> List[List[MetricConfiguration]]:
+        """Plans resolution of pending metrics, assuming that every metric resolves successfully.
+
+        Returns:
+            List of levels; metrics in every level depend only on metrics in preceding levels (or on resolved metrics).
+            Metrics that can never become ready (e.g., those on circular dependency paths) are not included.
+        """
+        num_unmet_dependencies: Dict[Tuple[str, str, str], int] = dict(
+            self._num_unmet_dependencies
+        )
+
+        levels: List[List[MetricConfiguration]] = []
+
+        level: List[Tuple[str, str, str]] = list(self._ready_metric_ids)
+        next_level: List[Tuple[str, str, str]]
+        metric_id: Tuple[str, str, str]
+        dependent_id: Tuple[str, str, str]
+        while level:
+            levels.append([self._pending_metrics[metric_id] for metric_id in level])
+            next_level = []
+            for metric_id in level:
+                for dependent_id in self._dependents.get(metric_id, []):
+                    num_unmet_dependencies[dependent_id] -= 1
+                    if num_unmet_dependencies[dependent_id] == 0:
+                        next_level.append(dependent_id)
+
+            level = next_level
+
+        return levels
+
+
 class ValidationGraph:
     def __init__(
         self,
@@ -79,6 +223,9 @@ class ValidationGraph:
 
         self._edge_ids = {edge.id for edge in self._edges}
 
+        # Metrics requested of this graph (as opposed to those added only as dependencies of other metrics).
+        self._requested_metric_ids: Set[Tuple[str, str, str]] = set()
+
     def __eq__(self, other) -> bool:
         """Supports comparing two "ValidationGraph" objects."""
         return self.edge_ids == other.edge_ids
@@ -93,6 +240,11 @@ class ValidationGraph:
         """Returns "MetricEdge" objects, contained within this "ValidationGraph" object (as set of two-tuples)."""
         return {edge.id for edge in self._edges}
 
+    @property
+    def requested_metric_ids(self) -> Set[Tuple[str, str, str]]:
+        """Returns IDs of metrics, for which this "ValidationGraph" object was built (their dependencies excluded)."""
+        return self._requested_metric_ids
+
     def add(self, edge: MetricEdge) -> None:
         """Adds supplied "MetricEdge" object to this "ValidationGraph" object (if not already present)."""
         if edge.id not in self._edge_ids:
@@ -112,47 +264,16 @@ class ValidationGraph:
             metric_configuration: Desired MetricConfiguration object to be resolved.
             runtime_configuration: Additional run-time settings (see "Validator.DEFAULT_RUNTIME_CONFIGURATION").
         """
-
-        metric_impl_klass: MetricProvider
-        metric_provider: Callable
-        (
-            metric_impl_klass,
-            metric_provider,
-        ) = self.set_metric_configuration_default_kwargs_if_absent(
-            metric_configuration=metric_configuration
-        )
-
-        metric_dependencies = metric_impl_klass.get_evaluation_dependencies(
-            metric=metric_configuration,
+        graph: ValidationGraph = MetricDependencyGraphBuilder(
             execution_engine=self._execution_engine,
             runtime_configuration=runtime_configuration,
-        )
+        ).build_metric_dependency_graph(metric_configurations=[metric_configuration])
 
-        if len(metric_dependencies) == 0:
-            self.add(
-                MetricEdge(
-                    left=metric_configuration,
-                )
-            )
-        else:
-            metric_configuration.metric_dependencies = metric_dependencies
-            for metric_dependency in metric_dependencies.values():
-                # TODO: <Alex>In the future, provide a more robust cycle detection mechanism.</Alex>
-                if metric_dependency.id == metric_configuration.id:
-                    logger.warning(
-                        f"Metric {str(metric_configuration.id)} has created a circular dependency"
-                    )
-                    continue
-                self.add(
-                    MetricEdge(
-                        left=metric_configuration,
-                        right=metric_dependency,
-                    )
-                )
-                self.build_metric_dependency_graph(
-                    metric_configuration=metric_dependency,
-                    runtime_configuration=runtime_configuration,
-                )
+        edge: MetricEdge
+        for edge in graph.edges:
+            self.add(edge=edge)
+
+        self._requested_metric_ids.update(graph.requested_metric_ids)
 
     def set_metric_configuration_default_kwargs_if_absent(
         self, metric_configuration: MetricConfiguration
@@ -178,6 +299,76 @@ class ValidationGraph:
         )
         return metric_impl_klass, metric_provider
 
+    def _get_edges_of_needed_metrics(
+        self, metrics: Dict[Tuple[str, str, str], MetricValue]
+    ) -> List[MetricEdge]:
+        """Omits edges of unresolved partial metrics, which no unresolved metric depends on (directly or transitively).
+
+        Partial metrics (e.g., map conditions) are usually consumed only by other metrics; once all of their dependents
+        have been resolved (e.g., obtained from persistent metric cache), computing them would be wasted effort.  All
+        unresolved non-partial metrics, unresolved requested metrics (including those not depended on by any other
+        metric), and their dependencies are retained.
+
+        Args:
+            metrics: resolved metrics
+
+        Returns:
+            List of "MetricEdge" objects, whose dependent metrics remain needed
+        """
+        metric_configurations: Dict[Tuple[str, str, str], MetricConfiguration] = {}
+        dependencies: Dict[
+            Tuple[str, str, str], List[Tuple[str, str, str]]
+        ] = defaultdict(list)
+
+        dependency_ids: Set[Tuple[str, str, str]] = set()
+
+        edge: MetricEdge
+        for edge in self.edges:
+            metric_configurations.setdefault(edge.left.id, edge.left)
+            if edge.right is not None:
+                dependencies[edge.left.id].append(edge.right.id)
+                dependency_ids.add(edge.right.id)
+
+        metric_ids_to_visit: List[Tuple[str, str, str]] = [
+            metric_id
+            for metric_id, metric_configuration in metric_configurations.items()
+            if metric_id not in metrics
+            and (
+                not metric_configuration.is_partial
+                or metric_id in self._requested_metric_ids
+                or metric_id not in dependency_ids
+            )
+        ]
+        needed_metric_ids: Set[Tuple[str, str, str]] = set()
+
+        metric_id: Tuple[str, str, str]
+        while metric_ids_to_visit:
+            metric_id = metric_ids_to_visit.pop()
+            if metric_id in needed_metric_ids:
+                continue
+
+            needed_metric_ids.add(metric_id)
+            metric_ids_to_visit.extend(
+                dependency_id
+                for dependency_id in dependencies[metric_id]
+                if dependency_id not in metrics
+            )
+
+        return [edge for edge in self.edges if edge.left.id in needed_metric_ids]
+
+    def get_metric_resolution_levels(
+        self, metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None
+    ) -> List[List[MetricConfiguration]]:
+        """Returns planned levels of metric resolution (for inspection); see "MetricResolutionScheduler.get_levels()".
+
+        Args:
+            metrics: already-computed metrics (these are excluded from the plan)
+
+        Returns:
+            List of levels of "MetricConfiguration" objects, each level depending only on preceding levels.
+        """
+        return MetricResolutionScheduler(edges=self.edges, metrics=metrics).get_levels()
+
     def resolve(
         self,
         runtime_configuration: Optional[dict] = None,
@@ -236,8 +427,23 @@ class ValidationGraph:
             Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
         ] = {}
 
-        ready_metrics: Set[MetricConfiguration]
-        needed_metrics: Set[MetricConfiguration]
+        edges: List[MetricEdge] = self.edges
+
+        # Metrics, persisted by prior runs against unchanged data, are reused (their dependencies may become unneeded).
+        persisted_metrics: Dict[
+            Tuple[str, str, str], MetricValue
+        ] = self._execution_engine.get_persisted_metrics(
+            metric_configurations=(edge.left for edge in edges)
+        )
+        if persisted_metrics:
+            metrics.update(persisted_metrics)
+            edges = self._get_edges_of_needed_metrics(metrics=metrics)
+
+        scheduler = MetricResolutionScheduler(edges=edges, metrics=metrics)
+
+        ready_metrics: List[MetricConfiguration]
+        num_needed_metrics: int
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
 
         exception_info: ExceptionInfo
 
@@ -245,7 +451,8 @@ class ValidationGraph:
 
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse(metrics=metrics)
+            ready_metrics = scheduler.ready_metrics
+            num_needed_metrics = scheduler.num_pending_metrics - len(ready_metrics)
 
             # Check to see if the user has disabled progress bars
             disable = not show_progress_bars
@@ -255,7 +462,7 @@ class ValidationGraph:
             if progress_bar is None:
                 # noinspection PyProtectedMember,SpellCheckingInspection
                 progress_bar = tqdm(
-                    total=len(ready_metrics) + len(needed_metrics),
+                    total=len(ready_metrics) + num_needed_metrics,
                     desc="Calculating Metrics",
                     disable=disable,
                 )
@@ -272,13 +479,14 @@ class ValidationGraph:
 
             try:
                 # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.
-                metrics.update(
-                    self._execution_engine.resolve_metrics(
-                        metrics_to_resolve=computable_metrics,
-                        metrics=metrics,
-                        runtime_configuration=runtime_configuration,
-                    )
+                resolved_metrics = self._execution_engine.resolve_metrics(
+                    metrics_to_resolve=computable_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
                 )
+                metrics.update(resolved_metrics)
+                # Releases dependents of newly resolved metrics for computation on next pass.
+                scheduler.mark_resolved(metric_ids=resolved_metrics.keys())
                 progress_bar.update(len(computable_metrics))
                 progress_bar.refresh()
             except gx_exceptions.MetricResolutionError as err:
@@ -313,7 +521,7 @@ class ValidationGraph:
                 else:
                     raise e
 
-            if (len(ready_metrics) + len(needed_metrics) == 0) or (
+            if (len(ready_metrics) + num_needed_metrics == 0) or (
                 len(ready_metrics) == len(aborted_metrics_info)
             ):
                 done = True
@@ -328,23 +536,8 @@ class ValidationGraph:
     ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
         """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
         validation graph (a graph structure of metric ids) edges"""
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in self.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
-
-        return maybe_ready - unmet_dependency, unmet_dependency
+        scheduler = MetricResolutionScheduler(edges=self.edges, metrics=metrics)
+        return set(scheduler.ready_metrics), set(scheduler.needed_metrics)
 
     @staticmethod
     def _set_default_metric_kwargs_if_absent(
@@ -366,6 +559,143 @@ class ValidationGraph:
         return ", ".join([edge.__repr__() for edge in self._edges])
 
 
+class MetricDependencyGraphBuilder:
+    """Builds "ValidationGraph" objects for lists of metrics, expanding dependencies of every distinct metric only once.
+
+    Dependencies of every metric (identified by metric ID) are obtained from its "MetricProvider" upon first encounter
+    and memoized together with corresponding "MetricEdge" objects.  Subsequent encounters of the same metric (e.g.,
+    "table.columns" or "table.row_count", which are shared by many Expectations of a Suite) reuse memoized edges, so
+    graphs built by one builder reference shared "MetricConfiguration" and "MetricEdge" objects instead of duplicates.
+
+    Since metric dependencies can depend on "runtime_configuration", one builder must only be used for one of them.
+    """
+
+    def __init__(
+        self,
+        execution_engine: ExecutionEngine,
+        runtime_configuration: Optional[dict] = None,
+    ) -> None:
+        self._execution_engine = execution_engine
+        self._runtime_configuration = runtime_configuration
+
+        # Expanded metric ("MetricConfiguration" object first encountered) and its direct dependency edges by metric ID.
+        self._expanded_metrics: Dict[
+            Tuple[str, str, str], Tuple[MetricConfiguration, List[MetricEdge]]
+        ] = {}
+
+    def build_metric_dependency_graph(
+        self,
+        metric_configurations: List[MetricConfiguration],
+    ) -> ValidationGraph:
+        """
+        Obtain domain and value keys for metrics and proceeds to add these metrics (and, recursively, their
+        dependencies) to new validation graph, reusing dependencies expanded by earlier calls to this method.
+
+        Args:
+            metric_configurations: List of "MetricConfiguration" objects, for which to build combined "ValidationGraph".
+
+        Returns:
+            Resulting "ValidationGraph" object.
+        """
+        graph = ValidationGraph(execution_engine=self._execution_engine)
+
+        visited_metric_ids: Set[Tuple[str, str, str]] = set()
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            graph.set_metric_configuration_default_kwargs_if_absent(
+                metric_configuration=metric_configuration
+            )
+            graph.requested_metric_ids.add(metric_configuration.id)
+            self._add_metric_dependency_edges(
+                graph=graph,
+                metric_configuration=metric_configuration,
+                visited_metric_ids=visited_metric_ids,
+            )
+
+        return graph
+
+    def _add_metric_dependency_edges(
+        self,
+        graph: ValidationGraph,
+        metric_configuration: MetricConfiguration,
+        visited_metric_ids: Set[Tuple[str, str, str]],
+    ) -> None:
+        # Default metric kwargs must have been set (since metric ID, computed here, freezes them).
+        metric_id: Tuple[str, str, str] = metric_configuration.id
+        if metric_id in visited_metric_ids:
+            return
+
+        visited_metric_ids.add(metric_id)
+
+        edges: List[MetricEdge]
+        if metric_id in self._expanded_metrics:
+            expanded_metric_configuration: MetricConfiguration
+            expanded_metric_configuration, edges = self._expanded_metrics[metric_id]
+            if expanded_metric_configuration is not metric_configuration:
+                metric_configuration.metric_dependencies = (
+                    expanded_metric_configuration.metric_dependencies
+                )
+        else:
+            edges = self._expand_metric(
+                graph=graph, metric_configuration=metric_configuration
+            )
+
+        edge: MetricEdge
+        for edge in edges:
+            graph.add(edge=edge)
+            if edge.right is not None:
+                self._add_metric_dependency_edges(
+                    graph=graph,
+                    metric_configuration=edge.right,
+                    visited_metric_ids=visited_metric_ids,
+                )
+
+    def _expand_metric(
+        self,
+        graph: ValidationGraph,
+        metric_configuration: MetricConfiguration,
+    ) -> List[MetricEdge]:
+        metric_impl_klass: MetricProvider
+        metric_impl_klass, _ = get_metric_provider(
+            metric_name=metric_configuration.metric_name,
+            execution_engine=self._execution_engine,
+        )
+        metric_dependencies = metric_impl_klass.get_evaluation_dependencies(
+            metric=metric_configuration,
+            execution_engine=self._execution_engine,
+            runtime_configuration=self._runtime_configuration,
+        )
+
+        edges: List[MetricEdge]
+        if len(metric_dependencies) == 0:
+            edges = [MetricEdge(left=metric_configuration)]
+        else:
+            metric_configuration.metric_dependencies = metric_dependencies
+            edges = []
+            for metric_dependency in metric_dependencies.values():
+                # Metric kwargs are frozen once metric ID is computed; hence, defaults must be set before this happens.
+                graph.set_metric_configuration_default_kwargs_if_absent(
+                    metric_configuration=metric_dependency
+                )
+                if metric_dependency.id == metric_configuration.id:
+                    logger.warning(
+                        f"Metric {str(metric_configuration.id)} has created a circular dependency"
+                    )
+                    continue
+                edges.append(
+                    MetricEdge(
+                        left=metric_configuration,
+                        right=metric_dependency,
+                    )
+                )
+
+        self._expanded_metrics[metric_configuration.id] = (
+            metric_configuration,
+            edges,
+        )
+        return edges
+
+
 class ExpectationValidationGraph:
     def __init__(
         self,
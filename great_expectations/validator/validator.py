@@ -3,7 +3,6 @@ from __future__ import annotations
 import copy
 import datetime
 import inspect
-import itertools
 import json
 import logging
 import traceback
@@ -68,6 +67,7 @@ from great_expectations.validator.exception_info import ExceptionInfo
 from great_expectations.validator.metrics_calculator import MetricsCalculator
 from great_expectations.validator.validation_graph import (
     ExpectationValidationGraph,
+    MetricDependencyGraphBuilder,
     MetricEdge,
     ValidationGraph,
 )
@@ -1046,7 +1046,8 @@ class Validator:
         result: ExpectationValidationResult
         for configuration in processed_configurations:
             try:
-                runtime_configuration_default = copy.deepcopy(runtime_configuration)
+                # Only top-level keys (e.g., "result_format") are set by "metrics_validate()"; hence, no deep copy.
+                runtime_configuration_default = dict(runtime_configuration)
 
                 result = configuration.metrics_validate(
                     metrics=resolved_metrics,
@@ -1087,6 +1088,11 @@ class Validator:
         evaluated_config: ExpectationConfiguration
         metric_configuration: MetricConfiguration
         graph: ValidationGraph
+        # Shared by all expectations, so that metrics they have in common (and dependencies thereof) are expanded once.
+        graph_builder = MetricDependencyGraphBuilder(
+            execution_engine=self._execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
         for configuration in expectation_configurations:
             # Validating
             try:
@@ -1096,8 +1102,9 @@ class Validator:
             except AssertionError as e:
                 raise InvalidExpectationConfigurationError(str(e))
 
-            evaluated_config = copy.deepcopy(configuration)
-            evaluated_config.kwargs.update({"batch_id": self.active_batch_id})
+            evaluated_config = configuration.copy_with_updated_kwargs(
+                kwargs={"batch_id": self.active_batch_id}
+            )
 
             expectation_impl = get_expectation_impl(evaluated_config.expectation_type)
             validation_dependencies: ValidationDependencies = (
@@ -1111,9 +1118,8 @@ class Validator:
             try:
                 expectation_validation_graph: ExpectationValidationGraph = ExpectationValidationGraph(
                     configuration=evaluated_config,
-                    graph=self._metrics_calculator.build_metric_dependency_graph(
+                    graph=graph_builder.build_metric_dependency_graph(
                         metric_configurations=validation_dependencies.get_metric_configurations(),
-                        runtime_configuration=runtime_configuration,
                     ),
                 )
                 expectation_validation_graphs.append(expectation_validation_graph)
@@ -1141,19 +1147,20 @@ class Validator:
         self,
         expectation_validation_graphs: List[ExpectationValidationGraph],
     ) -> ValidationGraph:
-        # Collect edges from all expectation-level sub-graphs and incorporate them under common suite-level graph.
+        # Collect edges from all expectation-level sub-graphs and incorporate them under common suite-level graph (edges,
+        # shared by several expectation-level sub-graphs, are incorporated only once).
+        validation_graph = ValidationGraph(execution_engine=self._execution_engine)
+
         expectation_validation_graph: ExpectationValidationGraph
-        edges: List[MetricEdge] = list(
-            itertools.chain.from_iterable(
-                [
-                    expectation_validation_graph.graph.edges
-                    for expectation_validation_graph in expectation_validation_graphs
-                ]
+        edge: MetricEdge
+        for expectation_validation_graph in expectation_validation_graphs:
+            for edge in expectation_validation_graph.graph.edges:
+                validation_graph.add(edge=edge)
+
+            validation_graph.requested_metric_ids.update(
+                expectation_validation_graph.graph.requested_metric_ids
             )
-        )
-        validation_graph = ValidationGraph(
-            execution_engine=self._execution_engine, edges=edges
-        )
+
         return validation_graph
 
     def _resolve_suite_level_graph_and_process_metric_evaluation_errors(
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pandas as pd
 import pytest
 
@@ -10,7 +13,10 @@ from great_expectations.core.batch import (
     IDDict,
 )
 from great_expectations.core.batch_spec import RuntimeDataBatchSpec
-from great_expectations.core.id_dict import deep_convert_properties_iterable_to_id_dict
+from great_expectations.core.id_dict import (
+    FrozenIDDict,
+    deep_convert_properties_iterable_to_id_dict,
+)
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.exceptions import InvalidBatchSpecError
 
@@ -96,6 +102,78 @@ def test_iddict_is_hashable():
         assert False, "IDDict.__hash__() failed."
 
 
+@pytest.mark.unit
+def test_frozen_id_dict_computes_id_once_and_matches_id_dict(mocker):
+    data: dict = {"column": "a", "batch_id": "1234", "row_condition": None}
+    frozen_id_dict = FrozenIDDict(data)
+
+    assert not frozen_id_dict.is_frozen
+
+    to_id_spy = mocker.spy(IDDict, "to_id")
+    for _ in range(3):
+        assert frozen_id_dict.to_id() == IDDict(data).to_id()
+        assert hash(frozen_id_dict) == hash(IDDict(data))
+
+    assert frozen_id_dict.is_frozen
+    # One computation for FrozenIDDict, plus one for each of the six transient IDDict objects used for comparison.
+    assert to_id_spy.call_count == 7
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        pytest.param(lambda d: d.__setitem__("column", "b"), id="setitem"),
+        pytest.param(lambda d: d.__delitem__("column"), id="delitem"),
+        pytest.param(lambda d: d.update({"column": "b"}), id="update"),
+        pytest.param(lambda d: d.__ior__({"column": "b"}), id="ior"),
+        pytest.param(lambda d: d.setdefault("new_key", 1), id="setdefault"),
+        pytest.param(lambda d: d.pop("column"), id="pop"),
+        pytest.param(lambda d: d.popitem(), id="popitem"),
+        pytest.param(lambda d: d.clear(), id="clear"),
+    ],
+)
+def test_frozen_id_dict_detects_mutation_after_id_computed(mutate):
+    frozen_id_dict = FrozenIDDict({"column": "a", "batch_id": "1234"})
+
+    # Mutation is allowed until the ID is first computed.
+    frozen_id_dict["mostly"] = 0.9
+
+    original_id = frozen_id_dict.to_id()
+
+    with pytest.raises(TypeError):
+        mutate(frozen_id_dict)
+
+    assert frozen_id_dict == {"column": "a", "batch_id": "1234", "mostly": 0.9}
+    assert frozen_id_dict.to_id() == original_id
+
+
+@pytest.mark.unit
+def test_frozen_id_dict_copies_are_not_frozen():
+    frozen_id_dict = FrozenIDDict({"column": "a", "value_set": [1, 2]})
+    frozen_id_dict.to_id()
+
+    for frozen_id_dict_copy in [
+        copy.copy(frozen_id_dict),
+        copy.deepcopy(frozen_id_dict),
+        pickle.loads(pickle.dumps(frozen_id_dict)),
+    ]:
+        assert isinstance(frozen_id_dict_copy, FrozenIDDict)
+        assert frozen_id_dict_copy == frozen_id_dict
+        assert not frozen_id_dict_copy.is_frozen
+        frozen_id_dict_copy["column"] = "b"
+        assert frozen_id_dict_copy.to_id() != frozen_id_dict.to_id()
+
+
+@pytest.mark.unit
+def test_frozen_id_dict_in_place_union_before_id_computed():
+    frozen_id_dict = FrozenIDDict({"column": "a"})
+    frozen_id_dict |= {"batch_id": "1234"}
+
+    assert isinstance(frozen_id_dict, FrozenIDDict)
+    assert frozen_id_dict == {"column": "a", "batch_id": "1234"}
+
+
 @pytest.mark.unit
 def test_batch_definition_id():
     # noinspection PyUnusedLocal,PyPep8Naming
@@ -1,17 +1,21 @@
+import threading
 from contextlib import contextmanager
 from unittest import mock
 
 import pytest
 
+import great_expectations.exceptions as gx_exceptions
 from great_expectations.core.config_substitutor import (
     _ConfigurationSubstitutor,
+    _SecretStoreCache,
     secretmanager,
 )
 
 
 @pytest.fixture
 def config_substitutor() -> _ConfigurationSubstitutor:
-    return _ConfigurationSubstitutor()
+    # Each test uses its own secret cache, so that mocked secrets (and clients) do not leak between tests.
+    return _ConfigurationSubstitutor(secret_store_cache=_SecretStoreCache())
 
 
 @contextmanager
@@ -235,3 +239,216 @@ def test_substitute_value_from_azure_keyvault(
                 )
                 == expected
             )
+
+
+class CountingBoto3Session:
+    """Mocked boto3 Session, counting created clients and fetched secrets (by secret name)."""
+
+    def __init__(self, secret_strings):
+        self.secret_strings = secret_strings
+        self.num_clients = 0
+        self.fetched_secret_ids = []
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        return self
+
+    def client(self, *args, **kwargs):
+        with self._lock:
+            self.num_clients += 1
+
+        session = self
+
+        class Client:
+            def get_secret_value(self, SecretId, **kwargs):
+                with session._lock:
+                    session.fetched_secret_ids.append(SecretId)
+                return {"SecretString": session.secret_strings[SecretId]}
+
+        return Client()
+
+
+@pytest.mark.unit
+def test_substitute_all_config_variables_fetches_each_secret_once(config_substitutor):
+    arn = "secret|arn:aws:secretsmanager:region-name-1:123456789012:secret"
+    session = CountingBoto3Session(
+        secret_strings={
+            "my-credentials": '{"user": "my_user", "password": "my_password"}',
+            "my-token": "my_token",
+            "my-other-token": "my_other_token",
+        }
+    )
+    config = {
+        "connection": {
+            "user": f"{arn}:my-credentials|user",
+            "password": f"{arn}:my-credentials|password",
+            "token": "${TOKEN}",
+        },
+        "other_connections": [
+            {"token": f"{arn}:my-other-token"},
+            {"token": f"{arn}:my-other-token", "port": 5432},
+        ],
+        "name": "not_a_secret",
+    }
+
+    with mock.patch(
+        "great_expectations.core.config_substitutor.boto3.session.Session",
+        return_value=session,
+    ):
+        for _ in range(3):
+            assert config_substitutor.substitute_all_config_variables(
+                config, {"TOKEN": f"{arn}:my-token"}
+            ) == {
+                "connection": {
+                    "user": "my_user",
+                    "password": "my_password",
+                    "token": "my_token",
+                },
+                "other_connections": [
+                    {"token": "my_other_token"},
+                    {"token": "my_other_token", "port": 5432},
+                ],
+                "name": "not_a_secret",
+            }
+
+    assert sorted(session.fetched_secret_ids) == [
+        "my-credentials",
+        "my-other-token",
+        "my-token",
+    ]
+    assert session.num_clients == 1
+
+
+@pytest.mark.unit
+def test_substitute_config_variable_refetches_secret_after_ttl_expires():
+    secret_reference = (
+        "secret|arn:aws:secretsmanager:region-name-1:123456789012:secret:my-secret"
+    )
+    session = CountingBoto3Session(secret_strings={"my-secret": "value"})
+    secret_store_cache = _SecretStoreCache(ttl_seconds=60)
+    config_substitutor = _ConfigurationSubstitutor(
+        secret_store_cache=secret_store_cache
+    )
+
+    clock = {"now": 0.0}
+    with mock.patch(
+        "great_expectations.core.config_substitutor.boto3.session.Session",
+        return_value=session,
+    ), mock.patch(
+        "great_expectations.core.config_substitutor.time.monotonic",
+        side_effect=lambda: clock["now"],
+    ):
+        assert (
+            config_substitutor.substitute_config_variable(secret_reference, {})
+            == "value"
+        )
+        session.secret_strings["my-secret"] = "rotated_value"
+
+        clock["now"] = 30.0
+        assert (
+            config_substitutor.substitute_config_variable(secret_reference, {})
+            == "value"
+        )
+
+        clock["now"] = 90.0
+        assert (
+            config_substitutor.substitute_config_variable(secret_reference, {})
+            == "rotated_value"
+        )
+
+    assert session.fetched_secret_ids == ["my-secret", "my-secret"]
+    assert session.num_clients == 1
+
+
+@pytest.mark.unit
+def test_substitute_all_config_variables_raises_for_first_failing_secret(
+    config_substitutor,
+):
+    arn = "secret|arn:aws:secretsmanager:region-name-1:123456789012:secret"
+    session = CountingBoto3Session(secret_strings={"my-secret": "value"})
+
+    with mock.patch(
+        "great_expectations.core.config_substitutor.boto3.session.Session",
+        return_value=session,
+    ):
+        with pytest.raises(KeyError, match="my-missing-secret"):
+            config_substitutor.substitute_all_config_variables(
+                {
+                    "present": f"{arn}:my-secret",
+                    "missing": f"{arn}:my-missing-secret",
+                },
+                {},
+            )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "ttl_seconds,expected_fetched_secret_ids",
+    [
+        pytest.param("60", ["my-secret"], id="cached"),
+        pytest.param("0", ["my-secret", "my-secret"], id="caching_disabled"),
+    ],
+)
+def test_secret_cache_ttl_is_read_from_environment_variable(
+    config_substitutor, monkeypatch, ttl_seconds, expected_fetched_secret_ids
+):
+    secret_reference = (
+        "secret|arn:aws:secretsmanager:region-name-1:123456789012:secret:my-secret"
+    )
+    session = CountingBoto3Session(secret_strings={"my-secret": "value"})
+    monkeypatch.setenv("GX_SECRET_CACHE_TTL_SECONDS", ttl_seconds)
+
+    with mock.patch(
+        "great_expectations.core.config_substitutor.boto3.session.Session",
+        return_value=session,
+    ):
+        for _ in range(2):
+            assert (
+                config_substitutor.substitute_config_variable(secret_reference, {})
+                == "value"
+            )
+
+    assert session.fetched_secret_ids == expected_fetched_secret_ids
+
+
+@pytest.mark.unit
+def test_secret_cache_ttl_environment_variable_must_be_number(monkeypatch):
+    monkeypatch.setenv("GX_SECRET_CACHE_TTL_SECONDS", "five minutes")
+
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        _SecretStoreCache().get_secret("my-secret", lambda: "value")
+
+
+@pytest.mark.unit
+def test_secret_cache_prunes_expired_secrets_and_their_locks():
+    secret_store_cache = _SecretStoreCache(ttl_seconds=60)
+
+    def _fetch_missing_secret() -> str:
+        raise KeyError("my-failing-secret")
+
+    clock = {"now": 0.0}
+    with mock.patch(
+        "great_expectations.core.config_substitutor.time.monotonic",
+        side_effect=lambda: clock["now"],
+    ):
+        assert secret_store_cache.get_secret("my-secret", lambda: "value") == "value"
+        with pytest.raises(KeyError):
+            secret_store_cache.get_secret("my-failing-secret", _fetch_missing_secret)
+        assert set(secret_store_cache._secret_locks) == {
+            "my-secret",
+            "my-failing-secret",
+        }
+
+        clock["now"] = 30.0
+        secret_store_cache.get_secret("my-other-secret", lambda: "other_value")
+        assert set(secret_store_cache._secrets) == {"my-secret", "my-other-secret"}
+        assert set(secret_store_cache._secret_locks) == {
+            "my-secret",
+            "my-other-secret",
+        }
+
+        clock["now"] = 90.0
+        secret_store_cache.get_secret("my-other-secret", lambda: "other_value")
+        assert set(secret_store_cache._secrets) == {"my-other-secret"}
+        assert set(secret_store_cache._secret_locks) == {"my-other-secret"}
+        assert not secret_store_cache._num_secret_lock_users
@@ -1,4 +1,7 @@
+import json
+
 import numpy as np
+import pandas as pd
 import pytest
 
 from great_expectations.core.util import convert_to_json_serializable
@@ -53,3 +56,57 @@ def test_serialization_numpy_datetime():
     datetime_to_test = "2022-12-08T12:56:23.423"
     data = np.datetime64(datetime_to_test)
     assert convert_to_json_serializable(data) == datetime_to_test
+
+
+def test_serialization_of_numpy_arrays():
+    assert convert_to_json_serializable(np.array([1, 2, 3])) == [1, 2, 3]
+    assert convert_to_json_serializable(np.array([[1.5, np.nan], [np.inf, 0.0]])) == [
+        [1.5, None],
+        [np.inf, 0.0],
+    ]
+    assert convert_to_json_serializable(
+        np.array(
+            ["2022-12-08T12:56:23", "2022-12-08T12:56:23.423", "NaT"],
+            dtype="datetime64[ms]",
+        )
+    ) == ["2022-12-08T12:56:23", "2022-12-08T12:56:23.423000", None]
+    assert convert_to_json_serializable(np.array([1, "a", np.nan], dtype=object)) == [
+        1,
+        "a",
+        None,
+    ]
+
+
+def test_serialization_of_pandas_objects():
+    assert convert_to_json_serializable(
+        pd.Series([1.5, np.nan], index=pd.Index(["a", "b"], name="key"), name="val")
+    ) == [{"key": "a", "val": 1.5}, {"key": "b", "val": None}]
+    assert convert_to_json_serializable(
+        pd.DataFrame(
+            {
+                "a": [1, 2],
+                "b": [0.5, np.nan],
+                3: pd.to_datetime(["2022-12-08", None]),
+                "d": ["x", None],
+            }
+        )
+    ) == [
+        {"a": 1, "b": 0.5, "3": "2022-12-08T00:00:00", "d": "x"},
+        {"a": 2, "b": None, "3": "NaT", "d": None},
+    ]
+
+
+@pytest.mark.skipif(
+    np.dtype(np.longdouble).itemsize <= 8,
+    reason="Requires extended precision numpy.longdouble",
+)
+def test_serialization_of_longdouble_arrays():
+    data = np.array([1.5, 2.25], dtype=np.longdouble)
+
+    # Elements are converted one by one into Python "float" values, which "json.dumps()" accepts.
+    converted = convert_to_json_serializable(data)
+    assert converted == [1.5, 2.25]
+    assert [type(val) for val in converted] == [float, float]
+    assert json.dumps(convert_to_json_serializable(pd.Series(data))) == (
+        '[{"index": 0, "value": 1.5}, {"index": 1, "value": 2.25}]'
+    )
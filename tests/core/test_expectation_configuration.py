@@ -1,6 +1,9 @@
 import pytest
 
-from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.expectation_configuration import (
+    ExpectationConfiguration,
+    parse_result_format,
+)
 
 
 @pytest.fixture
@@ -197,3 +200,29 @@ def test_expectation_configuration_patch(config4, config5, config6, config7):
 
     with pytest.raises(ValueError):
         config5.patch("add", "/foo/-", 4)
+
+
+@pytest.mark.unit
+def test_expectation_configuration_copy_with_updated_kwargs(config1):
+    updated_config = config1.copy_with_updated_kwargs(kwargs={"batch_id": "my_batch"})
+
+    assert updated_config.kwargs == {**config1.kwargs, "batch_id": "my_batch"}
+    assert updated_config.meta == config1.meta
+    # Original configuration is left unchanged, but (potentially large) kwarg values are shared rather than copied.
+    assert "batch_id" not in config1.kwargs
+    assert updated_config.kwargs["value_set"] is config1.kwargs["value_set"]
+
+    updated_config.meta["notes"] = "This is an updated expectation."
+    assert config1.meta == {"notes": "This is an expectation."}
+
+
+@pytest.mark.unit
+def test_parse_result_format_does_not_modify_given_result_format():
+    result_format = {"result_format": "SUMMARY"}
+
+    assert parse_result_format(result_format=result_format) == {
+        "result_format": "SUMMARY",
+        "partial_unexpected_count": 20,
+        "include_unexpected_rows": False,
+    }
+    assert result_format == {"result_format": "SUMMARY"}
@@ -1,4 +1,5 @@
 from copy import deepcopy
+from typing import List
 from unittest import mock
 
 import pytest
@@ -489,6 +490,138 @@ def test_patch_expectation_remove(exp5, exp8, domain_success_runtime_suite):
     )
 
 
+def _find_expectation_indexes_by_scanning(
+    suite: ExpectationSuite,
+    expectation_configuration: ExpectationConfiguration,
+    match_type: str,
+) -> List[int]:
+    return [
+        idx
+        for idx, expectation in enumerate(suite.expectations)
+        if expectation.isEquivalentTo(
+            other=expectation_configuration, match_type=match_type
+        )
+    ]
+
+
+@pytest.mark.unit
+def test_find_expectation_indexes_stays_consistent_through_crud_methods(
+    exp1, exp2, exp4, exp5, table_exp2, column_pair_expectation
+):
+    suite = ExpectationSuite(
+        expectation_suite_name="warning",
+        expectations=[exp1, exp2, table_exp2, column_pair_expectation],
+    )
+    queries: List[ExpectationConfiguration] = [
+        exp1,
+        exp2,
+        exp4,
+        exp5,
+        table_exp2,
+        column_pair_expectation,
+    ]
+
+    def _assert_consistent() -> None:
+        for query in queries:
+            for match_type in ["domain", "success", "runtime"]:
+                assert suite.find_expectation_indexes(
+                    expectation_configuration=query, match_type=match_type
+                ) == _find_expectation_indexes_by_scanning(
+                    suite=suite,
+                    expectation_configuration=query,
+                    match_type=match_type,
+                )
+
+    _assert_consistent()
+    assert suite.find_expectation_indexes(exp4) == [1]
+
+    # Upserting Expectation with same domain replaces it.
+    suite.add_expectation(exp5, send_usage_event=False)
+    assert suite.expectations[1] is exp5
+    _assert_consistent()
+
+    # Patching domain kwargs moves Expectation to another domain.
+    suite.patch_expectation(
+        exp5, op="replace", path="/column", value="c", match_type="runtime"
+    )
+    assert suite.find_expectation_indexes(exp4) == []
+    _assert_consistent()
+
+    suite.remove_expectation(exp1)
+    _assert_consistent()
+
+    suite.replace_expectation(
+        new_expectation_configuration=exp1,
+        existing_expectation_configuration=table_exp2,
+    )
+    _assert_consistent()
+
+    # Modifications of "expectations" list, made directly, are reflected as well.
+    suite.expectations.append(exp2)
+    _assert_consistent()
+    suite.expectations[-1] = exp4
+    _assert_consistent()
+    suite.expectations.pop(0)
+    _assert_consistent()
+    suite.expectations += [exp1]
+    _assert_consistent()
+    suite.expectations *= 2
+    _assert_consistent()
+    suite.expectations *= 0
+    _assert_consistent()
+    suite.expectations = [table_exp2]
+    _assert_consistent()
+    assert suite.find_expectation_indexes(table_exp2) == [0]
+
+
+@pytest.mark.unit
+def test_find_expectation_indexes_by_ge_cloud_id_assigned_after_adding(exp1, exp2):
+    suite = ExpectationSuite(expectation_suite_name="warning")
+    suite.add_expectation_configurations(
+        expectation_configurations=[exp1, exp2], send_usage_event=False
+    )
+    assert suite.find_expectation_indexes(ge_cloud_id="some_id") == []
+
+    exp2.ge_cloud_id = "some_id"
+    assert suite.find_expectation_indexes(ge_cloud_id="some_id") == [1]
+
+
+@pytest.mark.unit
+def test_find_expectation_indexes_after_expectation_is_modified_in_place(exp1):
+    suite = ExpectationSuite(expectation_suite_name="warning")
+    suite.add_expectation(exp1, send_usage_event=False)
+    assert suite.find_expectation_indexes(exp1) == [0]
+
+    suite.expectations[0].kwargs["column"] = "b"
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "b", "value_set": [1, 2, 3], "mostly": 0.5},
+    )
+    assert suite.find_expectation_indexes(expectation_configuration) == [0]
+
+    # Upserting Expectation with (modified) domain replaces, rather than duplicates, it.
+    suite.add_expectation(expectation_configuration, send_usage_event=False)
+    assert len(suite.expectations) == 1
+    assert suite.expectations[0] is expectation_configuration
+
+    suite.expectations[0].kwargs["column"] = "c"
+    suite.add_expectation_configurations(
+        expectation_configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={"column": "c", "value_set": [1, 2, 3], "mostly": 0.5},
+            )
+        ],
+        send_usage_event=False,
+    )
+    assert len(suite.expectations) == 1
+
+    for expectation in suite.expectations:
+        expectation.kwargs["column"] = "d"
+    expectation_configuration.kwargs["column"] = "d"
+    assert suite.find_expectation_indexes(expectation_configuration) == [0]
+
+
 def test_add_expectation_configurations(
     exp1,
     exp2,
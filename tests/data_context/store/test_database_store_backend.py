@@ -1,12 +1,13 @@
 import logging
 import os
+from unittest import mock
 
 import pytest
 
 import tests.test_utils as test_utils
 from great_expectations.data_context.store import DatabaseStoreBackend
 from great_expectations.data_context.util import instantiate_class_from_config
-from great_expectations.exceptions import StoreBackendError
+from great_expectations.exceptions import StoreBackendError, StoreError
 
 pytestmark = pytest.mark.sqlalchemy_version_compatibility
 
@@ -220,3 +221,80 @@ def test_database_store_backend_id_initialization(caplog, sa, test_backends):
         expectations_store_with_database_backend.store_backend_id
         == "00000000-0000-0000-0000-000000aaaaaa"
     )
+
+
+@pytest.mark.integration
+def test_database_store_backend_get_many_and_set_many(sa):
+    # Use sqlite so we don't require postgres for this test.
+    store_backend = DatabaseStoreBackend(
+        url="sqlite://",
+        table_name="test_database_store_backend_get_many_and_set_many",
+        key_columns=["k1", "k2"],
+    )
+    # small chunks ensure that bulk operations span several statements
+    store_backend.BULK_OPERATION_MAX_PARAMETERS = 6
+
+    key_value_pairs = [((f"a{idx}", f"b{idx}"), f"value_{idx}") for idx in range(7)]
+    store_backend.set_many(key_value_pairs)
+    assert set(store_backend.list_keys()) == {key for key, _ in key_value_pairs}
+
+    keys = [key for key, _ in reversed(key_value_pairs)]
+    assert store_backend.get_many(keys) == [
+        value for _, value in reversed(key_value_pairs)
+    ]
+
+    # existing keys are updated (by native upsert of dialect or by UPDATE statements), and new keys are inserted
+    updated_key_value_pairs = [
+        (("a0", "b0"), "updated_value_0"),
+        (("a7", "b7"), "value_7"),
+        (("a0", "b0"), "updated_again_value_0"),
+    ]
+    store_backend.set_many(updated_key_value_pairs)
+    with mock.patch.object(store_backend, "_get_upsert_statement", return_value=None):
+        store_backend.set_many([(("a1", "b1"), "updated_value_1")])
+
+    assert store_backend.get_many([("a0", "b0"), ("a1", "b1"), ("a7", "b7")]) == [
+        "updated_again_value_0",
+        "updated_value_1",
+        "value_7",
+    ]
+    assert len(store_backend.list_keys()) == 8
+
+    # without "allow_update", storing identical values is tolerated, and storing different ones fails
+    store_backend.set_many([(("a7", "b7"), "value_7")], allow_update=False)
+    with pytest.raises(StoreBackendError):
+        store_backend.set_many(
+            [(("a8", "b8"), "value_8"), (("a7", "b7"), "value_other")],
+            allow_update=False,
+        )
+
+    with pytest.raises(StoreError):
+        store_backend.get_many([("a0", "b0"), ("not", "here")])
+
+
+@pytest.mark.integration
+def test_database_store_backend_get_many_matches_keys_as_database_does(sa, tmp_path):
+    # Keys, matched by database differently from Python (here, under case-insensitive collation), are still found.
+    url = f"sqlite:///{tmp_path / 'store.db'}"
+    with sa.create_engine(url).begin() as connection:
+        connection.execute(
+            sa.text(
+                "CREATE TABLE case_insensitive_keys (k1 VARCHAR COLLATE NOCASE NOT NULL, "
+                "k2 VARCHAR COLLATE NOCASE NOT NULL, value VARCHAR, PRIMARY KEY (k1, k2))"
+            )
+        )
+
+    store_backend = DatabaseStoreBackend(
+        url=url,
+        table_name="case_insensitive_keys",
+        key_columns=["k1", "k2"],
+    )
+    store_backend.set_many([(("A0", "b0"), "value_0"), (("a1", "b1"), "value_1")])
+
+    assert store_backend.get_many([("a0", "B0"), ("a1", "b1")]) == [
+        "value_0",
+        "value_1",
+    ]
+
+    with pytest.raises(StoreError):
+        store_backend.get_many([("a0", "b0"), ("not", "here")])
@@ -28,6 +28,7 @@ from great_expectations.data_context.store import (
 from great_expectations.data_context.store.inline_store_backend import (
     InlineStoreBackend,
 )
+from great_expectations.data_context.store.tuple_store_backend import _ObjectReadCache
 from great_expectations.data_context.types.base import DataContextConfig
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
@@ -1654,3 +1655,65 @@ def test_store_backend_path_special_character_escape():
         escaped_path
         == "/validations/default/pandas_data_asset/20230315T205136.109084Z/default_pandas_datasource-%23ephemeral_pandas_asset.html"
     )
+
+
+@mock_s3
+@pytest.mark.integration
+def test_TupleS3StoreBackend_get_many_with_read_cache():
+    bucket = "leakybucket"
+    prefix = "this_is_a_test_prefix"
+    conn = boto3.client("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}",
+        bucket=bucket,
+        prefix=prefix,
+        max_concurrent_reads=4,
+        cache_reads=True,
+    )
+    keys = [(f"key_{idx}",) for idx in range(10)]
+    for idx, key in enumerate(keys):
+        my_store.set(key, f"value_{idx}")
+
+    # values are returned in order of keys, even though objects are read concurrently
+    assert my_store.get_many(keys) == [f"value_{idx}" for idx in range(10)]
+
+    # only the object, which has changed since it was read, is downloaded again
+    conn.put_object(Bucket=bucket, Key=f"{prefix}/my_file_key_3", Body=b"changed")
+    with mock.patch.object(
+        my_store._read_cache, "set", wraps=my_store._read_cache.set
+    ) as mock_read_cache_set:
+        values = my_store.get_many(keys)
+
+    assert values[3] == "changed"
+    assert values[:3] + values[4:] == [f"value_{idx}" for idx in range(10) if idx != 3]
+    assert mock_read_cache_set.call_count == 1
+
+    # objects, stored through the backend, are not served from cache
+    my_store.set(keys[0], "updated")
+    assert my_store.get(keys[0]) == "updated"
+
+    with pytest.raises(InvalidKeyError):
+        my_store.get_many([keys[0], ("not_here",)])
+
+
+@pytest.mark.unit
+def test_object_read_cache_evicts_least_recently_used_objects():
+    read_cache = _ObjectReadCache(max_size=10)
+    read_cache.set(object_key="a", version="1", value="aaaa")
+    read_cache.set(object_key="b", version="1", value="bbbb")
+    assert read_cache.get(object_key="a") == ("1", "aaaa")
+
+    # "b" is the least recently used object, so it is evicted to make room for "c"
+    read_cache.set(object_key="c", version="1", value="cccc")
+    assert read_cache.get(object_key="b") is None
+    assert read_cache.get(object_key="a") == ("1", "aaaa")
+
+    # objects larger than the cache are not cached at all
+    read_cache.set(object_key="d", version="1", value="d" * 11)
+    assert read_cache.get(object_key="d") is None
+
+    read_cache.invalidate(object_key="a")
+    assert read_cache.get(object_key="a") is None
+    assert read_cache.get(object_key="c") == ("1", "cccc")
@@ -1,3 +1,4 @@
+import base64
 import datetime
 from unittest import mock
 
@@ -6,16 +7,27 @@ import pytest
 from freezegun import freeze_time
 from moto import mock_s3
 
+import great_expectations.exceptions as gx_exceptions
 import tests.test_utils as test_utils
 from great_expectations.core import ExpectationSuiteValidationResult
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
+    ExpectationSuiteValidationResultSchema,
+    ExpectationValidationResult,
 )
 from great_expectations.data_context.store import ValidationsStore
+from great_expectations.data_context.store.compact_validation_result_codec import (
+    CompactValidationResultCodec,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
 )
+from great_expectations.optional_imports import (
+    MSGPACK_NOT_IMPORTED,
+    msgpack,
+    zstandard,
+)
 from great_expectations.util import gen_directory_tree_str
 from tests.core.usage_statistics.util import (
     usage_stats_exceptions_exist,
@@ -252,6 +264,150 @@ def test_ValidationsStore_with_TupleFileSystemStoreBackend(tmp_path_factory):
     assert my_store.store_backend_id == my_store_duplicate.store_backend_id
 
 
+@pytest.mark.integration
+def test_ValidationsStore_with_compact_serialization(tmp_path_factory):
+    path = str(
+        tmp_path_factory.mktemp("test_ValidationsStore_with_compact_serialization__dir")
+    )
+    store_backend_config: dict = {
+        "module_name": "great_expectations.data_context.store",
+        "class_name": "TupleFilesystemStoreBackend",
+        "base_directory": "my_store/",
+    }
+
+    json_store = ValidationsStore(
+        store_backend=dict(store_backend_config),
+        runtime_environment={"root_directory": path},
+    )
+    compact_store = ValidationsStore(
+        store_backend=dict(store_backend_config),
+        runtime_environment={"root_directory": path},
+        compact_serialization={"encoding": "json", "compression": "gzip"},
+    )
+    assert compact_store.config["compact_serialization"] == {
+        "encoding": "json",
+        "compression": "gzip",
+    }
+
+    validation_result = ExpectationSuiteValidationResult(
+        success=False,
+        statistics={"evaluated_expectations": 1, "successful_expectations": 0},
+        results=[
+            ExpectationValidationResult(
+                success=False, result={"unexpected_list": list(range(100))}
+            )
+        ],
+        meta={"run_id": "prod-100"},
+    )
+
+    ns_1 = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+        run_id="prod-100",
+        batch_identifier="batch_id_1",
+    )
+    ns_2 = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+        run_id="prod-100",
+        batch_identifier="batch_id_2",
+    )
+    compact_store.set(ns_1, validation_result)
+    json_store.set(ns_2, validation_result)
+
+    # Compact Validation Results are not stored under ".json" file path suffix.
+    assert compact_store.store_backend.filepath_suffix == ".gxvr"
+    assert compact_store.list_keys() == [ns_1]
+    assert json_store.list_keys() == [ns_2]
+
+    serialized_value: str = compact_store.store_backend.get(
+        compact_store.key_to_tuple(ns_1)
+    )
+    assert CompactValidationResultCodec.is_encoded(serialized_value)
+    assert len(serialized_value) < len(json_store.serialize(validation_result))
+    assert compact_store.get(ns_1) == validation_result
+
+    # Both formats are readable regardless of how the store is configured.
+    mixed_store = ValidationsStore(
+        store_backend={**store_backend_config, "filepath_suffix": ".json"},
+        runtime_environment={"root_directory": path},
+        compact_serialization={"encoding": "json", "compression": "gzip"},
+    )
+    mixed_store.set(ns_1, validation_result)
+    for store in (json_store, mixed_store):
+        assert store.get(ns_1) == validation_result
+        assert store.get(ns_2) == validation_result
+
+    summaries = mixed_store.get_summaries([ns_1, ns_2])
+    expected_summary = ExpectationSuiteValidationResult(
+        success=False,
+        statistics={"evaluated_expectations": 1, "successful_expectations": 0},
+        results=[],
+        meta={"run_id": "prod-100"},
+    )
+    assert summaries == [expected_summary, expected_summary]
+
+    with mock.patch.object(
+        ExpectationSuiteValidationResultSchema,
+        "load",
+        wraps=compact_store._expectationSuiteValidationResultSchema.load,
+    ) as mock_load:
+        compact_store.get_summaries([ns_1])
+    assert mock_load.call_args[0][0]["results"] == []
+
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        ValidationsStore(
+            store_backend=dict(store_backend_config),
+            runtime_environment={"root_directory": path},
+            compact_serialization={"encoding": "yaml"},
+        )
+
+
+@pytest.mark.unit
+def test_ValidationsStore_compact_serialization_with_missing_dependency():
+    my_store = ValidationsStore(
+        store_backend={
+            "module_name": "great_expectations.data_context.store",
+            "class_name": "InMemoryStoreBackend",
+        },
+    )
+    serialized_value = "\n".join(
+        (
+            "GXVR/1 encoding=msgpack compression=none",
+            base64.b64encode(b"\x80").decode("ascii"),
+            base64.b64encode(b"\x90").decode("ascii"),
+        )
+    )
+
+    with mock.patch(
+        "great_expectations.data_context.store.compact_validation_result_codec.msgpack",
+        MSGPACK_NOT_IMPORTED,
+    ), pytest.raises(gx_exceptions.StoreError):
+        my_store.deserialize(serialized_value)
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(
+    not (msgpack and zstandard),
+    reason="requires msgpack and zstandard",
+)
+def test_ValidationsStore_with_msgpack_zstd_compact_serialization():
+    my_store = ValidationsStore(
+        store_backend={
+            "module_name": "great_expectations.data_context.store",
+            "class_name": "InMemoryStoreBackend",
+        },
+        compact_serialization={"encoding": "msgpack", "compression": "zstd"},
+    )
+    ns_1 = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+        run_id="prod-100",
+        batch_identifier="batch_id",
+    )
+    my_store.set(ns_1, ExpectationSuiteValidationResult(success=True))
+    assert my_store.get(ns_1) == ExpectationSuiteValidationResult(
+        success=True, statistics={}, results=[]
+    )
+
+
 @pytest.mark.filterwarnings(
     "ignore:String run_ids are deprecated*:DeprecationWarning:great_expectations.data_context.types.resource_identifiers"
 )
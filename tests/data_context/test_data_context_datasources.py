@@ -3,6 +3,7 @@ from unittest import mock
 
 import pytest
 
+import great_expectations.exceptions as gx_exceptions
 from great_expectations.data_context.data_context.data_context import DataContext
 from great_expectations.data_context.data_context.ephemeral_data_context import (
     EphemeralDataContext,
@@ -17,6 +18,7 @@ from great_expectations.data_context.types.base import (
     DataContextConfig,
     DatasourceConfig,
     GXCloudConfig,
+    InMemoryStoreBackendDefaults,
 )
 from great_expectations.datasource import Datasource
 from great_expectations.util import get_context
@@ -427,3 +429,139 @@ def test_BaseDataContext_delete_datasource_updates_cache(
 
     assert not mock_delete.called
     assert name not in context.datasources
+
+
+@pytest.mark.integration
+def test_datasources_are_instantiated_upon_first_access(
+    pandas_enabled_datasource_config: dict,
+    caplog,
+) -> None:
+    """
+    What does this test and why?
+
+    Configured datasources are instantiated when they are first retrieved (rather than when the context is created),
+    so that contexts with many datasources only pay for those actually used; datasources, which cannot be
+    instantiated, are left out of the cache (as before).
+    """
+    broken_datasource_config = {
+        "class_name": "Datasource",
+        "execution_engine": {
+            "class_name": "SqlAlchemyExecutionEngine",
+            "connection_string": "not_a_dialect://",
+        },
+    }
+    project_config = DataContextConfig(
+        store_backend_defaults=InMemoryStoreBackendDefaults(),
+        datasources={
+            "my_pandas_datasource": pandas_enabled_datasource_config,
+            "my_broken_datasource": broken_datasource_config,
+        },
+    )
+
+    with mock.patch.object(
+        EphemeralDataContext,
+        "_instantiate_datasource_from_config",
+        autospec=True,
+        side_effect=EphemeralDataContext._instantiate_datasource_from_config,
+    ) as mock_instantiate:
+        context = get_context(project_config=project_config)
+        assert not mock_instantiate.called
+
+        datasource = context.get_datasource("my_pandas_datasource")
+        assert isinstance(datasource, Datasource)
+        assert mock_instantiate.call_count == 1
+        assert not context._cached_datasources.is_instantiated("my_broken_datasource")
+
+        # Subsequent retrievals return already instantiated datasource.
+        assert context.get_datasource("my_pandas_datasource") is datasource
+        assert mock_instantiate.call_count == 1
+
+        assert "my_broken_datasource" not in context.datasources
+        assert list(context.datasources.keys()) == ["my_pandas_datasource"]
+
+    assert "Cannot initialize datasource my_broken_datasource" in caplog.text
+
+
+@pytest.mark.integration
+def test_datasource_config_substitution_errors_surface_upon_first_access(
+    pandas_enabled_datasource_config: dict,
+    monkeypatch,
+) -> None:
+    """
+    What does this test and why?
+
+    Configuration variables of each datasource are substituted when that datasource is instantiated (upon its first
+    access, rather than when the context is created), so substitution errors are raised then; removing datasources,
+    which have not been accessed, does not instantiate them.
+    """
+    monkeypatch.setenv("MY_CONNECTION_STRING", "sqlite://")
+    datasource_config = {
+        "class_name": "Datasource",
+        "execution_engine": {
+            "class_name": "SqlAlchemyExecutionEngine",
+            "connection_string": "${MY_CONNECTION_STRING}",
+        },
+    }
+    project_config = DataContextConfig(
+        store_backend_defaults=InMemoryStoreBackendDefaults(),
+        datasources={
+            "my_pandas_datasource": pandas_enabled_datasource_config,
+            "my_sql_datasource": datasource_config,
+            "my_other_sql_datasource": datasource_config,
+        },
+    )
+
+    with mock.patch.object(
+        EphemeralDataContext,
+        "_instantiate_datasource_from_config",
+        autospec=True,
+        side_effect=EphemeralDataContext._instantiate_datasource_from_config,
+    ) as mock_instantiate:
+        context = get_context(project_config=project_config)
+        monkeypatch.delenv("MY_CONNECTION_STRING")
+
+        with pytest.raises(gx_exceptions.MissingConfigVariableError):
+            context.get_datasource("my_sql_datasource")
+
+        assert context._cached_datasources.pop("my_other_sql_datasource") is None
+        del context._cached_datasources["my_sql_datasource"]
+        assert not mock_instantiate.called
+
+        assert list(context.datasources.keys()) == ["my_pandas_datasource"]
+
+
+@pytest.mark.integration
+def test_fluent_datasources_and_version_check_do_not_instantiate_datasources(
+    pandas_enabled_datasource_config: dict,
+) -> None:
+    """
+    What does this test and why?
+
+    Listing fluent datasources and checking whether any datasources are configured (e.g., to determine API version)
+    must not instantiate configured (block-config) datasources, which are instantiated only upon first access.
+    """
+    project_config = DataContextConfig(
+        store_backend_defaults=InMemoryStoreBackendDefaults(),
+        datasources={
+            "my_pandas_datasource": pandas_enabled_datasource_config,
+        },
+    )
+
+    with mock.patch.object(
+        EphemeralDataContext,
+        "_instantiate_datasource_from_config",
+        autospec=True,
+        side_effect=EphemeralDataContext._instantiate_datasource_from_config,
+    ) as mock_instantiate:
+        context = get_context(project_config=project_config)
+
+        assert context.fluent_datasources == {}
+        assert context._get_data_context_version(arg1="my_unknown_datasource") is None
+        assert not mock_instantiate.called
+        assert context._cached_datasources
+
+        pandas_fluent_datasource = context.sources.add_pandas("my_fluent_datasource")
+        assert context.fluent_datasources == {
+            "my_fluent_datasource": pandas_fluent_datasource
+        }
+        assert not mock_instantiate.called
@@ -2,6 +2,7 @@ from unittest.mock import Mock
 
 import pytest
 
+import great_expectations.exceptions as gx_exceptions
 from great_expectations.data_context.types.base import (
     ExecutionEngineConfigSchema,
 )
@@ -38,3 +39,26 @@ def test_execution_engine_config_conect_args(connect_args):
     )
 
     assert cfg.connect_args == connect_args
+
+
+@pytest.mark.unit
+def test_execution_engine_config_fingerprint_updated_at_column_is_sql_only():
+    cfg = ExecutionEngineConfigSchema().load(
+        {
+            "class_name": "SqlAlchemyExecutionEngine",
+            "module_name": "great_expectations.execution_engine",
+            "connection_string": "sqlite://",
+            "fingerprint_updated_at_column": "modified_at",
+        }
+    )
+
+    assert cfg.fingerprint_updated_at_column == "modified_at"
+
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        ExecutionEngineConfigSchema().load(
+            {
+                "class_name": "PandasExecutionEngine",
+                "module_name": "great_expectations.execution_engine",
+                "fingerprint_updated_at_column": "modified_at",
+            }
+        )
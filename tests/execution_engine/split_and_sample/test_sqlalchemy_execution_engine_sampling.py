@@ -1,12 +1,14 @@
 from __future__ import annotations
 import datetime
 import os
-from typing import List
+from typing import Dict, List
+from unittest import mock
 
 import pandas as pd
 import pytest
 from dateutil.parser import parse
 
+import great_expectations.exceptions as gx_exceptions
 from great_expectations.core.batch_spec import SqlAlchemyDatasourceBatchSpec
 from great_expectations.core.id_dict import BatchSpec
 from great_expectations.data_context.util import file_relative_path
@@ -46,6 +48,7 @@ pytestmark = pytest.mark.sqlalchemy_version_compatibility
         for sampler_method_name in [
             "sample_using_limit",
             "sample_using_random",
+            "sample_using_tablesample",
             "sample_using_mod",
             "sample_using_a_list",
             "sample_using_md5",
@@ -385,3 +388,185 @@ def test_sample_using_random(sqlite_view_engine, test_df):
     assert len(rows_0) == len(rows_1)
 
     assert not (rows_0 == rows_1)
+
+
+# SQLAlchemy dialects of Snowflake, BigQuery, and Trino are separate (optional) packages, so their queries (which use
+# generic TABLESAMPLE construct) are compiled with PostgreSQL dialect; all other dialects are shipped with SQLAlchemy.
+_TABLESAMPLE_COMPILE_DIALECT_MODULE_NAMES: Dict[str, str] = {
+    "postgresql": "sqlalchemy.dialects.postgresql",
+    "mssql": "sqlalchemy.dialects.mssql",
+    "mysql": "sqlalchemy.dialects.mysql",
+    "oracle": "sqlalchemy.dialects.oracle",
+    "sqlite": "sqlalchemy.dialects.sqlite",
+    "trino": "sqlalchemy.dialects.postgresql",
+    "snowflake": "sqlalchemy.dialects.postgresql",
+    "bigquery": "sqlalchemy.dialects.postgresql",
+}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "dialect_name,sampling_kwargs,expected",
+    [
+        pytest.param(
+            "postgresql",
+            {"p": 0.1, "seed": 42},
+            "SELECT * FROM test_schema_name.test_table AS test_table TABLESAMPLE bernoulli(10) REPEATABLE (42) WHERE true",
+            id="postgresql",
+        ),
+        pytest.param(
+            "mssql",
+            {"p": 0.25, "method": "bernoulli", "seed": 42},
+            "SELECT * FROM test_schema_name.test_table AS test_table TABLESAMPLE system(25 PERCENT) REPEATABLE (42) WHERE 1 = 1",
+            id="mssql_system_only",
+        ),
+        pytest.param(
+            "trino",
+            {"p": 0.1, "method": "system", "seed": 42},
+            "SELECT * FROM test_schema_name.test_table AS test_table TABLESAMPLE system(10) WHERE true",
+            id="trino_seed_ignored",
+        ),
+        pytest.param(
+            "snowflake",
+            {"p": 0.5, "seed": 7},
+            "SELECT * FROM test_schema_name.test_table AS test_table TABLESAMPLE bernoulli(50) REPEATABLE (7) WHERE true",
+            id="snowflake",
+        ),
+        pytest.param(
+            "bigquery",
+            {"p": 0.05},
+            "SELECT * FROM test_schema_name.test_table AS test_table TABLESAMPLE system(5 PERCENT) WHERE true",
+            id="bigquery",
+        ),
+        pytest.param(
+            "mysql",
+            {"p": 0.1, "seed": 42, "column_name": "id"},
+            "SELECT * FROM test_schema_name.test_table WHERE right(md5(concat('42', CAST(id AS CHAR))), 8) < '19999999'",
+            id="mysql_hash_fallback",
+        ),
+        pytest.param(
+            "mysql",
+            {"p": 0.1},
+            "SELECT * FROM test_schema_name.test_table WHERE rand() < 0.1",
+            id="mysql_random_fallback",
+        ),
+        pytest.param(
+            "mysql",
+            {"p": 1.0},
+            "SELECT * FROM test_schema_name.test_table WHERE true = 1",
+            id="mysql_all_rows",
+        ),
+        pytest.param(
+            "oracle",
+            {"p": 0.1, "column_name": "id"},
+            "SELECT * FROM test_schema_name.test_table WHERE dbms_random.value < 0.1",
+            id="oracle_random_fallback",
+        ),
+        pytest.param(
+            "sqlite",
+            {"p": 0.1},
+            "SELECT * FROM test_schema_name.test_table WHERE 1 = 1 AND (abs(random()) % 1000000) / 1000000.0 < 0.1",
+            id="sqlite_random_fallback",
+        ),
+    ],
+)
+def test_sample_using_tablesample_builds_correct_query(
+    dialect_name: str, sampling_kwargs: dict, expected: str
+):
+    """What does this test and why?
+
+    sample_using_tablesample should use native sampling of dialects supporting it, and hash-based (if column is given)
+    or random filtering otherwise. Queries are compiled with their own dialects (see above for exceptions).
+    """
+    batch_spec = BatchSpec(
+        table_name="test_table",
+        schema_name="test_schema_name",
+        sampling_method="sample_using_tablesample",
+        sampling_kwargs=sampling_kwargs,
+    )
+    query = SqlAlchemyDataSampler().sample_using_tablesample(
+        execution_engine=mock.Mock(dialect_name=dialect_name),
+        batch_spec=batch_spec,
+        where_clause=None,
+    )
+
+    query_str: str = clean_query_for_comparison(
+        str(
+            query.compile(
+                dialect=import_library_module(
+                    module_name=_TABLESAMPLE_COMPILE_DIALECT_MODULE_NAMES[dialect_name]
+                ).dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+    )
+
+    assert query_str == clean_query_for_comparison(expected)
+
+
+@pytest.mark.unit
+def test_sample_using_tablesample_without_random_function_of_dialect():
+    batch_spec = BatchSpec(
+        table_name="test_table",
+        sampling_method="sample_using_tablesample",
+        sampling_kwargs={"p": 0.1, "column_name": "id"},
+    )
+
+    with pytest.raises(gx_exceptions.SamplerError, match="teradatasql"):
+        SqlAlchemyDataSampler().sample_using_tablesample(
+            execution_engine=mock.Mock(dialect_name="teradatasql"),
+            batch_spec=batch_spec,
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "sampling_kwargs",
+    [
+        pytest.param({}, id="missing_p"),
+        pytest.param({"p": 1.5}, id="p_above_one"),
+        pytest.param({"p": 0.1, "method": "cluster"}, id="unknown_method"),
+        pytest.param({"p": 0.1, "seed": "abc"}, id="non_integer_seed"),
+    ],
+)
+def test_sample_using_tablesample_invalid_sampling_kwargs(sampling_kwargs: dict):
+    batch_spec = BatchSpec(
+        table_name="test_table",
+        sampling_method="sample_using_tablesample",
+        sampling_kwargs=sampling_kwargs,
+    )
+
+    with pytest.raises(gx_exceptions.SamplerError):
+        SqlAlchemyDataSampler().sample_using_tablesample(
+            execution_engine=mock.Mock(dialect_name="postgresql"),
+            batch_spec=batch_spec,
+        )
+
+
+@pytest.mark.integration
+def test_sqlite_sample_using_tablesample(sqlite_view_engine, test_df):
+    my_execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
+        engine=sqlite_view_engine
+    )
+    add_dataframe_to_db(df=test_df, name="test_table_1", con=my_execution_engine.engine)
+
+    def _count_sampled_rows(p: float) -> int:
+        batch_spec = SqlAlchemyDatasourceBatchSpec(
+            table_name="test_table_1",
+            schema_name="main",
+            sampling_method="sample_using_tablesample",
+            sampling_kwargs={"p": p},
+        )
+        batch_data: SqlAlchemyBatchData = my_execution_engine.get_batch_data(
+            batch_spec=batch_spec
+        )
+        return batch_data.execution_engine.engine.execute(
+            sqlalchemy.select(sqlalchemy.func.count()).select_from(
+                batch_data.selectable
+            )
+        ).scalar()
+
+    # SQLite has no TABLESAMPLE, so rows are filtered randomly (without counting and sorting all rows first).
+    assert _count_sampled_rows(p=1.0) == test_df.shape[0]
+    assert _count_sampled_rows(p=0.0) == 0
+    assert 0 < _count_sampled_rows(p=0.5) < test_df.shape[0]
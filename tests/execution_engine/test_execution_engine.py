@@ -331,3 +331,33 @@ def test_resolve_metrics_with_incomplete_metric_input():
     # Ensuring that incomplete metrics given raises a GreatExpectationsError
     with pytest.raises(gx_exceptions.GreatExpectationsError) as error:
         engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics={})
+
+
+def test_resolve_metrics_reads_dependencies_from_bounded_metric_cache():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": df},
+        metric_cache_limits={"scalar": {"max_entries": 1}},
+    )
+
+    table_columns_metric: MetricConfiguration
+    table_columns_metric, _ = get_table_columns_metric(engine=engine)
+
+    mean = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    mean.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    # Dependency "table.columns" is not supplied, so it must be read from local in-memory metric cache.
+    results = engine.resolve_metrics(metrics_to_resolve=(mean,), metrics={})
+    assert results[mean.id] == 2.0
+
+    statistics = engine.metric_cache_statistics
+    assert statistics.hits >= 1
+    # Entry budget of 1 keeps only most recently computed final metric value.
+    assert statistics.evictions >= 1
+    assert mean.id in engine._metric_cache
+    assert table_columns_metric.id not in engine._metric_cache
@@ -0,0 +1,206 @@
+import pathlib
+import threading
+from typing import Tuple
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine.metric_cache import (
+    BoundedMetricCache,
+    MetricCacheLimits,
+    MetricCacheStatistics,
+    PersistentMetricCache,
+)
+
+COLUMN_MAX_METRIC_ID: Tuple[str, str, str] = ("column.max", "column=a", "")
+COLUMN_MIN_METRIC_ID: Tuple[str, str, str] = ("column.min", "column=a", "")
+
+
+@pytest.mark.unit
+def test_persistent_metric_cache_round_trip_is_scoped_by_batch_fingerprint(
+    tmp_path: pathlib.Path,
+):
+    path = tmp_path / "nested" / "metric_cache.db"
+    metric_cache = PersistentMetricCache(path=path)
+    metric_cache.set_many(
+        batch_fingerprint="fingerprint_1",
+        metrics={COLUMN_MAX_METRIC_ID: 6, COLUMN_MIN_METRIC_ID: None},
+    )
+
+    # Another instance, pointing to the same file (e.g., in subsequent run), sees persisted entries.
+    metric_cache = PersistentMetricCache(path=path)
+    assert metric_cache.get_many(
+        batch_fingerprint="fingerprint_1",
+        metric_ids=[COLUMN_MAX_METRIC_ID, COLUMN_MIN_METRIC_ID],
+    ) == {COLUMN_MAX_METRIC_ID: 6, COLUMN_MIN_METRIC_ID: None}
+    assert (
+        metric_cache.get_many(
+            batch_fingerprint="fingerprint_2", metric_ids=[COLUMN_MAX_METRIC_ID]
+        )
+        == {}
+    )
+    assert len(metric_cache) == 2
+
+    metric_cache.clear()
+    assert len(metric_cache) == 0
+
+
+@pytest.mark.unit
+def test_persistent_metric_cache_expires_entries_after_ttl(tmp_path: pathlib.Path):
+    metric_cache = PersistentMetricCache(
+        path=tmp_path / "metric_cache.db", ttl_seconds=60
+    )
+    with mock.patch(
+        "great_expectations.execution_engine.metric_cache.time.time",
+        return_value=1000.0,
+    ):
+        metric_cache.set_many(
+            batch_fingerprint="fingerprint", metrics={COLUMN_MAX_METRIC_ID: 6}
+        )
+
+    with mock.patch(
+        "great_expectations.execution_engine.metric_cache.time.time",
+        return_value=1059.0,
+    ):
+        assert metric_cache.get_many(
+            batch_fingerprint="fingerprint", metric_ids=[COLUMN_MAX_METRIC_ID]
+        ) == {COLUMN_MAX_METRIC_ID: 6}
+
+    with mock.patch(
+        "great_expectations.execution_engine.metric_cache.time.time",
+        return_value=1061.0,
+    ):
+        assert (
+            metric_cache.get_many(
+                batch_fingerprint="fingerprint", metric_ids=[COLUMN_MAX_METRIC_ID]
+            )
+            == {}
+        )
+        # Expired entries are purged when new entries are stored.
+        metric_cache.set_many(
+            batch_fingerprint="fingerprint", metrics={COLUMN_MIN_METRIC_ID: 1}
+        )
+
+    assert len(metric_cache) == 1
+
+
+@pytest.mark.unit
+def test_persistent_metric_cache_evicts_least_recently_used_entries_over_size_budget(
+    tmp_path: pathlib.Path,
+):
+    value = "x" * 1000
+    metric_cache = PersistentMetricCache(
+        path=tmp_path / "metric_cache.db", max_size_bytes=2500
+    )
+    metric_ids = [(f"metric_{idx}", "column=a", "") for idx in range(3)]
+
+    with mock.patch(
+        "great_expectations.execution_engine.metric_cache.time.time",
+        side_effect=[1.0, 2.0, 3.0, 4.0],
+    ):
+        metric_cache.set_many(
+            batch_fingerprint="fingerprint", metrics={metric_ids[0]: value}
+        )
+        metric_cache.set_many(
+            batch_fingerprint="fingerprint", metrics={metric_ids[1]: value}
+        )
+        # Reading first entry makes second entry least recently used.
+        assert metric_ids[0] in metric_cache.get_many(
+            batch_fingerprint="fingerprint", metric_ids=[metric_ids[0]]
+        )
+        metric_cache.set_many(
+            batch_fingerprint="fingerprint", metrics={metric_ids[2]: value}
+        )
+
+    assert metric_cache.size_bytes <= 2500
+    assert set(
+        metric_cache.get_many(batch_fingerprint="fingerprint", metric_ids=metric_ids)
+    ) == {metric_ids[0], metric_ids[2]}
+
+
+@pytest.mark.unit
+def test_persistent_metric_cache_skips_unpicklable_and_oversized_values(
+    tmp_path: pathlib.Path,
+):
+    metric_cache = PersistentMetricCache(
+        path=tmp_path / "metric_cache.db", max_size_bytes=100
+    )
+    metric_cache.set_many(
+        batch_fingerprint="fingerprint",
+        metrics={
+            COLUMN_MAX_METRIC_ID: threading.Lock(),
+            COLUMN_MIN_METRIC_ID: "x" * 1000,
+        },
+    )
+
+    assert len(metric_cache) == 0
+
+
+@pytest.mark.unit
+def test_bounded_metric_cache_evicts_least_recently_used_entries_over_entry_budget():
+    metric_cache = BoundedMetricCache(
+        scalar_limits=MetricCacheLimits(max_entries=2),
+    )
+    metric_ids = [(f"metric_{idx}", "column=a", "") for idx in range(3)]
+
+    metric_cache[metric_ids[0]] = 0
+    metric_cache[metric_ids[1]] = 1
+    # Reading first entry makes second entry least recently used.
+    assert metric_cache[metric_ids[0]] == 0
+    metric_cache[metric_ids[2]] = 2
+
+    assert metric_ids[1] not in metric_cache
+    assert metric_cache.get(metric_ids[1]) is None
+    assert metric_cache.statistics == MetricCacheStatistics(
+        hits=1,
+        misses=1,
+        evictions=1,
+        num_entries=2,
+        size_bytes=metric_cache.statistics.size_bytes,
+    )
+
+
+@pytest.mark.unit
+def test_bounded_metric_cache_applies_separate_byte_budget_to_partial_metrics():
+    metric_cache = BoundedMetricCache(
+        scalar_limits=MetricCacheLimits(max_size_bytes=1000),
+        partial_limits=MetricCacheLimits(max_size_bytes=2 * 8 * 1000 + 1000),
+    )
+    condition_metric_ids = [
+        (f"column_values.metric_{idx}.condition", "column=a", "") for idx in range(3)
+    ]
+    column_max_metric_id = ("column.max", "column=a", "")
+
+    metric_cache[column_max_metric_id] = 6
+    metric_cache.update(
+        {
+            condition_metric_id: pd.Series(np.zeros(1000, dtype=np.int64))
+            for condition_metric_id in condition_metric_ids
+        }
+    )
+
+    # Large partial values evict one another, while final metric values remain cached.
+    assert [
+        condition_metric_id in metric_cache
+        for condition_metric_id in condition_metric_ids
+    ] == [False, True, True]
+    assert metric_cache[column_max_metric_id] == 6
+    assert metric_cache.statistics.evictions == 1
+
+    # Value exceeding budget of its segment is not cached at all.
+    metric_cache[("table.head", "", "")] = pd.DataFrame({"a": np.zeros(1000)})
+    assert ("table.head", "", "") not in metric_cache
+    assert metric_cache[column_max_metric_id] == 6
+
+
+@pytest.mark.unit
+def test_bounded_metric_cache_from_limits_config_retains_defaults_for_omitted_segments():
+    metric_cache = BoundedMetricCache.from_limits_config(
+        config={"partial": {"max_entries": 10}}
+    )
+
+    assert metric_cache.partial_limits == MetricCacheLimits(max_entries=10)
+    assert metric_cache.scalar_limits == BoundedMetricCache.DEFAULT_SCALAR_LIMITS
+    assert metric_cache.records_limits == BoundedMetricCache.DEFAULT_RECORDS_LIMITS
@@ -1,5 +1,5 @@
 import os
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 from unittest import mock
 
 import pandas as pd
@@ -12,6 +12,7 @@ from great_expectations.optional_imports import google_cloud_storage
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.core.batch_spec import RuntimeDataBatchSpec, S3BatchSpec
 from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasColumnSummary,
     PandasExecutionEngine,
 )
 from great_expectations.util import is_library_loadable
@@ -232,6 +233,114 @@ def test_get_domain_records_with_multicolumn_domain():
     ), "Data does not match after getting full access compute domain"
 
 
+def test_get_domain_records_shares_filtered_records_until_batch_is_reloaded():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame(
+        {"a": [1, 2, 3, 4, 5], "b": [2, 3, 4, 5, None], "c": [1, None, 3, 4, None]}
+    )
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    column_domain_kwargs: dict = {
+        "column": "a",
+        "row_condition": "a<5",
+        "condition_parser": "pandas",
+    }
+    multicolumn_domain_kwargs: dict = {
+        "column_list": ["b", "c"],
+        "row_condition": "a<5",
+        "condition_parser": "pandas",
+        "ignore_row_if": "any_value_is_missing",
+    }
+
+    data = engine.get_domain_records(domain_kwargs=column_domain_kwargs)
+    assert data.equals(df.iloc[:4])
+    # Repeated requests for the same Domain reuse filtered records instead of querying the Batch again.
+    assert (
+        engine.get_domain_records(domain_kwargs=dict(column_domain_kwargs, column="b"))
+        is data
+    )
+
+    data = engine.get_domain_records(domain_kwargs=multicolumn_domain_kwargs)
+    assert data.equals(df.iloc[[0, 2, 3]])
+    assert engine.get_domain_records(domain_kwargs=multicolumn_domain_kwargs) is data
+
+    # When no rows are dropped, records (already filtered by row condition) are returned without copying.
+    assert engine.get_domain_records(
+        domain_kwargs=dict(multicolumn_domain_kwargs, column_list=["a", "b"])
+    ) is engine.get_domain_records(domain_kwargs=column_domain_kwargs)
+
+    # Reloading the Batch discards records derived from its previous data.
+    df = pd.DataFrame({"a": [1, 6], "b": [None, 1], "c": [1, 1]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    assert engine.get_domain_records(domain_kwargs=column_domain_kwargs).equals(
+        df.iloc[:1]
+    )
+    assert engine.get_domain_records(domain_kwargs=multicolumn_domain_kwargs).empty
+
+
+def test_get_domain_records_without_caching_filters_records_on_every_request():
+    engine = PandasExecutionEngine(caching=False)
+    df = pd.DataFrame({"a": [1, 2, None], "b": [None, 2, 3]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    domain_kwargs: dict = {
+        "column_A": "a",
+        "column_B": "b",
+        "ignore_row_if": "either_value_is_missing",
+    }
+    data = engine.get_domain_records(domain_kwargs=domain_kwargs)
+
+    assert data.equals(df.iloc[[1]])
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs) is not data
+    assert engine.metric_cache_statistics.num_entries == 0
+
+
+def test_get_domain_records_keeps_filtered_records_within_records_budget():
+    engine = PandasExecutionEngine(metric_cache_limits={"records": {"max_entries": 2}})
+    df = pd.DataFrame({"a": [1, 2, 3, 4]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    def _get_domain_records(row_condition: str) -> pd.DataFrame:
+        return engine.get_domain_records(
+            domain_kwargs={"row_condition": row_condition, "condition_parser": "pandas"}
+        )
+
+    data = _get_domain_records(row_condition="a<2")
+    _get_domain_records(row_condition="a<3")
+    assert _get_domain_records(row_condition="a<2") is data
+
+    # Least recently used records ("a<3") are evicted, once budget of records segment is exceeded.
+    _get_domain_records(row_condition="a<4")
+    assert engine.metric_cache_statistics.num_entries == 2
+    assert engine.metric_cache_statistics.evictions == 1
+    assert _get_domain_records(row_condition="a<2") is data
+
+
+def test_remove_batch_data_releases_batch_data_and_derived_records():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    engine.get_domain_records(
+        domain_kwargs={"row_condition": "a<3", "condition_parser": "pandas"}
+    )
+    assert engine.metric_cache_statistics.num_entries == 1
+
+    with mock.patch.object(
+        engine, "release_batch_data", wraps=engine.release_batch_data
+    ) as mock_release_batch_data:
+        engine.batch_manager.remove_batch_data(batch_id="1234")
+        # Removing Batch, which is no longer loaded, is a no-op.
+        engine.batch_manager.remove_batch_data(batch_id="1234")
+
+    mock_release_batch_data.assert_called_once()
+    call_kwargs = mock_release_batch_data.call_args.kwargs
+    assert call_kwargs["batch_id"] == "1234"
+    assert call_kwargs["batch_data"].dataframe is df
+    assert engine.batch_manager.loaded_batch_ids == []
+    assert engine.batch_manager.active_batch_data_id is None
+    assert engine.metric_cache_statistics.num_entries == 0
+
+
 def test_get_compute_domain_with_no_domain_kwargs():
     engine = PandasExecutionEngine()
     df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
@@ -402,6 +511,50 @@ def test_resolve_metric_bundle():
     )
 
 
+def test_get_column_summary_is_computed_once_per_domain_column():
+    df = pd.DataFrame({"a": [1, None, 3, None], "b": [1, 2, 3, 4]})
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    column_summary = engine.get_column_summary(domain_kwargs={}, column_name="a")
+    assert column_summary.null_count == 2
+    assert column_summary.nonnull_count == 2
+    assert column_summary.nonnull_column.tolist() == [1.0, 3.0]
+    assert engine.get_column_summary(domain_kwargs={}, column_name="a") is (
+        column_summary
+    )
+
+    # Columns without missing values are shared as they are, rather than copied.
+    column_summary = engine.get_column_summary(domain_kwargs={}, column_name="b")
+    assert column_summary.null_count == 0
+    assert column_summary.nonnull_column is column_summary.column
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+    desired_metrics = []
+    for metric_name in ("column.min", "column.max", "column.mean"):
+        metric = MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=None,
+        )
+        metric.metric_dependencies = {"table.columns": table_columns_metric}
+        desired_metrics.append(metric)
+
+    with mock.patch(
+        "great_expectations.execution_engine.pandas_execution_engine.PandasColumnSummary",
+        wraps=PandasColumnSummary,
+    ) as mock_column_summary:
+        engine.load_batch_data(batch_id="other-id", batch_data=df)
+        results = engine.resolve_metrics(
+            metrics_to_resolve=tuple(desired_metrics), metrics=metrics
+        )
+
+    # All aggregates of Domain share one pass over missing values of the column.
+    assert mock_column_summary.call_count == 1
+    assert [results[metric.id] for metric in desired_metrics] == [1.0, 3.0, 2.0]
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error
 def test_resolve_metric_bundle_with_nonexistent_metric():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
@@ -635,3 +788,18 @@ def test_get_batch_with_gcs_misconfigured(gcs_batch_spec):
     # Raises error if batch_spec causes ExecutionEngine error
     with pytest.raises(gx_exceptions.ExecutionEngineError):
         execution_engine_no_gcs.get_batch_data(batch_spec=gcs_batch_spec)
+
+
+def test_batch_fingerprint_reflects_contents_and_column_names():
+    def _get_batch_fingerprint(df: pd.DataFrame) -> Optional[str]:
+        execution_engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+        return execution_engine.get_batch_fingerprint(batch_id="my_id")
+
+    fingerprint = _get_batch_fingerprint(df=pd.DataFrame({"a": [1, 2, 3]}))
+    assert fingerprint is not None
+    assert _get_batch_fingerprint(df=pd.DataFrame({"a": [1, 2, 3]})) == fingerprint
+    assert _get_batch_fingerprint(df=pd.DataFrame({"a": [1, 2, 4]})) != fingerprint
+    assert _get_batch_fingerprint(df=pd.DataFrame({"b": [1, 2, 3]})) != fingerprint
+    assert (
+        _get_batch_fingerprint(df=pd.DataFrame({"a": [1.0, 2.0, 3.0]})) != fingerprint
+    )
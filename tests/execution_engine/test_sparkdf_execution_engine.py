@@ -1,6 +1,7 @@
 import datetime
 import logging
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -11,6 +12,13 @@ from great_expectations.core.batch_spec import PathBatchSpec, RuntimeDataBatchSp
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.metric_function_types import MetricPartialFunctionTypes
 from great_expectations.execution_engine import SparkDFExecutionEngine
+from great_expectations.execution_engine.sparkdf_batch_data import SparkDFBatchData
+from great_expectations.execution_engine.execution_engine import (
+    MetricComputationConfiguration,
+)
+from great_expectations.execution_engine.sparkdf_execution_engine import (
+    SparkColumnAggregate,
+)
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -18,9 +26,10 @@ from great_expectations.expectations.row_conditions import (
 from great_expectations.self_check.util import build_spark_engine
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import ValidationGraph
 from tests.expectations.test_util import get_table_columns_metric
 from tests.test_utils import create_files_in_directory
-from great_expectations.optional_imports import F, sparktypes, pyspark_sql_Row
+from great_expectations.optional_imports import F, pyspark, sparktypes, pyspark_sql_Row
 
 
 def test_reader_fn(spark_session, basic_spark_df_execution_engine):
@@ -485,6 +494,172 @@ def test_get_compute_domain_with_row_condition(
     assert accessor_kwargs == {}
 
 
+def test_persisted_batch_dataframe_is_unpersisted_when_batch_is_evicted(
+    spark_session, spark_df_from_pandas_df
+):
+    engine = SparkDFExecutionEngine(
+        cache_policy={"storage_level": "MEMORY_ONLY", "batch_dataframes": "persist"}
+    )
+    df = spark_df_from_pandas_df(spark_session, pd.DataFrame({"a": [1, 2, 3]}))
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+
+    assert df.is_cached
+    assert df.storageLevel == pyspark.StorageLevel.MEMORY_ONLY
+    assert engine.cache_footprint.num_persisted_batches == 1
+
+    engine.close()
+
+    assert not df.is_cached
+    assert engine.batch_manager.loaded_batch_ids == []
+    assert engine.cache_footprint.num_persisted_batches == 0
+
+
+def test_batch_dataframe_is_not_persisted_by_default(
+    spark_session, spark_df_from_pandas_df
+):
+    engine = SparkDFExecutionEngine()
+    df = spark_df_from_pandas_df(spark_session, pd.DataFrame({"a": [1, 2, 3]}))
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+
+    assert not df.is_cached
+    assert engine.cache_footprint.num_persisted_batches == 0
+
+
+def test_get_domain_records_caches_reused_filtered_domain(
+    spark_session, spark_df_from_pandas_df
+):
+    engine = SparkDFExecutionEngine(
+        cache_policy={"filtered_domains": "persist", "filtered_domain_min_reuse": 2},
+    )
+    df = spark_df_from_pandas_df(
+        spark_session, pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    )
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+    domain_kwargs: dict = {"row_condition": "b > 2", "condition_parser": "spark"}
+
+    # Filtered Domain is cached only once it is requested again.
+    assert not engine.get_domain_records(domain_kwargs=domain_kwargs).is_cached
+    data = engine.get_domain_records(domain_kwargs=domain_kwargs)
+    assert data.is_cached
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs) is data
+    assert data.collect() == df.filter(F.col("b") > 2).collect()
+    assert engine.cache_footprint.num_cached_filtered_domains == 1
+
+    # Unfiltered Domains are never cached.
+    assert engine.get_domain_records(domain_kwargs={"column": "a"}) is df
+
+    # Reloading the Batch unpersists Domains filtered from its previous data.
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+    assert not data.is_cached
+    assert engine.cache_footprint.num_cached_filtered_domains == 0
+
+
+def _build_spark_engine_with_mocked_session(
+    cache_policy: dict,
+) -> SparkDFExecutionEngine:
+    # Caching bookkeeping does not depend on Spark itself, so it is also checked where Spark is unavailable.
+    with mock.patch(
+        "great_expectations.execution_engine.sparkdf_execution_engine.get_or_create_spark_application"
+    ), mock.patch(
+        "great_expectations.execution_engine.sparkdf_execution_engine.pyspark",
+        new=mock.MagicMock(),
+    ):
+        return SparkDFExecutionEngine(cache_policy=cache_policy)
+
+
+def test_close_evicts_batches_and_unpersists_only_dataframes_cached_by_engine():
+    engine = _build_spark_engine_with_mocked_session(
+        cache_policy={"batch_dataframes": "persist", "filtered_domains": "persist"}
+    )
+    df = mock.MagicMock(is_cached=False)
+    df_cached_by_creator = mock.MagicMock(is_cached=True)
+    engine.load_batch_data(
+        batch_id="cached_by_creator",
+        batch_data=SparkDFBatchData(engine, df_cached_by_creator),
+    )
+    engine.load_batch_data(batch_id="1234", batch_data=SparkDFBatchData(engine, df))
+
+    assert df.persist.call_count == 1
+    assert not df_cached_by_creator.persist.called
+    assert engine.cache_footprint.num_persisted_batches == 1
+
+    # Filtered Domain of active Batch is cached (for it) when no "batch_id" is specified.
+    domain_kwargs: dict = {"row_condition": "b > 2", "condition_parser": "spark"}
+    with mock.patch.object(
+        SparkDFExecutionEngine, "_filter_domain_records"
+    ) as mock_filter_domain_records:
+        engine.get_domain_records(domain_kwargs=domain_kwargs)
+        filtered_data = engine.get_domain_records(domain_kwargs=domain_kwargs)
+        assert engine.get_domain_records(domain_kwargs=domain_kwargs) is filtered_data
+        assert mock_filter_domain_records.call_count == 2
+
+    assert engine.cache_footprint.num_cached_filtered_domains == 1
+
+    engine.close()
+
+    assert df.unpersist.call_count == 1
+    assert not df_cached_by_creator.unpersist.called
+    assert filtered_data.unpersist.call_count == 1
+    assert engine.batch_manager.loaded_batch_ids == []
+    assert engine.batch_manager.active_batch_data is None
+    assert engine.cache_footprint.num_persisted_batches == 0
+    assert engine.cache_footprint.num_cached_filtered_domains == 0
+
+    # Batches must be loaded again before metrics can be computed.
+    with pytest.raises(gx_exceptions.ValidationError):
+        engine.get_domain_records(domain_kwargs=domain_kwargs)
+
+
+def test_close_evicts_batches_without_unpersisting_when_nothing_is_cached():
+    engine = _build_spark_engine_with_mocked_session(cache_policy={})
+    df = mock.MagicMock(is_cached=False)
+    engine.load_batch_data(batch_id="1234", batch_data=SparkDFBatchData(engine, df))
+
+    engine.close()
+
+    assert not df.persist.called
+    assert not df.unpersist.called
+    assert engine.batch_manager.loaded_batch_ids == []
+
+
+@pytest.mark.parametrize(
+    "arrow_conf,pyspark_version,pyarrow_installed,expected_arrow_enabled",
+    [
+        pytest.param("true", "3.3.0", True, True, id="arrow_enabled"),
+        pytest.param(" TRUE ", "3.3.0", True, True, id="arrow_enabled_in_upper_case"),
+        pytest.param("false", "3.3.0", True, False, id="arrow_disabled"),
+        pytest.param(None, "3.3.0", True, False, id="arrow_not_configured"),
+        pytest.param("true", "2.4.8", True, False, id="spark_without_iterator_udfs"),
+        pytest.param("true", "3.3.0", False, False, id="pyarrow_not_installed"),
+    ],
+)
+def test_arrow_enabled(
+    arrow_conf, pyspark_version, pyarrow_installed, expected_arrow_enabled
+):
+    engine = _build_spark_engine_with_mocked_session(cache_policy={})
+    engine.spark.conf.get.return_value = arrow_conf
+
+    with mock.patch(
+        "great_expectations.execution_engine.sparkdf_execution_engine.pyspark",
+        new=mock.Mock(__version__=pyspark_version),
+    ), mock.patch(
+        "great_expectations.execution_engine.sparkdf_execution_engine.pyarrow",
+        new=mock.Mock() if pyarrow_installed else None,
+    ):
+        assert engine.arrow_enabled is expected_arrow_enabled
+
+
+def test_unrecognized_cache_policy_raises_error(spark_session):
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        SparkDFExecutionEngine(cache_policy={"storage_level": "NOT_A_STORAGE_LEVEL"})
+
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        SparkDFExecutionEngine(cache_policy={"filtered_domains": "always"})
+
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        SparkDFExecutionEngine(cache_policy={"batch_dataframes": "checkpoint"})
+
+
 # What happens when we filter such that no value meets the condition?
 def test_get_compute_domain_with_unmeetable_row_condition(
     spark_session, basic_spark_df_execution_engine, spark_df_from_pandas_df
@@ -797,6 +972,145 @@ def test_sparkdf_batch_aggregate_metrics(caplog, spark_session):
     assert found_message
 
 
+@pytest.mark.parametrize(
+    "bundle_domains_in_single_job,deferred_aggregates,num_single_jobs",
+    [
+        pytest.param(False, True, 0, id="per_domain_jobs"),
+        pytest.param(True, True, 1, id="single_job"),
+        # Aggregates, whose column is unknown, cannot be restricted to their Domains; hence, computed per Domain.
+        pytest.param(True, False, 0, id="single_job_with_opaque_aggregates"),
+    ],
+)
+def test_resolve_metric_bundle_of_many_domains(
+    spark_session,
+    spark_df_from_pandas_df,
+    bundle_domains_in_single_job,
+    deferred_aggregates,
+    num_single_jobs,
+):
+    engine = SparkDFExecutionEngine(
+        bundle_domains_in_single_job=bundle_domains_in_single_job
+    )
+    df = spark_df_from_pandas_df(
+        spark_session,
+        pd.DataFrame({"a": [1, 2, 3, 4], "b": [2.0, 3.0, 4.0, None]}),
+    )
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+
+    compute_domain_kwargs_list: List[dict] = [
+        {},
+        {"row_condition": "a > 1", "condition_parser": "spark"},
+        {
+            "row_condition": 'col("b")<4',
+            "condition_parser": "great_expectations__experimental__",
+        },
+        # No records satisfy this row condition.
+        {"row_condition": "a > 10", "condition_parser": "spark"},
+    ]
+    metric_computation_configurations: List[MetricComputationConfiguration] = [
+        MetricComputationConfiguration(
+            metric_configuration=MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs=dict(compute_domain_kwargs, column="a"),
+                metric_value_kwargs=None,
+            ),
+            metric_fn=metric_fn,
+            metric_provider_kwargs={},
+            compute_domain_kwargs=compute_domain_kwargs,
+            accessor_domain_kwargs={"column": "a"},
+        )
+        for compute_domain_kwargs in compute_domain_kwargs_list
+        for metric_name, metric_fn in (
+            (
+                "column.max",
+                SparkColumnAggregate(column=F.col("a"), aggregate_fn=F.max)
+                if deferred_aggregates
+                else F.max(F.col("a")),
+            ),
+            (
+                "table.row_count",
+                SparkColumnAggregate(column=F.lit(1), aggregate_fn=F.count)
+                if deferred_aggregates
+                else F.count(F.lit(1)),
+            ),
+        )
+    ]
+
+    with mock.patch.object(
+        engine,
+        "_resolve_domain_aggregates_in_single_job",
+        wraps=engine._resolve_domain_aggregates_in_single_job,
+    ) as mock_resolve_domain_aggregates_in_single_job:
+        results = engine.resolve_metric_bundle(
+            metric_fn_bundle=metric_computation_configurations
+        )
+
+    assert mock_resolve_domain_aggregates_in_single_job.call_count == num_single_jobs
+
+    assert [
+        results[metric_computation_configuration.metric_configuration.id]
+        for metric_computation_configuration in metric_computation_configurations
+    ] == [4, 4, 4, 3, 2, 2, None, 0]
+
+
+@pytest.mark.parametrize("bundle_domains_in_single_job", [False, True])
+def test_failing_aggregate_does_not_fail_other_bundled_metrics(
+    spark_session, spark_df_from_pandas_df, bundle_domains_in_single_job
+):
+    engine = SparkDFExecutionEngine(
+        bundle_domains_in_single_job=bundle_domains_in_single_job
+    )
+    df = spark_df_from_pandas_df(
+        spark_session,
+        pd.DataFrame({"a": [1, 2, 3, 4], "s": ["w", "x", "y", "z"]}),
+    )
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+
+    # Mean of string column raises TypeError (in "ColumnMean._spark") when its aggregate is built.
+    failing_metric = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "s"},
+    )
+    metrics_to_resolve: List[MetricConfiguration] = [
+        failing_metric,
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"column": "a"},
+        ),
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={
+                "column": "a",
+                "row_condition": "a < 3",
+                "condition_parser": "spark",
+            },
+        ),
+        MetricConfiguration(
+            metric_name="column.min",
+            metric_domain_kwargs={"column": "s"},
+        ),
+    ]
+
+    graph = ValidationGraph(execution_engine=engine)
+    metric_configuration: MetricConfiguration
+    for metric_configuration in metrics_to_resolve:
+        graph.build_metric_dependency_graph(metric_configuration=metric_configuration)
+
+    resolved_metrics, aborted_metrics_info = graph.resolve(
+        runtime_configuration={"catch_exceptions": True}, show_progress_bars=False
+    )
+
+    # Only partial metric of failing aggregate is aborted (after retries); metrics bundled with it are resolved.
+    assert [metric_id[0] for metric_id in aborted_metrics_info] == [
+        f"column.mean.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}"
+    ]
+    assert failing_metric.id not in resolved_metrics
+    assert [
+        resolved_metrics[metric_configuration.id]
+        for metric_configuration in metrics_to_resolve[1:]
+    ] == [4, 2, "w"]
+
+
 # Ensuring functionality of compute_domain when no domain kwargs are given
 def test_get_compute_domain_with_no_domain_kwargs_alt(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
@@ -1,6 +1,7 @@
 import logging
 import os
-from typing import Dict, Tuple, cast
+import threading
+from typing import Dict, List, Optional, Tuple, cast
 
 import pandas as pd
 import pytest
@@ -16,7 +17,9 @@ from great_expectations.core.metric_function_types import (
     MetricPartialFunctionTypeSuffixes,
     SummarizationMetricNameSuffixes,
 )
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.data_context.util import file_relative_path
+from great_expectations.execution_engine.metric_cache import PersistentMetricCache
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
@@ -923,6 +926,246 @@ def test_resolve_metric_bundle_with_compute_domain_kwargs_json_serialization(sa)
         assert False, str(e)
 
 
+def _build_file_backed_sa_engine(
+    sa, database_path: str, concurrency_enabled: bool
+) -> SqlAlchemyExecutionEngine:
+    sqlalchemy_engine = sa.create_engine(f"sqlite:///{database_path}")
+    add_dataframe_to_db(
+        df=pd.DataFrame({"a": [1, 2, 3, 4, 5, 6], "b": [1, 1, 2, 2, 3, 3]}),
+        name="test",
+        con=sqlalchemy_engine,
+        if_exists="replace",
+        index=False,
+    )
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        concurrency=ConcurrencyConfig(enabled=concurrency_enabled),
+    )
+    batch_data = SqlAlchemyBatchData(
+        execution_engine=execution_engine, table_name="test"
+    )
+    execution_engine.load_batch_data(batch_id="1234", batch_data=batch_data)
+    return execution_engine
+
+
+def _resolve_column_max_per_row_condition(
+    execution_engine: SqlAlchemyExecutionEngine,
+) -> Dict[str, MetricValue]:
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(engine=execution_engine)
+    metrics.update(results)
+
+    row_conditions = [None, 'col("b")==1', 'col("b")==2', 'col("b")==3']
+
+    desired_metrics: Dict[str, MetricConfiguration] = {}
+    aggregate_fn_metrics = []
+    for row_condition in row_conditions:
+        metric_domain_kwargs = {"column": "a", "batch_id": "1234"}
+        if row_condition is not None:
+            metric_domain_kwargs["row_condition"] = row_condition
+            metric_domain_kwargs[
+                "condition_parser"
+            ] = "great_expectations__experimental__"
+
+        aggregate_fn_metric = MetricConfiguration(
+            metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        aggregate_fn_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+        aggregate_fn_metrics.append(aggregate_fn_metric)
+
+        desired_metric = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        desired_metric.metric_dependencies = {
+            "metric_partial_fn": aggregate_fn_metric,
+            "table.columns": table_columns_metric,
+        }
+        desired_metrics[str(row_condition)] = desired_metric
+
+    results = execution_engine.resolve_metrics(
+        metrics_to_resolve=aggregate_fn_metrics, metrics=metrics
+    )
+    metrics.update(results)
+
+    results = execution_engine.resolve_metrics(
+        metrics_to_resolve=list(desired_metrics.values()), metrics=metrics
+    )
+    return {
+        row_condition: results[desired_metric.id]
+        for row_condition, desired_metric in desired_metrics.items()
+    }
+
+
+def test_resolve_metric_bundle_executes_domains_concurrently(sa, tmp_path, monkeypatch):
+    execution_engine = _build_file_backed_sa_engine(
+        sa=sa,
+        database_path=str(tmp_path / "concurrent.db"),
+        concurrency_enabled=True,
+    )
+
+    thread_ids: List[int] = []
+    execute_bundle_query = SqlAlchemyExecutionEngine._execute_bundle_query
+
+    def _recording_execute_bundle_query(connectable, sa_query_object):
+        thread_ids.append(threading.get_ident())
+        return execute_bundle_query(
+            connectable=connectable, sa_query_object=sa_query_object
+        )
+
+    monkeypatch.setattr(
+        execution_engine, "_execute_bundle_query", _recording_execute_bundle_query
+    )
+
+    results = _resolve_column_max_per_row_condition(execution_engine=execution_engine)
+
+    assert results == {
+        "None": 6,
+        'col("b")==1': 2,
+        'col("b")==2': 4,
+        'col("b")==3': 6,
+    }
+    # Partial metric functions are bundled into one query per row condition; each ran on a worker thread.
+    assert len(thread_ids) == 4
+    assert threading.get_ident() not in thread_ids
+
+
+def test_resolve_metric_bundle_concurrent_results_match_sequential_results(
+    sa, tmp_path
+):
+    concurrent_results = _resolve_column_max_per_row_condition(
+        execution_engine=_build_file_backed_sa_engine(
+            sa=sa,
+            database_path=str(tmp_path / "concurrent.db"),
+            concurrency_enabled=True,
+        )
+    )
+    sequential_results = _resolve_column_max_per_row_condition(
+        execution_engine=_build_file_backed_sa_engine(
+            sa=sa,
+            database_path=str(tmp_path / "sequential.db"),
+            concurrency_enabled=False,
+        )
+    )
+
+    assert concurrent_results == sequential_results
+
+
+def test_resolve_metric_bundle_does_not_execute_concurrently_on_in_memory_sqlite(
+    sa,
+):
+    execution_engine = build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 3], "b": [1, 1, 2]}), sa, batch_id="1234"
+    )
+    execution_engine._concurrency = ConcurrencyConfig(enabled=True)
+
+    queries = {
+        ("domain_1",): {"domain_kwargs": {"batch_id": "1234"}},
+        ("domain_2",): {"domain_kwargs": {"batch_id": "1234"}},
+    }
+    assert not execution_engine._can_execute_bundle_queries_concurrently(
+        queries=queries
+    )
+
+
+def test_resolve_metric_bundle_concurrent_failure_raises_metric_resolution_error(
+    sa, tmp_path, monkeypatch
+):
+    execution_engine = _build_file_backed_sa_engine(
+        sa=sa,
+        database_path=str(tmp_path / "concurrent.db"),
+        concurrency_enabled=True,
+    )
+
+    def _failing_execute_bundle_query(connectable, sa_query_object):
+        raise gx_exceptions.ExecutionEngineError(message="query failed")
+
+    monkeypatch.setattr(
+        execution_engine, "_execute_bundle_query", _failing_execute_bundle_query
+    )
+
+    with pytest.raises(gx_exceptions.MetricResolutionError) as e:
+        _resolve_column_max_per_row_condition(execution_engine=execution_engine)
+
+    assert str(e.value) == "query failed"
+    assert len(e.value.failed_metrics) == 4
+
+
+def test_batch_fingerprint_tracks_row_count_and_latest_update_of_table(sa, tmp_path):
+    sqlalchemy_engine = sa.create_engine(f"sqlite:///{tmp_path / 'fingerprint.db'}")
+    add_dataframe_to_db(
+        df=pd.DataFrame({"a": [1, 2], "updated_at": ["2023-01-01", "2023-01-02"]}),
+        name="tracked",
+        con=sqlalchemy_engine,
+        index=False,
+    )
+    add_dataframe_to_db(
+        df=pd.DataFrame({"a": [1, 2]}),
+        name="untracked",
+        con=sqlalchemy_engine,
+        index=False,
+    )
+
+    def _get_batch_fingerprint(table_name: str) -> Optional[str]:
+        execution_engine = SqlAlchemyExecutionEngine(engine=sqlalchemy_engine)
+        execution_engine.load_batch_data(
+            batch_id="1234",
+            batch_data=SqlAlchemyBatchData(
+                execution_engine=execution_engine, table_name=table_name
+            ),
+        )
+        return execution_engine.get_batch_fingerprint(batch_id="1234")
+
+    fingerprint = _get_batch_fingerprint(table_name="tracked")
+    assert fingerprint is not None
+    assert _get_batch_fingerprint(table_name="tracked") == fingerprint
+
+    with sqlalchemy_engine.begin() as connection:
+        connection.execute(
+            sa.text("UPDATE tracked SET a = 3, updated_at = '2023-01-03' WHERE a = 2")
+        )
+
+    assert _get_batch_fingerprint(table_name="tracked") not in (None, fingerprint)
+
+    # Without modification timestamps, in-place changes of rows cannot be detected; hence, no fingerprint is computed.
+    assert _get_batch_fingerprint(table_name="untracked") is None
+
+
+def test_config_holds_persistent_metric_cache_arguments_rather_than_cache_object(
+    sa, tmp_path
+):
+    metric_cache = PersistentMetricCache(
+        path=tmp_path / "metric_cache.db", max_size_bytes=1000000
+    )
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=sa.create_engine("sqlite://"), metric_cache=metric_cache
+    )
+
+    assert execution_engine.config["metric_cache"] == {
+        "path": str(tmp_path / "metric_cache.db"),
+        "max_size_bytes": 1000000,
+        "ttl_seconds": None,
+    }
+
+    # Configuration round-trips: equivalent ExecutionEngine (sharing same cache file) is built from it.
+    rebuilt_execution_engine = SqlAlchemyExecutionEngine(
+        engine=sa.create_engine("sqlite://"),
+        metric_cache=execution_engine.config["metric_cache"],
+    )
+    assert (
+        rebuilt_execution_engine.persistent_metric_cache.config == metric_cache.config
+    )
+
+
 def test_get_batch_data_and_markers_using_query(sqlite_view_engine, test_df):
     my_execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
         engine=sqlite_view_engine
@@ -1,3 +1,8 @@
+import gzip
+import json
+import os
+from unittest import mock
+
 import pandas as pd
 import pytest
 
@@ -36,6 +41,9 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     MapMetricProvider,
 )
+from great_expectations.expectations.metrics.map_metric_provider.condition_functions import (
+    evaluate_on_unique_values,
+)
 from great_expectations.validator.validation_graph import MetricConfiguration
 from great_expectations.validator.validator import Validator
 
@@ -1110,6 +1118,181 @@ def test_sqlite_single_column_complete_result_format_id_pk(
     }
 
 
+def test_sqlite_single_column_complete_result_format_with_unexpected_rows_limit(
+    sa,
+    in_memory_runtime_context,
+    sqlite_table_for_unexpected_rows_with_index,
+):
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={
+            "column": "animals",
+            "value_set": ["cat", "fish", "dog"],
+            "result_format": {
+                "result_format": "COMPLETE",
+                "include_unexpected_rows": True,
+                "unexpected_rows_limit": 2,
+                "unexpected_rows_sampling": "reservoir",
+                "unexpected_rows_sampling_seed": 0,
+            },
+        },
+    )
+
+    # result_format configuration at ExpectationConfiguration-level will emit warning
+    with pytest.warns(UserWarning):
+        result: ExpectationValidationResult = (
+            _expecation_configuration_to_validation_result_sql(
+                expectation_configuration=expectation_configuration,
+                context=in_memory_runtime_context,
+            )
+        )
+
+    unexpected_rows = result.result["unexpected_rows"]
+    assert len(unexpected_rows) == 2
+    assert {row[2] for row in unexpected_rows} < {"giraffe", "lion", "zebra"}
+    assert result.result["unexpected_count"] == 3
+
+
+@pytest.mark.parametrize(
+    "unexpected_rows_limit_directive,expected_num_unexpected_rows",
+    [
+        pytest.param({}, 2, id="default_limit"),
+        pytest.param({"unexpected_rows_limit": None}, 3, id="no_limit"),
+    ],
+)
+def test_sqlite_single_column_complete_result_format_bounds_unexpected_rows_by_default(
+    sa,
+    in_memory_runtime_context,
+    sqlite_table_for_unexpected_rows_with_index,
+    unexpected_rows_limit_directive,
+    expected_num_unexpected_rows,
+):
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={
+            "column": "animals",
+            "value_set": ["cat", "fish", "dog"],
+            "result_format": {
+                "result_format": "COMPLETE",
+                "include_unexpected_rows": True,
+                **unexpected_rows_limit_directive,
+            },
+        },
+    )
+
+    # result_format configuration at ExpectationConfiguration-level will emit warning
+    with mock.patch(
+        "great_expectations.expectations.metrics.map_metric_provider.map_condition_auxilliary_methods._DEFAULT_UNEXPECTED_ROWS_LIMIT",
+        2,
+    ), pytest.warns(UserWarning):
+        result: ExpectationValidationResult = (
+            _expecation_configuration_to_validation_result_sql(
+                expectation_configuration=expectation_configuration,
+                context=in_memory_runtime_context,
+            )
+        )
+
+    assert len(result.result["unexpected_rows"]) == expected_num_unexpected_rows
+    assert result.result["unexpected_count"] == 3
+
+
+def test_sqlite_single_column_complete_result_format_spills_unexpected_index_list(
+    sa,
+    in_memory_runtime_context,
+    sqlite_table_for_unexpected_rows_with_index,
+    tmp_path,
+):
+    earlier_spill_file = tmp_path / "unexpected_index_list_earlier.jsonl.gz"
+    earlier_spill_file.touch()
+    os.utime(earlier_spill_file, (0, 0))
+
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={
+            "column": "animals",
+            "value_set": ["cat", "fish", "dog"],
+            "result_format": {
+                "result_format": "COMPLETE",
+                "partial_unexpected_count": 1,
+                "unexpected_index_column_names": ["pk_1"],
+                "unexpected_spill_directory": str(tmp_path),
+            },
+        },
+    )
+
+    # result_format configuration at ExpectationConfiguration-level will emit warning
+    with pytest.warns(UserWarning):
+        result: ExpectationValidationResult = (
+            _expecation_configuration_to_validation_result_sql(
+                expectation_configuration=expectation_configuration,
+                context=in_memory_runtime_context,
+            )
+        )
+
+    # Only leading part of unexpected index list is kept in validation result.
+    assert result.result["unexpected_index_list"] == [{"animals": "giraffe", "pk_1": 3}]
+    with gzip.open(result.result["unexpected_index_list_path"], "rt") as f:
+        assert [json.loads(line) for line in f] == [
+            {"animals": "giraffe", "pk_1": 3},
+            {"animals": "lion", "pk_1": 4},
+            {"animals": "zebra", "pk_1": 5},
+        ]
+
+    # Spill files, which validation results may still refer to, are not deleted by default.
+    assert earlier_spill_file.exists()
+
+
+def test_sqlite_single_column_complete_result_format_spills_unexpected_rows(
+    sa,
+    in_memory_runtime_context,
+    sqlite_table_for_unexpected_rows_with_index,
+    tmp_path,
+):
+    expired_spill_file = tmp_path / "unexpected_rows_expired.jsonl.gz"
+    expired_spill_file.touch()
+    os.utime(expired_spill_file, (0, 0))
+    other_file = tmp_path / "other.jsonl.gz"
+    other_file.touch()
+    os.utime(other_file, (0, 0))
+
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={
+            "column": "animals",
+            "value_set": ["cat", "fish", "dog"],
+            "result_format": {
+                "result_format": "COMPLETE",
+                "include_unexpected_rows": True,
+                "partial_unexpected_count": 1,
+                "unexpected_spill_directory": str(tmp_path),
+                "unexpected_spill_retention_seconds": 60 * 60,
+            },
+        },
+    )
+
+    # result_format configuration at ExpectationConfiguration-level will emit warning
+    with pytest.warns(UserWarning):
+        result: ExpectationValidationResult = (
+            _expecation_configuration_to_validation_result_sql(
+                expectation_configuration=expectation_configuration,
+                context=in_memory_runtime_context,
+            )
+        )
+
+    # Only leading unexpected row is kept in validation result.
+    assert [row["animals"] for row in result.result["unexpected_rows"]] == ["giraffe"]
+    with gzip.open(result.result["unexpected_rows_path"], "rt") as f:
+        assert [json.loads(line)["animals"] for line in f] == [
+            "giraffe",
+            "lion",
+            "zebra",
+        ]
+
+    # With retention period set, expired spill files are deleted by subsequent spills; other files are left alone.
+    assert not expired_spill_file.exists()
+    assert other_file.exists()
+
+
 def test_sqlite_single_column_summary_result_format(
     sa, in_memory_runtime_context, sqlite_table_for_unexpected_rows_with_index
 ):
@@ -1175,3 +1358,121 @@ def test_sqlite_single_column_basic_result_format(
         "unexpected_percent_nonmissing": 50.0,
         "unexpected_percent_total": 50.0,
     }
+
+
+@pytest.mark.unit
+def test_evaluate_on_unique_values_calls_metric_fn_once_per_distinct_value():
+    evaluated_columns: list = []
+
+    def metric_fn(column: pd.Series) -> pd.Series:
+        evaluated_columns.append(column.tolist())
+        return column.map(lambda val: isinstance(val, int) and val > 1)
+
+    column = pd.Series(
+        [1, 2, 2, None, 1.0, True, 2, None, "2"],
+        index=list("abcdefghi"),
+        name="my_column",
+        dtype=object,
+    )
+    results: pd.Series = evaluate_on_unique_values(column=column, metric_fn=metric_fn)
+
+    assert results.tolist() == [
+        False,
+        True,
+        True,
+        False,
+        False,
+        False,
+        True,
+        False,
+        False,
+    ]
+    assert results.index.tolist() == column.index.tolist()
+    assert results.name == "my_column"
+    # Equal values of different types (1, 1.0, and True) are evaluated separately.
+    assert len(evaluated_columns) == 1
+    assert sorted(map(repr, evaluated_columns[0])) == sorted(
+        map(repr, [1, 2, None, 1.0, True, "2"])
+    )
+
+
+@pytest.mark.unit
+def test_evaluate_on_unique_values_evaluates_unhashable_values_entirely():
+    column = pd.Series([[1], [1], {"a": 1}])
+    results: pd.Series = evaluate_on_unique_values(
+        column=column, metric_fn=lambda col: col.map(lambda val: isinstance(val, list))
+    )
+
+    assert results.tolist() == [True, True, False]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "expectation_type,kwargs,values,expected_unexpected_index_list",
+    [
+        pytest.param(
+            "expect_column_values_to_be_json_parseable",
+            {},
+            ['{"a": 1}', "{", '{"a": 1}', None, "{", "[]"],
+            [1, 4],
+            id="json_parseable",
+        ),
+        pytest.param(
+            "expect_column_values_to_match_json_schema",
+            {"json_schema": {"type": "object", "required": ["a"]}},
+            ['{"a": 1}', '{"b": 1}', '{"a": 1}', None, '{"b": 1}', '{"a": 2}'],
+            [1, 4],
+            id="match_json_schema",
+        ),
+        pytest.param(
+            "expect_column_values_to_match_strftime_format",
+            {"strftime_format": "%Y-%m-%d"},
+            [
+                "2023-01-01",
+                "01/01/2023",
+                "2023-01-01",
+                None,
+                "01/01/2023",
+                "2023-01-02",
+            ],
+            [1, 4],
+            id="match_strftime_format",
+        ),
+        pytest.param(
+            "expect_column_values_to_be_in_type_list",
+            {"type_list": ["int"]},
+            [1, 1.0, 1, None, True, 2],
+            [1],
+            id="in_type_list",
+        ),
+    ],
+)
+def test_pandas_condition_evaluated_on_unique_values(
+    expectation_type: str,
+    kwargs: dict,
+    values: list,
+    expected_unexpected_index_list: list,
+):
+    df = pd.DataFrame({"a": pd.Series(values, dtype=object)})
+    batch = Batch(
+        data=df,
+        batch_definition=BatchDefinition(
+            datasource_name="my_datasource",
+            data_connector_name="my_data_connector",
+            data_asset_name="my_data_asset",
+            batch_identifiers=IDDict({}),
+        ),
+    )
+    validator = Validator(execution_engine=PandasExecutionEngine(), batches=[batch])
+
+    result: ExpectationValidationResult = validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type=expectation_type,
+                kwargs={"column": "a", "result_format": "COMPLETE", **kwargs},
+            )
+        ]
+    )[0]
+
+    assert result.exception_info["raised_exception"] is False, result.exception_info
+    assert result.result["unexpected_index_list"] == expected_unexpected_index_list
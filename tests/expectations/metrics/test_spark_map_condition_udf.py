@@ -0,0 +1,222 @@
+import inspect
+import json
+import logging
+import sys
+import typing
+from typing import Iterator, List, Optional
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from great_expectations.expectations.metrics.map_metric_provider import (
+    condition_functions,
+    spark_map_condition_udf,
+)
+from great_expectations.expectations.metrics.map_metric_provider.spark_map_condition_udf import (
+    get_spark_map_condition_udf,
+)
+
+
+def _is_json(val) -> bool:
+    try:
+        json.loads(val)
+        return True
+    except Exception:
+        return False
+
+
+@pytest.fixture
+def udf_functions():
+    """Replaces Spark UDF constructors, so that Python functions, wrapped by UDFs, can be called directly."""
+    # Replacements are given explicitly ("pyspark" may not be installed, in which case originals cannot be inspected).
+    mock_functions = mock.Mock()
+    mock_functions.udf.side_effect = lambda fn, return_type: fn
+    mock_functions.pandas_udf.side_effect = lambda fn, return_type: fn
+    with mock.patch(
+        "great_expectations.expectations.metrics.map_metric_provider.spark_map_condition_udf.F",
+        new=mock_functions,
+    ), mock.patch(
+        "great_expectations.expectations.metrics.map_metric_provider.spark_map_condition_udf.sparktypes",
+        new=mock.Mock(),
+    ):
+        yield mock_functions
+
+
+@pytest.mark.unit
+def test_arrow_udf_evaluates_condition_once_per_distinct_value_of_batch(
+    udf_functions,
+):
+    evaluated_values: list = []
+    num_built: List[int] = []
+
+    def make_condition_fn():
+        num_built.append(1)
+
+        def condition_fn(val) -> bool:
+            evaluated_values.append(val)
+            return _is_json(val)
+
+        return condition_fn
+
+    evaluate_condition = get_spark_map_condition_udf(
+        execution_engine=mock.Mock(arrow_enabled=True),
+        make_condition_fn=make_condition_fn,
+    )
+    assert udf_functions.pandas_udf.call_count == 1
+
+    batches = [
+        pd.Series(
+            ['{"a": 1}', "not json", '{"a": 1}', None, "not json", None, "[]"],
+            index=[10, 11, 12, 13, 14, 15, 16],
+        ),
+        pd.Series(["1", "x", "1"]),
+        pd.Series([], dtype=object),
+    ]
+    results: List[pd.Series] = list(evaluate_condition(iter(batches)))
+
+    assert [result.tolist() for result in results] == [
+        [True, False, True, False, False, False, True],
+        [True, False, True],
+        [],
+    ]
+    assert results[0].index.tolist() == batches[0].index.tolist()
+    assert all(result.dtype == bool for result in results)
+    # Condition is built once per task, and is evaluated for "None" only if batch has missing values.
+    assert len(num_built) == 1
+    assert evaluated_values == [None, '{"a": 1}', "not json", "[]", "1", "x"]
+
+
+@pytest.mark.unit
+def test_arrow_udf_is_declared_as_iterator_of_series_pandas_udf(udf_functions):
+    get_spark_map_condition_udf(
+        execution_engine=mock.Mock(arrow_enabled=True),
+        make_condition_fn=lambda: _is_json,
+    )
+
+    assert not udf_functions.udf.called
+    evaluate_condition, return_type = udf_functions.pandas_udf.call_args.args
+    assert return_type is spark_map_condition_udf.sparktypes.BooleanType()
+    # Spark infers kind of pandas UDF from type hints of function.
+    assert typing.get_type_hints(evaluate_condition) == {
+        "batches": Iterator[pd.Series],
+        "return": Iterator[pd.Series],
+    }
+
+
+@pytest.mark.unit
+def test_python_udf_builds_condition_upon_first_call(udf_functions):
+    num_built: List[int] = []
+
+    def make_condition_fn():
+        num_built.append(1)
+        return _is_json
+
+    is_json = get_spark_map_condition_udf(
+        execution_engine=mock.Mock(arrow_enabled=False),
+        make_condition_fn=make_condition_fn,
+    )
+    assert udf_functions.udf.call_count == 1
+    assert num_built == []
+
+    assert is_json("{}") is True
+    assert is_json("{") is False
+    assert num_built == [1]
+
+
+@pytest.mark.unit
+def test_condition_functions_are_registered_for_pickling_by_value(udf_functions):
+    mock_cloudpickle = mock.Mock()
+    with mock.patch.dict(
+        sys.modules, {"pyspark": mock.Mock(cloudpickle=mock_cloudpickle)}
+    ):
+        get_spark_map_condition_udf(
+            execution_engine=mock.Mock(arrow_enabled=False),
+            make_condition_fn=lambda: _is_json,
+        )
+
+    mock_cloudpickle.register_pickle_by_value.assert_called_once_with(
+        condition_functions
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "pyspark_module",
+    [
+        pytest.param(None, id="pyspark_not_importable"),
+        pytest.param(
+            mock.Mock(cloudpickle=mock.Mock(spec=[])),
+            id="cloudpickle_without_register_pickle_by_value",
+        ),
+    ],
+)
+def test_udf_is_built_where_condition_functions_cannot_be_pickled_by_value(
+    udf_functions, pyspark_module, caplog
+):
+    with mock.patch.dict(sys.modules, {"pyspark": pyspark_module}), caplog.at_level(
+        logging.DEBUG
+    ):
+        is_json = get_spark_map_condition_udf(
+            execution_engine=mock.Mock(arrow_enabled=False),
+            make_condition_fn=lambda: _is_json,
+        )
+
+    assert is_json("{}") is True
+    assert "PySpark does not support pickling modules by value" in caplog.text
+
+
+@pytest.mark.unit
+def test_condition_functions_do_not_depend_on_great_expectations():
+    """Functions, called by Spark UDFs, are shipped to executors by value, so they must not need "great_expectations"."""
+    referenced_module_names = {
+        value.__name__ if inspect.ismodule(value) else value.__module__
+        for name, value in vars(condition_functions).items()
+        if not name.startswith("__")
+        and (
+            inspect.ismodule(value)
+            or inspect.isfunction(value)
+            or inspect.isclass(value)
+        )
+    }
+    assert condition_functions.__name__ in referenced_module_names
+    assert not {
+        module_name
+        for module_name in referenced_module_names - {condition_functions.__name__}
+        if module_name.startswith("great_expectations")
+    }
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("arrow_enabled", [True, False])
+def test_get_spark_map_condition_udf_with_and_without_arrow(
+    spark_session, basic_spark_df_execution_engine, arrow_enabled: bool
+):
+    from great_expectations.optional_imports import F
+
+    values: List[Optional[str]] = ['{"a": 1}', "not json", None, "[]", "not json"]
+
+    previous_arrow_conf: str = spark_session.conf.get(
+        "spark.sql.execution.arrow.pyspark.enabled"
+    )
+    spark_session.conf.set(
+        "spark.sql.execution.arrow.pyspark.enabled", str(arrow_enabled).lower()
+    )
+    try:
+        if arrow_enabled and not basic_spark_df_execution_engine.arrow_enabled:
+            pytest.skip("Arrow-backed pandas UDFs are not supported by this Spark.")
+
+        df = spark_session.createDataFrame(
+            [(value,) for value in values], "value string"
+        )
+        is_json_udf = get_spark_map_condition_udf(
+            execution_engine=basic_spark_df_execution_engine,
+            make_condition_fn=lambda: _is_json,
+        )
+        rows = df.select(is_json_udf(F.col("value")).alias("is_json")).collect()
+    finally:
+        spark_session.conf.set(
+            "spark.sql.execution.arrow.pyspark.enabled", previous_arrow_conf
+        )
+
+    assert [row["is_json"] for row in rows] == [True, False, False, True, False]
@@ -0,0 +1,9 @@
+import _pytest.config
+import pytest
+
+
+@pytest.fixture
+def skip_if_performance_tests_not_enabled(pytestconfig: _pytest.config.Config):
+    """Skips benchmark unless pytest is run with --performance-tests flag."""
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
@@ -0,0 +1,108 @@
+"""
+Test performance of DataContext startup with many configured (SQL and filesystem) datasources.
+"""
+
+import pathlib
+import sys
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.data_context.types.base import (
+    DataContextConfig,
+    InMemoryStoreBackendDefaults,
+)
+from great_expectations.util import get_context
+
+NUM_SQL_DATASOURCES: int = 40
+NUM_FILESYSTEM_DATASOURCES: int = 40
+
+
+def _build_project_config(tmp_path: pathlib.Path) -> DataContextConfig:
+    datasources: dict = {}
+
+    idx: int
+    for idx in range(NUM_SQL_DATASOURCES):
+        datasources[f"my_sql_datasource_{idx}"] = {
+            "class_name": "Datasource",
+            "execution_engine": {
+                "class_name": "SqlAlchemyExecutionEngine",
+                "connection_string": f"sqlite:///{tmp_path / f'database_{idx}.db'}",
+            },
+            "data_connectors": {
+                "my_runtime_data_connector": {
+                    "class_name": "RuntimeDataConnector",
+                    "batch_identifiers": ["id"],
+                },
+            },
+        }
+
+    for idx in range(NUM_FILESYSTEM_DATASOURCES):
+        datasources[f"my_filesystem_datasource_{idx}"] = {
+            "class_name": "Datasource",
+            "execution_engine": {
+                "class_name": "PandasExecutionEngine",
+            },
+            "data_connectors": {
+                "my_inferred_data_connector": {
+                    "class_name": "InferredAssetFilesystemDataConnector",
+                    "base_directory": str(tmp_path),
+                    "default_regex": {
+                        "group_names": ["data_asset_name"],
+                        "pattern": "(.*)\\.csv",
+                    },
+                },
+            },
+        }
+
+    return DataContextConfig(
+        store_backend_defaults=InMemoryStoreBackendDefaults(),
+        datasources=datasources,
+    )
+
+
+@pytest.mark.parametrize(
+    "instantiate_all_datasources",
+    [
+        pytest.param(True, id="eager_80_datasources"),
+        pytest.param(False, id="lazy_80_datasources"),
+    ],
+)
+def test_data_context_startup_benchmark(
+    benchmark: BenchmarkFixture,
+    skip_if_performance_tests_not_enabled: None,
+    tmp_path: pathlib.Path,
+    instantiate_all_datasources: bool,
+):
+    """Benchmark creating DataContext with 80 datasources and retrieving one of them (as Checkpoint would).
+
+    Datasources are instantiated upon first access, so "lazy" parametrization (which uses only one datasource) is
+    expected to be much faster than "eager" one (which accesses, thereby instantiating, all of datasources).
+    """
+    project_config: DataContextConfig = _build_project_config(tmp_path=tmp_path)
+
+    def _start_data_context() -> int:
+        context = get_context(project_config=project_config)
+        if instantiate_all_datasources:
+            _ = list(context.datasources.values())
+
+        context.get_datasource("my_sql_datasource_0")
+        return sum(
+            context._cached_datasources.is_instantiated(datasource_name)
+            for datasource_name in project_config.datasources
+        )
+
+    num_instantiated_datasources: int = benchmark.pedantic(
+        _start_data_context, rounds=3, iterations=1
+    )
+
+    assert num_instantiated_datasources == (
+        NUM_SQL_DATASOURCES + NUM_FILESYSTEM_DATASOURCES
+        if instantiate_all_datasources
+        else 1
+    )
+
+
+if __name__ == "__main__":
+    # For profiling, it can be useful to support running this script directly instead of using pytest to run.
+    sys.exit(pytest.main(sys.argv))
@@ -0,0 +1,71 @@
+"""
+Test performance of bulk insertion of Expectations into "ExpectationSuite".
+"""
+
+import sys
+from typing import List
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.expectation_suite import ExpectationSuite
+
+
+def _build_expectation_configurations(
+    num_expectations: int,
+) -> List[ExpectationConfiguration]:
+    return [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={"column": f"column_{idx}", "min_value": 0, "max_value": idx},
+        )
+        for idx in range(num_expectations)
+    ]
+
+
+@pytest.mark.parametrize(
+    "num_expectations",
+    [
+        pytest.param(2500, id="2.5k_expectations"),
+        pytest.param(10000, id="10k_expectations"),
+    ],
+)
+def test_expectation_suite_add_expectation_configurations_benchmark(
+    benchmark: BenchmarkFixture,
+    skip_if_performance_tests_not_enabled: None,
+    num_expectations: int,
+):
+    """Benchmark bulk insertion of Expectations, each of which has its own domain.
+
+    Every insertion looks up Expectations with same domain through index (rather than scanning whole Suite), so time
+    is expected to grow linearly with number of Expectations (10k parametrization takes about four times longer).
+    """
+    expectation_configurations: List[
+        ExpectationConfiguration
+    ] = _build_expectation_configurations(num_expectations=num_expectations)
+
+    def _add_expectation_configurations() -> ExpectationSuite:
+        suite = ExpectationSuite(expectation_suite_name="benchmark_suite")
+        suite.add_expectation_configurations(
+            expectation_configurations=expectation_configurations,
+            send_usage_event=False,
+        )
+        return suite
+
+    suite: ExpectationSuite = benchmark.pedantic(
+        _add_expectation_configurations, rounds=3, iterations=1
+    )
+
+    assert len(suite.expectations) == num_expectations
+    # Upserting Expectations again replaces (rather than duplicates) them.
+    suite.add_expectation_configurations(
+        expectation_configurations=expectation_configurations[:100],
+        send_usage_event=False,
+    )
+    assert len(suite.expectations) == num_expectations
+
+
+if __name__ == "__main__":
+    # For profiling, it can be useful to support running this script directly instead of using pytest to run.
+    sys.exit(pytest.main(sys.argv))
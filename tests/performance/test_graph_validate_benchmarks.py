@@ -0,0 +1,89 @@
+"""
+Test performance of "Validator.graph_validate" on Expectation Suites with large value sets.
+"""
+
+import sys
+from typing import List
+
+import pandas as pd
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.core import IDDict
+from great_expectations.core.batch import Batch, BatchDefinition
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.expectation_validation_result import (
+    ExpectationValidationResult,
+)
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.validator.validator import Validator
+
+NUM_ROWS: int = 1000
+
+
+@pytest.mark.parametrize(
+    "num_expectations,value_set_size",
+    [
+        pytest.param(20, 10000, id="20_expectations_10k_value_set"),
+        pytest.param(100, 10000, id="100_expectations_10k_value_set"),
+    ],
+)
+def test_graph_validate_large_value_sets_benchmark(
+    benchmark: BenchmarkFixture,
+    skip_if_performance_tests_not_enabled: None,
+    num_expectations: int,
+    value_set_size: int,
+):
+    """Benchmark validation of "expect_column_values_to_be_in_set" Expectations, each with large "value_set".
+
+    Evaluated configurations and runtime configurations are copied on write (sharing "value_set" lists), rather than
+    deep-copied for every Expectation, so time is dominated by metric computation.
+    """
+    df = pd.DataFrame(
+        {
+            f"column_{idx}": [f"value_{row_idx}" for row_idx in range(NUM_ROWS)]
+            for idx in range(num_expectations)
+        }
+    )
+    batch = Batch(
+        data=df,
+        batch_definition=BatchDefinition(
+            datasource_name="my_datasource",
+            data_connector_name="my_data_connector",
+            data_asset_name="my_data_asset",
+            batch_identifiers=IDDict({}),
+        ),
+    )
+    validator = Validator(execution_engine=PandasExecutionEngine(), batches=[batch])
+
+    value_set: List[str] = [f"value_{idx}" for idx in range(value_set_size)]
+    expectation_configurations: List[ExpectationConfiguration] = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": f"column_{idx}", "value_set": value_set},
+        )
+        for idx in range(num_expectations)
+    ]
+
+    results: List[ExpectationValidationResult] = benchmark.pedantic(
+        validator.graph_validate,
+        kwargs={
+            "configurations": expectation_configurations,
+            "runtime_configuration": {"result_format": "BASIC"},
+        },
+        rounds=3,
+        iterations=1,
+    )
+
+    assert len(results) == num_expectations
+    assert all(result.success for result in results)
+    # Expectation Suite configurations are left unchanged by validation.
+    assert all(
+        "batch_id" not in expectation_configuration.kwargs
+        for expectation_configuration in expectation_configurations
+    )
+
+
+if __name__ == "__main__":
+    # For profiling, it can be useful to support running this script directly instead of using pytest to run.
+    sys.exit(pytest.main(sys.argv))
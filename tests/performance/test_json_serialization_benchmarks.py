@@ -0,0 +1,76 @@
+"""
+Test performance of "convert_to_json_serializable" on large unexpected lists, arrays, and frames.
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.core.util import convert_to_json_serializable
+
+NUM_ELEMENTS: int = 1000000
+
+
+@pytest.mark.parametrize(
+    "unexpected_list",
+    [
+        pytest.param(list(range(NUM_ELEMENTS)), id="1M_int_list"),
+        pytest.param([f"value_{idx}" for idx in range(NUM_ELEMENTS)], id="1M_str_list"),
+        pytest.param(
+            np.random.default_rng(seed=0).random(NUM_ELEMENTS), id="1M_float_ndarray"
+        ),
+    ],
+)
+def test_convert_to_json_serializable_unexpected_list_benchmark(
+    benchmark: BenchmarkFixture,
+    skip_if_performance_tests_not_enabled: None,
+    unexpected_list,
+):
+    """Benchmark serialization of "result" dictionary, carrying unexpected list of 1M elements.
+
+    JSON-native scalars are passed through without (recursive) function call and NumPy arrays are converted with
+    "tolist()" at once, so none of parametrizations makes function call per element.
+    """
+    result: dict = {
+        "element_count": NUM_ELEMENTS,
+        "unexpected_count": NUM_ELEMENTS,
+        "unexpected_list": unexpected_list,
+    }
+
+    serialized_result: dict = benchmark.pedantic(
+        convert_to_json_serializable, args=(result,), rounds=3, iterations=1
+    )
+
+    assert len(serialized_result["unexpected_list"]) == NUM_ELEMENTS
+
+
+def test_convert_to_json_serializable_dataframe_benchmark(
+    benchmark: BenchmarkFixture,
+    skip_if_performance_tests_not_enabled: None,
+):
+    """Benchmark serialization of DataFrame with 1M values (numeric columns are converted one column at a time)."""
+
+    rng = np.random.default_rng(seed=0)
+    num_rows: int = NUM_ELEMENTS // 4
+    df = pd.DataFrame(
+        {
+            "int_column": rng.integers(low=0, high=100, size=num_rows),
+            "float_column": rng.random(num_rows),
+            "bool_column": rng.random(num_rows) > 0.5,
+            "str_column": [f"value_{idx}" for idx in range(num_rows)],
+        }
+    )
+
+    records: list = benchmark.pedantic(
+        convert_to_json_serializable, args=(df,), rounds=3, iterations=1
+    )
+
+    assert len(records) == num_rows
+
+
+if __name__ == "__main__":
+    # For profiling, it can be useful to support running this script directly instead of using pytest to run.
+    sys.exit(pytest.main(sys.argv))
@@ -0,0 +1,74 @@
+"""
+Test performance of row-wise pandas map metrics on low-cardinality columns, with and without unique-value evaluation.
+"""
+
+import inspect
+import json
+import sys
+
+import pandas as pd
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.expectations.metrics.column_map_metrics.column_values_match_json_schema import (
+    ColumnValuesMatchJsonSchema,
+)
+from great_expectations.expectations.metrics.map_metric_provider import (
+    condition_functions,
+)
+
+NUM_ROWS: int = 1000000
+NUM_DISTINCT_VALUES: int = 100
+JSON_SCHEMA: dict = {
+    "type": "object",
+    "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+    "required": ["id", "name"],
+}
+
+
+@pytest.mark.parametrize(
+    "evaluate_on_unique_values",
+    [
+        pytest.param(False, id="every_row"),
+        pytest.param(True, id="unique_values"),
+    ],
+)
+def test_pandas_match_json_schema_benchmark(
+    benchmark: BenchmarkFixture,
+    skip_if_performance_tests_not_enabled: None,
+    evaluate_on_unique_values: bool,
+):
+    """Benchmark "column_values.match_json_schema" condition over 1M rows with 100 distinct values."""
+
+    values = [
+        json.dumps({"id": idx, "name": f"name_{idx}"})
+        if idx % 10
+        else json.dumps({"id": str(idx)})
+        for idx in range(NUM_DISTINCT_VALUES)
+    ]
+    column = pd.Series([values[idx % NUM_DISTINCT_VALUES] for idx in range(NUM_ROWS)])
+
+    # Undecorated metric function is what "column_condition_partial" calls (with entire or deduplicated column).
+    metric_fn = inspect.unwrap(ColumnValuesMatchJsonSchema._pandas)
+
+    def _evaluate_condition(column: pd.Series) -> pd.Series:
+        return metric_fn(ColumnValuesMatchJsonSchema, column, json_schema=JSON_SCHEMA)
+
+    if evaluate_on_unique_values:
+        meets_expectation_series: pd.Series = benchmark.pedantic(
+            condition_functions.evaluate_on_unique_values,
+            kwargs={"column": column, "metric_fn": _evaluate_condition},
+            rounds=3,
+            iterations=1,
+        )
+    else:
+        meets_expectation_series = benchmark.pedantic(
+            _evaluate_condition, args=(column,), rounds=3, iterations=1
+        )
+
+    assert (~meets_expectation_series).sum() == NUM_ROWS // 10
+
+
+if __name__ == "__main__":
+    # For profiling, it can be useful to support running this script directly instead of using pytest to run.
+    sys.exit(pytest.main(sys.argv))
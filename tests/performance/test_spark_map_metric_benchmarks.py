@@ -0,0 +1,100 @@
+"""
+Test performance of row-wise Spark map metrics (Python UDFs) with and without Arrow-backed "pandas_udf" implementations.
+"""
+
+import inspect
+import json
+import os
+import sys
+from typing import List
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.core.util import get_or_create_spark_application
+from great_expectations.execution_engine import SparkDFExecutionEngine
+from great_expectations.expectations.metrics.column_map_metrics.column_values_match_json_schema import (
+    ColumnValuesMatchJsonSchema,
+)
+from great_expectations.optional_imports import F, pyspark
+
+NUM_ROWS: int = 1000000
+NUM_DISTINCT_VALUES: int = 1000
+JSON_SCHEMA: dict = {
+    "type": "object",
+    "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+    "required": ["id", "name"],
+}
+
+
+@pytest.mark.parametrize(
+    "arrow_enabled",
+    [
+        pytest.param(False, id="python_udf"),
+        pytest.param(True, id="arrow_pandas_udf"),
+    ],
+)
+def test_spark_match_json_schema_benchmark(
+    benchmark: BenchmarkFixture,
+    skip_if_performance_tests_not_enabled: None,
+    arrow_enabled: bool,
+):
+    """Benchmark "column_values.match_json_schema" condition over 1M rows (1K distinct values) on local SparkSession.
+
+    Throughput per core (rows per second per core) is recorded in "extra_info" of benchmark.
+    """
+    if not pyspark:
+        pytest.skip("This test requires pyspark.")
+
+    num_cores: int = os.cpu_count() or 1
+    spark = get_or_create_spark_application(
+        spark_config={
+            "spark.master": f"local[{num_cores}]",
+            "spark.sql.execution.arrow.pyspark.enabled": str(arrow_enabled).lower(),
+        }
+    )
+    execution_engine = SparkDFExecutionEngine(
+        spark_config=dict(spark.sparkContext.getConf().getAll())
+    )
+    spark.conf.set(
+        "spark.sql.execution.arrow.pyspark.enabled", str(arrow_enabled).lower()
+    )
+    if arrow_enabled and not execution_engine.arrow_enabled:
+        pytest.skip("Arrow-backed pandas UDFs require pyarrow and Spark 3.0 or later.")
+
+    values: List[str] = [
+        json.dumps({"id": idx, "name": f"name_{idx}"})
+        if idx % 10
+        else json.dumps({"id": str(idx)})
+        for idx in range(NUM_DISTINCT_VALUES)
+    ]
+    df = spark.range(NUM_ROWS).select(
+        F.element_at(
+            F.array(*[F.lit(value) for value in values]),
+            (F.col("id") % NUM_DISTINCT_VALUES + 1).cast("int"),
+        ).alias("value")
+    )
+
+    # Condition (boolean column expression) is built by undecorated metric function, as "column_condition_partial" does.
+    condition = inspect.unwrap(ColumnValuesMatchJsonSchema._spark)(
+        ColumnValuesMatchJsonSchema,
+        F.col("value"),
+        json_schema=JSON_SCHEMA,
+        _execution_engine=execution_engine,
+    )
+
+    def _count_unexpected() -> int:
+        return df.filter(~condition).count()
+
+    num_unexpected: int = benchmark.pedantic(_count_unexpected, rounds=3, iterations=1)
+
+    benchmark.extra_info["rows_per_second_per_core"] = (
+        NUM_ROWS / benchmark.stats.stats.mean / num_cores
+    )
+
+    assert num_unexpected == NUM_ROWS // 10
+
+
+if __name__ == "__main__":
+    # For profiling, it can be useful to support running this script directly instead of using pytest to run.
+    sys.exit(pytest.main(sys.argv))
@@ -0,0 +1,118 @@
+"""
+Test performance of "ValidationGraph" metric resolution scheduling on large synthetic graphs.
+"""
+
+import random
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple, cast
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.validator.computed_metric import MetricValue
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import MetricEdge, ValidationGraph
+
+
+class _InstantExecutionEngine:
+    """Resolves every metric immediately, so that benchmarks measure only graph scheduling overhead."""
+
+    def __init__(self) -> None:
+        self.num_resolve_metrics_calls = 0
+
+    # noinspection PyUnusedLocal
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        self.num_resolve_metrics_calls += 1
+        return {
+            metric_configuration.id: None for metric_configuration in metrics_to_resolve
+        }
+
+    # noinspection PyUnusedLocal
+    @staticmethod
+    def get_persisted_metrics(
+        metric_configurations: Iterable[MetricConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        return {}
+
+
+def _build_layered_metric_edges(
+    num_levels: int, num_metrics_per_level: int, num_dependencies_per_metric: int
+) -> List[MetricEdge]:
+    rng = random.Random(0)
+
+    edges: List[MetricEdge] = []
+
+    previous_level: List[MetricConfiguration] = []
+    level: List[MetricConfiguration]
+    for level_idx in range(num_levels):
+        level = [
+            MetricConfiguration(
+                metric_name=f"synthetic.metric_{level_idx}",
+                metric_domain_kwargs={"column": f"column_{metric_idx}"},
+            )
+            for metric_idx in range(num_metrics_per_level)
+        ]
+        for metric_configuration in level:
+            if not previous_level:
+                edges.append(MetricEdge(left=metric_configuration))
+                continue
+
+            for dependency in rng.sample(previous_level, num_dependencies_per_metric):
+                edges.append(MetricEdge(left=metric_configuration, right=dependency))
+
+        previous_level = level
+
+    return edges
+
+
+@pytest.mark.parametrize(
+    "num_levels,num_metrics_per_level,num_dependencies_per_metric",
+    [
+        pytest.param(10, 1000, 5, id="10_levels_50k_edges"),
+        pytest.param(100, 100, 5, id="100_levels_50k_edges"),
+    ],
+)
+def test_validation_graph_resolve_benchmark(
+    benchmark: BenchmarkFixture,
+    skip_if_performance_tests_not_enabled: None,
+    num_levels: int,
+    num_metrics_per_level: int,
+    num_dependencies_per_metric: int,
+):
+    """Benchmark resolution of synthetic layered graph with about 50,000 edges.
+
+    Scheduling work is proportional to the number of edges (rather than to the number of levels times the number of
+    edges), so both parametrizations are expected to take comparable time.
+    """
+    edges = _build_layered_metric_edges(
+        num_levels=num_levels,
+        num_metrics_per_level=num_metrics_per_level,
+        num_dependencies_per_metric=num_dependencies_per_metric,
+    )
+
+    def _resolve() -> Tuple[ValidationGraph, _InstantExecutionEngine, dict]:
+        execution_engine = _InstantExecutionEngine()
+        graph = ValidationGraph(
+            execution_engine=cast(ExecutionEngine, execution_engine), edges=edges
+        )
+        resolved_metrics, _ = graph.resolve(show_progress_bars=False)
+        return graph, execution_engine, resolved_metrics
+
+    graph, execution_engine, resolved_metrics = benchmark.pedantic(
+        _resolve, rounds=5, iterations=1
+    )
+
+    assert len(resolved_metrics) == num_levels * num_metrics_per_level
+    assert execution_engine.num_resolve_metrics_calls == num_levels + 1
+    assert len(graph.get_metric_resolution_levels()) == num_levels
+
+
+if __name__ == "__main__":
+    # For profiling, it can be useful to support running this script directly instead of using pytest to run.
+    sys.exit(pytest.main(sys.argv))
@@ -1,13 +1,18 @@
+import json
 import os
 import shutil
 from typing import Dict
+from unittest import mock
 
 import pytest
 from freezegun import freeze_time
 
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context.store import ExpectationsStore, ValidationsStore
-from great_expectations.data_context.types.base import AnonymizedUsageStatisticsConfig
+from great_expectations.data_context.types.base import (
+    AnonymizedUsageStatisticsConfig,
+    ConcurrencyConfig,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
@@ -16,7 +21,10 @@ from great_expectations.data_context.util import (
     file_relative_path,
     instantiate_class_from_config,
 )
-from great_expectations.render.renderer.site_builder import SiteBuilder
+from great_expectations.render.renderer.site_builder import (
+    DataDocsManifest,
+    SiteBuilder,
+)
 from great_expectations.util import get_context
 
 
@@ -500,6 +508,130 @@ def test_configuration_driven_site_builder_skip_and_clean_missing(
     assert validations_set == validation_html_pages
 
 
+@pytest.mark.slow  # 3.00s
+def test_configuration_driven_site_builder_incremental_build(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    # in incremental mode, site builder keeps manifest of rendered resources, so that subsequent builds render only
+    # new (or changed) resources and build index page without retrieving Validation Results from validations store
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        incremental_build=True,
+        **local_site_config
+    )
+    _, index_links_dict = site_builder.build()
+
+    manifest_backend = site_builder.target_store.store_backends["manifest"]
+    assert manifest_backend.has_key(())
+    manifest = json.loads(site_builder.target_store.read_manifest())
+    assert manifest["version"] == DataDocsManifest.VERSION
+    validations_store = context.stores["validations_store"]
+    expectations_store = context.stores["expectations_store"]
+    assert len(manifest["resources"]["profiling"]) == len(validations_store.list_keys())
+    assert len(manifest["resources"]["expectations"]) == len(
+        expectations_store.list_keys()
+    )
+
+    with mock.patch.object(
+        validations_store, "get", wraps=validations_store.get
+    ) as mock_validations_store_get:
+        _, incremental_index_links_dict = site_builder.build()
+
+    # neither profiling section nor index page retrieves already rendered Validation Results
+    mock_validations_store_get.assert_not_called()
+    assert incremental_index_links_dict == index_links_dict
+
+    # changed Expectation Suite is rendered again, unchanged one is skipped
+    expectation_suite_key = expectations_store.list_keys()[0]
+    expectation_suite = context.get_expectation_suite(
+        expectation_suite_key.expectation_suite_name
+    )
+    expectations_section_builder = site_builder.site_section_builders["expectations"]
+    with mock.patch.object(
+        expectations_section_builder.renderer_class,
+        "render",
+        wraps=expectations_section_builder.renderer_class.render,
+    ) as mock_render:
+        site_builder.build()
+        mock_render.assert_not_called()
+
+        expectation_suite.meta["notes"] = "changed"
+        context.add_or_update_expectation_suite(expectation_suite=expectation_suite)
+        site_builder.build()
+        assert mock_render.call_count == 1
+
+    # page removed from site is rendered again
+    profiling_result_key = validations_store.list_keys()[0]
+    site_builder.target_store.store_backends[ValidationResultIdentifier].remove_key(
+        profiling_result_key.to_tuple()
+    )
+    site_builder.build()
+    assert site_builder.target_store.store_backends[ValidationResultIdentifier].has_key(
+        profiling_result_key.to_tuple()
+    )
+
+
+@pytest.mark.slow  # 4.00s
+def test_configuration_driven_site_builder_concurrent_build(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    # with concurrency enabled, pages are built on pool of threads (and templated on pool of processes, if configured);
+    # failure to render one page is logged and does not prevent other pages from being built
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    context.variables.concurrency = ConcurrencyConfig(enabled=True)
+
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        rendering_processes=2,
+        **local_site_config
+    )
+    _, index_links_dict = site_builder.build()
+
+    validations_set = set(context.stores["validations_store"].list_keys())
+    validation_html_pages = {
+        ValidationResultIdentifier.from_tuple(result_tuple)
+        for result_tuple in site_builder.target_store.store_backends[
+            ValidationResultIdentifier
+        ].list_keys()
+    }
+    assert validations_set == validation_html_pages
+    assert len(index_links_dict["profiling_links"]) == len(validations_set)
+
+    site_builder.clean_site()
+    failing_key = sorted(validations_set, key=lambda key: key.to_tuple())[0]
+    profiling_section_builder = site_builder.site_section_builders["profiling"]
+    render = profiling_section_builder.renderer_class.render
+    failing_result_meta = context.stores["validations_store"].get(failing_key).meta
+
+    def _render_or_fail(validation_result):
+        if validation_result.meta == failing_result_meta:
+            raise ValueError("Page cannot be rendered.")
+        return render(validation_result)
+
+    with mock.patch.object(
+        profiling_section_builder.renderer_class,
+        "render",
+        side_effect=_render_or_fail,
+    ):
+        site_builder.build()
+
+    validation_html_pages = {
+        ValidationResultIdentifier.from_tuple(result_tuple)
+        for result_tuple in site_builder.target_store.store_backends[
+            ValidationResultIdentifier
+        ].list_keys()
+    }
+    assert validation_html_pages == validations_set - {failing_key}
+
+
 @pytest.mark.rendered_output
 @pytest.mark.filterwarnings(
     "ignore:name is deprecated as a batch_parameter*:DeprecationWarning:great_expectations.data_context.data_context"
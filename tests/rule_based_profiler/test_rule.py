@@ -1,11 +1,22 @@
-from typing import Any
+from typing import Any, Optional, Tuple
+from unittest import mock
 
 import pytest
 
 import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.domain import Domain
+from great_expectations.data_context import DataContext
+from great_expectations.rule_based_profiler.domain_builder import ColumnDomainBuilder
+from great_expectations.rule_based_profiler.parameter_builder import (
+    MetricMultiBatchParameterBuilder,
+    ParameterBuilder,
+)
 from great_expectations.rule_based_profiler.parameter_container import (
+    DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
     get_parameter_value_by_fully_qualified_parameter_name,
 )
+from great_expectations.rule_based_profiler.rule import Rule
+from great_expectations.rule_based_profiler.rule.rule_state import RuleState
 
 
 # noinspection PyPep8Naming
@@ -351,3 +362,161 @@ def test_get_parameter_value_by_fully_qualified_parameter_name_valid_parameter_n
             )
             == details
         )
+
+
+@pytest.mark.integration
+@pytest.mark.slow  # 1.50s
+def test_rule_run_with_prefetch_metrics_resolves_metrics_of_all_domains_together(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    rule = Rule(
+        name="my_rule",
+        domain_builder=ColumnDomainBuilder(
+            include_column_names=[
+                "passenger_count",
+                "trip_distance",
+                "fare_amount",
+            ],
+            data_context=data_context,
+        ),
+        parameter_builders=[
+            MetricMultiBatchParameterBuilder(
+                name=f"{metric_name.replace('.', '_')}",
+                metric_name=metric_name,
+                metric_domain_kwargs=DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
+                data_context=data_context,
+            )
+            for metric_name in ["column.min", "column.max"]
+        ],
+    )
+
+    def _run(runtime_configuration: Optional[dict]) -> Tuple[RuleState, int]:
+        with mock.patch(
+            "great_expectations.rule_based_profiler.parameter_builder.parameter_builder.ParameterBuilder.resolve_metrics",
+            autospec=True,
+            side_effect=ParameterBuilder.resolve_metrics,
+        ) as mock_resolve:
+            rule_state: RuleState = rule.run(
+                batch_request=batch_request,
+                runtime_configuration=runtime_configuration,
+                rule_state=RuleState(),
+            )
+
+        return rule_state, mock_resolve.call_count
+
+    rule_state, num_graph_resolutions = _run(runtime_configuration=None)
+    assert num_graph_resolutions == 6
+
+    prefetch_rule_state, num_graph_resolutions = _run(
+        runtime_configuration={"prefetch_metrics": True}
+    )
+    assert num_graph_resolutions == 1
+
+    assert len(prefetch_rule_state.domains) == 3
+    domain: Domain
+    for domain in rule_state.domains:
+        for parameter_name in ["column_min", "column_max"]:
+            fully_qualified_parameter_name = (
+                f"$parameter.{parameter_name}.attributed_value"
+            )
+            assert get_parameter_value_by_fully_qualified_parameter_name(
+                fully_qualified_parameter_name=fully_qualified_parameter_name,
+                domain=domain,
+                parameters=prefetch_rule_state.parameters,
+            ) == get_parameter_value_by_fully_qualified_parameter_name(
+                fully_qualified_parameter_name=fully_qualified_parameter_name,
+                domain=domain,
+                parameters=rule_state.parameters,
+            )
+
+
+@pytest.mark.integration
+@pytest.mark.slow  # 1.50s
+def test_rule_run_with_prefetch_metrics_resolves_metrics_per_batch_request_of_parameter_builder(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    def _build_rule() -> Rule:
+        column_max_parameter_builder = MetricMultiBatchParameterBuilder(
+            name="column_max",
+            metric_name="column.max",
+            metric_domain_kwargs=DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
+            data_context=data_context,
+        )
+        # This "ParameterBuilder" only uses most recent "Batch" (hence, its metrics are resolved by its own "Validator").
+        column_max_parameter_builder.batch_request = dict(
+            batch_request, data_connector_query={"index": -1}
+        )
+        return Rule(
+            name="my_rule",
+            domain_builder=ColumnDomainBuilder(
+                include_column_names=["passenger_count", "fare_amount"],
+                data_context=data_context,
+            ),
+            parameter_builders=[
+                MetricMultiBatchParameterBuilder(
+                    name="column_min",
+                    metric_name="column.min",
+                    metric_domain_kwargs=DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
+                    data_context=data_context,
+                ),
+                column_max_parameter_builder,
+            ],
+        )
+
+    def _run(runtime_configuration: Optional[dict]) -> Tuple[RuleState, int]:
+        with mock.patch(
+            "great_expectations.rule_based_profiler.parameter_builder.parameter_builder.ParameterBuilder.resolve_metrics",
+            autospec=True,
+            side_effect=ParameterBuilder.resolve_metrics,
+        ) as mock_resolve:
+            rule_state: RuleState = _build_rule().run(
+                batch_request=batch_request,
+                runtime_configuration=runtime_configuration,
+                rule_state=RuleState(),
+            )
+
+        return rule_state, mock_resolve.call_count
+
+    rule_state, _ = _run(runtime_configuration=None)
+
+    prefetch_rule_state, num_graph_resolutions = _run(
+        runtime_configuration={"prefetch_metrics": True}
+    )
+    # One "ValidationGraph" per distinct set of "Batch" objects.
+    assert num_graph_resolutions == 2
+
+    domain: Domain
+    for domain in rule_state.domains:
+        for parameter_name in ["column_min", "column_max"]:
+            fully_qualified_parameter_name = (
+                f"$parameter.{parameter_name}.attributed_value"
+            )
+            assert get_parameter_value_by_fully_qualified_parameter_name(
+                fully_qualified_parameter_name=fully_qualified_parameter_name,
+                domain=domain,
+                parameters=prefetch_rule_state.parameters,
+            ) == get_parameter_value_by_fully_qualified_parameter_name(
+                fully_qualified_parameter_name=fully_qualified_parameter_name,
+                domain=domain,
+                parameters=rule_state.parameters,
+            )
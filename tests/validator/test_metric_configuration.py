@@ -63,3 +63,22 @@ def test_metric_configuration_get_domain(
             "column": "my_column",
         },
     )
+
+
+@pytest.mark.unit
+def test_metric_configuration_id_is_computed_once_and_kwargs_are_then_frozen(
+    column_histogram_metric_config: MetricConfiguration,
+) -> None:
+    metric_id = column_histogram_metric_config.id
+
+    assert column_histogram_metric_config.id is metric_id
+    assert column_histogram_metric_config.metric_domain_kwargs.is_frozen
+    assert column_histogram_metric_config.metric_value_kwargs.is_frozen
+
+    with pytest.raises(TypeError):
+        column_histogram_metric_config.metric_domain_kwargs["column"] = "other"
+
+    with pytest.raises(TypeError):
+        column_histogram_metric_config.metric_value_kwargs.update({"bins": 10})
+
+    assert column_histogram_metric_config.id == metric_id
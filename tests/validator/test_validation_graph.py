@@ -1,12 +1,15 @@
+import pathlib
 import sys
-from typing import Dict, Iterable, Optional, Set, Tuple, Union, cast
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union, cast
 from unittest import mock
 
+import pandas as pd
 import pytest
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
-from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine.metric_cache import PersistentMetricCache
 from great_expectations.expectations.core import ExpectColumnValueZScoresToBeLessThan
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.exception_info import ExceptionInfo
@@ -14,7 +17,9 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 from great_expectations.validator.validation_graph import (
     MAX_METRIC_COMPUTATION_RETRIES,
     ExpectationValidationGraph,
+    MetricDependencyGraphBuilder,
     MetricEdge,
+    MetricResolutionScheduler,
     ValidationGraph,
 )
 from great_expectations.validator.validator import ValidationDependencies
@@ -281,6 +286,113 @@ def test_parse_validation_graph(
     assert len(ready_metrics) == 2 and len(needed_metrics) == 9
 
 
+@pytest.mark.unit
+def test_MetricResolutionScheduler_releases_dependents_as_dependencies_resolve() -> None:
+    table_columns = MetricConfiguration(
+        metric_name="table.columns", metric_domain_kwargs={}
+    )
+    table_row_count = MetricConfiguration(
+        metric_name="table.row_count", metric_domain_kwargs={}
+    )
+    column_max = MetricConfiguration(
+        metric_name="column.max", metric_domain_kwargs={"column": "a"}
+    )
+    column_min = MetricConfiguration(
+        metric_name="column.min", metric_domain_kwargs={"column": "a"}
+    )
+    column_range = MetricConfiguration(
+        metric_name="column.range", metric_domain_kwargs={"column": "a"}
+    )
+    edges = [
+        MetricEdge(left=table_columns),
+        MetricEdge(left=table_row_count),
+        MetricEdge(left=column_max, right=table_columns),
+        MetricEdge(left=column_min, right=table_columns),
+        MetricEdge(left=column_range, right=column_max),
+        MetricEdge(left=column_range, right=column_min),
+        MetricEdge(left=column_range, right=table_row_count),
+        # Duplicate edges do not inflate dependency counts.
+        MetricEdge(left=column_range, right=column_min),
+    ]
+
+    scheduler = MetricResolutionScheduler(edges=edges)
+
+    assert scheduler.num_pending_metrics == 5
+    assert scheduler.ready_metrics == [table_columns, table_row_count]
+    assert scheduler.get_levels() == [
+        [table_columns, table_row_count],
+        [column_max, column_min],
+        [column_range],
+    ]
+
+    scheduler.mark_resolved(metric_ids=[table_columns.id])
+    assert scheduler.ready_metrics == [table_row_count, column_max, column_min]
+
+    scheduler.mark_resolved(metric_ids=[column_max.id, column_min.id])
+    assert scheduler.ready_metrics == [table_row_count]
+    assert scheduler.needed_metrics == [column_range]
+
+    scheduler.mark_resolved(
+        metric_ids=[table_row_count.id, ("unknown", "unknown", "unknown")]
+    )
+    assert scheduler.ready_metrics == [column_range]
+
+    scheduler.mark_resolved(metric_ids=[column_range.id])
+    assert scheduler.ready_metrics == []
+    assert scheduler.num_pending_metrics == 0
+
+
+@pytest.mark.unit
+def test_MetricResolutionScheduler_skips_resolved_and_never_releases_cycles() -> None:
+    table_columns = MetricConfiguration(
+        metric_name="table.columns", metric_domain_kwargs={}
+    )
+    column_max = MetricConfiguration(
+        metric_name="column.max", metric_domain_kwargs={"column": "a"}
+    )
+    column_min = MetricConfiguration(
+        metric_name="column.min", metric_domain_kwargs={"column": "a"}
+    )
+    edges = [
+        MetricEdge(left=table_columns),
+        MetricEdge(left=column_max, right=table_columns),
+        MetricEdge(left=column_min, right=column_min),
+    ]
+
+    scheduler = MetricResolutionScheduler(
+        edges=edges, metrics={table_columns.id: ["a"]}
+    )
+
+    assert scheduler.ready_metrics == [column_max]
+    assert scheduler.needed_metrics == [column_min]
+    assert scheduler.get_levels() == [[column_max]]
+
+
+@pytest.mark.unit
+def test_ValidationGraph_get_metric_resolution_levels(
+    expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
+):
+    graph = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph
+    levels = graph.get_metric_resolution_levels()
+
+    ready_metrics, needed_metrics = graph._parse(metrics={})
+    assert set(levels[0]) == ready_metrics
+    assert sum(len(level) for level in levels) == len(ready_metrics) + len(
+        needed_metrics
+    )
+
+    resolved_metric_ids = set()
+    for level in levels:
+        for metric_configuration in level:
+            assert all(
+                dependency.id in resolved_metric_ids
+                for dependency in metric_configuration.metric_dependencies.values()
+            )
+        resolved_metric_ids.update(
+            metric_configuration.id for metric_configuration in level
+        )
+
+
 @pytest.mark.unit
 def test_populate_dependencies(
     expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
@@ -317,6 +429,185 @@ def test_populate_dependencies_with_incorrect_metric_name():
     )
 
 
+@pytest.mark.unit
+def test_metric_dependency_graph_builder_expands_shared_metrics_once():
+    execution_engine = PandasExecutionEngine()
+    graph_builder = MetricDependencyGraphBuilder(execution_engine=execution_engine)
+
+    def _build_graph(metric_names: List[str]) -> ValidationGraph:
+        return graph_builder.build_metric_dependency_graph(
+            metric_configurations=[
+                MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs={"column": "a"},
+                )
+                for metric_name in metric_names
+            ]
+        )
+
+    unexpected_count_graph: ValidationGraph = _build_graph(
+        metric_names=["column_values.nonnull.unexpected_count"]
+    )
+    with mock.patch.object(
+        graph_builder, "_expand_metric", wraps=graph_builder._expand_metric
+    ) as mock_expand_metric:
+        shared_dependencies_graph: ValidationGraph = _build_graph(
+            metric_names=[
+                "column_values.nonnull.unexpected_count",
+                "column_values.nonnull.unexpected_count",
+                "column.max",
+            ]
+        )
+
+    # Only "column.max" (and those of its dependencies, not encountered before) are expanded anew.
+    expanded_metric_names: List[str] = [
+        call.kwargs["metric_configuration"].metric_name
+        for call in mock_expand_metric.call_args_list
+    ]
+    assert "column_values.nonnull.unexpected_count" not in expanded_metric_names
+    assert "column.max" in expanded_metric_names
+
+    # Graphs reference shared edges, and each graph contains every edge only once.
+    unexpected_count_edge: MetricEdge
+    for unexpected_count_edge in unexpected_count_graph.edges:
+        assert any(
+            edge is unexpected_count_edge for edge in shared_dependencies_graph.edges
+        )
+    assert len(shared_dependencies_graph.edges) == len(
+        shared_dependencies_graph.edge_ids
+    )
+
+    # Graph equals one built without shared builder.
+    graph = ValidationGraph(execution_engine=execution_engine)
+    graph.build_metric_dependency_graph(
+        metric_configuration=MetricConfiguration(
+            metric_name="column_values.nonnull.unexpected_count",
+            metric_domain_kwargs={"column": "a"},
+        )
+    )
+    assert graph == unexpected_count_graph
+
+
+@pytest.mark.unit
+def test_resolve_validation_graph_reuses_persisted_metrics_of_unchanged_batch(
+    tmp_path: pathlib.Path,
+):
+    metric_cache = PersistentMetricCache(path=tmp_path / "metric_cache.db")
+
+    def _resolve(
+        df: pd.DataFrame,
+    ) -> Tuple[Dict[Tuple[str, str, str], MetricValue], List[str]]:
+        execution_engine = PandasExecutionEngine(
+            batch_data_dict={"my_batch_id": df}, metric_cache=metric_cache
+        )
+        graph = ValidationGraph(execution_engine=execution_engine)
+        graph.build_metric_dependency_graph(
+            metric_configuration=MetricConfiguration(
+                metric_name="column_values.nonnull.unexpected_count",
+                metric_domain_kwargs={"column": "a"},
+            )
+        )
+        with mock.patch.object(
+            execution_engine,
+            "resolve_metrics",
+            wraps=execution_engine.resolve_metrics,
+        ) as mock_resolve_metrics:
+            resolved_metrics, _ = graph.resolve(show_progress_bars=False)
+
+        computed_metric_names: List[str] = [
+            metric_configuration.metric_name
+            for call in mock_resolve_metrics.call_args_list
+            for metric_configuration in call.kwargs["metrics_to_resolve"]
+        ]
+        return resolved_metrics, computed_metric_names
+
+    unexpected_count_metric_id: Tuple[str, str, str] = MetricConfiguration(
+        metric_name="column_values.nonnull.unexpected_count",
+        metric_domain_kwargs={"column": "a"},
+    ).id
+
+    resolved_metrics, computed_metric_names = _resolve(
+        df=pd.DataFrame({"a": [1, None, None]})
+    )
+    assert resolved_metrics[unexpected_count_metric_id] == 2
+    assert "column_values.nonnull.condition" in computed_metric_names
+
+    # Neither persisted metrics nor partial metrics, needed only by them, are computed again for unchanged data.
+    resolved_metrics, computed_metric_names = _resolve(
+        df=pd.DataFrame({"a": [1, None, None]})
+    )
+    assert resolved_metrics[unexpected_count_metric_id] == 2
+    assert computed_metric_names == []
+
+    resolved_metrics, computed_metric_names = _resolve(
+        df=pd.DataFrame({"a": [1, 2, None]})
+    )
+    assert resolved_metrics[unexpected_count_metric_id] == 1
+    assert "column_values.nonnull.condition" in computed_metric_names
+
+
+@pytest.mark.unit
+def test_resolve_validation_graph_computes_requested_partial_metrics_of_persisted_metrics(
+    tmp_path: pathlib.Path,
+):
+    metric_cache = PersistentMetricCache(path=tmp_path / "metric_cache.db")
+    df = pd.DataFrame({"a": [1, None, None]})
+
+    unexpected_count_metric_configuration = MetricConfiguration(
+        metric_name="column_values.nonnull.unexpected_count",
+        metric_domain_kwargs={"column": "a"},
+    )
+    condition_metric_configuration = MetricConfiguration(
+        metric_name="column_values.nonnull.condition",
+        metric_domain_kwargs={"column": "a"},
+    )
+
+    graph = ValidationGraph(
+        execution_engine=PandasExecutionEngine(
+            batch_data_dict={"my_batch_id": df}, metric_cache=metric_cache
+        )
+    )
+    graph.build_metric_dependency_graph(
+        metric_configuration=unexpected_count_metric_configuration
+    )
+    graph.resolve(show_progress_bars=False)
+
+    # Partial metric, requested along with persisted metric depending on it, is still computed.
+    graph = ValidationGraph(
+        execution_engine=PandasExecutionEngine(
+            batch_data_dict={"my_batch_id": df}, metric_cache=metric_cache
+        )
+    )
+    graph.build_metric_dependency_graph(
+        metric_configuration=unexpected_count_metric_configuration
+    )
+    graph.build_metric_dependency_graph(
+        metric_configuration=condition_metric_configuration
+    )
+    assert graph.requested_metric_ids == {
+        unexpected_count_metric_configuration.id,
+        condition_metric_configuration.id,
+    }
+
+    resolved_metrics, _ = graph.resolve(show_progress_bars=False)
+    assert resolved_metrics[unexpected_count_metric_configuration.id] == 2
+    assert condition_metric_configuration.id in resolved_metrics
+
+    # Partial metric, which no other metric of graph depends on, is computed, even if it was not marked as requested.
+    graph = ValidationGraph(
+        execution_engine=PandasExecutionEngine(
+            batch_data_dict={"my_batch_id": df}, metric_cache=metric_cache
+        )
+    )
+    graph.build_metric_dependency_graph(
+        metric_configuration=condition_metric_configuration
+    )
+    graph.requested_metric_ids.clear()
+
+    resolved_metrics, _ = graph.resolve(show_progress_bars=False)
+    assert condition_metric_configuration.id in resolved_metrics
+
+
 @pytest.mark.unit
 def test_resolve_validation_graph_with_bad_config_catch_exceptions_true():
     failed_metric_configuration = MetricConfiguration(
@@ -357,6 +648,13 @@ def test_resolve_validation_graph_with_bad_config_catch_exceptions_true():
                 for metric_configuration in metrics_to_resolve
             }
 
+        # noinspection PyUnusedLocal
+        @staticmethod
+        def get_persisted_metrics(
+            metric_configurations: Iterable[MetricConfiguration],
+        ) -> Dict[Tuple[str, str, str], MetricValue]:
+            return {}
+
     PandasExecutionEngineFake.__name__ = "PandasExecutionEngine"
     execution_engine = cast(ExecutionEngine, PandasExecutionEngineFake())
 
@@ -424,18 +722,23 @@ def test_progress_bar_config(
         pass
 
     class DummyExecutionEngine:
-        pass
+        # noinspection PyUnusedLocal
+        @staticmethod
+        def get_persisted_metrics(
+            metric_configurations: Iterable[MetricConfiguration],
+        ) -> Dict[Tuple[str, str, str], MetricValue]:
+            return {}
 
     metric_configuration = cast(MetricConfiguration, DummyMetricConfiguration)
     execution_engine = cast(ExecutionEngine, DummyExecutionEngine)
 
     # ValidationGraph is a complex object that requires len > 3 to not trigger tqdm
     with mock.patch(
-        "great_expectations.validator.validation_graph.ValidationGraph._parse",
-        return_value=(
-            {},
-            {},
-        ),
+        "great_expectations.validator.validation_graph.MetricResolutionScheduler",
+        **{
+            "return_value.ready_metrics": [],
+            "return_value.num_pending_metrics": 0,
+        },
     ), mock.patch(
         "great_expectations.validator.validation_graph.ValidationGraph.edges",
         new_callable=mock.PropertyMock,